@@ -22,6 +22,7 @@ from sqlalchemy import create_engine, text, Column, Integer, String, DateTime, T
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
+from db_utils import POOL_RECYCLE_SECONDS
 import hashlib
 import socket
 import ipaddress
@@ -138,8 +139,8 @@ def get_db_engine():
     engine = create_engine(
         url,
         poolclass=QueuePool,
-        pool_pre_ping=True,  # 恢复pre_ping，但调大recycle时间
-        pool_recycle=3600,   # 调整为1小时，减少连接重建频率
+        pool_pre_ping=True,  # 取出连接前先检测是否存活
+        pool_recycle=POOL_RECYCLE_SECONDS,  # Railway代理会断开空闲连接，闲置5分钟即重建
         pool_size=2,         # 保持小连接池
         max_overflow=3,      # 减少最大溢出连接
         pool_timeout=30,     # 连接超时
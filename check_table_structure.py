@@ -5,9 +5,11 @@ Check research_data table structure
 
 import os
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from dotenv import load_dotenv
 
+from db_utils import get_engine
+
 def check_table_structure():
     """Check the actual structure of research_data table"""
     
@@ -29,8 +31,8 @@ def check_table_structure():
     }
     
     try:
-        url = f"mysql+pymysql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}?charset=utf8mb4"
-        engine = create_engine(url)
+        engine = get_engine(db_config['host'], db_config['port'], db_config['user'],
+                            db_config['password'], db_config['database'])
         
         with engine.connect() as conn:
             # Get table structure
@@ -0,0 +1,26 @@
+"""
+数据库配置公共模块
+进程内只解析一次.env，各脚本通过 get_db_config() 读取 DB_* 变量，
+默认值由调用方按各自场景提供
+"""
+
+import os
+from functools import lru_cache
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+# 环境变量名 -> get_db_config() 返回对象的属性名
+DB_ENV_VARS = {
+    'DB_HOST': 'host',
+    'DB_PORT': 'port',
+    'DB_USER': 'user',
+    'DB_PASSWORD': 'password',
+    'DB_NAME': 'database',
+}
+
+@lru_cache(maxsize=1)
+def get_db_config():
+    """加载.env并返回数据库配置（未设置的变量为None），结果在进程内缓存"""
+    load_dotenv()
+    return SimpleNamespace(**{attr: os.getenv(var) for var, attr in DB_ENV_VARS.items()})
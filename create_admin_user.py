@@ -6,7 +6,9 @@ Creates the admin@frp.com user directly in the Railway database
 
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+
+from db_utils import get_engine
 
 def create_admin_user():
     """Create admin user in the database"""
@@ -29,8 +31,8 @@ def create_admin_user():
     
     try:
         # Create database connection
-        url = f"mysql+pymysql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}?charset=utf8mb4"
-        engine = create_engine(url)
+        engine = get_engine(db_config['host'], db_config['port'], db_config['user'],
+                            db_config['password'], db_config['database'])
         
         with engine.begin() as conn:
             # First, create the users table if it doesn't exist
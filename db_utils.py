@@ -0,0 +1,47 @@
+"""
+数据库连接公共模块
+测试、校验、导出和迁移脚本通过 get_engine() 共用SQLAlchemy引擎，
+同一进程内按连接参数复用连接池（Streamlit重跑脚本时模块不会重新导入，引擎同样保留）
+"""
+
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+from sqlalchemy import create_engine
+
+# 可选：mysqlclient（C扩展）解析结果集更快，未安装时使用纯Python的pymysql（Streamlit Cloud部署）
+try:
+    import MySQLdb  # noqa: F401
+    MYSQL_DRIVER = 'mysqldb'
+except ImportError:
+    MYSQL_DRIVER = 'pymysql'
+
+def build_mysql_url(host, port, user, pwd, dbname):
+    """生成 mysql+<驱动> 连接URL（密码做URL编码以处理特殊字符）"""
+    if pwd:
+        return f"mysql+{MYSQL_DRIVER}://{user}:{quote_plus(str(pwd))}@{host}:{port}/{dbname}?charset=utf8mb4"
+    return f"mysql+{MYSQL_DRIVER}://{user}@{host}:{port}/{dbname}?charset=utf8mb4"
+
+# Railway代理会断开空闲连接，连接在池中闲置超过该秒数即重建（取出前另有pre-ping检测）
+POOL_RECYCLE_SECONDS = 300
+
+@lru_cache(maxsize=8)
+def get_engine(host, port, user, pwd, dbname, local_infile=False, init_command=None):
+    """按连接参数返回共享引擎（QueuePool线程安全，连接池大小与app一致）
+    init_command 在每个新建的连接上执行一次，用于设置会话变量
+    """
+    connect_args = {}
+    if local_infile:
+        connect_args['local_infile'] = True
+    if init_command:
+        connect_args['init_command'] = init_command
+    
+    return create_engine(
+        build_mysql_url(host, port, user, pwd, dbname),
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        pool_size=2,
+        max_overflow=3,
+        pool_timeout=30,
+        connect_args=connect_args,
+    )
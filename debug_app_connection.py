@@ -8,6 +8,8 @@ import pandas as pd
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 
+from db_utils import POOL_RECYCLE_SECONDS
+
 def debug_app_connection():
     """Debug the exact same connection logic used by the app"""
     
@@ -64,7 +66,7 @@ def debug_app_connection():
         engine = create_engine(
             url,
             pool_pre_ping=True,
-            pool_recycle=3600,
+            pool_recycle=POOL_RECYCLE_SECONDS,
             pool_size=2,
             max_overflow=3,
             pool_timeout=30,
@@ -0,0 +1,200 @@
+"""
+Excel -> MySQL 数据导入公共模块
+供 migrate_to_railway.py 和 new dataset (excel to SQL).py 共用：
+1. 以 openpyxl 只读模式分块读取 database 4.xlsx
+2. 原地清理数据块（不复制整表）
+3. 通过 LOAD DATA LOCAL INFILE 整块导入
+"""
+
+import csv
+import logging
+import math
+import os
+import tempfile
+from itertools import islice
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+# 可选：pyarrow 用于以Arrow字符串存储文本列，未安装时保持object
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 流式读取Excel时每块的行数
+CHUNK_SIZE = 20000
+
+# 数值字段位置: Year, diameter, Value1_1, COV1_1
+NUMERIC_POSITIONS = [5, 18, 34, 35]
+
+# 百分比字段位置: retention1, retention2, retention3
+RETENTION_POSITIONS = [98, 102, 106]
+
+# 清理时视为空值的特殊字符串（比较前先去除首尾空白）
+SPECIAL_VALUES = frozenset(['SMD', 'Notreported', 'N/A', '', 'nan', 'NULL', 'None'])
+
+# 文本字段最大长度，防止数据库字段溢出
+MAX_TEXT_LENGTH = 2000
+
+# 不同取值占比低于该值的文本列转为category
+CATEGORY_RATIO = 0.5
+
+# 客户端或服务器禁用 LOAD DATA LOCAL INFILE 时的错误码，仅这些错误按"不支持"处理
+# 1148: ER_NOT_ALLOWED_COMMAND, 3948: ER_CLIENT_LOCAL_FILES_DISABLED,
+# 2068: CR_LOAD_DATA_LOCAL_INFILE_REJECTED
+LOCAL_INFILE_DISABLED_ERRORS = frozenset([1148, 3948, 2068])
+
+class LoadDataError(Exception):
+    """LOAD DATA 产生警告或导入行数不符
+
+    LOCAL 导入隐含 IGNORE 语义：类型不符的值被静默转为0/截断、重复键被跳过，
+    因此有警告时视为失败，由调用方回滚
+    """
+
+def _make_header(cells):
+    """生成与 pd.read_excel 一致的列名（空单元格 -> Unnamed: i，重复列名追加 .1/.2）"""
+    header = []
+    seen = {}
+    for i, cell in enumerate(cells):
+        name = f"Unnamed: {i}" if cell is None else str(cell)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+def stream_excel_chunks(path, chunk_size=CHUNK_SIZE, header_row=3, max_columns=134):
+    """以 openpyxl 只读模式流式读取工作表，每次产出 chunk_size 行的DataFrame"""
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        # 跳过表头之前的说明行（等价于 header=3）
+        for _ in range(header_row):
+            next(rows, None)
+        header = _make_header(next(rows, ())[:max_columns])
+
+        while True:
+            buf = list(islice(rows, chunk_size))
+            if not buf:
+                break
+            data = [row[:max_columns] for row in buf if any(v is not None for v in row)]
+            if data:
+                # 统一以object构造，跳过逐列类型推断；数值列在清理时一次性转换
+                yield pd.DataFrame(data, columns=header, dtype=object)
+    finally:
+        wb.close()
+
+def _clean_value(value, _isinstance=isinstance, _float=float, _isnan=math.isnan, _str=str,
+                 _special=SPECIAL_VALUES, _max_len=MAX_TEXT_LENGTH):
+    """清理单个单元格：空值和特殊值返回None，其余转为去除首尾空白的字符串并截断"""
+    # 逐单元格调用的热点函数，全局名称通过默认参数绑定为局部变量
+    if value is None or (_isinstance(value, _float) and _isnan(value)):
+        return None
+    text = _str(value).strip()
+    if text in _special:
+        return None
+    return text[:_max_len]
+
+# 逐元素作用于object数组的清理函数
+_clean_cells = np.frompyfunc(_clean_value, 1, 1)
+
+def _to_float(col):
+    """数值列转为float64：只含数值/空值时直接整列转换，含无法解析的文本时才逐值解析"""
+    try:
+        return pd.Series(col.to_numpy(dtype=np.float64, na_value=np.nan), index=col.index, name=col.name)
+    except (TypeError, ValueError):
+        return pd.to_numeric(col, errors='coerce')
+
+def compact_text_inplace(df):
+    """原地压缩文本列：重复值多的转为category，其余转为Arrow字符串（如可用）"""
+    # 重复值多的文本列（纤维类型、期刊名等）转为category，降低内存占用
+    n_rows = len(df)
+    for col in df.select_dtypes('object').columns:
+        nunique = df[col].nunique(dropna=True)
+        if nunique and nunique / n_rows < CATEGORY_RATIO:
+            df[col] = df[col].astype('category')
+
+    # 其余文本列使用Arrow字符串存储（连续缓冲区，空值开销小）
+    if PYARROW_AVAILABLE:
+        text_cols = df.select_dtypes('object').columns
+        df[text_cols] = df[text_cols].astype('string[pyarrow]')
+    return df
+
+def clean_inplace(df, compact=True):
+    """原地清理数据块并返回该数据块（不复制整表，保持内存占用平稳）
+
+    compact=False 时跳过文本列压缩：并行清理的各部分合并后再统一调用 compact_text_inplace，
+    否则各部分的category取值不同，pd.concat 会退回object
+    """
+    logger.info("🧹 正在清理数据...")
+
+    # 处理数值字段：直接从原始值整列转换为float64（特殊值转换失败即为NaN）
+    numeric_cols = df.columns[[pos for pos in NUMERIC_POSITIONS if pos < len(df.columns)]]
+    df[numeric_cols] = df[numeric_cols].apply(_to_float)
+
+    # 其余文本列一次遍历完成：特殊值/NaN -> None、转为字符串并限制长度
+    obj_cols = df.select_dtypes('object').columns
+    if len(obj_cols):
+        df[obj_cols] = _clean_cells(df[obj_cols].to_numpy(dtype=object))
+
+    # 处理百分比字段
+    for pos in RETENTION_POSITIONS:
+        if pos < len(df.columns) and df.iloc[:, pos].dtype == 'object':
+            df.iloc[:, pos] = df.iloc[:, pos].str.replace('%', '', regex=False)
+
+    if compact:
+        compact_text_inplace(df)
+
+    logger.info("✅ 数据清理完成")
+    return df
+
+def mysql_error_code(exc):
+    """取出驱动异常的MySQL错误码（mysql.connector 为 errno，pymysql/MySQLdb 为 args[0]）"""
+    code = getattr(exc, 'errno', None)
+    if code is None and exc.args and isinstance(exc.args[0], int):
+        code = exc.args[0]
+    return code
+
+def load_data_infile(cursor, rows_df, table, columns):
+    """使用 LOAD DATA LOCAL INFILE 将数据块导入 table（不提交事务）
+
+    LOCAL INFILE 被禁用时返回None，由调用方改用INSERT；
+    产生警告或导入行数与数据块不符时抛出 LoadDataError，其他数据库错误原样抛出
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix='.tsv')
+    os.close(fd)
+    try:
+        rows_df.to_csv(tmp_path, sep='\t', index=False, header=False, na_rep='NULL',
+                       quoting=csv.QUOTE_MINIMAL, lineterminator='\n', encoding='utf-8')
+        columns_sql = ', '.join([f"`{col}`" for col in columns])
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{tmp_path.replace(os.sep, '/')}' INTO TABLE {table} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                f"LINES TERMINATED BY '\\n' ({columns_sql})"
+            )
+        except Exception as e:
+            # mysql.connector / pymysql 的异常类型不同，按错误码区分"功能被禁用"和真正的数据/连接错误
+            if mysql_error_code(e) in LOCAL_INFILE_DISABLED_ERRORS:
+                logger.warning(f"LOAD DATA LOCAL INFILE 不可用，改用批量INSERT: {e}")
+                return None
+            raise
+        loaded = cursor.rowcount
+
+        cursor.execute("SHOW WARNINGS")
+        warnings = [w for w in cursor.fetchall() if w[0] != 'Note']
+        if warnings:
+            raise LoadDataError(f"LOAD DATA 产生 {len(warnings)} 条警告，例如: {warnings[0]}")
+        if loaded != len(rows_df):
+            raise LoadDataError(f"LOAD DATA 导入 {loaded} 行，与数据块的 {len(rows_df)} 行不符")
+        return loaded
+    finally:
+        os.remove(tmp_path)
@@ -9,15 +9,12 @@ import subprocess
 import importlib
 from pathlib import Path
 
-def check_python_version():
-    """检查Python版本"""
-    print("🐍 检查Python版本...")
+def check_python_version(quiet=False):
+    """检查Python版本，不满足要求时直接退出"""
     if sys.version_info < (3, 8):
-        print("❌ 错误: 需要Python 3.8或更高版本")
-        print(f"   当前版本: {sys.version}")
-        return False
-    print(f"✅ Python版本: {sys.version}")
-    return True
+        sys.exit("❌ 错误: 需要Python 3.8或更高版本，当前版本: %d.%d" % sys.version_info[:2])
+    if not quiet:
+        print("✅ Python版本: %d.%d.%d" % sys.version_info[:3])
 
 def install_requirements():
     """安装依赖包"""
@@ -139,9 +136,8 @@ def main():
     print("🚀 FRP本地预测系统 - 安装向导")
     print("=" * 50)
     
-    # 检查Python版本
-    if not check_python_version():
-        sys.exit(1)
+    # 检查Python版本 (--quiet 时不输出版本信息)
+    check_python_version(quiet='--quiet' in sys.argv[1:])
     
     # 安装依赖
     if not install_requirements():
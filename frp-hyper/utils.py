@@ -18,7 +18,6 @@ from sklearn.feature_selection import SelectKBest, f_regression
 from sklearn.pipeline import Pipeline
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import FunctionTransformer
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import warnings
 
 def apply_sklearn_compatibility_patch():
@@ -89,21 +88,24 @@ def create_enhanced_preprocessor(categorical_cols, numeric_cols, add_polynomial=
     ])
     
     # Enhanced numeric transformer with optional polynomial features and feature selection
-    if add_polynomial and len(numeric_cols) > 1:  # Only add if multiple numeric features
-        numeric_transformer = Pipeline([
-            ('scaler', StandardScaler()),
-            ('poly', PolynomialFeatures(degree=polynomial_degree, interaction_only=True, include_bias=False)),
-            ('selector', SelectKBest(f_regression, k=min(50, len(numeric_cols)*2)))  # Limit features
-        ])
+    n_numeric = len(numeric_cols)
+    use_polynomial = add_polynomial and n_numeric > 1  # Only add if multiple numeric features
+    
+    if use_polynomial:
+        k = min(50, n_numeric * 2)  # Limit features
+    elif n_numeric > 10:  # Use feature selection even without polynomial features
+        k = min(20, n_numeric)
     else:
-        # Use feature selection even without polynomial features
-        if len(numeric_cols) > 10:  # Only if many features
-            numeric_transformer = Pipeline([
-                ('scaler', StandardScaler()),
-                ('selector', SelectKBest(f_regression, k=min(20, len(numeric_cols))))  # Select best features
-            ])
-        else:
-            numeric_transformer = StandardScaler()
+        k = 0
+    
+    steps = [('scaler', StandardScaler())]
+    if use_polynomial:
+        steps.append(('poly', PolynomialFeatures(degree=polynomial_degree, interaction_only=True, include_bias=False)))
+    if k > 0:
+        steps.append(('selector', SelectKBest(f_regression, k=k)))
+    
+    # Plain scaler when no extra steps, avoiding a nested single-step Pipeline
+    numeric_transformer = Pipeline(steps) if len(steps) > 1 else steps[0][1]
     
     # Create preprocessor
     preprocessor = ColumnTransformer(
@@ -120,17 +122,27 @@ def create_enhanced_preprocessor(categorical_cols, numeric_cols, add_polynomial=
 def diagnose_model_performance(y_true, y_pred, model_name="Model"):
     """Diagnose model performance and return insights"""
     
-    r2 = r2_score(y_true, y_pred)
-    mse = mean_squared_error(y_true, y_pred)
-    mae = mean_absolute_error(y_true, y_pred)
+    # 一次计算残差，所有指标都从残差推导（避免多次遍历 y_true/y_pred）
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+    residuals = y_true - y_pred
+    
+    ss_res = np.dot(residuals, residuals)
+    mse = ss_res / residuals.size
+    mae = np.mean(np.abs(residuals))
     rmse = np.sqrt(mse)
     
-    # Calculate residuals
-    residuals = y_true - y_pred
+    centered = y_true - y_true.mean()
+    ss_tot = np.dot(centered, centered)
+    if ss_tot == 0:
+        # 与 sklearn.metrics.r2_score 对常数目标的处理保持一致
+        r2 = 1.0 if ss_res == 0 else 0.0
+    else:
+        r2 = 1 - ss_res / ss_tot
     
     # Check for patterns in residuals
-    residual_std = np.std(residuals)
-    residual_mean = np.mean(residuals)
+    residual_std = residuals.std()
+    residual_mean = residuals.mean()
     
     diagnosis = {
         'r2': r2,
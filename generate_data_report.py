@@ -17,6 +17,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 报告所需的元数据查询：先查字段结构（同时判断表是否存在），再查版本、记录数和表大小
+COLUMNS_SQL = """
+    SELECT column_name, column_type, is_nullable
+    FROM information_schema.COLUMNS
+    WHERE table_schema = DATABASE() AND table_name = 'data'
+    ORDER BY ordinal_position
+"""
+
+TABLE_INFO_SQL = """
+    SELECT 
+        VERSION(),
+        DATABASE(),
+        (SELECT COUNT(*) FROM data),
+        ROUND(((data_length + index_length) / 1024 / 1024), 2)
+    FROM information_schema.TABLES 
+    WHERE table_schema = DATABASE() AND table_name = 'data'
+"""
+
 def connect_to_database():
     """连接到数据库"""
     try:
@@ -55,20 +73,20 @@ def generate_complete_report():
         print("\n🏷️  数据库基本信息")
         print("-" * 50)
         
-        cursor.execute("SELECT VERSION()")
-        version = cursor.fetchone()[0]
-        print(f"📌 MySQL版本: {version}")
+        # 表不存在时COUNT子查询会报错，因此先通过字段结构判断
+        cursor.execute(COLUMNS_SQL)
+        columns = cursor.fetchall()
+        if not columns:
+            print("❌ 未找到 data 表")
+            return
         
-        cursor.execute("SELECT DATABASE()")
-        current_db = cursor.fetchone()[0]
-        print(f"📌 数据库名称: {current_db}")
+        # 版本、记录数和表大小在一次查询中取回
+        cursor.execute(TABLE_INFO_SQL)
+        version, current_db, total_records, size_mb = cursor.fetchone()
         
-        cursor.execute("SELECT COUNT(*) FROM data")
-        total_records = cursor.fetchone()[0]
+        print(f"📌 MySQL版本: {version}")
+        print(f"📌 数据库名称: {current_db}")
         print(f"📌 总记录数: {total_records:,} 条")
-        
-        cursor.execute("SHOW COLUMNS FROM data")
-        columns = cursor.fetchall()
         print(f"📌 字段数量: {len(columns)} 个")
         
         # 2. 表结构详情
@@ -77,8 +95,7 @@ def generate_complete_report():
         print("字段编号 | 字段名称                | 数据类型      | 是否必填")
         print("-" * 70)
         
-        for i, col in enumerate(columns, 1):
-            field_name, field_type, null, key, default, extra = col
+        for i, (field_name, field_type, null) in enumerate(columns, 1):
             nullable = "可为空" if null == "YES" else "必填"
             print(f"{i:8d} | {field_name:22} | {field_type:12} | {nullable}")
         
@@ -167,18 +184,7 @@ def generate_complete_report():
         print("\n💾 数据存储信息")
         print("-" * 50)
         
-        # 计算表大小
-        cursor.execute("""
-            SELECT 
-                table_name,
-                ROUND(((data_length + index_length) / 1024 / 1024), 2) AS 'Size_MB'
-            FROM information_schema.TABLES 
-            WHERE table_schema = 'frp_database' AND table_name = 'data'
-        """)
-        size_info = cursor.fetchone()
-        if size_info:
-            table_name, size_mb = size_info
-            print(f"📁 表大小: {size_mb} MB")
+        print(f"📁 表大小: {size_mb} MB")
         
         print(f"📁 存储位置: C:\\xampp\\mysql\\data\\frp_database\\")
         print(f"📁 备份建议: 定期导出SQL文件")
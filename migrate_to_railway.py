@@ -8,11 +8,21 @@
 
 import pandas as pd
 from sqlalchemy import create_engine
-import numpy as np
+from sqlalchemy.dialects.mysql import DOUBLE
+from sqlalchemy.types import Text
 import os
 from dotenv import load_dotenv
 import logging
 
+# Excel读取与LOAD DATA导入的公共逻辑（清理规则与etl.clean_inplace不同，见 clean_chunk）
+import etl
+from etl import CATEGORY_RATIO, MAX_TEXT_LENGTH, NUMERIC_POSITIONS, PYARROW_AVAILABLE, stream_excel_chunks
+
+# 可选：pyarrow 用于写入 Parquet 备份，未安装时退回 CSV
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
 # 设置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -23,6 +33,22 @@ load_dotenv()
 # Excel文件路径
 EXCEL_FILE_PATH = './database 4.xlsx'
 
+# 清理时视为空值的特殊字符串（按原样匹配，不去除首尾空白）
+SPECIAL_VALUES = ['SMD', 'Notreported', 'N/A', '', ' ', 'nan', 'NULL', 'None']
+
+# research_data表中数值字段的列类型（其余字段为TEXT）
+# 使用DOUBLE：DECIMAL会被PyMySQL读成decimal.Decimal，应用中的load_default_data将得到object列而非float64
+NUMERIC_COLUMN_TYPES = {
+    'Year': DOUBLE(),
+    'diameter': DOUBLE(),
+    'Value1_1': DOUBLE(),
+    'COV1_1': DOUBLE(),
+}
+
+# 数据备份文件（Parquet需要pyarrow）
+BACKUP_PARQUET_PATH = 'frp_data_export.parquet'
+BACKUP_CSV_PATH = 'frp_data_export.csv'
+
 # Railway数据库配置（使用Railway环境变量）
 RAILWAY_DB_CONFIG = {
     'host': 'switchback.proxy.rlwy.net',  # 使用外部可访问的主机名
@@ -32,68 +58,110 @@ RAILWAY_DB_CONFIG = {
     'database': 'railway'
 }
 
+def clean_chunk(df):
+    """按Railway迁移原有的规则原地清理数据块并返回
+
+    与 etl.clean_inplace 的区别：特殊值不去除空白后再匹配、保留百分比字段中的'%'、
+    文本列保持object而不转为Arrow字符串
+    """
+    df[df.columns] = df.replace({value: None for value in SPECIAL_VALUES})
+    
+    # 处理数值字段：整列替换为float64（iloc原地赋值会保留object类型）
+    numeric_cols = df.columns[[pos for pos in NUMERIC_POSITIONS if pos < len(df.columns)]]
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+    
+    # 限制文本长度，防止数据库字段溢出（所有文本列一次性整块赋值）
+    obj_cols = df.select_dtypes('object').columns
+    if len(obj_cols):
+        text = df[obj_cols].astype(str).apply(lambda col: col.str.slice(0, MAX_TEXT_LENGTH))
+        df[obj_cols] = text.where(df[obj_cols].notna(), None)
+    
+    # 重复值多的文本列转为category，降低内存占用
+    for col in df.select_dtypes('object').columns:
+        nunique = df[col].nunique(dropna=True)
+        if nunique and nunique / len(df) < CATEGORY_RATIO:
+            df[col] = df[col].astype('category')
+    return df
+
 def export_from_excel():
-    """从Excel文件导出数据"""
+    """从Excel文件分块导出并清理数据（生成器，每次产出一块清理后的数据）"""
     print("🔄 正在从Excel文件读取数据...")
     
+    parquet_writer = None
     try:
         # 检查Excel文件是否存在
         if not os.path.exists(EXCEL_FILE_PATH):
             print(f"❌ Excel文件不存在: {EXCEL_FILE_PATH}")
             print("请确保database 4.xlsx文件在当前目录")
-            return None
+            return
         
-        # 读取Excel文件
+        # 读取Excel文件（只读流式，读取时即截取前134列）
         print("📖 正在读取Excel文件...")
-        df = pd.read_excel(EXCEL_FILE_PATH, header=3, engine='openpyxl')
-        print(f"✅ 成功读取Excel文件，数据形状: {df.shape}")
-        
-        # 取前134列（适配database 4.xlsx的新结构）
-        df = df.iloc[:, :134]
-        print(f"使用前134列，调整后形状: {df.shape}")
-        
-        # 清理数据
-        print("🧹 正在清理数据...")
-        special_values = ['SMD', 'Notreported', 'N/A', '', ' ', 'nan', 'NULL', 'None']
-        df = df.replace(special_values, None)
-        df = df.replace({np.nan: None})
-        
-        # 处理数值字段
-        numeric_positions = [5, 18, 34, 35]  # Year, diameter, Value1_1, COV1_1等
-        for pos in numeric_positions:
-            if pos < len(df.columns):
-                df.iloc[:, pos] = pd.to_numeric(df.iloc[:, pos], errors='coerce')
+        for chunk_idx, df in enumerate(stream_excel_chunks(EXCEL_FILE_PATH)):
+            print(f"✅ 读取数据块 {chunk_idx + 1}，使用前134列，数据形状: {df.shape}")
+            
+            # 原地清理数据块
+            clean_chunk(df)
+            
+            # 追加写入备份文件
+            if PYARROW_AVAILABLE:
+                # 固定schema（数值列float64，其余string），保证各数据块可写入同一文件
+                if parquet_writer is None:
+                    backup_schema = pa.schema([
+                        (col, pa.float64() if pd.api.types.is_numeric_dtype(df[col]) else pa.string())
+                        for col in df.columns
+                    ])
+                    parquet_writer = pq.ParquetWriter(BACKUP_PARQUET_PATH, backup_schema, compression='zstd')
+                backup_df = df.astype({col: object for col in df.select_dtypes('category').columns})
+                parquet_writer.write_table(
+                    pa.Table.from_pandas(backup_df, schema=backup_schema, preserve_index=False)
+                )
+            else:
+                df.to_csv(BACKUP_CSV_PATH, mode='w' if chunk_idx == 0 else 'a',
+                          header=(chunk_idx == 0), index=False)
+            
+            yield df
         
-        # 限制文本长度，防止数据库字段溢出
-        for col_idx in range(len(df.columns)):
-            if df.iloc[:, col_idx].dtype == 'object':
-                df.iloc[:, col_idx] = df.iloc[:, col_idx].astype(str).str[:2000]
-                df.iloc[:, col_idx] = df.iloc[:, col_idx].replace('None', None)
-        
-        print(f"✅ 数据清理完成，共 {len(df)} 条记录")
-        
-        # 保存到CSV文件作为备份
-        df.to_csv('frp_data_export.csv', index=False)
-        print("✅ 数据已保存到 frp_data_export.csv")
-        
-        return df
+        backup_path = BACKUP_PARQUET_PATH if PYARROW_AVAILABLE else BACKUP_CSV_PATH
+        print(f"✅ 数据清理完成，已保存到 {backup_path}")
     
     except Exception as e:
+        # 中途失败时继续抛出，由导入方回滚并报告失败，避免把部分数据当作完整导入
         print(f"❌ Excel读取失败: {e}")
+        raise
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+def load_data_infile(engine, df, table):
+    """使用 LOAD DATA LOCAL INFILE 批量导入，不支持或数据有警告时回滚并返回None（改用严格模式的INSERT）"""
+    connection = engine.raw_connection()
+    try:
+        loaded = etl.load_data_infile(connection.cursor(), df, table, df.columns)
+        if loaded is None:
+            connection.rollback()
+        else:
+            connection.commit()
+        return loaded
+    except etl.LoadDataError as e:
+        connection.rollback()
+        print(f"⚠️ {e}，本块改用INSERT导入")
         return None
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
 
-def import_to_railway(df):
-    """导入数据到Railway数据库"""
-    if df is None:
-        print("❌ 没有数据需要导入")
-        return False
-        
+def import_to_railway(chunks):
+    """逐块导入数据到Railway数据库"""
     print("🔄 正在导入数据到Railway...")
     
     try:
-        # 连接Railway数据库
+        # 连接Railway数据库（开启local_infile以支持LOAD DATA LOCAL INFILE）
         railway_engine = create_engine(
-            f"mysql+pymysql://{RAILWAY_DB_CONFIG['user']}:{RAILWAY_DB_CONFIG['password']}@{RAILWAY_DB_CONFIG['host']}:{RAILWAY_DB_CONFIG['port']}/{RAILWAY_DB_CONFIG['database']}"
+            f"mysql+pymysql://{RAILWAY_DB_CONFIG['user']}:{RAILWAY_DB_CONFIG['password']}@{RAILWAY_DB_CONFIG['host']}:{RAILWAY_DB_CONFIG['port']}/{RAILWAY_DB_CONFIG['database']}",
+            connect_args={'local_infile': True}
         )
         
         # 定义列名映射（与database 4.xlsx结构对应）
@@ -130,12 +198,33 @@ def import_to_railway(df):
             'note_10', 'important_note'
         ]
         
-        # 确保DataFrame有正确的列名
-        df.columns = column_names[:len(df.columns)]
+        total = 0
+        for chunk_idx, df in enumerate(chunks):
+            # 确保DataFrame有正确的列名
+            df.columns = column_names[:len(df.columns)]
+            
+            if chunk_idx == 0:
+                # 先按显式类型重建research_data表：数值字段用DOUBLE（见NUMERIC_COLUMN_TYPES），其余统一为TEXT，
+                # 不依赖pandas按数据块推断的类型
+                column_types = {col: NUMERIC_COLUMN_TYPES.get(col, Text()) for col in df.columns}
+                df.head(0).to_sql('research_data', railway_engine, if_exists='replace',
+                                  index=False, dtype=column_types)
+            
+            # 整块LOAD DATA导入
+            loaded = load_data_infile(railway_engine, df, 'research_data')
+            if loaded is None:
+                # 服务器未开启local_infile时回退到批量INSERT
+                df.to_sql('research_data', railway_engine, if_exists='append', index=False,
+                          method='multi', chunksize=10000)
+                loaded = len(df)
+            total += loaded
+            print(f"📊 进度: 已导入 {total} 条记录")
+        
+        if total == 0:
+            print("❌ 没有数据需要导入")
+            return False
         
-        # 导入数据到research_data表
-        df.to_sql('research_data', railway_engine, if_exists='replace', index=False, method='multi')
-        print(f"✅ 成功导入 {len(df)} 条记录到Railway数据库 (research_data表)")
+        print(f"✅ 成功导入 {total} 条记录到Railway数据库 (research_data表)")
         
         return True
         
@@ -148,22 +237,29 @@ def main():
     print("🚂 开始数据库迁移到Railway")
     print("=" * 50)
     
-    # 第一步：从Excel文件导出
-    df = export_from_excel()
+    # 分块流水线：Excel读取 -> 清理 -> 导入Railway，内存中只保留一块数据
+    stats = {'rows': 0, 'columns': 0, 'peak_mb': 0.0}
     
-    if df is not None:
-        print(f"\n数据概况:")
-        print(f"- 总行数: {len(df)}")
-        print(f"- 总列数: {len(df.columns)}")
-        print(f"- 数据大小: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
-        
-        # 第二步：导入到Railway
-        if import_to_railway(df):
-            print("\n🎉 数据迁移完成！")
-            print("现在可以更新应用配置使用Railway数据库")
-            print("数据已从database 4.xlsx成功导入到Railway MySQL")
-        else:
-            print("\n❌ 数据迁移失败")
+    def track(chunks):
+        for df in chunks:
+            stats['rows'] += len(df)
+            stats['columns'] = len(df.columns)
+            stats['peak_mb'] = max(stats['peak_mb'], df.memory_usage(deep=True).sum() / 1024 / 1024)
+            yield df
+    
+    success = import_to_railway(track(export_from_excel()))
+    
+    print(f"\n数据概况:")
+    print(f"- 总行数: {stats['rows']}")
+    print(f"- 总列数: {stats['columns']}")
+    print(f"- 单块最大数据大小: {stats['peak_mb']:.2f} MB")
+    
+    if success:
+        print("\n🎉 数据迁移完成！")
+        print("现在可以更新应用配置使用Railway数据库")
+        print("数据已从database 4.xlsx成功导入到Railway MySQL")
+    else:
+        print("\n❌ 数据迁移失败")
     
     print("=" * 50)
 
@@ -1,11 +1,25 @@
 import pandas as pd
-import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 import numpy as np
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from urllib.parse import quote
 from dotenv import load_dotenv
 
+# Excel读取、清理与LOAD DATA导入的公共逻辑
+from etl import (PYARROW_AVAILABLE, LoadDataError, stream_excel_chunks, clean_inplace,
+                 compact_text_inplace, load_data_infile)
+
+# 可选：ADBC MySQL驱动，可直接写入Arrow数据，未安装时使用LOAD DATA/INSERT
+try:
+    import pyarrow as pa
+    import adbc_driver_mysql.dbapi as adbc_mysql
+    ADBC_AVAILABLE = PYARROW_AVAILABLE
+except ImportError:
+    ADBC_AVAILABLE = False
+
 # 加载环境变量
 load_dotenv()
 
@@ -14,6 +28,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # 数据库配置 - 支持本地/Railway切换
+@lru_cache(maxsize=1)
 def get_db_config():
     """获取数据库配置 - 优先使用Railway，备用本地"""
     # 检查Railway环境变量
@@ -186,11 +201,117 @@ MYSQL_COLUMNS = [
     'important_note'                 # 位置134 (原132)
 ]
 
+# 导入data表的字段（前70个主要字段），以及预先生成的字段列表和INSERT语句
+MAIN_COLUMNS = MYSQL_COLUMNS[:70]
+MAIN_COLUMNS_SQL = ', '.join([f"`{col}`" for col in MAIN_COLUMNS])
+INSERT_SQL = f"INSERT INTO data ({MAIN_COLUMNS_SQL}) VALUES ({', '.join(['%s'] * len(MAIN_COLUMNS))})"
+
+# data表字段定义（声明顺序，建表时按列宽重新排列）
+DATA_TABLE_COLUMNS = [
+    ('feature_name', 'VARCHAR(255)'),
+    ('Title', 'TEXT'),
+    ('Author', 'VARCHAR(500)'),
+    ('SCI', 'VARCHAR(100)'),
+    ('Journal_or_Conference_name', 'VARCHAR(500)'),
+    ('Year', 'INT'),
+    ('No_field', 'VARCHAR(100)'),
+    ('no_field_secondary', 'VARCHAR(100)'),
+    ('Fiber_type', 'VARCHAR(200)'),
+    ('Fiber_type_detail', 'VARCHAR(500)'),
+    ('Matrix_type', 'VARCHAR(200)'),
+    ('Matrix_type_detail', 'VARCHAR(500)'),
+    ('glass_transition_temperature', 'DECIMAL(10,3)'),
+    ('glass_transition_temperature_run_2', 'DECIMAL(10,3)'),
+    ('cure_ratio', 'DECIMAL(10,3)'),
+    ('Fiber_content_weight', 'DECIMAL(10,3)'),
+    ('Fiber_content_volume', 'DECIMAL(10,3)'),
+    ('Void_content', 'DECIMAL(10,3)'),
+    ('diameter', 'DECIMAL(10,3)'),
+    ('average_area', 'DECIMAL(10,3)'),
+    ('nominal_area', 'DECIMAL(10,3)'),
+    ('rib', 'VARCHAR(100)'),
+    ('surface_treatment', 'VARCHAR(200)'),
+    ('Water_absorption_at_saturation', 'DECIMAL(10,3)'),
+    ('Water_absorption_test_standard', 'VARCHAR(200)'),
+    ('Water_absorption_note', 'TEXT'),
+    ('Brand_name', 'VARCHAR(200)'),
+    ('Manufacturer', 'VARCHAR(200)'),
+    ('Important_notes', 'TEXT'),
+    ('Notes_of_rebar', 'TEXT'),
+    ('Target_parameter', 'VARCHAR(100)'),
+    ('note_of_target_parameter', 'TEXT'),
+    ('num_1', 'DECIMAL(10,3)'),
+    ('note_of_number', 'TEXT'),
+    ('Value1_1', 'DECIMAL(10,3)'),
+    ('COV1_1', 'DECIMAL(10,3)'),
+    ('note_of_Value1', 'TEXT'),
+    ('Value2_1', 'DECIMAL(10,3)'),
+    ('COV2_1', 'DECIMAL(10,3)'),
+    ('Value2note_1', 'TEXT'),
+    ('Value3_1', 'DECIMAL(10,3)'),
+    ('COV3_1', 'DECIMAL(10,3)'),
+    ('Value3note_1', 'TEXT'),
+    ('SEM_T_BCBT', 'VARCHAR(100)'),
+    ('SEM_L_BCBT', 'VARCHAR(100)'),
+    ('OTHER_main', 'VARCHAR(200)'),
+    ('OTHER1_1', 'VARCHAR(200)'),
+    ('FTIR_1', 'VARCHAR(200)'),
+    ('note_1', 'TEXT'),
+    ('temperature', 'DECIMAL(10,3)'),
+    ('note_of_temperature', 'TEXT'),
+    ('time_field', 'DECIMAL(10,3)'),
+    ('note_of_time', 'TEXT'),
+    ('concrete', 'VARCHAR(200)'),
+    ('pH_of_concrete', 'DECIMAL(10,3)'),
+    ('strength_of_concrete', 'DECIMAL(10,3)'),
+    ('crack', 'VARCHAR(100)'),
+    ('cover', 'DECIMAL(10,3)'),
+    ('note_of_concrete', 'TEXT'),
+    ('pH_1', 'DECIMAL(10,3)'),
+    ('pHafter', 'DECIMAL(10,3)'),
+    ('ingredient_1', 'VARCHAR(200)'),
+    ('pH_2', 'DECIMAL(10,3)'),
+    ('RH_1', 'DECIMAL(10,3)'),
+    ('ingredient_2', 'VARCHAR(200)'),
+    ('note_2', 'TEXT'),
+    ('Location', 'VARCHAR(200)'),
+    ('Effektive_Klimaklassifikation', 'VARCHAR(200)'),
+    ('field_average_humidity', 'DECIMAL(10,3)'),
+    ('field_average_temperature', 'DECIMAL(10,3)'),
+    ('pH_2_additional', 'DECIMAL(10,3)'),
+    ('Ingrediant_additional', 'VARCHAR(200)'),
+    ('number_field', 'VARCHAR(100)'),
+    ('type_field', 'VARCHAR(100)'),
+    ('SolutionorMoisture', 'VARCHAR(200)'),
+    ('cycle_pH', 'DECIMAL(10,3)'),
+    ('cycle_pH_after', 'DECIMAL(10,3)'),
+]
+
+# 数据块行数达到该值时才使用多进程清理（进程启动和序列化开销较大）
+PARALLEL_MIN_ROWS = 5000
+
+# 批量INSERT的批大小范围
+MAX_BATCH_SIZE = 20000
+MIN_BATCH_SIZE = 500
+
+# 插入时视为空值的字符串
+NULL_STRINGS = frozenset(['nan', 'None', 'NULL', '', 'SMD', 'Notreported'])
+
+@lru_cache(maxsize=1)
+def get_connection_pool():
+    """创建（仅一次）数据库连接池，各步骤复用连接，避免重复握手和认证"""
+    # 各步骤顺序执行，连接池在创建时即建立全部连接，因此保持较小的池大小
+    return pooling.MySQLConnectionPool(
+        pool_name='frp',
+        pool_size=2,
+        allow_local_infile=True,
+        **get_db_config()
+    )
+
 def test_connection():
     """测试数据库连接"""
     try:
-        db_config = get_db_config()
-        connection = mysql.connector.connect(**db_config)
+        connection = get_connection_pool().get_connection()
         if connection.is_connected():
             logger.info("✅ 数据库连接测试成功")
             connection.close()
@@ -214,148 +335,159 @@ def check_files():
         return False
 
 def read_excel_data():
-    """读取Excel数据"""
+    """分块读取Excel数据（生成器，内存占用只与块大小有关）"""
     try:
         logger.info("📖 正在读取Excel文件...")
-        df = pd.read_excel(EXCEL_FILE_PATH, header=3, engine='openpyxl')
-        logger.info(f"✅ Excel读取成功，数据形状: {df.shape}")
-        
-        # 取前134列（适配database 4.xlsx的新结构）
-        df = df.iloc[:, :134]
-        logger.info(f"使用前134列（包含2个新字段），调整后形状: {df.shape}")
-        
-        return df
+        # 只读流式读取，读取时即截取前134列（适配database 4.xlsx的新结构）
+        for df in stream_excel_chunks(EXCEL_FILE_PATH):
+            logger.info(f"✅ 读取数据块，使用前134列（包含2个新字段），数据形状: {df.shape}")
+            yield df
     except Exception as e:
+        # 中途失败时继续抛出，由插入方报告失败，避免把部分数据当作完整导入
         logger.error(f"❌ Excel读取失败: {e}")
-        return None
+        raise
 
-def clean_data(df):
-    """清理数据"""
-    logger.info("🧹 正在清理数据...")
-    
-    df_clean = df.copy()
-    
-    # 处理特殊值
-    special_values = ['SMD', 'Notreported', 'N/A', '', ' ', 'nan', 'NULL', 'None']
-    df_clean = df_clean.replace(special_values, None)
-    df_clean = df_clean.replace({np.nan: None})
-    
-    # 处理数值字段
-    numeric_positions = [5, 18, 34, 35]  # Year, diameter, Value1_1, COV1_1
-    for pos in numeric_positions:
-        if pos < len(df_clean.columns):
-            df_clean.iloc[:, pos] = pd.to_numeric(df_clean.iloc[:, pos], errors='coerce')
-    
-    # 处理百分比字段
-    retention_positions = [98, 102, 106]  # retention1, retention2, retention3
-    for pos in retention_positions:
-        if pos < len(df_clean.columns):
-            df_clean.iloc[:, pos] = df_clean.iloc[:, pos].astype(str).str.replace('%', '').str.replace('nan', '')
-    
-    # 限制文本长度
-    for col_idx in range(len(df_clean.columns)):
-        if df_clean.iloc[:, col_idx].dtype == 'object':
-            df_clean.iloc[:, col_idx] = df_clean.iloc[:, col_idx].astype(str).str[:2000]
-            df_clean.iloc[:, col_idx] = df_clean.iloc[:, col_idx].replace('None', None)
-    
-    logger.info("✅ 数据清理完成")
-    return df_clean
+def clean_data_parallel(df, executor, workers):
+    """将数据块拆分后在进程池中并行清理；行数较少时直接在当前进程清理"""
+    if len(df) < PARALLEL_MIN_ROWS or workers < 2:
+        return clean_inplace(df)
+    # 按位置切分（DataFrame上的np.array_split依赖已弃用的swapaxes）
+    bounds = np.linspace(0, len(df), workers + 1, dtype=int)
+    parts = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    # 各部分只做清理，合并后再统一转换category/Arrow字符串，保证各列取值一致
+    merged = pd.concat(executor.map(partial(clean_inplace, compact=False), parts))
+    return compact_text_inplace(merged)
+
+def _column_layout_rank(column_type):
+    """列排序键：定长数值在前，其次短VARCHAR、长VARCHAR，TEXT放在最后"""
+    if column_type.startswith(('INT', 'DECIMAL')):
+        return 0
+    if column_type.startswith('VARCHAR'):
+        length = int(column_type[len('VARCHAR('):-1])
+        return 1 if length <= 64 else 2
+    return 3
 
 def create_table(cursor):
     """创建数据表"""
-    # 创建简化表结构，只包含主要字段
-    create_table_sql = """
+    # 已存在的旧表（未压缩行格式）先删除重建；导入前本就会清空数据
+    cursor.execute("""
+        SELECT row_format FROM information_schema.TABLES
+        WHERE table_schema = DATABASE() AND table_name = 'data'
+    """)
+    existing = cursor.fetchone()
+    if existing and str(existing[0]).lower() != 'compressed':
+        cursor.execute("DROP TABLE IF EXISTS data")
+        logger.info("♻️ 旧表结构已删除，按新的列布局重建")
+    
+    # 创建简化表结构，只包含主要字段；列按定长数值 -> VARCHAR -> TEXT 排列，
+    # 配合压缩行格式减少行宽和页外指针（插入时显式列出字段，与声明顺序无关）
+    ordered = sorted(DATA_TABLE_COLUMNS, key=lambda col: _column_layout_rank(col[1]))
+    column_defs = ',\n        '.join(f"{name} {column_type}" for name, column_type in ordered)
+    create_table_sql = f"""
     CREATE TABLE IF NOT EXISTS data (
         id INT AUTO_INCREMENT PRIMARY KEY,
-        feature_name VARCHAR(255),
-        Title TEXT,
-        Author VARCHAR(500),
-        SCI VARCHAR(100),
-        Journal_or_Conference_name VARCHAR(500),
-        Year INT,
-        No_field VARCHAR(100),
-        no_field_secondary VARCHAR(100),
-        Fiber_type VARCHAR(200),
-        Fiber_type_detail VARCHAR(500),
-        Matrix_type VARCHAR(200),
-        Matrix_type_detail VARCHAR(500),
-        glass_transition_temperature DECIMAL(10,3),
-        glass_transition_temperature_run_2 DECIMAL(10,3),
-        cure_ratio DECIMAL(10,3),
-        Fiber_content_weight DECIMAL(10,3),
-        Fiber_content_volume DECIMAL(10,3),
-        Void_content DECIMAL(10,3),
-        diameter DECIMAL(10,3),
-        average_area DECIMAL(10,3),
-        nominal_area DECIMAL(10,3),
-        rib VARCHAR(100),
-        surface_treatment VARCHAR(200),
-        Water_absorption_at_saturation DECIMAL(10,3),
-        Water_absorption_test_standard VARCHAR(200),
-        Water_absorption_note TEXT,
-        Brand_name VARCHAR(200),
-        Manufacturer VARCHAR(200),
-        Important_notes TEXT,
-        Notes_of_rebar TEXT,
-        Target_parameter VARCHAR(100),
-        note_of_target_parameter TEXT,
-        num_1 DECIMAL(10,3),
-        note_of_number TEXT,
-        Value1_1 DECIMAL(10,3),
-        COV1_1 DECIMAL(10,3),
-        note_of_Value1 TEXT,
-        Value2_1 DECIMAL(10,3),
-        COV2_1 DECIMAL(10,3),
-        Value2note_1 TEXT,
-        Value3_1 DECIMAL(10,3),
-        COV3_1 DECIMAL(10,3),
-        Value3note_1 TEXT,
-        SEM_T_BCBT VARCHAR(100),
-        SEM_L_BCBT VARCHAR(100),
-        OTHER_main VARCHAR(200),
-        OTHER1_1 VARCHAR(200),
-        FTIR_1 VARCHAR(200),
-        note_1 TEXT,
-        temperature DECIMAL(10,3),
-        note_of_temperature TEXT,
-        time_field DECIMAL(10,3),
-        note_of_time TEXT,
-        concrete VARCHAR(200),
-        pH_of_concrete DECIMAL(10,3),
-        strength_of_concrete DECIMAL(10,3),
-        crack VARCHAR(100),
-        cover DECIMAL(10,3),
-        note_of_concrete TEXT,
-        pH_1 DECIMAL(10,3),
-        pHafter DECIMAL(10,3),
-        ingredient_1 VARCHAR(200),
-        pH_2 DECIMAL(10,3),
-        RH_1 DECIMAL(10,3),
-        ingredient_2 VARCHAR(200),
-        note_2 TEXT,
-        Location VARCHAR(200),
-        Effektive_Klimaklassifikation VARCHAR(200),
-        field_average_humidity DECIMAL(10,3),
-        field_average_temperature DECIMAL(10,3),
-        pH_2_additional DECIMAL(10,3),
-        Ingrediant_additional VARCHAR(200),
-        number_field VARCHAR(100),
-        type_field VARCHAR(100),
-        SolutionorMoisture VARCHAR(200),
-        cycle_pH DECIMAL(10,3),
-        cycle_pH_after DECIMAL(10,3),
+        {column_defs},
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    ) ENGINE=InnoDB ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
     cursor.execute(create_table_sql)
     logger.info("✅ 数据表结构创建/验证完成")
 
-def insert_data(df):
-    """插入数据到MySQL"""
+def open_adbc_connection():
+    """打开ADBC连接，驱动未安装或连接失败时返回None"""
+    if not ADBC_AVAILABLE:
+        return None
+    cfg = get_db_config()
+    uri = (f"mysql://{quote(cfg['user'], safe='')}:{quote(cfg['password'], safe='')}"
+           f"@{cfg['host']}:{cfg['port']}/{cfg['database']}")
+    try:
+        return adbc_mysql.connect(uri=uri)
+    except Exception as e:
+        logger.warning(f"ADBC连接失败，改用LOAD DATA/INSERT: {e}")
+        return None
+
+def adbc_ingest(adbc_conn, rows_df, columns, table='data'):
+    """通过ADBC将数据块以Arrow列式格式直接写入，失败时返回None"""
+    frame = rows_df.set_axis(columns, axis=1)
+    arrow_table = pa.Table.from_pandas(frame, preserve_index=False)
+    # 整列为空的字段推断为null类型，统一按字符串写入
+    arrow_table = arrow_table.cast(pa.schema([
+        field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+        for field in arrow_table.schema
+    ]))
+    try:
+        with adbc_conn.cursor() as cur:
+            loaded = cur.adbc_ingest(table, arrow_table, mode='append')
+        adbc_conn.commit()
+        return loaded
+    except Exception as e:
+        adbc_conn.rollback()
+        logger.warning(f"ADBC写入失败，改用LOAD DATA/INSERT: {e}")
+        return None
+
+def estimate_batch_size(cursor, data_rows, sample_size=100):
+    """根据 max_allowed_packet 和样本行大小估算每批插入行数"""
+    cursor.execute("SELECT @@max_allowed_packet")
+    max_packet = cursor.fetchone()[0]
+    
+    sample = data_rows[:sample_size]
+    avg_row_bytes = max(1, sum(len(str(row)) for row in sample) // max(1, len(sample)))
+    return int(max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, max_packet // (avg_row_bytes * 1.2))))
+
+def prepare_rows(df, n_columns):
+    """向量化清理数据块，返回只含前 n_columns 列、空值为None的object DataFrame"""
+    # Categorical/Arrow字符串/数值列统一转为object（MySQL驱动无法绑定这些扩展类型）
+    sub = df.iloc[:, :n_columns]
+    text_cols = sub.select_dtypes(include=['object', 'category', 'string']).columns
+    sub = sub.astype(object)
+    if len(text_cols):
+        # 非字符串值（.str得到NaN）保留原值
+        stripped = sub[text_cols].apply(lambda s: s.str.strip())
+        stripped = stripped.where(stripped.notna(), sub[text_cols])
+        sub[text_cols] = stripped.where(~stripped.isin(list(NULL_STRINGS)), None)
+    sub = sub.where(pd.notna(sub), None)
+    
+    # 列数不足时以None补齐
+    for i in range(sub.shape[1], n_columns):
+        sub[f'_missing_{i}'] = None
+    
+    return sub
+
+def insert_rows(cursor, query, data_rows, batch_size):
+    """分批 executemany 插入，返回成功插入的行数（不提交事务）"""
+    # executemany 会合并为单条多行INSERT，失败时整批不生效，
+    # 因此只需缩小批次重试：减半直到 MIN_BATCH_SIZE，再逐行定位问题行
+    total_rows = len(data_rows)
+    inserted = 0
+    i = 0
+    size = batch_size
+    while i < total_rows:
+        batch = data_rows[i:i + size]
+        try:
+            cursor.executemany(query, batch)
+            i += len(batch)
+            inserted += len(batch)
+        except Error as batch_error:
+            if size > MIN_BATCH_SIZE:
+                size = max(MIN_BATCH_SIZE, size // 2)
+                logger.warning(f"批次插入失败，缩小批次到 {size} 行重试: {batch_error}")
+            elif size > 1:
+                size = 1
+                logger.warning(f"批次插入失败，尝试单行插入: {batch_error}")
+            else:
+                logger.error(f"单行插入失败 (块内第 {i+1} 行): {batch_error}")
+                i += 1
+                size = batch_size
+    return inserted
+
+def insert_data(chunks):
+    """将清理后的数据块逐块插入MySQL，每块提交一次"""
+    connection = None
+    cursor = None
+    adbc_conn = None
     try:
-        db_config = get_db_config()
-        connection = mysql.connector.connect(**db_config)
+        connection = get_connection_pool().get_connection()
         cursor = connection.cursor()
         
         # 创建表（如果不存在）
@@ -366,81 +498,73 @@ def insert_data(df):
         connection.commit()
         logger.info("🧹 已清空表 data，准备插入新数据")
         
-        # 使用简化的字段列表（前70个主要字段）
-        main_columns = MYSQL_COLUMNS[:70]  # 只使用前70个主要字段
-        columns_str = ', '.join([f"`{col}`" for col in main_columns])
-        placeholders = ', '.join(['%s'] * len(main_columns))
-        query = f"INSERT INTO data ({columns_str}) VALUES ({placeholders})"
-        
-        logger.info(f"📝 准备插入 {len(main_columns)} 个字段到 {len(df)} 行数据")
+        logger.info(f"📝 准备逐块插入 {len(MAIN_COLUMNS)} 个字段")
         
-        # 准备数据
-        data_rows = []
-        for _, row in df.iterrows():
-            row_data = []
-            for i in range(len(main_columns)):
-                if i < len(row):
-                    value = row.iloc[i]
-                    
-                    if pd.isna(value) or value is None:
-                        row_data.append(None)
-                    elif isinstance(value, (int, float)) and not np.isnan(value):
-                        row_data.append(value)
-                    else:
-                        str_value = str(value).strip()
-                        if str_value in ['nan', 'None', 'NULL', '', 'SMD', 'Notreported']:
-                            row_data.append(None)
-                        else:
-                            row_data.append(str_value)
-                else:
-                    row_data.append(None)
-            
-            data_rows.append(tuple(row_data))
-        
-        # 批量插入
-        batch_size = 500
-        total_rows = len(data_rows)
+        adbc_conn = open_adbc_connection()
+        use_infile = True
+        batch_size = None
         inserted = 0
         
-        logger.info(f"🚀 开始插入 {total_rows} 行数据...")
-        
-        for i in range(0, total_rows, batch_size):
-            batch = data_rows[i:i + batch_size]
-            try:
-                cursor.executemany(query, batch)
-                connection.commit()
-                inserted += len(batch)
-                
-                progress = (inserted / total_rows) * 100
-                logger.info(f"📊 进度: {inserted}/{total_rows} ({progress:.1f}%)")
-                
-            except Error as batch_error:
-                logger.warning(f"批次插入失败，尝试单行插入: {batch_error}")
-                connection.rollback()
-                
-                for j, row in enumerate(batch):
-                    try:
-                        cursor.execute(query, row)
+        for df in chunks:
+            sub = prepare_rows(df, len(MAIN_COLUMNS))
+            
+            # 已安装ADBC驱动时直接写入Arrow数据，不经过Python逐行元组
+            if adbc_conn is not None:
+                loaded = adbc_ingest(adbc_conn, sub, MAIN_COLUMNS)
+                if loaded is not None:
+                    inserted += loaded
+                    logger.info(f"📊 ADBC 进度: 已插入 {inserted} 行")
+                    continue
+                adbc_conn.close()
+                adbc_conn = None
+            
+            # 优先整块LOAD DATA，一次往返完成导入；服务器不支持时后续块直接走INSERT
+            if use_infile:
+                try:
+                    loaded = load_data_infile(cursor, sub, 'data', MAIN_COLUMNS)
+                except LoadDataError as e:
+                    # LOAD DATA会静默转换坏值，回滚后本块改用INSERT，由严格模式逐行拒绝问题行
+                    connection.rollback()
+                    logger.warning(f"⚠️ {e}，本块改用批量INSERT")
+                else:
+                    if loaded is not None:
                         connection.commit()
-                        inserted += 1
-                    except Error as single_error:
-                        logger.error(f"单行插入失败 (行 {i+j+1}): {single_error}")
+                        inserted += loaded
+                        logger.info(f"📊 LOAD DATA 进度: 已插入 {inserted} 行")
+                        continue
+                    use_infile = False
+            
+            # 整块转为object二维数组后按行取出，不再逐行构造Series或逐列zip
+            data_rows = sub.to_numpy(dtype=object).tolist()
+            if batch_size is None:
+                # 按 max_allowed_packet 估算批大小
+                batch_size = estimate_batch_size(cursor, data_rows)
+                logger.info(f"🚀 使用批量INSERT (批大小 {batch_size})")
+            
+            inserted += insert_rows(cursor, INSERT_SQL, data_rows, batch_size)
+            connection.commit()
+            logger.info(f"📊 进度: 已插入 {inserted} 行")
         
         logger.info(f"✅ 数据插入完成！共插入 {inserted} 行")
-        
-        cursor.close()
-        connection.close()
         return inserted > 0
         
-    except Error as e:
+    except Exception as e:
+        # 数据库错误和Excel读取中途的错误都按插入失败处理
         logger.error(f"❌ 数据插入失败: {e}")
         return False
+    finally:
+        # 出错时同样关闭ADBC连接，并把连接归还连接池
+        if adbc_conn is not None:
+            adbc_conn.close()
+        if cursor is not None:
+            cursor.close()
+        if connection is not None:
+            connection.close()
 
 def verify_data():
     """验证插入的数据"""
     try:
-        db_config = get_db_config()
-        connection = mysql.connector.connect(**db_config)
+        connection = get_connection_pool().get_connection()
         cursor = connection.cursor()
         
         cursor.execute("SELECT COUNT(*) FROM data")
@@ -522,19 +646,13 @@ def main():
         show_env_setup_guide()
         return
     
-    # 步骤3: 读取Excel
-    logger.info("步骤3: 读取Excel数据 (Database 4.xlsx)")
-    df = read_excel_data()
-    if df is None:
-        return
-    
-    # 步骤4: 清理数据
-    logger.info("步骤4: 清理数据")
-    df_clean = clean_data(df)
-    
-    # 步骤5: 插入数据
-    logger.info("步骤5: 插入数据到MySQL")
-    if not insert_data(df_clean):
+    # 步骤3-5: 分块读取Excel -> 清理 -> 插入MySQL（流水线，内存中只保留一块数据）
+    logger.info("步骤3-5: 分块读取Excel数据 (Database 4.xlsx)、清理并插入MySQL")
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = (clean_data_parallel(df, executor, workers) for df in read_excel_data())
+        inserted_ok = insert_data(chunks)
+    if not inserted_ok:
         logger.error("❌ 数据插入失败")
         return
     
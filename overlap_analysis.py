@@ -4,191 +4,208 @@
 详细分析 app.py 和 platform code.py 的功能重叠情况
 """
 
+import io
+import sys
+
+# 重叠功能分析
+OVERLAP_ANALYSIS = {
+    'core_ml_features': {
+        'description': '核心机器学习功能',
+        'overlap_level': '95%',
+        'shared_components': [
+            '• FRPDataPreprocessor 类 - 几乎完全相同',
+            '• 特征工程算法 - 相同的13特征处理逻辑',
+            '• 机器学习模型 - RandomForest, XGBoost, LightGBM',
+            '• SHAP 可解释性分析 - 相同的实现',
+            '• 数据预处理流程 - 相同的清理和标准化',
+            '• 预测功能 - 相同的预测算法'
+        ]
+    },
+    'data_processing': {
+        'description': '数据处理功能',
+        'overlap_level': '90%',
+        'shared_components': [
+            '• 数据库连接和查询 - 相同的 SQLAlchemy 实现',
+            '• 数据缓存机制 - 相似的缓存策略',
+            '• 数据验证和清理 - 相同的验证逻辑',
+            '• 特征选择算法 - 相同的选择策略'
+        ]
+    },
+    'ui_components': {
+        'description': '用户界面组件',
+        'overlap_level': '70%',
+        'shared_components': [
+            '• Streamlit 基础组件 - 相同的表单和图表',
+            '• 数据可视化 - 相似的 Plotly 图表',
+            '• 结果展示 - 相同的结果显示格式',
+            '• 模型评估界面 - 相似的评估指标展示'
+        ]
+    },
+    'utility_functions': {
+        'description': '工具函数',
+        'overlap_level': '80%',
+        'shared_components': [
+            '• 数据库配置函数 - 完全相同',
+            '• 错误处理机制 - 相同的异常处理',
+            '• 日志记录功能 - 相似的日志实现',
+            '• 数据格式化函数 - 相同的格式化逻辑'
+        ]
+    }
+}
+
+# 各文件独有功能
+UNIQUE_FEATURES = {
+    'app_py_unique': {
+        'description': 'app.py 独有功能',
+        'features': [
+            '• 简洁的单用户界面设计',
+            '• 轻量级的模型训练流程',
+            '• 快速原型开发支持',
+            '• 研究导向的数据探索工具',
+            '• 简化的配置管理'
+        ],
+        'advantages': [
+            '✅ 启动速度快',
+            '✅ 资源消耗低',
+            '✅ 易于调试和修改',
+            '✅ 适合单人使用'
+        ]
+    },
+    'platform_code_unique': {
+        'description': 'platform code.py 独有功能',
+        'features': [
+            '• 用户认证和权限管理系统',
+            '• 数据变更审批流程',
+            '• 高级模型缓存管理 (ModelCacheManager)',
+            '• 操作日志和审计功能',
+            '• 邮件通知系统',
+            '• IP访问控制',
+            '• 数据版本控制',
+            '• 企业级UI/UX设计',
+            '• 多用户协作支持',
+            '• 数据安全和备份机制'
+        ],
+        'advantages': [
+            '✅ 企业级安全性',
+            '✅ 多用户协作',
+            '✅ 完整的审计追踪',
+            '✅ 高级缓存优化',
+            '✅ 生产环境就绪'
+        ]
+    }
+}
+
+# 代码冗余程度
+REDUNDANCY_METRICS = {
+    'estimated_overlap': {
+        'total_overlap_percentage': '75-80%',
+        'core_algorithms': '95%',
+        'ui_components': '70%',
+        'data_processing': '90%',
+        'utility_functions': '85%'
+    },
+    'redundant_components': [
+        'FRPDataPreprocessor 类 (几乎完全重复)',
+        '特征工程函数 (完全相同)',
+        '数据库连接代码 (完全相同)',
+        'SHAP 分析代码 (完全相同)',
+        '预测算法 (完全相同)',
+        '数据可视化函数 (高度相似)'
+    ],
+    'maintenance_impact': {
+        'issues': [
+            '❌ 代码维护工作量翻倍',
+            '❌ Bug修复需要在两处进行',
+            '❌ 新功能开发成本增加',
+            '❌ 版本同步困难',
+            '❌ 测试覆盖率需求增加'
+        ]
+    }
+}
+
+# 决策矩阵的行模板（表头和各行共用）
+DECISION_ROW_TEMPLATE = "{scenario:<15} {app_py:<20} {platform_code:<20} {recommendation:<15}"
+
 def analyze_code_overlap():
     """分析两个文件的功能重叠"""
     
     print("🔍 app.py 和 platform code.py 功能重叠分析")
     print("=" * 80)
     
-    # 重叠功能分析
-    overlap_analysis = {
-        'core_ml_features': {
-            'description': '核心机器学习功能',
-            'overlap_level': '95%',
-            'shared_components': [
-                '• FRPDataPreprocessor 类 - 几乎完全相同',
-                '• 特征工程算法 - 相同的13特征处理逻辑',
-                '• 机器学习模型 - RandomForest, XGBoost, LightGBM',
-                '• SHAP 可解释性分析 - 相同的实现',
-                '• 数据预处理流程 - 相同的清理和标准化',
-                '• 预测功能 - 相同的预测算法'
-            ]
-        },
-        'data_processing': {
-            'description': '数据处理功能',
-            'overlap_level': '90%',
-            'shared_components': [
-                '• 数据库连接和查询 - 相同的 SQLAlchemy 实现',
-                '• 数据缓存机制 - 相似的缓存策略',
-                '• 数据验证和清理 - 相同的验证逻辑',
-                '• 特征选择算法 - 相同的选择策略'
-            ]
-        },
-        'ui_components': {
-            'description': '用户界面组件',
-            'overlap_level': '70%',
-            'shared_components': [
-                '• Streamlit 基础组件 - 相同的表单和图表',
-                '• 数据可视化 - 相似的 Plotly 图表',
-                '• 结果展示 - 相同的结果显示格式',
-                '• 模型评估界面 - 相似的评估指标展示'
-            ]
-        },
-        'utility_functions': {
-            'description': '工具函数',
-            'overlap_level': '80%',
-            'shared_components': [
-                '• 数据库配置函数 - 完全相同',
-                '• 错误处理机制 - 相同的异常处理',
-                '• 日志记录功能 - 相似的日志实现',
-                '• 数据格式化函数 - 相同的格式化逻辑'
-            ]
-        }
-    }
-    
-    return overlap_analysis
+    return OVERLAP_ANALYSIS
 
 def analyze_unique_features():
     """分析每个文件独有的功能"""
-    
-    unique_features = {
-        'app_py_unique': {
-            'description': 'app.py 独有功能',
-            'features': [
-                '• 简洁的单用户界面设计',
-                '• 轻量级的模型训练流程',
-                '• 快速原型开发支持',
-                '• 研究导向的数据探索工具',
-                '• 简化的配置管理'
-            ],
-            'advantages': [
-                '✅ 启动速度快',
-                '✅ 资源消耗低',
-                '✅ 易于调试和修改',
-                '✅ 适合单人使用'
-            ]
-        },
-        'platform_code_unique': {
-            'description': 'platform code.py 独有功能',
-            'features': [
-                '• 用户认证和权限管理系统',
-                '• 数据变更审批流程',
-                '• 高级模型缓存管理 (ModelCacheManager)',
-                '• 操作日志和审计功能',
-                '• 邮件通知系统',
-                '• IP访问控制',
-                '• 数据版本控制',
-                '• 企业级UI/UX设计',
-                '• 多用户协作支持',
-                '• 数据安全和备份机制'
-            ],
-            'advantages': [
-                '✅ 企业级安全性',
-                '✅ 多用户协作',
-                '✅ 完整的审计追踪',
-                '✅ 高级缓存优化',
-                '✅ 生产环境就绪'
-            ]
-        }
-    }
-    
-    return unique_features
+    return UNIQUE_FEATURES
 
 def calculate_code_redundancy():
     """计算代码冗余程度"""
-    
-    redundancy_metrics = {
-        'estimated_overlap': {
-            'total_overlap_percentage': '75-80%',
-            'core_algorithms': '95%',
-            'ui_components': '70%',
-            'data_processing': '90%',
-            'utility_functions': '85%'
-        },
-        'redundant_components': [
-            'FRPDataPreprocessor 类 (几乎完全重复)',
-            '特征工程函数 (完全相同)',
-            '数据库连接代码 (完全相同)',
-            'SHAP 分析代码 (完全相同)',
-            '预测算法 (完全相同)',
-            '数据可视化函数 (高度相似)'
-        ],
-        'maintenance_impact': {
-            'issues': [
-                '❌ 代码维护工作量翻倍',
-                '❌ Bug修复需要在两处进行',
-                '❌ 新功能开发成本增加',
-                '❌ 版本同步困难',
-                '❌ 测试覆盖率需求增加'
-            ]
-        }
-    }
-    
-    return redundancy_metrics
+    return REDUNDANCY_METRICS
 
 def print_overlap_analysis():
     """打印重叠分析结果"""
+    buf = io.StringIO()
     overlap = analyze_code_overlap()
     
     for category, info in overlap.items():
-        print(f"\n📊 {info['description']}")
-        print(f"   重叠程度: {info['overlap_level']}")
-        print(f"   共同组件:")
+        print(f"\n📊 {info['description']}", file=buf)
+        print(f"   重叠程度: {info['overlap_level']}", file=buf)
+        print(f"   共同组件:", file=buf)
         for component in info['shared_components']:
-            print(f"     {component}")
+            print(f"     {component}", file=buf)
+    
+    # 一次性写出，避免逐行print
+    sys.stdout.write(buf.getvalue())
 
 def print_unique_features():
     """打印独有功能分析"""
+    buf = io.StringIO()
     unique = analyze_unique_features()
     
-    print(f"\n\n🎯 独有功能对比")
-    print("=" * 80)
+    print(f"\n\n🎯 独有功能对比", file=buf)
+    print("=" * 80, file=buf)
     
     for file_key, info in unique.items():
-        print(f"\n{'app.py' if 'app' in file_key else 'platform code.py'} 独有功能:")
-        print(f"   {info['description']}")
+        print(f"\n{'app.py' if 'app' in file_key else 'platform code.py'} 独有功能:", file=buf)
+        print(f"   {info['description']}", file=buf)
         
-        print(f"\n   独特功能:")
+        print(f"\n   独特功能:", file=buf)
         for feature in info['features']:
-            print(f"     {feature}")
+            print(f"     {feature}", file=buf)
         
-        print(f"\n   优势:")
+        print(f"\n   优势:", file=buf)
         for advantage in info['advantages']:
-            print(f"     {advantage}")
+            print(f"     {advantage}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
 def print_redundancy_analysis():
     """打印冗余分析"""
+    buf = io.StringIO()
     redundancy = calculate_code_redundancy()
     
-    print(f"\n\n⚠️ 代码冗余分析")
-    print("=" * 80)
+    print(f"\n\n⚠️ 代码冗余分析", file=buf)
+    print("=" * 80, file=buf)
     
-    print(f"\n📈 重叠程度评估:")
+    print(f"\n📈 重叠程度评估:", file=buf)
     for metric, percentage in redundancy['estimated_overlap'].items():
-        print(f"   • {metric}: {percentage}")
+        print(f"   • {metric}: {percentage}", file=buf)
     
-    print(f"\n🔄 主要冗余组件:")
+    print(f"\n🔄 主要冗余组件:", file=buf)
     for component in redundancy['redundant_components']:
-        print(f"   • {component}")
+        print(f"   • {component}", file=buf)
     
-    print(f"\n💼 维护成本影响:")
+    print(f"\n💼 维护成本影响:", file=buf)
     for issue in redundancy['maintenance_impact']['issues']:
-        print(f"   {issue}")
+        print(f"   {issue}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
 def suggest_optimization_strategies():
     """建议优化策略"""
-    print(f"\n\n💡 优化建议")
-    print("=" * 80)
+    buf = io.StringIO()
+    print(f"\n\n💡 优化建议", file=buf)
+    print("=" * 80, file=buf)
     
     strategies = [
         {
@@ -241,14 +258,17 @@ def suggest_optimization_strategies():
     ]
     
     for strategy in strategies:
-        print(f"\n{strategy['strategy']}:")
+        print(f"\n{strategy['strategy']}:", file=buf)
         for option in strategy['options']:
-            print(f"   {option}")
+            print(f"   {option}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
 def analyze_decision_matrix():
     """分析决策矩阵"""
-    print(f"\n\n🤔 使用场景决策矩阵")
-    print("=" * 80)
+    buf = io.StringIO()
+    print(f"\n\n🤔 使用场景决策矩阵", file=buf)
+    print("=" * 80, file=buf)
     
     decision_factors = [
         {
@@ -283,11 +303,12 @@ def analyze_decision_matrix():
         }
     ]
     
-    print(f"{'场景':<15} {'app.py':<20} {'platform_code.py':<20} {'建议':<15}")
-    print("-" * 75)
+    header = {'scenario': '场景', 'app_py': 'app.py', 'platform_code': 'platform_code.py', 'recommendation': '建议'}
+    print(DECISION_ROW_TEMPLATE.format_map(header), file=buf)
+    print("-" * 75, file=buf)
+    print("\n".join(map(DECISION_ROW_TEMPLATE.format_map, decision_factors)), file=buf)
     
-    for factor in decision_factors:
-        print(f"{factor['scenario']:<15} {factor['app_py']:<20} {factor['platform_code']:<20} {factor['recommendation']:<15}")
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     print_overlap_analysis()
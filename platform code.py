@@ -34,6 +34,13 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import plotly.express as px
 
+# 可选：pyarrow 用于research_data的本地Parquet缓存，未安装时每次冷启动都查询数据库
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # ——————————————————————————————
 # Global Functions for Model Training (pickle-safe)
 # ——————————————————————————————
@@ -2076,6 +2083,15 @@ DB_PASSWORD = os.environ.get("DB_PASSWORD", "666666")  # MySQL password
 DB_HOST = os.environ.get("DB_HOST", "localhost")
 DB_NAME = os.environ.get("DB_NAME", "haigui_database")
 
+# research_data本地Parquet缓存目录（按表指纹命名，表更新后自动失效）
+DATA_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_cache")
+
+# 已训练模型的本地磁盘缓存目录（按model_key和数据库中的updated_at命名，数据库仍为主存储）
+MODEL_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model_cache")
+
+# 本地磁盘最多保留的模型文件数，超出时删除最久未使用的
+MODEL_CACHE_MAX_FILES = 20
+
 # Create database engine (using connection pool)
 @st.cache_resource
 def get_db_engine():
@@ -2784,6 +2800,42 @@ class ModelCacheManager:
         except Exception as e:
             st.warning(f"Model cache table initialization failed: {e}")
     
+    def _disk_cache_path(self, model_key, updated_at):
+        """模型在本地磁盘缓存中的路径（文件名包含数据库记录的updated_at，记录更新后旧文件不再命中）"""
+        stamp = updated_at.strftime("%Y%m%d%H%M%S") if hasattr(updated_at, "strftime") else str(updated_at)
+        stamp = "".join(ch for ch in stamp if ch.isalnum())
+        return os.path.join(MODEL_CACHE_DIR, f"{model_key}_{stamp}.pkl")
+    
+    def _remove_disk_cache(self, model_key=None, keep_path=None):
+        """删除指定模型（或全部模型）的本地磁盘缓存，keep_path 指定的文件保留"""
+        if not os.path.isdir(MODEL_CACHE_DIR):
+            return
+        for name in os.listdir(MODEL_CACHE_DIR):
+            if not name.endswith(".pkl"):
+                continue
+            if model_key is not None and not name.startswith(f"{model_key}_"):
+                continue
+            path = os.path.join(MODEL_CACHE_DIR, name)
+            if path == keep_path:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _trim_disk_cache(self):
+        """模型文件数超过 MODEL_CACHE_MAX_FILES 时删除最久未使用的文件"""
+        try:
+            paths = [os.path.join(MODEL_CACHE_DIR, name) for name in os.listdir(MODEL_CACHE_DIR) if name.endswith(".pkl")]
+            paths.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for path in paths[MODEL_CACHE_MAX_FILES:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def _generate_model_key(self, model_name, target_variable, data_hash, evaluation_strategy):
         """生成模型的唯一标识key"""
         import hashlib
@@ -2876,18 +2928,43 @@ class ModelCacheManager:
                     })
                 
                 conn.commit()
-                return model_key
+            
+            # 数据库记录已更新，旧的磁盘缓存作废，下次加载时重新写入
+            self._remove_disk_cache(model_key)
+            return model_key
                 
         except Exception as e:
             st.error(f"Failed to save model: {e}")
             return None
     
     def load_model(self, model_key):
-        """根据model_key加载模型"""
+        """根据model_key加载模型（数据库记录未更新时读取本地磁盘缓存，避免从数据库拉取整个模型）"""
         try:
             import pickle
             import json
             
+            # 先只查询updated_at：其他进程/实例重新训练会覆盖数据库记录，磁盘缓存需随之失效
+            with self.engine.connect() as conn:
+                updated_at = conn.execute(
+                    text(f"SELECT updated_at FROM {self.cache_table_name} WHERE model_key = :model_key"),
+                    {"model_key": model_key}
+                ).scalar()
+            if updated_at is None:
+                self._remove_disk_cache(model_key)
+                return None
+            
+            disk_path = self._disk_cache_path(model_key, updated_at)
+            if os.path.exists(disk_path):
+                try:
+                    with open(disk_path, "rb") as f:
+                        cached_model = pickle.load(f)
+                    # 更新修改时间，供按最近使用顺序清理
+                    os.utime(disk_path)
+                    return cached_model
+                except Exception:
+                    # 缓存文件损坏时删除并回退到数据库
+                    self._remove_disk_cache(model_key)
+            
             query = f"""
             SELECT model_name, target_variable, evaluation_strategy, model_data, 
                    best_params, evaluation_results, feature_info, preprocessing_info, 
@@ -2903,7 +2980,7 @@ class ModelCacheManager:
                     # 反序列化模型
                     model_data = pickle.loads(base64.b64decode(result[3].encode()))
                     
-                    return {
+                    cached_model = {
                         'model_name': result[0],
                         'target_variable': result[1],
                         'evaluation_strategy': result[2],
@@ -2916,6 +2993,19 @@ class ModelCacheManager:
                         'created_at': result[9],
                         'updated_at': result[10]
                     }
+                    
+                    try:
+                        # 以本次读取到的updated_at命名，并删除该模型的旧版本文件
+                        disk_path = self._disk_cache_path(model_key, cached_model['updated_at'])
+                        os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+                        with open(disk_path, "wb") as f:
+                            pickle.dump(cached_model, f, protocol=pickle.HIGHEST_PROTOCOL)
+                        self._remove_disk_cache(model_key, keep_path=disk_path)
+                        self._trim_disk_cache()
+                    except Exception as e:
+                        print(f"Failed to write model disk cache: {e}")
+                    
+                    return cached_model
                 
         except Exception as e:
             st.error(f"Failed to load model: {e}")
@@ -2970,6 +3060,7 @@ class ModelCacheManager:
             with self.engine.begin() as conn:
                 query = f"DELETE FROM {self.cache_table_name} WHERE model_key = :model_key"
                 result = conn.execute(text(query), {"model_key": model_key})
+                self._remove_disk_cache(model_key)
                 return result.rowcount
                 
         except Exception as e:
@@ -3009,6 +3100,7 @@ class ModelCacheManager:
                 query = f"DELETE FROM {self.cache_table_name}"
                 result = conn.execute(text(query))
                 deleted_count = result.rowcount
+                self._remove_disk_cache()
                 
                 # 清除streamlit session state中的相关缓存
                 if "model_cache_manager" in st.session_state:
@@ -3054,6 +3146,8 @@ class ModelCacheManager:
                     
                     st.info(f"已删除 {total_deleted} 个模型...")
             
+            self._remove_disk_cache()
+            
             # 清除streamlit session state中的相关缓存
             if "model_cache_manager" in st.session_state:
                 del st.session_state["model_cache_manager"]
@@ -3182,12 +3276,32 @@ class ModelCacheManager:
             st.warning(f"Failed to get model key: {e}")
             return None
 
+def _hash_dataframe(df):
+    """按列名和全部单元格内容计算DataFrame摘要，作为特征工程缓存的key"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("|".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df).values.tobytes())
+    return digest.digest()
+
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_dataframe}, max_entries=4)
+def _cached_selected_features(_processor, df):
+    """数据未变化时直接复用特征工程结果（_processor不参与哈希）"""
+    return _processor._create_selected_features(df)
+
 class FRPDataPreprocessor:
     """
     Improved FRP data preprocessor
     Based on reference code data processing methods, integrated into main application
     """
     
+    # Keyword tables used by _process_ph_and_chloride for every row
+    CONCRETE_ENV_KEYWORDS = ('concrete', 'cover', 'crack', 'cement', 'mortar')
+    CONCRETE_COLUMNS = ('concrete', 'crack', 'cover', 'cement')
+    PH_COLUMNS = ('pH_1', 'pH', 'ph', 'PH')
+    WATER_TYPES = ('tap water', 'sea water', 'seawater', 'distilled water',
+                   'deionized water', 'di water', 'pure water')
+    CHLORIDE_KEYWORDS = ('cl', 'chloride', 'nacl', 'cacl2', 'mgcl2', 'salt')
+    
     def __init__(self, engine):
         self.engine = engine
         self.data_ori = None
@@ -3448,7 +3562,12 @@ class FRPDataPreprocessor:
         """
         Create selected_feature sub-table based on reference code
         Construct 13 key features for model training
+        Results are memoized on the content of df across reruns
         """
+        return _cached_selected_features(self, df)
+    
+    def _create_selected_features(self, df):
+        """Uncached feature engineering behind create_selected_features"""
         st.info("Creating selected_feature features...")
         
         # First preserve original important columns
@@ -3472,31 +3591,37 @@ class FRPDataPreprocessor:
         
         progress_bar = st.progress(0)
         
-        for i, idx in enumerate(df.index):
+        # Read each column's array once; the per-row steps below index these arrays
+        # instead of going through df.loc, and write into per-feature output arrays
+        cols = {col: df[col].to_numpy() for col in df.columns}
+        output_columns = feature_columns + (['Target_parameter'] if 'Target_parameter' in df.columns else [])
+        out = {col: df[col].to_numpy(dtype=object, copy=True) for col in output_columns}
+        
+        for i in range(length):
             try:
                 # 1. pH processing (based on solution_condition)
-                self._process_ph_and_chloride(df, idx)
+                self._process_ph_and_chloride(cols, out, i)
                 
                 # 2. Concrete indicator
-                self._process_concrete_indicator(df, idx)
+                self._process_concrete_indicator(cols, out, i)
                 
                 # 3. Diameter processing
-                self._process_diameter(df, idx)
+                self._process_diameter(cols, out, i)
                 
                 # 4. Load processing
-                self._process_load(df, idx)
+                self._process_load(cols, out, i)
                 
                 # 5. Fiber content processing
-                self._process_fiber_content(df, idx)
+                self._process_fiber_content(cols, out, i)
                 
                 # 6. Fiber and matrix type encoding
-                self._process_material_types(df, idx)
+                self._process_material_types(cols, out, i)
                 
                 # 7. Surface treatment
-                self._process_surface_treatment(df, idx)
+                self._process_surface_treatment(cols, out, i)
                 
                 # 8. Other features (ensure not overwriting Target_parameter)
-                self._process_other_features(df, idx)
+                self._process_other_features(cols, out, i)
                 
                 # Update progress bar
                 if i % 1000 == 0:  # Update progress every 1000 rows
@@ -3505,6 +3630,14 @@ class FRPDataPreprocessor:
             except Exception as e:
                 continue
         
+        # Write all engineered features back in one pass, keeping each column's dtype where possible
+        for col, values in out.items():
+            values = pd.Series(values, index=df.index, name=col)
+            try:
+                df[col] = values.astype(df[col].dtype)
+            except (TypeError, ValueError):
+                df[col] = values
+        
         progress_bar.progress(1.0)
         
         # Verify if Target_parameter is preserved
@@ -3516,7 +3649,7 @@ class FRPDataPreprocessor:
         st.success("selected_feature feature creation completed")
         return df
     
-    def _process_ph_and_chloride(self, df, idx):
+    def _process_ph_and_chloride(self, cols, out, i):
         """
         Strictly process pH and chloride features according to paper requirements
         
@@ -3527,25 +3660,23 @@ class FRPDataPreprocessor:
         4. Consider pHafter for averaging
         """
         # Initialize
-        df.loc[idx, 'Chloride_ion'] = 0
+        out['Chloride_ion'][i] = 0
         final_ph = 7.0  # Default value
         
         # Step 1: Determine environment type
         is_concrete_environment = False
         
         # Check Condition_environment field
-        if 'Condition_environment' in df.columns:
-            condition_env = str(df.loc[idx, 'Condition_environment']).lower()
-            concrete_keywords = ['concrete', 'cover', 'crack', 'cement', 'mortar']
-            if any(keyword in condition_env for keyword in concrete_keywords):
+        if 'Condition_environment' in cols:
+            condition_env = str(cols['Condition_environment'][i]).lower()
+            if any(keyword in condition_env for keyword in self.CONCRETE_ENV_KEYWORDS):
                 is_concrete_environment = True
         
         # Backup check: if no Condition_environment, check concrete-related columns
         if not is_concrete_environment:
-            concrete_cols = ['concrete', 'crack', 'cover', 'cement']
-            for col in concrete_cols:
-                if col in df.columns:
-                    value = df.loc[idx, col]
+            for col in self.CONCRETE_COLUMNS:
+                if col in cols:
+                    value = cols[col][i]
                     if isinstance(value, str) or (isinstance(value, (int, float)) and not pd.isna(value)):
                         is_concrete_environment = True
                         break
@@ -3553,8 +3684,8 @@ class FRPDataPreprocessor:
         # Step 2: pH processing in concrete environment
         if is_concrete_environment:
             # Check pH_of_concrete
-            if 'pH_of_concrete' in df.columns:
-                ph_concrete = df.loc[idx, 'pH_of_concrete']
+            if 'pH_of_concrete' in cols:
+                ph_concrete = cols['pH_of_concrete'][i]
                 if isinstance(ph_concrete, (int, float)) and not pd.isna(ph_concrete):
                     final_ph = float(ph_concrete)
                 else:
@@ -3568,8 +3699,8 @@ class FRPDataPreprocessor:
             ph_found = False
             
             # Check pH field in solution_condition
-            if 'solution_condition' in df.columns:
-                solution_condition = df.loc[idx, 'solution_condition']
+            if 'solution_condition' in cols:
+                solution_condition = cols['solution_condition'][i]
                 # Try to extract pH value from solution_condition
                 if isinstance(solution_condition, (int, float)) and not pd.isna(solution_condition):
                     final_ph = float(solution_condition)
@@ -3577,10 +3708,9 @@ class FRPDataPreprocessor:
             
             # Backup: check pH_1 or pH-related fields
             if not ph_found:
-                ph_columns = ['pH_1', 'pH', 'ph', 'PH']
-                for ph_col in ph_columns:
-                    if ph_col in df.columns:
-                        ph_value = df.loc[idx, ph_col]
+                for ph_col in self.PH_COLUMNS:
+                    if ph_col in cols:
+                        ph_value = cols[ph_col][i]
                         if isinstance(ph_value, (int, float)) and not pd.isna(ph_value):
                             final_ph = float(ph_value)
                             ph_found = True
@@ -3590,119 +3720,116 @@ class FRPDataPreprocessor:
             if not ph_found:
                 # Check solution_condition text description
                 solution_text = ''
-                if 'solution_condition' in df.columns:
-                    solution_text = str(df.loc[idx, 'solution_condition']).lower()
+                if 'solution_condition' in cols:
+                    solution_text = str(cols['solution_condition'][i]).lower()
                 
                 # Backup: check ingredient_1
-                if not solution_text and 'ingredient_1' in df.columns:
-                    solution_text = str(df.loc[idx, 'ingredient_1']).lower()
+                if not solution_text and 'ingredient_1' in cols:
+                    solution_text = str(cols['ingredient_1'][i]).lower()
                 
                 # Assign value based on solution type
-                water_types = ['tap water', 'sea water', 'seawater', 'distilled water', 
-                              'deionized water', 'di water', 'pure water']
-                
-                if any(water_type in solution_text for water_type in water_types):
+                if any(water_type in solution_text for water_type in self.WATER_TYPES):
                     final_ph = 7.0
                     
                     # Special handling for seawater
                     if 'sea' in solution_text:
-                        df.loc[idx, 'Chloride_ion'] = 1
+                        out['Chloride_ion'][i] = 1
         
         # Step 4: Consider pHafter
-        if 'pHafter' in df.columns:
-            ph_after = df.loc[idx, 'pHafter']
+        if 'pHafter' in cols:
+            ph_after = cols['pHafter'][i]
             if isinstance(ph_after, (int, float)) and not pd.isna(ph_after):
                 final_ph = (final_ph + float(ph_after)) / 2.0
         
         # Set final pH value
-        df.loc[idx, 'pH_of_condition_enviroment'] = final_ph
+        out['pH_of_condition_enviroment'][i] = final_ph
         
         # Additional chloride ion check
-        if 'ingredient_1' in df.columns:
-            ingredient = str(df.loc[idx, 'ingredient_1']).lower()
-            chloride_keywords = ['cl', 'chloride', 'nacl', 'cacl2', 'mgcl2', 'salt']
-            if any(keyword in ingredient for keyword in chloride_keywords):
-                df.loc[idx, 'Chloride_ion'] = 1
+        if 'ingredient_1' in cols:
+            ingredient = str(cols['ingredient_1'][i]).lower()
+            if any(keyword in ingredient for keyword in self.CHLORIDE_KEYWORDS):
+                out['Chloride_ion'][i] = 1
     
-    def _process_concrete_indicator(self, df, idx):
+    def _process_concrete_indicator(self, cols, out, i):
         """Process concrete indicator"""
         concrete_indicator = 0
         
         # Check related columns
         concrete_cols = ['concrete', 'crack', 'cover']
         for col in concrete_cols:
-            if col in df.columns:
-                value = df.loc[idx, col]
+            if col in cols:
+                value = cols[col][i]
                 if isinstance(value, str) or (isinstance(value, (int, float)) and not pd.isna(value)):
                     concrete_indicator = 1
                     break
         
-        df.loc[idx, 'concrete'] = concrete_indicator
+        out['concrete'][i] = concrete_indicator
     
-    def _process_diameter(self, df, idx):
+    def _process_diameter(self, cols, out, i):
         """Process diameter features"""
         # Priority use of directly measured diameter
-        if 'diameter' in df.columns:
-            diameter_value = df.loc[idx, 'diameter']
+        if 'diameter' in cols:
+            diameter_value = cols['diameter'][i]
             if isinstance(diameter_value, (int, float)) and not pd.isna(diameter_value):
-                df.loc[idx, 'diameter'] = diameter_value
+                out['diameter'][i] = diameter_value
                 return
         
         # Calculate diameter from nominal area
-        if 'nominal_area' in df.columns:
-            area_value = df.loc[idx, 'nominal_area']
+        if 'nominal_area' in cols:
+            area_value = cols['nominal_area'][i]
             if isinstance(area_value, (int, float)) and not pd.isna(area_value) and area_value > 0:
                 calculated_diameter = 2 * np.sqrt(area_value / np.pi)
-                df.loc[idx, 'diameter'] = calculated_diameter
+                out['diameter'][i] = calculated_diameter
     
-    def _process_load(self, df, idx):
+    def _process_load(self, cols, out, i):
         """Process load features"""
         load_value = 0
         
         # Check preloading
-        if 'type_of_load' in df.columns:
-            if df.loc[idx, 'type_of_load'] == 'preloading':
-                df.loc[idx, 'load_value'] = 0
+        if 'type_of_load' in cols:
+            if cols['type_of_load'][i] == 'preloading':
+                out['load_value'][i] = 0
                 return
         
         # Process stress/strain
-        if 'stress_or_strain' in df.columns and 'value_load' in df.columns:
-            stress_strain = df.loc[idx, 'stress_or_strain']
-            value = df.loc[idx, 'value_load']
+        if 'stress_or_strain' in cols and 'value_load' in cols:
+            stress_strain = cols['stress_or_strain'][i]
+            value = cols['value_load'][i]
             
             if isinstance(value, (int, float)) and not pd.isna(value):
                 if stress_strain == 'stress':
                     # Stress case: need to divide by ultimate tensile strength
-                    if 'ultimate_tensile_strength' in df.columns:
-                        uts = df.loc[idx, 'ultimate_tensile_strength']
+                    if 'ultimate_tensile_strength' in cols:
+                        uts = cols['ultimate_tensile_strength'][i]
                         if isinstance(uts, (int, float)) and uts > 0:
                             load_value = value / uts
                 elif stress_strain == 'strain':
                     # Strain case: convert to relative stress
-                    if 'tensile_modulus' in df.columns and 'ultimate_tensile_strength' in df.columns:
-                        modulus = df.loc[idx, 'tensile_modulus']
-                        uts = df.loc[idx, 'ultimate_tensile_strength']
-                        if all(isinstance(x, (int, float)) and x > 0 for x in [modulus, uts]):
+                    if 'tensile_modulus' in cols and 'ultimate_tensile_strength' in cols:
+                        modulus = cols['tensile_modulus'][i]
+                        uts = cols['ultimate_tensile_strength'][i]
+                        if (isinstance(modulus, (int, float)) and modulus > 0
+                                and isinstance(uts, (int, float)) and uts > 0):
                             load_value = value * 0.001 * modulus / uts
         
-        df.loc[idx, 'load_value'] = load_value
+        out['load_value'][i] = load_value
     
-    def _process_fiber_content(self, df, idx):
+    def _process_fiber_content(self, cols, out, i):
         """Process fiber content features"""
         # Priority use of weight percentage
-        if 'Fiber_content_weight' in df.columns:
-            weight_content = df.loc[idx, 'Fiber_content_weight']
+        if 'Fiber_content_weight' in cols:
+            weight_content = cols['Fiber_content_weight'][i]
             if isinstance(weight_content, (int, float)) and not pd.isna(weight_content):
-                df.loc[idx, 'fiber_content'] = weight_content
+                out['fiber_content'][i] = weight_content
                 return
         
         # Convert from volume percentage
-        if 'Fiber_content_volume' in df.columns:
-            volume_content = df.loc[idx, 'Fiber_content_volume']
+        if 'Fiber_content_volume' in cols:
+            volume_content = cols['Fiber_content_volume'][i]
             if isinstance(volume_content, (int, float)) and not pd.isna(volume_content):
                 # Get density
-                fiber_type = df.loc[idx, 'Fiber_type'] if 'Fiber_type' in df.columns else 'Unknown'
-                matrix_type = df.loc[idx, 'Matrix_type'] if 'Matrix_type' in df.columns else 'Unknown'
+                fiber_type = cols['Fiber_type'][i] if 'Fiber_type' in cols else 'Unknown'
+                matrix_type = cols['Matrix_type'][i] if 'Matrix_type' in cols else 'Unknown'
                 
                 # Fiber density
                 fiber_densities = {
@@ -3724,36 +3851,36 @@ class FRPDataPreprocessor:
                 weight_content = (100.0 * volume_content * density_fiber) / (
                     volume_content * density_fiber + (100.0 - volume_content) * density_matrix
                 )
-                df.loc[idx, 'fiber_content'] = weight_content
+                out['fiber_content'][i] = weight_content
     
-    def _process_material_types(self, df, idx):
+    def _process_material_types(self, cols, out, i):
         """Process material type encoding"""
         # Fiber type encoding (Glass fiber=1, Basalt fiber=0)
-        if 'Fiber_type' in df.columns:
-            fiber_type = df.loc[idx, 'Fiber_type']
+        if 'Fiber_type' in cols:
+            fiber_type = cols['Fiber_type'][i]
             if fiber_type == 'Glass':
-                df.loc[idx, 'Glass_or_Basalt'] = 1
+                out['Glass_or_Basalt'][i] = 1
             elif fiber_type == 'Basalt':
-                df.loc[idx, 'Glass_or_Basalt'] = 0
+                out['Glass_or_Basalt'][i] = 0
         
         # Matrix type encoding (Vinyl ester=1, Epoxy=0)
-        if 'Matrix_type' in df.columns:
-            matrix_type = df.loc[idx, 'Matrix_type']
+        if 'Matrix_type' in cols:
+            matrix_type = cols['Matrix_type'][i]
             if matrix_type == 'Vinyl ester':
-                df.loc[idx, 'Vinyl_ester_or_Epoxy'] = 1
+                out['Vinyl_ester_or_Epoxy'][i] = 1
             elif matrix_type == 'Epoxy':
-                df.loc[idx, 'Vinyl_ester_or_Epoxy'] = 0
+                out['Vinyl_ester_or_Epoxy'][i] = 0
     
-    def _process_surface_treatment(self, df, idx):
+    def _process_surface_treatment(self, cols, out, i):
         """Process surface treatment features"""
-        if 'surface_treatment' in df.columns:
-            treatment = df.loc[idx, 'surface_treatment']
+        if 'surface_treatment' in cols:
+            treatment = cols['surface_treatment'][i]
             if treatment == 'sand coated':
-                df.loc[idx, 'surface_treatment'] = 0
+                out['surface_treatment'][i] = 0
             elif treatment == 'Smooth':
-                df.loc[idx, 'surface_treatment'] = 1
+                out['surface_treatment'][i] = 1
     
-    def _process_other_features(self, df, idx):
+    def _process_other_features(self, cols, out, i):
         """Process other features"""
         # Features for direct copying
         feature_mappings = {
@@ -3766,24 +3893,24 @@ class FRPDataPreprocessor:
         }
         
         for new_col, old_col in feature_mappings.items():
-            if old_col in df.columns:
-                value = df.loc[idx, old_col]
+            if old_col in cols:
+                value = cols[old_col][i]
                 # For Target_parameter, copy directly regardless of type
                 if new_col == 'Target_parameter':
-                    df.loc[idx, new_col] = value
+                    out[new_col][i] = value
                 # For other numeric features, check if valid numeric
                 elif isinstance(value, (int, float)) and not pd.isna(value):
-                    df.loc[idx, new_col] = value
+                    out[new_col][i] = value
                 # For string type numerics, try to convert
                 elif isinstance(value, str) and value.strip() != '':
                     try:
                         numeric_value = float(value)
                         if not np.isnan(numeric_value):
-                            df.loc[idx, new_col] = numeric_value
+                            out[new_col][i] = numeric_value
                     except (ValueError, TypeError):
                         # If cannot convert to numeric, still preserve original value for certain fields
                         if new_col in ['Target_parameter']:
-                            df.loc[idx, new_col] = value
+                            out[new_col][i] = value
     
     def create_model_dataset(self, df):
         """
@@ -3872,6 +3999,23 @@ class FRPDataPreprocessor:
         
         return final_data
 
+def _research_data_cache_path(sql, checksum, count):
+    """根据查询、数据库、表的校验和与记录数生成Parquet缓存路径，无法判断表是否变化时返回None"""
+    if not PYARROW_AVAILABLE or checksum is None:
+        return None
+    fingerprint = hashlib.sha256(f"{sql}|{DB_HOST}|{DB_NAME}|{checksum}|{count}".encode()).hexdigest()
+    return os.path.join(DATA_CACHE_DIR, f"research_data_{fingerprint[:16]}.parquet")
+
+def _prune_research_data_cache(keep_path):
+    """删除除 keep_path 以外的旧Parquet缓存文件"""
+    for name in os.listdir(DATA_CACHE_DIR):
+        path = os.path.join(DATA_CACHE_DIR, name)
+        if name.startswith("research_data_") and name.endswith(".parquet") and path != keep_path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 @st.cache_data
 def load_default_data():
     """Load default data and perform basic cleaning"""
@@ -3891,9 +4035,33 @@ def load_default_data():
                 count = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
                 print(f"Found {count} records in research_data table")
                 
-                # 加载数据
-                df = pd.read_sql("SELECT * FROM research_data", engine)
-                print(f"Successfully loaded {len(df)} rows from research_data table")
+                # 表未变化时直接读取本地Parquet缓存。
+                # 使用CHECKSUM TABLE而非information_schema的UPDATE_TIME：
+                # 后者在MySQL 8中按information_schema_stats_expiry缓存（默认一天），不能及时反映UPDATE
+                sql = "SELECT * FROM research_data"
+                checksum = conn.execute(text("CHECKSUM TABLE research_data")).fetchone()[1]
+                cache_path = _research_data_cache_path(sql, checksum, count)
+                
+                if cache_path and os.path.exists(cache_path):
+                    df = pd.read_parquet(cache_path)
+                    print(f"Loaded {len(df)} rows from local cache: {cache_path}")
+                else:
+                    # 加载数据（服务端游标分块读取，驱动不会一次性缓存整个结果集）
+                    chunks = pd.read_sql(
+                        sql,
+                        conn.execution_options(stream_results=True),
+                        chunksize=50000,
+                    )
+                    df = pd.concat(chunks, ignore_index=True)
+                    print(f"Successfully loaded {len(df)} rows from research_data table")
+                    
+                    if cache_path:
+                        try:
+                            os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+                            df.to_parquet(cache_path, compression='zstd', index=False)
+                            _prune_research_data_cache(cache_path)
+                        except Exception as e:
+                            print(f"Failed to write local data cache: {e}")
             
             # Check for duplicates before cleaning
             original_count = len(df)
@@ -3959,3688 +4127,3878 @@ def create_advanced_model_dataset():
 # In Data Management Tab, modify data reading section
 # Replace original try-except block
 
-# ——————————————————————————————
-# 13. Main Program
-# ——————————————————————————————
-
-# Inject CSS styles
-inject_custom_css()
-
-# Initialize data manager
-data_manager = DataManager()
-
-# Get database connection and initialize system
-engine = get_db_engine()
-if engine:
-    create_tables(engine)
-    admin_success, admin_email, admin_status = initialize_admin(engine)
-
-# Initialize session state with improved data loading
-if "df_raw" not in st.session_state:
-    try:
-        with st.spinner("Loading data from database..."):
-            loaded_data = load_default_data()
-            if loaded_data is not None and len(loaded_data) > 0:
-                st.session_state.df_raw = loaded_data
-                print(f"Successfully initialized session data: {len(loaded_data)} records")
-            else:
-                st.session_state.df_raw = None
-                print("Failed to load initial data from database")
-    except Exception as e:
-        st.session_state.df_raw = None
-        print(f"Error during initial data loading: {e}")
-
-# Verify data loading status
-if st.session_state.df_raw is not None:
-    print(f"Session data available: {len(st.session_state.df_raw)} records")
-else:
-    print("Warning: Session data is None")
-
-# ——————————————————————————————
-# 14. Page Header
-# ——————————————————————————————
-st.markdown(create_gradient_header(
-    "FRP Rebar Durability Prediction Platform",
-    "Advanced Machine Learning for Material Performance Analysis"
-), unsafe_allow_html=True)
-
-# Display key metrics with database connection status
-if engine and "authenticated_user" in st.session_state:
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Get statistical data with error handling
-    try:
-        with engine.connect() as conn:
-            total_records = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar() or 0
-            active_users = conn.execute(
-                text("SELECT COUNT(DISTINCT user_email) FROM operation_logs WHERE DATE(created_at) = CURDATE()")
-            ).scalar() or 0
-            pending_changes = conn.execute(
-                text("SELECT COUNT(*) FROM data_changes WHERE status = 'pending'")
-            ).scalar() or 0
-            
-        # 数据库连接成功，显示正常指标
-        db_status = "Connected"
-        db_color = "#27ae60"
-        
-    except Exception as e:
-        # 数据库连接失败
-        total_records = 0
-        active_users = 0
-        pending_changes = 0
-        db_status = "Disconnected"
-        db_color = "#e74c3c"
-        st.error(f"⚠️ Database connection issue: {e}")
-    
-    with col1:
-        st.markdown(create_metric_card("Total Records", f"{total_records:,}", 5.2, "normal", 0), unsafe_allow_html=True)
-    with col2:
-        st.markdown(create_metric_card("Active Users Today", str(active_users), 12.3, "normal", 1), unsafe_allow_html=True)
-    with col3:
-        st.markdown(create_metric_card("Model Accuracy", "94.7%", 2.1, "normal", 2), unsafe_allow_html=True)
-    with col4:
-        # 显示数据库连接状态而不是pending changes
-        st.markdown(f"""
-        <div class="metric-card" style="animation-delay: 0.45s;">
-            <h4 style="color: #666; font-size: 0.9rem; margin: 0;">Database Status</h4>
-            <h2 style="color: {db_color}; margin: 0.5rem 0;">{db_status}</h2>
-            <p style="margin: 0; color: {db_color}; font-size: 0.8rem;">{db_status}</p>
-        </div>
-        """, unsafe_allow_html=True)
+# 离线预处理代码：第一处"Get Offline Code"提供完整的preprocess()流程
+OFFLINE_PREPROCESS_PIPELINE_CODE = '''
+import pandas as pd
+import numpy as np
+from sqlalchemy import create_engine
+import re
+import warnings
+warnings.filterwarnings('ignore')
 
-# ——————————————————————————————
-# 15. Sidebar
-# ——————————————————————————————
-with st.sidebar:
-    st.markdown("""
-    <div style="text-align: center; padding: 1rem;">
-        <h2 style="background: linear-gradient(120deg, #1e3d59 0%, #ff6e40 100%); 
-                   -webkit-background-clip: text; 
-                   -webkit-text-fill-color: transparent; 
-                   font-size: 2rem;
-                   font-weight: 800;
-                   margin: 0;">FRP Analytics</h2>
-    </div>
-    """, unsafe_allow_html=True)
+class FRPDataPreprocessor:
+    """FRP数据预处理器 - 完整的离线版本"""
     
-    # Display administrator information
-    if engine:
-        admin_name = "Chao Wu"
-        st.markdown(f"""
-        <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 1.5rem; border-left: 4px solid #3498db;">
-            <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600; text-align: center;">Administrator</p>
-            <p style="color: #2c3e50; margin: 0; font-weight: 500; text-align: center;">{admin_name}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    def __init__(self):
+        self.feature_columns = [
+            'pH', 'Fiber_content_wt', 'Diameter_mm', 'Surface_treatment',
+            'Resin_type', 'Temp_C', 'Duration_hours', 'Solution_type',
+            'Concentration_mol_L', 'Total_fibers', 'Aramid_fibers',
+            'Glass_fibers', 'Carbon_fibers'
+        ]
     
-    # Email authorization code input - only visible to admin
-    if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
-        auth_input = st.text_input("Email Authorization Code", type="password", help="Enter 163 email authorization code")
-        if auth_input:
-            # Store the authorization code in session state for all users to use
-            st.session_state["email_pass"] = auth_input
-            st.success("Authorization code saved for all users")
+    def change_smd_to_nan(self, df):
+        """将SMD替换为NaN"""
+        df_processed = df.copy()
+        
+        # 处理数值列中的SMD
+        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
+                          'Duration_hours', 'Concentration_mol_L']
+        
+        for col in numeric_columns:
+            if col in df_processed.columns:
+                df_processed[col] = df_processed[col].replace('SMD', np.nan)
+                df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce')
+        
+        return df_processed
     
-    # User Authentication Card 
-    if "authenticated_user" not in st.session_state:
-        # Login Card
-        st.markdown("""
-        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 1.5rem; border-left: 4px solid #e74c3c;">
-            <h4 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1rem; font-weight: 600; text-align: center;">
-                User Authentication
-            </h4>
-        """, unsafe_allow_html=True)
+    def parse_range_to_mean(self, df):
+        """将范围值转换为均值"""
+        df_processed = df.copy()
         
-        user_email = st.text_input(
-            "Email Address", 
-            key="user_email_sidebar",
-            placeholder="Enter your email address",
-            label_visibility="collapsed"
-        )
+        # 定义需要处理的数值列
+        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
+                          'Duration_hours', 'Concentration_mol_L']
         
-        if st.button("Login", type="primary", use_container_width=True):
-            if engine:
-                user = authenticate_user(user_email, engine)
-                if user:
-                    st.session_state["authenticated_user"] = {
-                        "email": user['email'],
-                        "name": user['name'],
-                        "role": user['role']
-                    }
+        range_pattern = r'(\d+(?:\.\d+)?)\s*[-−–]\s*(\d+(?:\.\d+)?)'
+        
+        for col in numeric_columns:
+            if col in df_processed.columns:
+                def process_value(val):
+                    if pd.isna(val) or val == '':
+                        return np.nan
                     
-                    # Set balloon flag for admin users
-                    if user['role'] == 'admin':
-                        st.session_state["show_admin_balloons"] = True
+                    val_str = str(val).strip()
                     
-                    st.success(f"Welcome, {user['name']}!")
+                    # 匹配范围值
+                    range_match = re.search(range_pattern, val_str)
+                    if range_match:
+                        try:
+                            start = float(range_match.group(1))
+                            end = float(range_match.group(2))
+                            return (start + end) / 2
+                        except ValueError:
+                            return np.nan
                     
-                    # Record login
-                    log_operation(
-                        user['email'],
-                        "login",
-                        None,
-                        None,
-                        {"ip": get_client_ip()},
-                        get_client_ip(),
-                        engine
-                    )
-                    st.rerun()
-                else:
-                    st.error("Authentication failed or access not approved")
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-    else:
-        # User Status Card
-        user_info = st.session_state["authenticated_user"]
-        st.markdown(f"""
-        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 1.5rem; border-left: 4px solid #27ae60;">
-            <h4 style="color: #2c3e50; margin: 0 0 1rem 0; font-size: 1rem; font-weight: 600;">
-                Current User
-            </h4>
-            <div style="margin-bottom: 0.5rem;">
-                <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600;">Name</p>
-                <p style="color: #2c3e50; margin: 0; font-weight: 500;">{user_info['name']}</p>
-            </div>
-            <div style="margin-bottom: 0.5rem;">
-                <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600;">Email</p>
-                <p style="color: #2c3e50; margin: 0; font-weight: 500; font-size: 0.85rem;">{user_info['email']}</p>
-            </div>
-            <div style="margin-bottom: 1rem;">
-                <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600;">Role</p>
-                <span style="background: #27ae60; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">
-                    {user_info['role'].upper()}
-                </span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+                    # 尝试直接转换为数值
+                    try:
+                        return float(val_str)
+                    except (ValueError, TypeError):
+                        return np.nan
+                
+                df_processed[col] = df_processed[col].apply(process_value)
         
-        if st.button("Logout", use_container_width=True):
-            del st.session_state["authenticated_user"]
-            st.rerun()
-
-# ——————————————————————————————
-# 16. Main Interface Tabs with Role-based Access Control
-# ——————————————————————————————
-# 根据用户角色动态创建标签页
-if "authenticated_user" in st.session_state:
-    # Check for admin balloon effect
-    if st.session_state.get("show_admin_balloons", False):
-        st.balloons()
-        # Clear the flag so balloons only show once
-        del st.session_state["show_admin_balloons"]
+        return df_processed
     
-    user_role = st.session_state["authenticated_user"]["role"]
+    def process_fiber_types(self, df):
+        """处理纤维类型数据"""
+        df_processed = df.copy()
+        
+        # 初始化纤维类型列
+        df_processed['Total_fibers'] = 0
+        df_processed['Aramid_fibers'] = 0
+        df_processed['Glass_fibers'] = 0
+        df_processed['Carbon_fibers'] = 0
+        
+        if 'Fiber_type' in df_processed.columns:
+            for idx, fiber_type in df_processed['Fiber_type'].items():
+                if pd.isna(fiber_type):
+                    continue
+                
+                fiber_str = str(fiber_type).lower()
+                
+                # 计算总纤维数
+                total_count = len(re.findall(r'aramid|glass|carbon', fiber_str))
+                df_processed.loc[idx, 'Total_fibers'] = total_count
+                
+                # 统计各类型纤维
+                df_processed.loc[idx, 'Aramid_fibers'] = len(re.findall(r'aramid', fiber_str))
+                df_processed.loc[idx, 'Glass_fibers'] = len(re.findall(r'glass', fiber_str))
+                df_processed.loc[idx, 'Carbon_fibers'] = len(re.findall(r'carbon', fiber_str))
+        
+        return df_processed
     
-    if user_role == "admin":
-        # admin用户可以看到所有标签页
-        tab_names = ["Data Management", "Access Control", "Data Changes", "Model Configuration", "Model Training", "Predictions"]
-        tabs = st.tabs(tab_names)
-        tab_indexes = {
-            "data_management": 0,
-            "access_control": 1,
-            "data_changes": 2,
-            "model_configuration": 3,
-            "model_training": 4,
-            "predictions": 5
-        }
-    elif user_role == "editor":
-        # editor用户可以看到：Data Management、Model Configuration和Predictions
-        tab_names = ["Data Management", "Model Configuration", "Predictions"]
-        tabs = st.tabs(tab_names)
-        tab_indexes = {
-            "data_management": 0,
-            "model_configuration": 1,
-            "predictions": 2
-        }
-    else:  # viewer用户
-        # viewer用户只能看到：Data Management、Model Configuration和Predictions
-        tab_names = ["Data Management", "Model Configuration", "Predictions"]
-        tabs = st.tabs(tab_names)
-        tab_indexes = {
-            "data_management": 0,
-            "model_configuration": 1,
-            "predictions": 2
+    def encode_categorical_features(self, df):
+        """编码分类特征"""
+        df_processed = df.copy()
+        
+        # 定义分类特征映射
+        categorical_mappings = {
+            'Surface_treatment': {
+                'Untreated': 0, 'Silane': 1, 'Plasma': 2, 'Acid etching': 3,
+                'Alkali treatment': 4, 'Coating': 5, 'Other': 6
+            },
+            'Resin_type': {
+                'Epoxy': 0, 'Polyester': 1, 'Vinyl ester': 2, 'Polyurethane': 3,
+                'Phenolic': 4, 'Other': 5
+            },
+            'Solution_type': {
+                'NaCl': 0, 'HCl': 1, 'NaOH': 2, 'H2SO4': 3, 'Seawater': 4,
+                'Ca(OH)2': 5, 'MgSO4': 6, 'Other': 7
+            }
         }
-else:
-    # 未认证用户显示登录注册标签和其他基本标签页
-    tab_names = ["Login/Register", "Model Configuration", "Predictions"]
-    tabs = st.tabs(tab_names)
-    tab_indexes = {
-        "login_register": 0,
-        "model_configuration": 1,
-        "predictions": 2
-    }
+        
+        for feature, mapping in categorical_mappings.items():
+            if feature in df_processed.columns:
+                # 处理未知类别
+                df_processed[feature] = df_processed[feature].fillna('Other')
+                df_processed[feature] = df_processed[feature].map(mapping).fillna(mapping.get('Other', 0))
+        
+        return df_processed
+    
+    def handle_missing_values(self, df):
+        """Handle missing values"""
+        df_processed = df.copy()
+        
+        # 数值特征使用中位数填充
+        numeric_features = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
+                           'Duration_hours', 'Concentration_mol_L']
+        
+        for feature in numeric_features:
+            if feature in df_processed.columns:
+                median_val = df_processed[feature].median()
+                df_processed[feature] = df_processed[feature].fillna(median_val)
+        
+        # 分类特征已在编码时处理
+        return df_processed
+    
+    def preprocess(self, df):
+        """完整的数据预处理流程"""
+        print("开始数据预处理...")
+        
+        # 1. 将SMD替换为NaN
+        df = self.change_smd_to_nan(df)
+        print("✓ SMD值已替换为NaN")
+        
+        # 2. 解析范围值为均值
+        df = self.parse_range_to_mean(df)
+        print("✓ 范围值已转换为均值")
+        
+        # 3. 处理纤维类型
+        df = self.process_fiber_types(df)
+        print("✓ 纤维类型特征已处理")
+        
+        # 4. 编码分类特征
+        df = self.encode_categorical_features(df)
+        print("✓ 分类特征已编码")
+        
+        # 5. Handle missing values
+        df = self.handle_missing_values(df)
+        print("✓ Missing values handled")
+        
+        # 6. 选择最终特征
+        final_features = [col for col in self.feature_columns if col in df.columns]
+        df_final = df[final_features].copy()
+        
+        print(f"✓ 预处理完成！最终数据形状: {df_final.shape}")
+        print(f"特征列: {list(df_final.columns)}")
+        
+        return df_final
 
+# 使用示例:
+# 1. 加载数据
+# df = pd.read_csv('your_data.csv')
 
-# ——————————————————————————————
-# 标签页内容处理
-# ——————————————————————————————
+# 2. 创建预处理器并处理数据
+# preprocessor = FRPDataPreprocessor()
+# processed_df = preprocessor.preprocess(df)
 
-# 登录/注册标签页 (未认证用户)
-if "authenticated_user" not in st.session_state:
-    with tabs[tab_indexes["login_register"]]:
+# 3. 保存处理后的数据
+# processed_df.to_csv('processed_data.csv', index=False)
+'''
+
+# 离线预处理代码：第二处"Get Offline Code"提供create_model_dataset()建模数据集流程
+OFFLINE_MODEL_DATASET_CODE = '''
+import pandas as pd
+import numpy as np
+from sqlalchemy import create_engine
+import re
+import warnings
+warnings.filterwarnings('ignore')
+
+class FRPDataPreprocessor:
+    """FRP数据预处理器 - 完整的离线版本"""
+    
+    def __init__(self):
+        self.feature_columns = [
+            'pH', 'Fiber_content_wt', 'Diameter_mm', 'Surface_treatment',
+            'Resin_type', 'Temp_C', 'Duration_hours', 'Solution_type',
+            'Concentration_mol_L', 'Total_fibers', 'Aramid_fibers',
+            'Glass_fibers', 'Carbon_fibers'
+        ]
+    
+    def change_smd_to_nan(self, df):
+        """将SMD替换为NaN"""
+        df_processed = df.copy()
         
-        if not engine:
-            st.error("❌ Database connection failed. Please check database configuration.")
-            st.markdown("""
-            **Troubleshooting steps:**
-            1. Verify MySQL server is running
-            2. Check database connection parameters in environment variables
-            3. Ensure network connectivity to localhost:3306
-            4. Contact system administrator if issues persist
-            """)
-            st.stop()
+        # 处理数值列中的SMD
+        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
+                          'Duration_hours', 'Concentration_mol_L']
         
-        st.warning("Please log in to access data management functions.")
+        for col in numeric_columns:
+            if col in df_processed.columns:
+                df_processed[col] = df_processed[col].replace('SMD', np.nan)
+                df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce')
         
-        # Access request form with clean design
-        st.subheader("Request Access")
+        return df_processed
+    
+    def parse_range_to_mean(self, df):
+        """将范围值转换为均值"""
+        df_processed = df.copy()
         
-        # Information card
-        st.markdown("""
-        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); border-left: 4px solid #3498db; margin-bottom: 2rem;">
-            <p style="color: #2c3e50; margin: 0; font-size: 1rem; line-height: 1.5;">
-                To access our FRP materials database, please complete the form below. 
-                All requests are reviewed by our research team within 2-3 business days.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
+                          'Duration_hours', 'Concentration_mol_L']
         
-        with st.form("access_request_form", clear_on_submit=True):
-            # Form layout in a more organized way
-            # Row 1: Name and Institution
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                req_name = st.text_input(
-                    "Full Name",
-                    placeholder="Enter your full name",
-                    help="Your complete name as it appears in official documents"
-                )
-            
-            with col2:
-                req_institution = st.text_input(
-                    "Institution/University",
-                    placeholder="Your academic or research institution",
-                    help="Name of your university, research center, or organization"
-                )
-            
-            # Row 2: Email
-            req_email = st.text_input(
-                "Email Address",
-                placeholder="your.email@institution.edu",
-                help="Please use your institutional email address"
-            )
-            
-            # Row 3: Research Purpose
-            research_purpose = st.text_area(
-                "Research Purpose",
-                placeholder="Brief description of your research goals...",
-                help="Help us understand how you plan to use the database",
-                height=100
-            )
-            
-            # IP address information
-            client_ip = get_client_ip()
-            st.markdown(f"""
-            <div style="background: #f8f9fa; padding: 1rem; border-radius: 6px; margin: 1rem 0; border-left: 3px solid #6c757d;">
-                <small style="color: #495057;">
-                    <strong>Your IP Address:</strong> {client_ip} 
-                    <em>(logged for security purposes)</em>
-                </small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Security notice if IP not in allowed range
-            if not is_ip_allowed(client_ip):
-                st.markdown("""
-                <div style="background: #fff3cd; padding: 1rem; border-radius: 6px; margin: 1rem 0; border-left: 3px solid #ffc107;">
-                    <small style="color: #856404;">
-                        <strong>Notice:</strong> Your IP address requires additional verification. 
-                        Your request may take longer to process.
-                    </small>
-                </div>
-                """, unsafe_allow_html=True)
+        for col in numeric_columns:
+            if col in df_processed.columns:
+                for idx, value in df_processed[col].items():
+                    if pd.isna(value):
+                        continue
+                    
+                    str_value = str(value)
+                    
+                    # 处理范围：X-Y, X~Y, X to Y
+                    range_patterns = [r'(\d+\.?\d*)\s*[-~]\s*(\d+\.?\d*)', 
+                                    r'(\d+\.?\d*)\s*to\s*(\d+\.?\d*)']
+                    
+                    for pattern in range_patterns:
+                        match = re.search(pattern, str_value, re.IGNORECASE)
+                        if match:
+                            start_val = float(match.group(1))
+                            end_val = float(match.group(2))
+                            df_processed.at[idx, col] = (start_val + end_val) / 2
+                            break
+                    else:
+                        # 尝试直接转换为数值
+                        try:
+                            df_processed.at[idx, col] = float(str_value)
+                        except:
+                            df_processed.at[idx, col] = np.nan
+        
+        return df_processed
+    
+    def create_selected_features(self, df):
+        """创建选定的特征"""
+        df_processed = df.copy()
+        
+        # 表面处理编码
+        if 'Surface_treatment' in df_processed.columns:
+            surface_mapping = {
+                'None': 0, 'Silane coupling agent': 1, 'Epoxy sizing': 2,
+                'Plasma treatment': 3, 'Acid etching': 4, 'Alkaline treatment': 5
+            }
+            df_processed['Surface_treatment'] = df_processed['Surface_treatment'].map(surface_mapping).fillna(0)
+        
+        # 树脂类型编码
+        if 'Resin_type' in df_processed.columns:
+            resin_mapping = {
+                'Epoxy': 1, 'Vinyl ester': 2, 'Polyester': 3, 'Phenolic': 4
+            }
+            df_processed['Resin_type'] = df_processed['Resin_type'].map(resin_mapping).fillna(1)
+        
+        # 溶液类型编码
+        if 'Solution_type' in df_processed.columns:
+            solution_mapping = {
+                'NaOH': 1, 'HCl': 2, 'H2SO4': 3, 'NaCl': 4, 'Seawater': 5
+            }
+            df_processed['Solution_type'] = df_processed['Solution_type'].map(solution_mapping).fillna(1)
+        
+        # 纤维特征工程
+        df_processed['Total_fibers'] = 0
+        df_processed['Aramid_fibers'] = 0
+        df_processed['Glass_fibers'] = 0
+        df_processed['Carbon_fibers'] = 0
+        
+        if 'Fiber_type' in df_processed.columns:
+            fiber_type_col = df_processed['Fiber_type'].fillna('Glass').str.lower()
             
-            # Terms acceptance
-            st.markdown("---")
-            terms_accepted = st.checkbox(
-                "I agree to use the FRP materials database responsibly for research purposes only",
-                help="Required: Agreement to terms of service and data usage policy"
-            )
+            df_processed['Aramid_fibers'] = (fiber_type_col.str.contains('aramid|kevlar', na=False)).astype(int)
+            df_processed['Glass_fibers'] = (fiber_type_col.str.contains('glass|e-glass', na=False)).astype(int)
+            df_processed['Carbon_fibers'] = (fiber_type_col.str.contains('carbon', na=False)).astype(int)
             
-            # Submit button
-            col_submit1, col_submit2, col_submit3 = st.columns([1, 1, 1])
-            with col_submit2:
-                submit_pressed = st.form_submit_button(
-                    "Submit Request",
-                    type="primary",
-                    use_container_width=True
-                )
+            # 如果都不匹配，默认为玻璃纤维
+            no_match = (df_processed['Aramid_fibers'] == 0) & (df_processed['Glass_fibers'] == 0) & (df_processed['Carbon_fibers'] == 0)
+            df_processed.loc[no_match, 'Glass_fibers'] = 1
             
-            # Form processing
-            if submit_pressed:
-                # Validation
-                if not all([req_name, req_email, req_institution]):
-                    st.error("Please fill in all required fields")
-                elif not terms_accepted:
-                    st.error("Please accept the terms and conditions")
-                elif "@" not in req_email or "." not in req_email:
-                    st.error("Please enter a valid email address")
-                else:
-                    # Process request
-                    success, msg = request_access(req_name, req_email, req_institution, client_ip, engine)
-                    if success:
-                        st.success("Access request submitted successfully!")
-                        st.info("Thank you for your interest. Our team will review your request and contact you within 2-3 business days.")
-                        
-                        # Send notification email
-                        email_body = f"""
-                        New FRP Database Access Request
-                        
-                        Request Details:
-                        • Name: {req_name}
-                        • Email: {req_email}
-                        • Institution: {req_institution}
-                        • IP Address: {client_ip}
-                        • Research Purpose: {research_purpose}
-                        • Terms Accepted: {terms_accepted}
-                        
-                        Submitted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-                        
-                        Please review and approve/deny this request in the admin panel.
-                        """
-                        
-                        send_email(
-                            EMAIL_USER,
-                            "New FRP DB Access Request",
-                            email_body
-                        )
-                    else:
-                        st.error(msg)
+            df_processed['Total_fibers'] = df_processed['Aramid_fibers'] + df_processed['Glass_fibers'] + df_processed['Carbon_fibers']
         
-        # Additional information
-        st.markdown("---")
-        st.markdown("""
-        <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 8px; margin-top: 2rem;">
-            <h5 style="color: #495057; margin: 0 0 1rem 0;">About Our Database</h5>
-            <p style="color: #6c757d; margin: 0; font-size: 0.95rem; line-height: 1.5;">
-                Our FRP materials database contains comprehensive research data for fiber-reinforced polymer 
-                materials, supporting global research in advanced materials science and engineering applications.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-# ——————————————————————————————
-# Data Management 标签页 (已认证用户)
-# ——————————————————————————————
-else:
-    with tabs[tab_indexes["data_management"]]:
-        if not engine:
-            st.error("❌ Database connection failed. Please check database configuration.")
-            st.markdown("""
-            **Troubleshooting steps:**
-            1. Verify MySQL server is running (check if XAMPP/WAMP is started)
-            2. Check database credentials in environment variables
-            3. Ensure research_data table exists in haigui_database
-            4. Contact system administrator if issues persist
-            """)
-            st.stop()
+        # 确保所有特征列存在
+        for col in self.feature_columns:
+            if col not in df_processed.columns:
+                df_processed[col] = 0
         
-        # Authenticated user's data management interface
-        user_info = st.session_state["authenticated_user"]
-        user_role = user_info.get("role", "viewer")
+        # 数据填充和清理
+        for col in self.feature_columns:
+            if col in ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 'Duration_hours', 'Concentration_mol_L']:
+                df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce').fillna(0)
+            else:
+                df_processed[col] = df_processed[col].fillna(0)
         
-        # Welcome header for authenticated users - clean design
-        st.markdown(f"""
-        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
-            <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
-                Data Management Console
-            </h3>
-            <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
-                Welcome back, {user_info.get('name', 'User')} ({user_role}) - Manage and explore FRP materials research data
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        return df_processed[self.feature_columns]
+    
+    def create_model_dataset(self, df, target_column):
+        """创建模型数据集"""
+        # 预处理步骤
+        df_step1 = self.change_smd_to_nan(df)
+        df_step2 = self.parse_range_to_mean(df_step1)
+        df_features = self.create_selected_features(df_step2)
         
-
-        # Data browsing section - clean design
-        st.markdown("### Database Overview")
+        # 添加目标变量
+        if target_column in df.columns:
+            df_features[target_column] = pd.to_numeric(df[target_column], errors='coerce')
         
-        # Select data table - clean styling
-        col_select1, col_select2 = st.columns([2, 1])
-        with col_select1:
-            table_name = st.selectbox(
-                "Select Data Table", 
-                ["research_data", "research_data_backup"],
-                help="Choose which data table to explore"
-            )
-        with col_select2:
-            st.markdown("""
-            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #27ae60; margin-top: 1.7rem;">
-                <small style="color: #2c3e50; font-weight: 600;">Data Explorer</small>
-            </div>
-            """, unsafe_allow_html=True)
+        # 移除包含NaN的行
+        df_final = df_features.dropna()
         
-        # Read data with improved error handling
-        try:
-            # Use fixed data loading function with explicit database connection
-            if table_name == "research_data":
-                df = data_manager.get_data(
-                    f"table_{table_name}",
-                    lambda: load_default_data()
-                )
-                # 验证数据是否正确加载
-                if df is None:
-                    st.error("❌ Failed to load data from database. Please check database connection.")
-                    # 提供重新加载选项
-                    if st.button("🔄 Retry Database Connection", key="retry_db_connection"):
-                        data_manager.invalidate_cache(f"table_{table_name}")
-                        st.session_state.df_raw = None  # 清除缓存
-                        st.rerun()
-                    st.stop()
-                    
-                # 更新全局状态
-                st.session_state.df_raw = df
-                
-            else:
-                # 对其他表的处理
-                df = data_manager.get_data(
-                    f"table_{table_name}",
-                    lambda: pd.read_sql(f"SELECT * FROM {table_name}", engine)
-                )
-            
-            if df is None or len(df) == 0:
-                st.error(f"❌ No data found in table '{table_name}' or data loading failed.")
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("🔄 Reload Data", key="reload_data_btn"):
-                        data_manager.invalidate_cache(f"table_{table_name}")
-                        st.session_state.df_raw = None  # 清除缓存
-                        st.rerun()
-                with col2:
-                    if st.button("🔍 Check Database", key="check_db_btn"):
-                        # 检查数据库连接状态
-                        try:
-                            with engine.connect() as conn:
-                                tables = conn.execute(text("SHOW TABLES")).fetchall()
-                                st.info(f"Database connected. Available tables: {[t[0] for t in tables]}")
-                                if table_name == "research_data":
-                                    count = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
-                                    st.info(f"research_data table contains {count} records")
-                        except Exception as e:
-                            st.error(f"Database connection failed: {e}")
-                st.stop()
-            
-            # 确保数据已正确加载
-            if df is not None and len(df) > 0:
-                # 数据加载成功，继续处理
-                pass
-            else:
-                st.error("❌ No data loaded from database")
-                st.stop()
-            
-            # 根据用户角色显示不同的数据管理功能
-            if user_role == "admin":
-                # admin用户可以看到所有功能：Data Overview、Missing Values Analysis、Data Distribution和Data Quality
-                with st.expander("Data Overview", expanded=True):
-                    render_data_overview_admin(df, table_name, data_manager)
+        return df_final
+
+# 使用示例
+def process_data(csv_file_path, target_column):
+    """
+    处理数据的主函数
+    
+    参数:
+    csv_file_path: CSV文件路径
+    target_column: 目标变量列名
+    
+    返回:
+    处理后的DataFrame
+    """
+    # 读取数据
+    df = pd.read_csv(csv_file_path)
+    
+    # 初始化预处理器
+    preprocessor = FRPDataPreprocessor()
+    
+    # 执行预处理
+    processed_data = preprocessor.create_model_dataset(df, target_column)
+    
+    return processed_data
+
+# 运行示例
+if __name__ == "__main__":
+    # 替换为你的CSV文件路径
+    file_path = "your_data.csv"
+    
+    # 替换为你的目标变量列名
+    target_col = "Tensile_strength_retention_rate"  # 或 "Residual_tensile_strength_MPa"
+    
+    try:
+        result = process_data(file_path, target_col)
+        print(f"数据预处理完成! 数据形状: {result.shape}")
+        print(f"特征列: {result.columns.tolist()}")
+        
+        # 保存处理后的数据
+        result.to_csv("preprocessed_data.csv", index=False)
+        print("预处理数据已保存到 preprocessed_data.csv")
+        
+    except Exception as e:
+        print(f"处理出错: {e}")
+'''
+
+# ——————————————————————————————
+# 13. Main Program
+# ——————————————————————————————
+
+# Inject CSS styles
+inject_custom_css()
+
+# Initialize data manager
+data_manager = DataManager()
+
+# Get database connection and initialize system
+engine = get_db_engine()
+if engine:
+    create_tables(engine)
+    admin_success, admin_email, admin_status = initialize_admin(engine)
+
+# Initialize session state with improved data loading
+if "df_raw" not in st.session_state:
+    try:
+        with st.spinner("Loading data from database..."):
+            loaded_data = load_default_data()
+            if loaded_data is not None and len(loaded_data) > 0:
+                st.session_state.df_raw = loaded_data
+                print(f"Successfully initialized session data: {len(loaded_data)} records")
             else:
-                # viewer用户只能看到：Data Overview
-                with st.expander("Data Overview", expanded=True):
-                    render_data_overview_viewer(df)
+                st.session_state.df_raw = None
+                print("Failed to load initial data from database")
+    except Exception as e:
+        st.session_state.df_raw = None
+        print(f"Error during initial data loading: {e}")
+
+# Verify data loading status
+if st.session_state.df_raw is not None:
+    print(f"Session data available: {len(st.session_state.df_raw)} records")
+else:
+    print("Warning: Session data is None")
+
+# ——————————————————————————————
+# 14. Page Header
+# ——————————————————————————————
+st.markdown(create_gradient_header(
+    "FRP Rebar Durability Prediction Platform",
+    "Advanced Machine Learning for Material Performance Analysis"
+), unsafe_allow_html=True)
+
+# Display key metrics with database connection status
+if engine and "authenticated_user" in st.session_state:
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Get statistical data with error handling
+    try:
+        with engine.connect() as conn:
+            total_records = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar() or 0
+            active_users = conn.execute(
+                text("SELECT COUNT(DISTINCT user_email) FROM operation_logs WHERE DATE(created_at) = CURDATE()")
+            ).scalar() or 0
+            pending_changes = conn.execute(
+                text("SELECT COUNT(*) FROM data_changes WHERE status = 'pending'")
+            ).scalar() or 0
             
-            # Data visualization - merge data quality dashboard with visualization features
-            with st.expander("Data Visualization", expanded=True):
-                st.markdown("""
-                <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #8e44ad;">
-                    <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
-                        Explore data patterns, distributions, and relationships through interactive visualizations
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # 确认数据可用性
-                if df is None or len(df) == 0:
-                    st.error("❌ No data available for visualization")
-                    st.stop()
-                
-                # 根据用户角色显示不同内容
-                user_role = st.session_state.get("authenticated_user", {}).get("role", "viewer")
-                
-                if user_role == "viewer":
-                    # Viewer用户只看到基本的统计卡片
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
-                            <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600;">RECORDS</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{len(df):,}</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Total entries</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    with col2:
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #8B5FBF;">
-                            <h4 style="color: #8B5FBF; margin: 0; font-size: 0.75rem; font-weight: 600;">COLUMNS</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{len(df.columns)}</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data fields</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    # Calculate data quality metrics
-                    missing_data = df.isnull().sum()
-                    total_missing = missing_data.sum()
-                    total_cells = len(df) * len(df.columns)
-                    completeness_rate = ((total_cells - total_missing) / total_cells * 100) if total_cells > 0 else 0
-                    
-                    with col3:
-                        completeness_color = "#27ae60" if completeness_rate > 80 else "#f39c12" if completeness_rate > 60 else "#e74c3c"
-                        completeness_percentage = f"{completeness_rate:.1f}%"
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {completeness_color};">
-                            <h4 style="color: {completeness_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">COMPLETE</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{completeness_percentage}</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data integrity</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    # Calculate key field completeness
-                    key_fields = ['Fiber_type', 'Matrix_type', 'temperature', 'time_field', 'Target_parameter']
-                    key_completeness = 0
-                    valid_key_fields = 0
-                    for field in key_fields:
-                        if field in df.columns:
-                            field_completeness = (1 - df[field].isnull().sum() / len(df)) * 100
-                            key_completeness += field_completeness
-                            valid_key_fields += 1
-                    
-                    avg_key_completeness = key_completeness / valid_key_fields if valid_key_fields > 0 else 0
-                    
-                    with col4:
-                        key_color = "#27ae60" if avg_key_completeness > 70 else "#f39c12" if avg_key_completeness > 50 else "#e74c3c"
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {key_color};">
-                            <h4 style="color: {key_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">QUALITY</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{avg_key_completeness:.1f}%</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Key fields</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                else:
-                    # Admin用户看到完整功能
-                    # Data quality statistics cards - following Model Configuration style
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
-                            <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600;">RECORDS</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{len(df):,}</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Total entries</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    with col2:
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #8B5FBF;">
-                            <h4 style="color: #8B5FBF; margin: 0; font-size: 0.75rem; font-weight: 600;">COLUMNS</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{len(df.columns)}</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data fields</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    # Calculate data quality metrics
-                    missing_data = df.isnull().sum()
-                    total_missing = missing_data.sum()
-                    total_cells = len(df) * len(df.columns)
-                    completeness_rate = ((total_cells - total_missing) / total_cells * 100) if total_cells > 0 else 0
-                    
-                    with col3:
-                        completeness_color = "#27ae60" if completeness_rate > 80 else "#f39c12" if completeness_rate > 60 else "#e74c3c"
-                        completeness_percentage = f"{completeness_rate:.1f}%"
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {completeness_color};">
-                            <h4 style="color: {completeness_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">COMPLETE</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{completeness_percentage}</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data integrity</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    # Calculate key field completeness
-                    key_fields = ['Fiber_type', 'Matrix_type', 'temperature', 'time_field', 'Target_parameter']
-                    key_completeness = 0
-                    valid_key_fields = 0
-                    for field in key_fields:
-                        if field in df.columns:
-                            field_completeness = (1 - df[field].isnull().sum() / len(df)) * 100
-                            key_completeness += field_completeness
-                            valid_key_fields += 1
-                    
-                    avg_key_completeness = key_completeness / valid_key_fields if valid_key_fields > 0 else 0
+        # 数据库连接成功，显示正常指标
+        db_status = "Connected"
+        db_color = "#27ae60"
+        
+    except Exception as e:
+        # 数据库连接失败
+        total_records = 0
+        active_users = 0
+        pending_changes = 0
+        db_status = "Disconnected"
+        db_color = "#e74c3c"
+        st.error(f"⚠️ Database connection issue: {e}")
+    
+    with col1:
+        st.markdown(create_metric_card("Total Records", f"{total_records:,}", 5.2, "normal", 0), unsafe_allow_html=True)
+    with col2:
+        st.markdown(create_metric_card("Active Users Today", str(active_users), 12.3, "normal", 1), unsafe_allow_html=True)
+    with col3:
+        st.markdown(create_metric_card("Model Accuracy", "94.7%", 2.1, "normal", 2), unsafe_allow_html=True)
+    with col4:
+        # 显示数据库连接状态而不是pending changes
+        st.markdown(f"""
+        <div class="metric-card" style="animation-delay: 0.45s;">
+            <h4 style="color: #666; font-size: 0.9rem; margin: 0;">Database Status</h4>
+            <h2 style="color: {db_color}; margin: 0.5rem 0;">{db_status}</h2>
+            <p style="margin: 0; color: {db_color}; font-size: 0.8rem;">{db_status}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# ——————————————————————————————
+# 15. Sidebar
+# ——————————————————————————————
+with st.sidebar:
+    st.markdown("""
+    <div style="text-align: center; padding: 1rem;">
+        <h2 style="background: linear-gradient(120deg, #1e3d59 0%, #ff6e40 100%); 
+                   -webkit-background-clip: text; 
+                   -webkit-text-fill-color: transparent; 
+                   font-size: 2rem;
+                   font-weight: 800;
+                   margin: 0;">FRP Analytics</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Display administrator information
+    if engine:
+        admin_name = "Chao Wu"
+        st.markdown(f"""
+        <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 1.5rem; border-left: 4px solid #3498db;">
+            <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600; text-align: center;">Administrator</p>
+            <p style="color: #2c3e50; margin: 0; font-weight: 500; text-align: center;">{admin_name}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Email authorization code input - only visible to admin
+    if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
+        auth_input = st.text_input("Email Authorization Code", type="password", help="Enter 163 email authorization code")
+        if auth_input:
+            # Store the authorization code in session state for all users to use
+            st.session_state["email_pass"] = auth_input
+            st.success("Authorization code saved for all users")
+    
+    # User Authentication Card 
+    if "authenticated_user" not in st.session_state:
+        # Login Card
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 1.5rem; border-left: 4px solid #e74c3c;">
+            <h4 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1rem; font-weight: 600; text-align: center;">
+                User Authentication
+            </h4>
+        """, unsafe_allow_html=True)
+        
+        user_email = st.text_input(
+            "Email Address", 
+            key="user_email_sidebar",
+            placeholder="Enter your email address",
+            label_visibility="collapsed"
+        )
+        
+        if st.button("Login", type="primary", use_container_width=True):
+            if engine:
+                user = authenticate_user(user_email, engine)
+                if user:
+                    st.session_state["authenticated_user"] = {
+                        "email": user['email'],
+                        "name": user['name'],
+                        "role": user['role']
+                    }
                     
-                    with col4:
-                        key_color = "#27ae60" if avg_key_completeness > 70 else "#f39c12" if avg_key_completeness > 50 else "#e74c3c"
-                        st.markdown(f"""
-                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {key_color};">
-                            <h4 style="color: {key_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">QUALITY</h4>
-                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{avg_key_completeness:.1f}%</h3>
-                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Key fields</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    # Set balloon flag for admin users
+                    if user['role'] == 'admin':
+                        st.session_state["show_admin_balloons"] = True
                     
-                    # 根据用户角色动态创建可视化分析标签页
-                    # admin用户可以看到所有功能：Missing Values Analysis、Data Distribution
-                    quality_tabs = st.tabs(["Missing Values Analysis", "Data Distribution"])
+                    st.success(f"Welcome, {user['name']}!")
                     
-                    # Missing Values Analysis - 只对admin用户可见
-                    with quality_tabs[0]:
-                        # Missing values analysis - complete original optimized layout
-                        missing_data = df.isnull().sum()
-                        missing_data = missing_data[missing_data > 0].sort_values(ascending=False)
-                        
-                        if len(missing_data) > 0:
-                            # Category information statistics
-                            severe_missing = missing_data[missing_data / len(df) > 0.8]
-                            moderate_missing = missing_data[(missing_data / len(df) > 0.5) & (missing_data / len(df) <= 0.8)]
-                            low_missing = missing_data[missing_data / len(df) <= 0.5]
-                        
-                        # Missing values analysis overview - moved before the three cards
-                        st.markdown("#### Missing Values Analysis Overview")
-                        
-                        # Category statistics cards following Model Configuration style
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #e74c3c; height: 85px; display: flex; flex-direction: column; justify-content: center; margin-bottom: 1rem;">
-                                <h4 style="color: #e74c3c; margin: 0 0 -0.8rem 0; font-size: 0.7rem; font-weight: 600; line-height: 0.6;">SEVERE MISSING</h4>
-                                <h2 style="color: #2c3e50; margin: 0; font-size: 1.3rem; font-weight: 700; line-height: 0.6;">{len(severe_missing)}</h2>
-                                <p style="margin: -0.6rem 0 0 0; font-size: 0.6rem; color: #7f8c8d; line-height: 0.6;">>80% Missing values</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # View Details button
-                            if st.button("View Details", key="severe_btn", use_container_width=True):
-                                # Clear other category details and missing analysis states
-                                st.session_state.show_detailed_missing_info = False
-                                st.session_state.show_detailed_table = False
-                                # Set current category
-                                st.session_state.show_category_detail = "Severe"
-                        
-                        with col2:
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #f39c12; height: 85px; display: flex; flex-direction: column; justify-content: center; margin-bottom: 1rem;">
-                                <h4 style="color: #f39c12; margin: 0 0 -0.8rem 0; font-size: 0.7rem; font-weight: 600; line-height: 0.6;">MODERATE MISSING</h4>
-                                <h2 style="color: #2c3e50; margin: 0; font-size: 1.3rem; font-weight: 700; line-height: 0.6;">{len(moderate_missing)}</h2>
-                                <p style="margin: -0.6rem 0 0 0; font-size: 0.6rem; color: #7f8c8d; line-height: 0.6;">50-80% Missing values</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            if st.button("View Details", key="moderate_btn", use_container_width=True):
-                                # Clear other category details and missing analysis states
-                                st.session_state.show_detailed_missing_info = False
-                                st.session_state.show_detailed_table = False
-                                # Set current category
-                                st.session_state.show_category_detail = "Moderate"
-                        
-                        with col3:
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db; height: 85px; display: flex; flex-direction: column; justify-content: center; margin-bottom: 1rem;">
-                                <h4 style="color: #3498db; margin: 0 0 -0.8rem 0; font-size: 0.7rem; font-weight: 600; line-height: 0.6;">LOW MISSING</h4>
-                                <h2 style="color: #2c3e50; margin: 0; font-size: 1.3rem; font-weight: 700; line-height: 0.6;">{len(low_missing)}</h2>
-                                <p style="margin: -0.6rem 0 0 0; font-size: 0.6rem; color: #7f8c8d; line-height: 0.6;"><50% Missing values</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            if st.button("View Details", key="low_btn", use_container_width=True):
-                                # Clear other category details and missing analysis states
-                                st.session_state.show_detailed_missing_info = False
-                                st.session_state.show_detailed_table = False
-                                # Set current category
-                                st.session_state.show_category_detail = "Low"
-                        
-                        # Detailed missing values table - optimized version
-                        st.markdown("#### Missing Values Analysis Details")
-                        
-                        # Create missing values details DataFrame
-                        missing_df = pd.DataFrame({
-                            'Column': missing_data.index,
-                            'Missing Count': missing_data.values,
-                            'Missing Percentage': (missing_data.values / len(df) * 100).round(2),
-                            'Data Type': [str(df[col].dtype) for col in missing_data.index],
-                            'Category': [
-                                'Severe' if missing_data[col] / len(df) > 0.8 
-                                else 'Moderate' if missing_data[col] / len(df) > 0.5 
-                                else 'Low' for col in missing_data.index
-                            ]
-                        })
-                        
-                        # Create integrated horizontal bar chart to display missing values information
-                        
-                        # Check if specific category details need to be displayed
-                        if 'show_category_detail' in st.session_state and st.session_state.show_category_detail:
-                            selected_category = st.session_state.show_category_detail
-                            category_data = missing_df[missing_df['Category'] == selected_category]
-                            
-                            if len(category_data) > 0:
-                                st.info(f"Displaying {selected_category} category missing values details ({len(category_data)} fields total)")
-                                
-                                # Create specialized chart for selected category
-                                fig_category = go.Figure()
-                                
-                                category_color = {'Severe': '#e74c3c', 'Moderate': '#f39c12', 'Low': '#3498db'}[selected_category]
-                                display_category = category_data.head(10)  # Display up to 10 items
-                                
-                                fig_category.add_trace(go.Bar(
-                                    y=display_category['Column'],
-                                    x=display_category['Missing Percentage'],
-                                    orientation='h',
-                                    marker=dict(color=category_color, line=dict(color='white', width=0.5)),
-                                    text=[f"{val:.1f}%" for val in display_category['Missing Percentage']],
-                                    textposition='inside',
-                                    textfont=dict(color='white', size=10),
-                                    hovertemplate=(
-                                        "<b>%{y}</b><br>" +
-                                        "Missing Ratio: %{x:.1f}%<br>" +
-                                        "Missing Count: %{customdata[0]:,}<br>" +
-                                        "Data Type: %{customdata[1]}" +
-                                        "<extra></extra>"
-                                    ),
-                                    customdata=[[row['Missing Count'], row['Data Type']] for _, row in display_category.iterrows()]
-                                ))
-                                
-                                fig_category.update_layout(
-                                    title=f"{selected_category} Category Missing Values Details",
-                                    xaxis=dict(title="Missing Percentage (%)", range=[0, 105]),
-                                    yaxis=dict(title="", autorange="reversed"),
-                                    height=max(200, len(display_category) * 30),
-                                    template="plotly_white",
-                                    margin=dict(l=120, r=30, t=50, b=40),
-                                    showlegend=False
-                                )
-                                
-                                st.plotly_chart(fig_category, use_container_width=True)
-                            else:
-                                st.warning(f"No missing values found in {selected_category} category")
-                        
-                        else:
-                            # Prepare data for visualization
-                            missing_viz_data = []
-                            for idx, row in missing_df.iterrows():
-                                percentage = row['Missing Percentage']
-                                category = row['Category']
-                                
-                                # Determine color based on category
-                                if category == 'Severe':
-                                    color = "#e74c3c"
-                                elif category == 'Moderate':
-                                    color = "#f39c12"
-                                else:
-                                    color = "#3498db"
-                                
-                                missing_viz_data.append({
-                                    'Column': row['Column'],
-                                    'Missing_Count': row['Missing Count'],
-                                    'Missing_Percentage': percentage,
-                                    'Category': category,
-                                    'Color': color,
-                                    'Data_Type': row['Data Type']
-                                })
-                            
-                            # Create beautiful integrated bar chart
-                            if missing_viz_data:
-                                # Sort by missing percentage
-                                missing_viz_data.sort(key=lambda x: x['Missing_Percentage'], reverse=True)
-                                
-                                # If too many fields, only show top 10 most severe ones
-                                display_data = missing_viz_data[:10] if len(missing_viz_data) > 10 else missing_viz_data
-                                remaining_count = len(missing_viz_data) - len(display_data)
-                                
-                                if remaining_count > 0:
-                                    st.markdown(f"""
-                                    <div class="missing-info-text">
-                                        <div style="background-color: #d1ecf1; color: #0c5460; padding: 0.75rem 1rem; border-radius: 8px; border-left: 4px solid #bee5eb; margin: 1rem 0; animation: slideInLeft 0.6s ease-out;">
-                                            Showing top {len(display_data)} fields with most missing values, {remaining_count} more fields have missing values
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                # Create Plotly chart - remove legend
-                                fig_overview = go.Figure()
-                                
-                                # Create single trace for all data without categorization
-                                fig_overview.add_trace(go.Bar(
-                                    y=[item['Column'] for item in display_data],
-                                    x=[item['Missing_Percentage'] for item in display_data],
-                                    orientation='h',
-                                    marker=dict(
-                                        color=[item['Color'] for item in display_data],
-                                        line=dict(color='white', width=0.5)
-                                    ),
-                                    text=[f"{item['Missing_Percentage']:.1f}%" for item in display_data],
-                                    textposition='inside',
-                                    textfont=dict(color='white', size=10, family="Arial"),
-                                    hovertemplate=(
-                                        "<b>%{y}</b><br>" +
-                                        "Missing Ratio: %{x:.1f}%<br>" +
-                                        "Missing Count: %{customdata[0]:,}<br>" +
-                                        "Data Type: %{customdata[1]}" +
-                                        "<extra></extra>"
-                                    ),
-                                    customdata=[[item['Missing_Count'], item['Data_Type']] for item in display_data],
-                                    showlegend=False
-                                ))
-                                
-                                fig_overview.update_layout(
-                                    title=dict(
-                                        text="Missing Values Analysis Overview",
-                                        font=dict(size=14, color="#2c3e50"),
-                                        x=0.5
-                                    ),
-                                    xaxis=dict(
-                                        title="Missing Percentage (%)",
-                                        showgrid=True,
-                                        gridcolor='rgba(128,128,128,0.2)',
-                                        range=[0, 105]
-                                    ),
-                                    yaxis=dict(
-                                        title="",
-                                        autorange="reversed",
-                                        tickfont=dict(size=10)
-                                    ),
-                                    height=max(250, len(display_data) * 30),
-                                    template="plotly_white",
-                                    margin=dict(l=120, r=30, t=50, b=40),
-                                    plot_bgcolor='rgba(248,249,250,0.5)',
-                                    paper_bgcolor='white',
-                                    showlegend=False
-                                )
-                                
-                                # Add simplified reference lines (only when meaningful)
-                                if any(item['Missing_Percentage'] > 50 for item in display_data):
-                                    fig_overview.add_vline(x=50, line_dash="dot", line_color="orange", line_width=1)
-                                if any(item['Missing_Percentage'] > 80 for item in display_data):
-                                    fig_overview.add_vline(x=80, line_dash="dot", line_color="red", line_width=1)
-                                
-                                st.plotly_chart(fig_overview, use_container_width=True)
-                                
-                                # Add compact statistical summary
-                                col_summary1, col_summary2, col_summary3, col_summary4 = st.columns(4)
-                                with col_summary1:
-                                    st.metric("Highest Missing Rate", f"{max(item['Missing_Percentage'] for item in missing_viz_data):.1f}%", 
-                                             help="Field with highest missing value proportion in dataset")
-                                with col_summary2:
-                                    avg_missing = sum(item['Missing_Percentage'] for item in missing_viz_data) / len(missing_viz_data)
-                                    st.metric("Average Missing Rate", f"{avg_missing:.1f}%", 
-                                             help="Average missing ratio for all fields with missing values")
-                                with col_summary3:
-                                    st.metric("Missing Fields Count", f"{len(missing_viz_data)}", 
-                                             help="Total number of fields with missing values")
-                                with col_summary4:
-                                    severe_count = len([item for item in missing_viz_data if item['Category'] == 'Severe'])
-                                    st.metric("Severe Missing", f"{severe_count}", 
-                                             help="Number of fields with missing rate exceeding 80%")
-                        
-                        # Add functional buttons (without divider) - Modified layout: 3+2 with longer bottom buttons
-                        col_btn1, col_btn2, col_btn3 = st.columns(3)
-                        with col_btn1:
-                            if st.button("Detailed Chart", key="detailed_chart_btn", use_container_width=True):
-                                # Clear other missing analysis states
-                                st.session_state.show_detailed_table = False
-                                if 'show_category_detail' in st.session_state:
-                                    del st.session_state.show_category_detail
-                                # Toggle current state
-                                st.session_state.show_detailed_missing_info = not st.session_state.get('show_detailed_missing_info', False)
-                        with col_btn2:
-                            if st.button("Data Table", key="detailed_table_btn", use_container_width=True):
-                                # Clear other missing analysis states
-                                st.session_state.show_detailed_missing_info = False
-                                if 'show_category_detail' in st.session_state:
-                                    del st.session_state.show_category_detail
-                                # Toggle current state
-                                st.session_state.show_detailed_table = not st.session_state.get('show_detailed_table', False)
-                        with col_btn3:
-                            if st.button("Back to Overview", key="back_overview_btn", use_container_width=True):
-                                # Clear all missing analysis states
-                                st.session_state.show_detailed_missing_info = False
-                                st.session_state.show_detailed_table = False
-                                if 'show_category_detail' in st.session_state:
-                                    del st.session_state.show_category_detail
-                        
-                        # Second row with 2 longer buttons
-                        col_btn4, col_btn5 = st.columns(2)
-                        with col_btn4:
-                            if st.button("Advanced Analysis", key="advanced_analysis_btn", use_container_width=True):
-                                st.info("Advanced missing value analysis coming soon!")
-                        with col_btn5:
-                            if st.button("Export Report", key="export_report_btn", use_container_width=True):
-                                st.info("Export functionality coming soon!")
-                        
-                        # Display detailed original charts (collapsible)
-                        if st.session_state.get('show_detailed_missing_info', False):
-                            st.markdown("#### Detailed Missing Values Visualization")
-                            
-                            # Create original missing value percentage chart
-                            missing_pct = (missing_data / len(df) * 100)
-                            
-                            fig_detailed = go.Figure(data=[
-                                go.Bar(
-                                    x=missing_pct.values,
-                                    y=missing_pct.index,
-                                    orientation='h',
-                                    marker=dict(
-                                        color=missing_pct.values,
-                                        colorscale='RdYlBu_r',
-                                        showscale=True,
-                                        colorbar=dict(title="Missing %", thickness=15)
-                                    ),
-                                    text=[f'{val:.1f}%' for val in missing_pct.values],
-                                    textposition='auto',
-                                    hovertemplate=(
-                                        "<b>%{y}</b><br>" +
-                                        "Missing Ratio: %{x:.1f}%<br>" +
-                                        "Missing Count: %{customdata:,}" +
-                                        "<extra></extra>"
-                                    ),
-                                    customdata=missing_data.values
-                                )
-                            ])
-                            
-                            fig_detailed.update_layout(
-                                title="Detailed Missing Values Analysis - Continuous Color Scale Display",
-                                xaxis_title="Missing Percentage (%)",
-                                yaxis_title="Field Name",
-                                height=max(400, len(missing_data) * 25),
-                                template="plotly_white",
-                                margin=dict(l=150, r=80, t=60, b=60)
-                            )
-                            
-                            st.plotly_chart(fig_detailed, use_container_width=True)
-                        
-                        # Display detailed data table (collapsible)
-                        if st.session_state.get('show_detailed_table', False):
-                            st.markdown("#### Detailed Data Table")
-                            
-                            # Use more refined styling function
-                            def style_missing_table(df):
-                                def color_percentage(val):
-                                    if val > 80:
-                                        return 'background: linear-gradient(90deg, #ffebee, #ffcdd2); color: #c62828; font-weight: 600;'
-                                    elif val > 50:
-                                        return 'background: linear-gradient(90deg, #fff3e0, #ffe0b2); color: #ef6c00; font-weight: 600;'
-                                    else:
-                                        return 'background: linear-gradient(90deg, #e3f2fd, #bbdefb); color: #1565c0; font-weight: 600;'
-                                
-                                def color_category(val):
-                                    if val == 'Severe':
-                                        return 'background: #ffebee; color: #c62828; font-weight: 600; text-align: center; border-radius: 8px; padding: 4px;'
-                                    elif val == 'Moderate':
-                                        return 'background: #fff3e0; color: #ef6c00; font-weight: 600; text-align: center; border-radius: 8px; padding: 4px;'
-                                    else:
-                                        return 'background: #e3f2fd; color: #1565c0; font-weight: 600; text-align: center; border-radius: 8px; padding: 4px;'
-                                
-                                return df.style.applymap(color_percentage, subset=['Missing Percentage']).applymap(color_category, subset=['Category']).format({
-                                    'Missing Count': '{:,}',
-                                    'Missing Percentage': '{:.1f}%'
-                                })
-                            
-                            styled_table = style_missing_table(missing_df)
-                            st.dataframe(styled_table, use_container_width=True, hide_index=True)
-                        
-                        else:
-                            # Display data integrity confirmation
-                            st.markdown(f"""
-                            <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; margin: 1rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">
-                                <h4 style="color: #27ae60; margin: 0; font-size: 1.2rem;">Perfect Data Quality</h4>
-                                <p style="margin: 0.5rem 0 0 0; color: #7f8c8d; font-size: 0.9rem;">All {len(df):,} records have complete data across all {len(df.columns)} columns.</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        st.markdown("<br>", unsafe_allow_html=True)
+                    # Record login
+                    log_operation(
+                        user['email'],
+                        "login",
+                        None,
+                        None,
+                        {"ip": get_client_ip()},
+                        get_client_ip(),
+                        engine
+                    )
+                    st.rerun()
+                else:
+                    st.error("Authentication failed or access not approved")
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    else:
+        # User Status Card
+        user_info = st.session_state["authenticated_user"]
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 1.5rem; border-left: 4px solid #27ae60;">
+            <h4 style="color: #2c3e50; margin: 0 0 1rem 0; font-size: 1rem; font-weight: 600;">
+                Current User
+            </h4>
+            <div style="margin-bottom: 0.5rem;">
+                <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600;">Name</p>
+                <p style="color: #2c3e50; margin: 0; font-weight: 500;">{user_info['name']}</p>
+            </div>
+            <div style="margin-bottom: 0.5rem;">
+                <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600;">Email</p>
+                <p style="color: #2c3e50; margin: 0; font-weight: 500; font-size: 0.85rem;">{user_info['email']}</p>
+            </div>
+            <div style="margin-bottom: 1rem;">
+                <p style="color: #7f8c8d; margin: 0; font-size: 0.8rem; font-weight: 600;">Role</p>
+                <span style="background: #27ae60; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">
+                    {user_info['role'].upper()}
+                </span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Logout", use_container_width=True):
+            del st.session_state["authenticated_user"]
+            st.rerun()
+
+# ——————————————————————————————
+# 16. Main Interface Tabs with Role-based Access Control
+# ——————————————————————————————
+# 根据用户角色动态创建标签页
+if "authenticated_user" in st.session_state:
+    # Check for admin balloon effect
+    if st.session_state.get("show_admin_balloons", False):
+        st.balloons()
+        # Clear the flag so balloons only show once
+        del st.session_state["show_admin_balloons"]
+    
+    user_role = st.session_state["authenticated_user"]["role"]
+    
+    if user_role == "admin":
+        # admin用户可以看到所有标签页
+        tab_names = ["Data Management", "Access Control", "Data Changes", "Model Configuration", "Model Training", "Predictions"]
+        tabs = st.tabs(tab_names)
+        tab_indexes = {
+            "data_management": 0,
+            "access_control": 1,
+            "data_changes": 2,
+            "model_configuration": 3,
+            "model_training": 4,
+            "predictions": 5
+        }
+    elif user_role == "editor":
+        # editor用户可以看到：Data Management、Model Configuration和Predictions
+        tab_names = ["Data Management", "Model Configuration", "Predictions"]
+        tabs = st.tabs(tab_names)
+        tab_indexes = {
+            "data_management": 0,
+            "model_configuration": 1,
+            "predictions": 2
+        }
+    else:  # viewer用户
+        # viewer用户只能看到：Data Management、Model Configuration和Predictions
+        tab_names = ["Data Management", "Model Configuration", "Predictions"]
+        tabs = st.tabs(tab_names)
+        tab_indexes = {
+            "data_management": 0,
+            "model_configuration": 1,
+            "predictions": 2
+        }
+else:
+    # 未认证用户显示登录注册标签和其他基本标签页
+    tab_names = ["Login/Register", "Model Configuration", "Predictions"]
+    tabs = st.tabs(tab_names)
+    tab_indexes = {
+        "login_register": 0,
+        "model_configuration": 1,
+        "predictions": 2
+    }
+
+
+# ——————————————————————————————
+# 标签页内容处理
+# ——————————————————————————————
+
+# 登录/注册标签页 (未认证用户)
+if "authenticated_user" not in st.session_state:
+    with tabs[tab_indexes["login_register"]]:
+        
+        if not engine:
+            st.error("❌ Database connection failed. Please check database configuration.")
+            st.markdown("""
+            **Troubleshooting steps:**
+            1. Verify MySQL server is running
+            2. Check database connection parameters in environment variables
+            3. Ensure network connectivity to localhost:3306
+            4. Contact system administrator if issues persist
+            """)
+            st.stop()
+        
+        st.warning("Please log in to access data management functions.")
+        
+        # Access request form with clean design
+        st.subheader("Request Access")
+        
+        # Information card
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); border-left: 4px solid #3498db; margin-bottom: 2rem;">
+            <p style="color: #2c3e50; margin: 0; font-size: 1rem; line-height: 1.5;">
+                To access our FRP materials database, please complete the form below. 
+                All requests are reviewed by our research team within 2-3 business days.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        with st.form("access_request_form", clear_on_submit=True):
+            # Form layout in a more organized way
+            # Row 1: Name and Institution
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                req_name = st.text_input(
+                    "Full Name",
+                    placeholder="Enter your full name",
+                    help="Your complete name as it appears in official documents"
+                )
+            
+            with col2:
+                req_institution = st.text_input(
+                    "Institution/University",
+                    placeholder="Your academic or research institution",
+                    help="Name of your university, research center, or organization"
+                )
+            
+            # Row 2: Email
+            req_email = st.text_input(
+                "Email Address",
+                placeholder="your.email@institution.edu",
+                help="Please use your institutional email address"
+            )
+            
+            # Row 3: Research Purpose
+            research_purpose = st.text_area(
+                "Research Purpose",
+                placeholder="Brief description of your research goals...",
+                help="Help us understand how you plan to use the database",
+                height=100
+            )
+            
+            # IP address information
+            client_ip = get_client_ip()
+            st.markdown(f"""
+            <div style="background: #f8f9fa; padding: 1rem; border-radius: 6px; margin: 1rem 0; border-left: 3px solid #6c757d;">
+                <small style="color: #495057;">
+                    <strong>Your IP Address:</strong> {client_ip} 
+                    <em>(logged for security purposes)</em>
+                </small>
+            </div>
+            """, unsafe_allow_html=True)
             
-            # Data Operations - collapsible section (对admin和editor用户可见)
-                    with quality_tabs[1]:
-                        # Data Distribution Analysis Panel - Integrated complete data visualization functionality
-                        st.markdown("### Data Distribution & Visualization")
-                        
-                        # Top statistics cards following Model Configuration style
-                        col1, col2, col3, col4 = st.columns(4)
-                        
-                        # Calculate statistics
-                        numeric_cols = df.select_dtypes(include=[np.number]).columns
-                        text_cols = df.select_dtypes(include=['object']).columns
-                        datetime_cols = df.select_dtypes(include=['datetime64']).columns
-                        if 'time_field' in df.columns:
-                            try:
-                                df['time_field'] = pd.to_datetime(df['time_field'])
-                                if 'time_field' not in datetime_cols:
-                                    datetime_cols = datetime_cols.union(['time_field'])
-                            except:
-                                pass
-                        
-                        # Calculate statistics
-                        if len(df) > 0:
-                            total_null = df.isnull().sum().sum()
-                        
-                        with col1:
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db; height: 120px; display: flex; flex-direction: column; justify-content: center;">
-                                <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600;">NUMERIC FIELDS</h4>
-                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{len(numeric_cols)}</h2>
-                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Continuous variables</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        with col2:
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #9b59b6; height: 120px; display: flex; flex-direction: column; justify-content: center;">
-                                <h4 style="color: #9b59b6; margin: 0; font-size: 0.75rem; font-weight: 600;">TEXT FIELDS</h4>
-                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{len(text_cols)}</h2>
-                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Categorical variables</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        with col3:
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #1abc9c; height: 120px; display: flex; flex-direction: column; justify-content: center;">
-                                <h4 style="color: #1abc9c; margin: 0; font-size: 0.75rem; font-weight: 600;">DATETIME FIELDS</h4>
-                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{len(datetime_cols)}</h2>
-                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Time series variables</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        with col4:
-                            null_percentage = (total_null / (len(df) * len(df.columns)) * 100) if len(df) > 0 else 0
-                            st.markdown(f"""
-                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #34495e; height: 120px; display: flex; flex-direction: column; justify-content: center;">
-                                <h4 style="color: #34495e; margin: 0; font-size: 0.75rem; font-weight: 600;">MISSING VALUES</h4>
-                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{null_percentage:.1f}%</h2>
-                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Overall completion</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # Integrated visualization analysis tab
-                        viz_sub_tabs = st.tabs(["Distribution Analysis", "Relationships", "Summary"])
-                        
-                        with viz_sub_tabs[0]:
-                            st.markdown("#### Field Distribution Analysis")
-                            
-                            # Create layout for column type selection and field selection
-                            col_type_selection, col_field_selection = st.columns([1, 2])
-                            
-                            with col_type_selection:
-                                # Column type selection
-                                available_types = []
-                                if len(numeric_cols) > 0:
-                                    available_types.append("Numerical Columns")
-                                if len(text_cols) > 0:
-                                    available_types.append("Text Columns")
-                                
-                                if available_types:
-                                    selected_type = st.selectbox(
-                                        "Select analysis type:",
-                                        available_types,
-                                        key="column_type_selection"
-                                    )
-                                else:
-                                    st.warning("No columns available for analysis")
-                                    selected_type = None
-                            
-                            with col_field_selection:
-                                if selected_type == "Numerical Columns":
-                                    # Numerical column selection
-                                    meaningful_cols = [col for col in numeric_cols if not col.lower().startswith('id')]
-                                    if not meaningful_cols:
-                                        meaningful_cols = numeric_cols.tolist()
-                                    
-                                    # Smart default selection
-                                    default_col = None
-                                    priority_cols = ['Value1', 'temperature', 'pH', 'pH_1', 'time_field', 'ultimate_tensile_strength']
-                                    for priority in priority_cols:
-                                        if priority in meaningful_cols:
-                                            default_col = priority
-                                            break
-                                    if not default_col and meaningful_cols:
-                                        default_col = meaningful_cols[0]
-                                    
-                                    selected_col = st.selectbox(
-                                        "Select numerical column to analyze:",
-                                        meaningful_cols,
-                                        index=meaningful_cols.index(default_col) if default_col in meaningful_cols else 0,
-                                        key="numeric_dist_analysis"
-                                    )
-                                
-                                elif selected_type == "Text Columns":
-                                    # Text column selection
-                                    selected_col = st.selectbox(
-                                        "Select text column to analyze:",
-                                        text_cols.tolist(),
-                                        key="text_dist_analysis"
-                                    )
-                                else:
-                                    selected_col = None
-                            
-                            # Analysis results display
-                            if selected_col and selected_type:
-                                st.markdown("---")
-                                
-                                if selected_type == "Numerical Columns":
-                                    # Numerical column analysis
-                                    col_data = pd.to_numeric(df[selected_col], errors='coerce').dropna()
-                                    
-                                    if len(col_data) > 0:
-                                        # Statistical summary
-                                        col1, col2, col3 = st.columns(3)
-                                        with col1:
-                                            st.metric("Mean", f"{col_data.mean():.2f}")
-                                        with col2:
-                                            st.metric("Median", f"{col_data.median():.2f}")
-                                        with col3:
-                                            st.metric("Std Dev", f"{col_data.std():.2f}")
-                                        
-                                        # Distribution chart
-                                        fig = px.histogram(x=col_data, title=f"{selected_col} Distribution")
-                                        st.plotly_chart(fig, use_container_width=True)
-                                    else:
-                                        st.warning(f"Column '{selected_col}' does not contain valid numerical data")
-                                
-                                elif selected_type == "Text Columns":
-                                    # Text column analysis
-                                    text_data = df[selected_col].dropna()
-                                    
-                                    if len(text_data) > 0:
-                                        # Text statistics
-                                        col1, col2, col3 = st.columns(3)
-                                        with col1:
-                                            st.metric("Unique Values", f"{text_data.nunique()}")
-                                        with col2:
-                                            st.metric("Most Common", f"{text_data.mode().iloc[0] if len(text_data.mode()) > 0 else 'N/A'}")
-                                        with col3:
-                                            st.metric("Total Count", f"{len(text_data)}")
-                                        
-                                        # Distribution chart
-                                        text_counts = text_data.value_counts().head(10)
-                                        fig = px.bar(x=text_counts.values, y=text_counts.index, orientation='h', 
-                                                   title=f"{selected_col} Distribution (Top 10)")
-                                        st.plotly_chart(fig, use_container_width=True)
-                                    else:
-                                        st.warning(f"Column '{selected_col}' does not contain valid text data")
-                        
-                        with viz_sub_tabs[1]:
-                            st.markdown("#### Variable Correlation Analysis")
-                            
-                            if len(numeric_cols) >= 2:
-                                # Variable selection
-                                col1, col2 = st.columns(2)
-                                
-                                with col1:
-                                    x_col = st.selectbox(
-                                        "X-axis Variable:",
-                                        numeric_cols.tolist(),
-                                        key="scatter_x_var"
-                                    )
-                                
-                                with col2:
-                                    y_col = st.selectbox(
-                                        "Y-axis Variable:",
-                                        [col for col in numeric_cols if col != x_col],
-                                        key="scatter_y_var"
-                                    )
-                                
-                                if x_col and y_col:
-                                    # Prepare data
-                                    x_data = pd.to_numeric(df[x_col], errors='coerce')
-                                    y_data = pd.to_numeric(df[y_col], errors='coerce')
-                                    valid_mask = x_data.notna() & y_data.notna()
-                                    
-                                    if valid_mask.sum() > 0:
-                                        # Calculate correlation
-                                        correlation = x_data[valid_mask].corr(y_data[valid_mask])
-                                        
-                                        # Display correlation
-                                        st.metric("Correlation Coefficient", f"{correlation:.3f}")
-                                        
-                                        # Scatter plot
-                                        plot_df = pd.DataFrame({
-                                            'x': x_data[valid_mask],
-                                            'y': y_data[valid_mask]
-                                        })
-                                        
-                                        fig = px.scatter(plot_df, x='x', y='y', 
-                                                       title=f"{x_col} vs {y_col}",
-                                                       labels={'x': x_col, 'y': y_col})
-                                        st.plotly_chart(fig, use_container_width=True)
-                                    else:
-                                        st.warning("No valid data points for correlation analysis")
-                            else:
-                                st.info("Need at least 2 numerical columns for correlation analysis")
+            # Security notice if IP not in allowed range
+            if not is_ip_allowed(client_ip):
+                st.markdown("""
+                <div style="background: #fff3cd; padding: 1rem; border-radius: 6px; margin: 1rem 0; border-left: 3px solid #ffc107;">
+                    <small style="color: #856404;">
+                        <strong>Notice:</strong> Your IP address requires additional verification. 
+                        Your request may take longer to process.
+                    </small>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Terms acceptance
+            st.markdown("---")
+            terms_accepted = st.checkbox(
+                "I agree to use the FRP materials database responsibly for research purposes only",
+                help="Required: Agreement to terms of service and data usage policy"
+            )
+            
+            # Submit button
+            col_submit1, col_submit2, col_submit3 = st.columns([1, 1, 1])
+            with col_submit2:
+                submit_pressed = st.form_submit_button(
+                    "Submit Request",
+                    type="primary",
+                    use_container_width=True
+                )
+            
+            # Form processing
+            if submit_pressed:
+                # Validation
+                if not all([req_name, req_email, req_institution]):
+                    st.error("Please fill in all required fields")
+                elif not terms_accepted:
+                    st.error("Please accept the terms and conditions")
+                elif "@" not in req_email or "." not in req_email:
+                    st.error("Please enter a valid email address")
+                else:
+                    # Process request
+                    success, msg = request_access(req_name, req_email, req_institution, client_ip, engine)
+                    if success:
+                        st.success("Access request submitted successfully!")
+                        st.info("Thank you for your interest. Our team will review your request and contact you within 2-3 business days.")
                         
-                        with viz_sub_tabs[2]:
-                            st.markdown("#### Comprehensive Data Summary")
-                            
-                            # Main content area with three analysis modules
-                            summary_tabs = st.tabs(["Correlation Overview", "Field Type Analysis", "Data Quality Report"])
-                            
-                            with summary_tabs[0]:
-                                # Correlation Overview - 相关性概览
-                                st.markdown("**Numerical Variable Correlation Overview**")
-                                
-                                if len(numeric_cols) >= 2:
-                                    # Select number of variables to display
-                                    max_vars = min(len(numeric_cols), 12)  # Display up to 12 variables
-                                    if len(numeric_cols) > max_vars:
-                                        st.info(f"Displaying correlation of top {max_vars} numerical variables, total {len(numeric_cols)} numerical variables")
-                                    
-                                    selected_numeric_cols = numeric_cols[:max_vars]
-                                    corr_matrix = df[selected_numeric_cols].corr()
-                                    
-                                    # Create correlation heatmap
-                                    fig_heatmap = px.imshow(
-                                        corr_matrix,
-                                        title="Variable Correlation Heatmap",
-                                        color_continuous_scale='RdBu',
-                                        aspect="auto",
-                                        text_auto=True,
-                                        height=400
-                                    )
-                                    
-                                    fig_heatmap.update_traces(
-                                        text=corr_matrix.round(2).values,
-                                        texttemplate="%{text}",
-                                        textfont={"size": 9}
-                                    )
-                                    
-                                    fig_heatmap.update_layout(
-                                        title_font_size=14,
-                                        margin=dict(l=100, r=50, t=60, b=50)
-                                    )
-                                    
-                                    st.plotly_chart(fig_heatmap, use_container_width=True)
-                                else:
-                                    st.info("Insufficient numerical variables to generate correlation heatmap")
-                            
-                            with summary_tabs[1]:
-                                # Field Type Analysis - Field Type Analysis
-                                st.markdown("**Field Type Distribution and Details**")
-                                
-                                # Data type statistics
-                                dtype_counts = df.dtypes.value_counts()
-                                
-                                if len(dtype_counts) > 0:
-                                    type_chart_col, type_detail_col = st.columns([1.5, 1])
-                                    
-                                    with type_chart_col:
-                                        fig_dtype = px.pie(
-                                            values=dtype_counts.values,
-                                            names=[str(dtype) for dtype in dtype_counts.index],
-                                            title="Data Type Distribution",
-                                            height=300
-                                        )
-                                        fig_dtype.update_traces(textposition='inside', textinfo='percent+label')
-                                        st.plotly_chart(fig_dtype, use_container_width=True)
-                                    
-                                    with type_detail_col:
-                                        # Detailed type statistics table
-                                        type_detail_df = pd.DataFrame({
-                                            'Data Type': [str(dtype) for dtype in dtype_counts.index],
-                                            'Field Count': dtype_counts.values,
-                                            'Percentage': [f"{count/len(df.columns)*100:.1f}%" for count in dtype_counts.values]
-                                        })
-                                        st.dataframe(type_detail_df, hide_index=True, use_container_width=True)
-                                
-                                # Field detailed information table
-                                st.markdown("**Field Detailed Information**")
-                                
-                                field_info = []
-                                for col in df.columns:
-                                    col_data = df[col]
-                                    field_info.append({
-                                        'Field Name': col,
-                                        'Data Type': str(col_data.dtype),
-                                        'Non-null Count': col_data.notna().sum(),
-                                        'Missing Count': col_data.isnull().sum(),
-                                        'Missing Rate': f"{col_data.isnull().sum()/len(col_data)*100:.1f}%",
-                                        'Unique Count': col_data.nunique() if col_data.dtype == 'object' else 'N/A'
-                                    })
-                                
-                                field_info_df = pd.DataFrame(field_info)
-                                st.dataframe(field_info_df, hide_index=True, use_container_width=True, height=400)
-                            
-                            with summary_tabs[2]:
-                                # Data Quality Report - 数据质量报告
-                                st.markdown("**Comprehensive Data Quality Assessment**")
-                                
-                                # Calculate comprehensive indicators
-                                total_rows = len(df)
-                                total_cols = len(df.columns)
-                                missing_cells = df.isnull().sum().sum()
-                                total_cells = total_rows * total_cols
-                                overall_completeness = ((total_cells - missing_cells) / total_cells * 100) if total_cells > 0 else 0
-                                duplicate_rows = df.duplicated().sum()
-                                
-                                # Quality score calculation
-                                completeness_score = overall_completeness
-                                uniqueness_score = (1 - duplicate_rows/total_rows) * 100 if total_rows > 0 else 100
-                                consistency_score = 85  # Basic consistency score
-                                
-                                overall_quality = (completeness_score + uniqueness_score + consistency_score) / 3
-                                
-                                # Quality score cards
-                                quality_col1, quality_col2, quality_col3, quality_col4 = st.columns(4)
-                                
-                                with quality_col1:
-                                    comp_color = "#27ae60" if completeness_score > 80 else "#f39c12" if completeness_score > 60 else "#e74c3c"
-                                    st.markdown(f"""
-                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {comp_color};">
-                                        <h4 style="color: {comp_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">COMPLETENESS</h4>
-                                        <h3 style="color: {comp_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{completeness_score:.1f}</h3>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                with quality_col2:
-                                    uniq_color = "#27ae60" if uniqueness_score > 90 else "#f39c12" if uniqueness_score > 70 else "#e74c3c"
-                                    st.markdown(f"""
-                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {uniq_color};">
-                                        <h4 style="color: {uniq_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">UNIQUENESS</h4>
-                                        <h3 style="color: {uniq_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{uniqueness_score:.1f}</h3>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                with quality_col3:
-                                    cons_color = "#27ae60" if consistency_score > 80 else "#f39c12" if consistency_score > 60 else "#e74c3c"
-                                    st.markdown(f"""
-                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {cons_color};">
-                                        <h4 style="color: {cons_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">CONSISTENCY</h4>
-                                        <h3 style="color: {cons_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{consistency_score:.1f}</h3>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                with quality_col4:
-                                    overall_color = "#27ae60" if overall_quality > 80 else "#f39c12" if overall_quality > 60 else "#e74c3c"
-                                    st.markdown(f"""
-                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {overall_color};">
-                                        <h4 style="color: {overall_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">OVERALL SCORE</h4>
-                                        <h3 style="color: {overall_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{overall_quality:.1f}</h3>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                st.markdown("<br>", unsafe_allow_html=True)
-                                
-                                # Quality issue analysis
-                                st.markdown("**Quality Issue Analysis**")
-                                
-                                quality_issues = []
-                                
-                                # Check missing values issue
-                                if missing_cells > total_cells * 0.1:
-                                    quality_issues.append("Dataset has too many missing values, data cleaning is recommended")
-                                
-                                # Check duplicate rows issue
-                                if duplicate_rows > 0:
-                                    quality_issues.append(f"Found {duplicate_rows} duplicate rows, deduplication is recommended")
-                                
-                                # Check data type consistency
-                                mixed_types = 0
-                                for col in df.columns:
-                                    if df[col].dtype == 'object':
-                                        # Try to convert to numeric, check for mixed types
-                                        numeric_converted = pd.to_numeric(df[col], errors='coerce')
-                                        if numeric_converted.notna().sum() > len(df[col]) * 0.5:  # If more than 50% can be converted to numeric
-                                            mixed_types += 1
-                                
-                                if mixed_types > 0:
-                                    quality_issues.append(f"Found {mixed_types} fields with possible data type inconsistency issues")
-                                
-                                if not quality_issues:
-                                    st.success("Data quality is good, no obvious issues found")
-                                else:
-                                    for issue in quality_issues:
-                                        st.warning(issue)
+                        # Send notification email
+                        email_body = f"""
+                        New FRP Database Access Request
+                        
+                        Request Details:
+                        • Name: {req_name}
+                        • Email: {req_email}
+                        • Institution: {req_institution}
+                        • IP Address: {client_ip}
+                        • Research Purpose: {research_purpose}
+                        • Terms Accepted: {terms_accepted}
+                        
+                        Submitted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                        
+                        Please review and approve/deny this request in the admin panel.
+                        """
+                        
+                        send_email(
+                            EMAIL_USER,
+                            "New FRP DB Access Request",
+                            email_body
+                        )
+                    else:
+                        st.error(msg)
+        
+        # Additional information
+        st.markdown("---")
+        st.markdown("""
+        <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 8px; margin-top: 2rem;">
+            <h5 style="color: #495057; margin: 0 0 1rem 0;">About Our Database</h5>
+            <p style="color: #6c757d; margin: 0; font-size: 0.95rem; line-height: 1.5;">
+                Our FRP materials database contains comprehensive research data for fiber-reinforced polymer 
+                materials, supporting global research in advanced materials science and engineering applications.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# ——————————————————————————————
+# Data Management 标签页 (已认证用户)
+# ——————————————————————————————
+else:
+    with tabs[tab_indexes["data_management"]]:
+        if not engine:
+            st.error("❌ Database connection failed. Please check database configuration.")
+            st.markdown("""
+            **Troubleshooting steps:**
+            1. Verify MySQL server is running (check if XAMPP/WAMP is started)
+            2. Check database credentials in environment variables
+            3. Ensure research_data table exists in haigui_database
+            4. Contact system administrator if issues persist
+            """)
+            st.stop()
+        
+        # Authenticated user's data management interface
+        user_info = st.session_state["authenticated_user"]
+        user_role = user_info.get("role", "viewer")
+        
+        # Welcome header for authenticated users - clean design
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
+            <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
+                Data Management Console
+            </h3>
+            <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
+                Welcome back, {user_info.get('name', 'User')} ({user_role}) - Manage and explore FRP materials research data
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
 
+        # Data browsing section - clean design
+        st.markdown("### Database Overview")
+        
+        # Select data table - clean styling
+        col_select1, col_select2 = st.columns([2, 1])
+        with col_select1:
+            table_name = st.selectbox(
+                "Select Data Table", 
+                ["research_data", "research_data_backup"],
+                help="Choose which data table to explore"
+            )
+        with col_select2:
+            st.markdown("""
+            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #27ae60; margin-top: 1.7rem;">
+                <small style="color: #2c3e50; font-weight: 600;">Data Explorer</small>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Read data with improved error handling
+        try:
+            # Use fixed data loading function with explicit database connection
+            if table_name == "research_data":
+                df = data_manager.get_data(
+                    f"table_{table_name}",
+                    lambda: load_default_data()
+                )
+                # 验证数据是否正确加载
+                if df is None:
+                    st.error("❌ Failed to load data from database. Please check database connection.")
+                    # 提供重新加载选项
+                    if st.button("🔄 Retry Database Connection", key="retry_db_connection"):
+                        data_manager.invalidate_cache(f"table_{table_name}")
+                        st.session_state.df_raw = None  # 清除缓存
+                        st.rerun()
+                    st.stop()
+                    
+                # 更新全局状态
+                st.session_state.df_raw = df
+                
+            else:
+                # 对其他表的处理
+                df = data_manager.get_data(
+                    f"table_{table_name}",
+                    lambda: pd.read_sql(f"SELECT * FROM {table_name}", engine)
+                )
             
-            # Data Filters
-            with st.expander("Data Filter", expanded=False):
+            if df is None or len(df) == 0:
+                st.error(f"❌ No data found in table '{table_name}' or data loading failed.")
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button("🔄 Reload Data", key="reload_data_btn"):
+                        data_manager.invalidate_cache(f"table_{table_name}")
+                        st.session_state.df_raw = None  # 清除缓存
+                        st.rerun()
+                with col2:
+                    if st.button("🔍 Check Database", key="check_db_btn"):
+                        # 检查数据库连接状态
+                        try:
+                            with engine.connect() as conn:
+                                tables = conn.execute(text("SHOW TABLES")).fetchall()
+                                st.info(f"Database connected. Available tables: {[t[0] for t in tables]}")
+                                if table_name == "research_data":
+                                    count = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
+                                    st.info(f"research_data table contains {count} records")
+                        except Exception as e:
+                            st.error(f"Database connection failed: {e}")
+                st.stop()
+            
+            # 确保数据已正确加载
+            if df is not None and len(df) > 0:
+                # 数据加载成功，继续处理
+                pass
+            else:
+                st.error("❌ No data loaded from database")
+                st.stop()
+            
+            # 根据用户角色显示不同的数据管理功能
+            if user_role == "admin":
+                # admin用户可以看到所有功能：Data Overview、Missing Values Analysis、Data Distribution和Data Quality
+                with st.expander("Data Overview", expanded=True):
+                    render_data_overview_admin(df, table_name, data_manager)
+            else:
+                # viewer用户只能看到：Data Overview
+                with st.expander("Data Overview", expanded=True):
+                    render_data_overview_viewer(df)
+            
+            # Data visualization - merge data quality dashboard with visualization features
+            with st.expander("Data Visualization", expanded=True):
                 st.markdown("""
-                <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #e67e22;">
+                <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #8e44ad;">
                     <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
-                        Apply advanced filtering criteria to focus on specific data subsets
+                        Explore data patterns, distributions, and relationships through interactive visualizations
                     </p>
                 </div>
                 """, unsafe_allow_html=True)
-                col1, col2, col3 = st.columns(3)
-                
-                # Initialize filter variables
-                fiber_filter = []
-                temp_range = None
-                ph_range = None
-                
-                with col1:
-                    st.subheader("Fiber Type")
-                    if "Fiber_type" in df.columns:
-                        unique_fibers = df["Fiber_type"].dropna().unique().tolist()
-                        if unique_fibers:
-                            fiber_filter = st.multiselect(
-                                "Select fiber types:",
-                                options=unique_fibers,
-                                key="fiber_filter"
-                            )
-                            if fiber_filter:
-                                filtered_count = df[df["Fiber_type"].isin(fiber_filter)].shape[0]
-                                st.caption(f"Selected: {len(fiber_filter)} types, {filtered_count:,} records")
-                        else:
-                            st.caption("No fiber type data available")
-                    else:
-                        st.caption("Fiber type column not found")
-                
-                with col2:
-                    st.subheader("Temperature Range")
-                    if "temperature" in df.columns:
-                        temp_numeric = pd.to_numeric(df["temperature"], errors='coerce')
-                        if temp_numeric.notna().sum() > 0:
-                            temp_min = float(temp_numeric.min())
-                            temp_max = float(temp_numeric.max())
-                            if temp_min != temp_max:
-                                temp_range = st.slider(
-                                    "Temperature (°C):",
-                                    temp_min,
-                                    temp_max,
-                                    (temp_min, temp_max),
-                                    step=0.1,
-                                    key="temp_filter"
-                                )
-                                st.caption(f"Range: {temp_range[0]:.1f}°C - {temp_range[1]:.1f}°C")
-                            else:
-                                temp_range = (temp_min, temp_max)
-                                st.caption(f"Single value: {temp_min:.1f}°C")
-                        else:
-                            st.caption("No valid temperature data")
-                    else:
-                        st.caption("Temperature column not found")
-                
-                with col3:
-                    st.subheader("pH Range")
-                    if "pH_1" in df.columns:
-                        ph_numeric = pd.to_numeric(df["pH_1"], errors='coerce')
-                        if ph_numeric.notna().sum() > 0:
-                            ph_min = float(ph_numeric.min())
-                            ph_max = float(ph_numeric.max())
-                            if ph_min != ph_max:
-                                ph_range = st.slider(
-                                    "pH:",
-                                    ph_min,
-                                    ph_max,
-                                    (ph_min, ph_max),
-                                    step=0.1,
-                                    key="ph_filter"
-                                )
-                                avg_ph = (ph_range[0] + ph_range[1]) / 2
-                                ph_category = "Acidic" if avg_ph < 7 else "Basic" if avg_ph > 7 else "Neutral"
-                                st.caption(f"Range: {ph_range[0]:.1f} - {ph_range[1]:.1f} ({ph_category})")
-                            else:
-                                ph_range = (ph_min, ph_max)
-                                st.caption(f"Single value: {ph_min:.1f}")
-                        else:
-                            st.caption("No valid pH data")
-                    else:
-                        st.caption("pH column not found")
-                
-                # Filter summary and reset
-                st.markdown("---")
-                
-                col_summary, col_reset = st.columns([3, 1])
-                
-                with col_summary:
-                    active_filters = []
-                    if fiber_filter:
-                        active_filters.append(f"Fiber Types: {len(fiber_filter)}")
-                    if temp_range and "temperature" in df.columns:
-                        temp_numeric = pd.to_numeric(df["temperature"], errors='coerce')
-                        if temp_numeric.notna().sum() > 0:
-                            temp_min_orig = float(temp_numeric.min())
-                            temp_max_orig = float(temp_numeric.max())
-                            if temp_range != (temp_min_orig, temp_max_orig):
-                                active_filters.append("Temperature Range")
-                    if ph_range and "pH_1" in df.columns:
-                        ph_numeric = pd.to_numeric(df["pH_1"], errors='coerce')
-                        if ph_numeric.notna().sum() > 0:
-                            ph_min_orig = float(ph_numeric.min())
-                            ph_max_orig = float(ph_numeric.max())
-                            if ph_range != (ph_min_orig, ph_max_orig):
-                                active_filters.append("pH Range")
-                    
-                    if active_filters:
-                        st.info(f"Active Filters: {', '.join(active_filters)}")
-                    else:
-                        st.info("No filters applied - Showing all data")
-                
-                with col_reset:
-                    if st.button("Reset Filters", use_container_width=True):
-                        for key in ['fiber_filter', 'temp_filter', 'ph_filter', 'has_active_filters', 'filtered_df', 'original_count', 'filtered_count']:
-                            if key in st.session_state:
-                                del st.session_state[key]
-                        st.rerun()
-                
-                # Apply filters
-                filtered_df = df.copy()
-                original_count = len(filtered_df)
-                
-                # Apply fiber type filter
-                if fiber_filter:
-                    filtered_df = filtered_df[filtered_df["Fiber_type"].isin(fiber_filter)]
-                
-                # Apply temperature filter
-                if temp_range and "temperature" in filtered_df.columns:
-                    temp_numeric = pd.to_numeric(filtered_df["temperature"], errors='coerce')
-                    temp_mask = (temp_numeric >= temp_range[0]) & (temp_numeric <= temp_range[1])
-                    filtered_df = filtered_df[temp_mask.fillna(False)]
-                
-                # Apply pH filter
-                if ph_range and "pH_1" in filtered_df.columns:  # Fix: use pH_1 instead of pH
-                    ph_numeric = pd.to_numeric(filtered_df["pH_1"], errors='coerce')
-                    ph_mask = (ph_numeric >= ph_range[0]) & (ph_numeric <= ph_range[1])
-                    filtered_df = filtered_df[ph_mask.fillna(False)]
                 
-                # Store filtered data for later use
-                filtered_count = len(filtered_df)
-                
-                # Store filter state for display outside expander
-                st.session_state['has_active_filters'] = (fiber_filter or 
-                    (temp_range and "temperature" in df.columns and temp_range != (pd.to_numeric(df["temperature"], errors='coerce').min(), pd.to_numeric(df["temperature"], errors='coerce').max())) or 
-                    (ph_range and "pH_1" in df.columns and ph_range != (pd.to_numeric(df["pH_1"], errors='coerce').min(), pd.to_numeric(df["pH_1"], errors='coerce').max())))
-                
-                st.session_state['filtered_df'] = filtered_df
-                st.session_state['original_count'] = original_count
-                st.session_state['filtered_count'] = filtered_count
-            
-            # Filtered Results section (outside the Data Filter expander)
-            if st.session_state.get('has_active_filters', False):
-                with st.expander("Filtered Results", expanded=True):
-                    st.markdown("""
-                    <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #27ae60;">
-                        <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
-                            View and analyze your filtered dataset results
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Get data from session state
-                    filtered_df = st.session_state.get('filtered_df', df)
-                    original_count = st.session_state.get('original_count', len(df))
-                    filtered_count = st.session_state.get('filtered_count', len(df))
-                    
-                    # Summary statistics
+                # 确认数据可用性
+                if df is None or len(df) == 0:
+                    st.error("❌ No data available for visualization")
+                    st.stop()
+                
+                # 根据用户角色显示不同内容
+                user_role = st.session_state.get("authenticated_user", {}).get("role", "viewer")
+                
+                if user_role == "viewer":
+                    # Viewer用户只看到基本的统计卡片
                     col1, col2, col3, col4 = st.columns(4)
                     
                     with col1:
-                        st.metric(
-                            label="Original Records",
-                            value=f"{original_count:,}",
-                            help="Total number of records before filtering"
-                        )
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
+                            <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600;">RECORDS</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{len(df):,}</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Total entries</p>
+                        </div>
+                        """, unsafe_allow_html=True)
                     
                     with col2:
-                        st.metric(
-                            label="Filtered Records", 
-                            value=f"{filtered_count:,}",
-                            delta=f"{filtered_count - original_count:,}",
-                            delta_color="inverse",
-                            help="Number of records after applying filters"
-                        )
-                    
-                    with col3:
-                        retention_rate = (filtered_count / original_count * 100) if original_count > 0 else 0
-                        st.metric(
-                            label="Retention Rate",
-                            value=f"{retention_rate:.1f}%",
-                            help="Percentage of records retained after filtering"
-                        )
-                    
-                    with col4:
-                        filtered_fields = len([col for col in filtered_df.columns if filtered_df[col].notna().any()])
-                        st.metric(
-                            label="Active Fields",
-                            value=f"{filtered_fields}",
-                            help="Number of fields with data in filtered results"
-                        )
-                    
-                    # Display filtered data
-                    if filtered_count > 0:
-                        st.markdown("#### Filtered Data Preview")
-                        
-                        # Prepare display data, handle NaN values
-                        display_filtered_df = filtered_df.copy()
-                        for col in display_filtered_df.columns:
-                            if display_filtered_df[col].dtype == 'object':
-                                display_filtered_df[col] = display_filtered_df[col].fillna('--')
-                            else:
-                                display_filtered_df[col] = display_filtered_df[col].fillna(0)
-                        
-                        # Show info about the filtered data
-                        st.info(f"Displaying {len(display_filtered_df):,} filtered records from {original_count:,} total records")
-                        
-                        # Display the filtered data table
-                        st.dataframe(
-                            display_filtered_df,
-                            use_container_width=True,
-                            height=400  # Set a reasonable height for the filtered results
-                        )
-                        
-                        # Download filtered data button
-                        if len(display_filtered_df) > 0:
-                            csv_data = display_filtered_df.to_csv(index=False)
-                            st.download_button(
-                                label="Download Filtered Data as CSV",
-                                data=csv_data,
-                                file_name=f"filtered_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                mime="text/csv",
-                                help="Download the filtered dataset as a CSV file"
-                            )
-                    else:
-                        st.warning("⚠️ No records match the selected filter criteria. Please adjust your filters to see results.")
-                        
-                        # Suggestions for users when no results found
-                        st.markdown("""
-                        **Suggestions:**
-                        - Try expanding the temperature or pH ranges
-                        - Select fewer or different fiber types
-                        - Check if the data contains the values you're filtering for
-                        - Use the 'Reset Filters' button to start over
-                        """)
-            
-            # Data Operations - collapsible section (对admin和editor用户可见)
-            if user_role in ["admin", "editor"]:
-                with st.expander("Data Operations", expanded=False):
-                    st.markdown("""
-                    <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #3498db;">
-                        <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
-                            Manage your FRP materials database with these essential data operations
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # 优化按钮布局：2行布局，视觉更平衡
-                    # 第一行：主要数据操作
-                    btn_col1, btn_col2, btn_col3 = st.columns(3)
-                    
-                    with btn_col1:
-                        if st.button(
-                            "Add New Record", 
-                            use_container_width=True, 
-                            help="Add a single new data record to the database"
-                        ):
-                            # Clear all other operation states
-                            for key in ["show_batch_upload", "show_edit_form", "show_create_model", "show_export", "show_cache_management"]:
-                                if key in st.session_state:
-                                    del st.session_state[key]
-                            st.session_state["show_add_form"] = True
-                    
-                    with btn_col2:
-                        if st.button(
-                            "Batch Upload", 
-                            use_container_width=True, 
-                            help="Upload multiple records from CSV or Excel files"
-                        ):
-                            # Clear all other operation states
-                            for key in ["show_add_form", "show_edit_form", "show_create_model", "show_export", "show_cache_management"]:
-                                if key in st.session_state:
-                                    del st.session_state[key]
-                            st.session_state["show_batch_upload"] = True
-                    
-                    with btn_col3:
-                        if st.button(
-                            "Edit Record", 
-                            use_container_width=True, 
-                            help="Modify existing data records"
-                        ):
-                            # Clear all other operation states
-                            for key in ["show_add_form", "show_batch_upload", "show_create_model", "show_export", "show_cache_management"]:
-                                if key in st.session_state:
-                                    del st.session_state[key]
-                            st.session_state["show_edit_form"] = True
-                    
-                    # Add spacing between rows
-                    st.markdown("<br>", unsafe_allow_html=True)
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #8B5FBF;">
+                            <h4 style="color: #8B5FBF; margin: 0; font-size: 0.75rem; font-weight: 600;">COLUMNS</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{len(df.columns)}</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data fields</p>
+                        </div>
+                        """, unsafe_allow_html=True)
                     
-                    # 第二行：模型和导出操作 - 两个更宽的按钮
-                    btn_col4, btn_col5 = st.columns(2)
+                    # Calculate data quality metrics
+                    missing_data = df.isnull().sum()
+                    total_missing = missing_data.sum()
+                    total_cells = len(df) * len(df.columns)
+                    completeness_rate = ((total_cells - total_missing) / total_cells * 100) if total_cells > 0 else 0
                     
-                    with btn_col4:
-                        if st.button(
-                            "Create Model Dataset", 
-                            use_container_width=True, 
-                            help="Generate preprocessed dataset for machine learning"
-                        ):
-                            # Clear all other operation states
-                            for key in ["show_add_form", "show_batch_upload", "show_edit_form", "show_export", "show_cache_management"]:
-                                if key in st.session_state:
-                                    del st.session_state[key]
-                            st.session_state["show_create_model"] = True
+                    with col3:
+                        completeness_color = "#27ae60" if completeness_rate > 80 else "#f39c12" if completeness_rate > 60 else "#e74c3c"
+                        completeness_percentage = f"{completeness_rate:.1f}%"
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {completeness_color};">
+                            <h4 style="color: {completeness_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">COMPLETE</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{completeness_percentage}</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data integrity</p>
+                        </div>
+                        """, unsafe_allow_html=True)
                     
-                    with btn_col5:
-                        if st.button(
-                            "Export Data", 
-                            use_container_width=True, 
-                            help="Download data in various formats (CSV, Excel, JSON)"
-                        ):
-                            # Clear all other operation states
-                            for key in ["show_add_form", "show_batch_upload", "show_edit_form", "show_create_model", "show_cache_management"]:
-                                if key in st.session_state:
-                                    del st.session_state[key]
-                            st.session_state["show_export"] = True
-            
-            # Ensure filtered_df is available for other sections
-            if 'filtered_df' not in locals():
-                # Apply filters if not already applied in Data Filter section
-                filtered_df = df.copy()
-                
-                # Apply fiber type filter if it exists
-                if 'fiber_filter' in locals() and fiber_filter:
-                    filtered_df = filtered_df[filtered_df["Fiber_type"].isin(fiber_filter)]
-                
-                # Apply temperature filter if it exists
-                if 'temp_range' in locals() and temp_range and "temperature" in filtered_df.columns:
-                    temp_numeric = pd.to_numeric(filtered_df["temperature"], errors='coerce')
-                    temp_mask = (temp_numeric >= temp_range[0]) & (temp_numeric <= temp_range[1])
-                    filtered_df = filtered_df[temp_mask.fillna(False)]
-                
-                # Apply pH filter if it exists
-                if 'ph_range' in locals() and ph_range and "pH_1" in filtered_df.columns:
-                    ph_numeric = pd.to_numeric(filtered_df["pH_1"], errors='coerce')
-                    ph_mask = (ph_numeric >= ph_range[0]) & (ph_numeric <= ph_range[1])
-                    filtered_df = filtered_df[ph_mask.fillna(False)]
-            
-            
-            # Add new record form
-            if st.session_state.get("show_add_form", False):
-                st.markdown("---")
-                st.subheader("Add New Record")
-                
-                # Feature descriptions dictionary
-                feature_descriptions = {
-                    'Title': 'Reference title of the research paper or study',
-                    'Fiber_type': 'Type of reinforcing fiber used in the composite material',
-                    'Matrix_type': 'Type of polymer matrix that binds the fibers together',
-                    'surface_treatment': 'Chemical or physical treatment applied to fiber surface for better bonding',
-                    'Fiber_type_detail': 'Specific grade, manufacturer, or detailed specification of the fiber',
-                    'Matrix_type_detail': 'Specific formulation, grade, or manufacturer details of the matrix',
-                    'Fiber_content_weight': 'Weight percentage of fibers in the total composite weight',
-                    'Fiber_content_volume': 'Volume percentage of fibers in the total composite volume',
-                    'diameter': 'Cross-sectional diameter of the FRP rebar specimen',
-                    'Void_content': 'Percentage of air voids or empty spaces in the composite',
-                    'cure_ratio': 'Degree of polymerization or crosslinking in the matrix material',
-                    'cure_ratio_2': 'Secondary or post-cure degree of polymerization',
-                    'tensile_modulus': 'Elastic modulus measuring stiffness under tensile loading',
-                    'ultimate_tensile_strength': 'Maximum stress the material can withstand before failure',
-                    'temperature': 'Environmental temperature during the exposure or testing',
-                    'temp': 'Ambient temperature conditions during the experiment',
-                    'temp2': 'Secondary temperature measurement or different stage temperature',
-                    'pH': 'Measure of acidity or alkalinity of the exposure environment',
-                    'pH_1': 'Initial pH value at the beginning of exposure',
-                    'pH_2': 'Final pH value at the end of exposure period',
-                    'pHafter': 'pH value measured after completing the exposure treatment',
-                    'cycle_pH': 'pH value during cyclic exposure conditions',
-                    'cycle_pH_after': 'pH value after completing cyclic exposure treatment',
-                    'Duration_hours': 'Total exposure time expressed in hours',
-                    'Duration_days': 'Total exposure time expressed in days',
-                    'test_age': 'Age of the specimen at the time of testing',
-                    'chloride': 'Concentration of chloride ions in the exposure solution',
-                    'alkaline': 'Concentration of alkaline substances in the exposure medium',
-                    'field_average_temperature': 'Average temperature recorded in field exposure conditions',
-                    'field_average_humidity': 'Average relative humidity during field exposure',
-                    'Effektive_Klimaklassifikation': 'Climate classification system used for environmental conditions',
-                    'Strength of unconditioned rebar': 'Baseline tensile strength before any environmental exposure',
-                    'Tensile strength retention': 'Ratio of residual strength to original strength (0-1 scale)',
-                    'Tensile strength retention rate (%)': 'Percentage of original strength retained after exposure',
-                    'Residual tensile strength (MPa)': 'Remaining tensile strength after environmental degradation'
-                }
-                
-                with st.form("add_record_form"):
-                    new_data = {}
+                    # Calculate key field completeness
+                    key_fields = ['Fiber_type', 'Matrix_type', 'temperature', 'time_field', 'Target_parameter']
+                    key_completeness = 0
+                    valid_key_fields = 0
+                    for field in key_fields:
+                        if field in df.columns:
+                            field_completeness = (1 - df[field].isnull().sum() / len(df)) * 100
+                            key_completeness += field_completeness
+                            valid_key_fields += 1
                     
-                    # Dynamically generate form fields
-                    cols = st.columns(3)
-                    col_index = 0
+                    avg_key_completeness = key_completeness / valid_key_fields if valid_key_fields > 0 else 0
                     
-                    for col in df.columns:
-                        if col != 'id':  # Skip ID field
-                            with cols[col_index % 3]:
-                                # Get feature description
-                                description = feature_descriptions.get(col, f'{col}')
-                                
-                                if df[col].dtype == 'object':
-                                    unique_vals = df[col].dropna().unique().tolist()
-                                    if len(unique_vals) < 20 and len(unique_vals) > 0:
-                                        new_data[col] = st.selectbox(f"{col}", [""] + unique_vals, 
-                                                                   help=description, key=f"add_{col}")
-                                    else:
-                                        new_data[col] = st.text_input(f"{col}", help=description, key=f"add_{col}")
-                                else:
-                                    new_data[col] = st.number_input(f"{col}", value=0.0, 
-                                                                  help=description, key=f"add_{col}")
-                            col_index += 1
+                    with col4:
+                        key_color = "#27ae60" if avg_key_completeness > 70 else "#f39c12" if avg_key_completeness > 50 else "#e74c3c"
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {key_color};">
+                            <h4 style="color: {key_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">QUALITY</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.6rem; font-weight: 700;">{avg_key_completeness:.1f}%</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Key fields</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                else:
+                    # Admin用户看到完整功能
+                    # Data quality statistics cards - following Model Configuration style
+                    col1, col2, col3, col4 = st.columns(4)
                     
-                    col1, col2 = st.columns(2)
                     with col1:
-                        if st.form_submit_button("Submit for Approval", type="primary"):
-                            # Submit change request
-                            submit_data_change(
-                                user_info['email'],
-                                'insert',
-                                table_name,
-                                None,
-                                None,
-                                new_data,
-                                engine
-                            )
-                            st.success("Changes submitted for approval!")
-                            st.session_state["show_add_form"] = False
-                            
-                            # Record operation
-                            log_operation(
-                                user_info['email'],
-                                'submit_insert',
-                                table_name,
-                                None,
-                                new_data,
-                                get_client_ip(),
-                                engine
-                            )
-                            st.rerun()
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
+                            <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600;">RECORDS</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{len(df):,}</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Total entries</p>
+                        </div>
+                        """, unsafe_allow_html=True)
                     
                     with col2:
-                        if st.form_submit_button("Cancel"):
-                            st.session_state["show_add_form"] = False
-                            st.rerun()
-            
-            # Batch upload function
-            if st.session_state.get("show_batch_upload", False):
-                st.markdown("---")
-                st.subheader("Batch Upload")
-                
-                uploaded_file = st.file_uploader(
-                    "Choose a file",
-                    type=['xlsx', 'xls', 'csv'],
-                    help="Upload Excel or CSV file with data",
-                    key="batch_upload_file"
-                )
-                
-                if uploaded_file is not None:
-                    try:
-                        # Read file
-                        if uploaded_file.name.endswith(('.xlsx', '.xls')):
-                            excel_file = pd.ExcelFile(uploaded_file)
-                            sheet_names = excel_file.sheet_names
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #8B5FBF;">
+                            <h4 style="color: #8B5FBF; margin: 0; font-size: 0.75rem; font-weight: 600;">COLUMNS</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{len(df.columns)}</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data fields</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    
+                    # Calculate data quality metrics
+                    missing_data = df.isnull().sum()
+                    total_missing = missing_data.sum()
+                    total_cells = len(df) * len(df.columns)
+                    completeness_rate = ((total_cells - total_missing) / total_cells * 100) if total_cells > 0 else 0
+                    
+                    with col3:
+                        completeness_color = "#27ae60" if completeness_rate > 80 else "#f39c12" if completeness_rate > 60 else "#e74c3c"
+                        completeness_percentage = f"{completeness_rate:.1f}%"
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {completeness_color};">
+                            <h4 style="color: {completeness_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">COMPLETE</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{completeness_percentage}</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Data integrity</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    
+                    # Calculate key field completeness
+                    key_fields = ['Fiber_type', 'Matrix_type', 'temperature', 'time_field', 'Target_parameter']
+                    key_completeness = 0
+                    valid_key_fields = 0
+                    for field in key_fields:
+                        if field in df.columns:
+                            field_completeness = (1 - df[field].isnull().sum() / len(df)) * 100
+                            key_completeness += field_completeness
+                            valid_key_fields += 1
+                    
+                    avg_key_completeness = key_completeness / valid_key_fields if valid_key_fields > 0 else 0
+                    
+                    with col4:
+                        key_color = "#27ae60" if avg_key_completeness > 70 else "#f39c12" if avg_key_completeness > 50 else "#e74c3c"
+                        st.markdown(f"""
+                        <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {key_color};">
+                            <h4 style="color: {key_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">QUALITY</h4>
+                            <h3 style="color: #2c3e50; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{avg_key_completeness:.1f}%</h3>
+                            <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Key fields</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    
+                    # 根据用户角色动态创建可视化分析标签页
+                    # admin用户可以看到所有功能：Missing Values Analysis、Data Distribution
+                    quality_tabs = st.tabs(["Missing Values Analysis", "Data Distribution"])
+                    
+                    # Missing Values Analysis - 只对admin用户可见
+                    with quality_tabs[0]:
+                        # Missing values analysis - complete original optimized layout
+                        missing_data = df.isnull().sum()
+                        missing_data = missing_data[missing_data > 0].sort_values(ascending=False)
+                        
+                        if len(missing_data) > 0:
+                            # Category information statistics
+                            severe_missing = missing_data[missing_data / len(df) > 0.8]
+                            moderate_missing = missing_data[(missing_data / len(df) > 0.5) & (missing_data / len(df) <= 0.8)]
+                            low_missing = missing_data[missing_data / len(df) <= 0.5]
+                        
+                        # Missing values analysis overview - moved before the three cards
+                        st.markdown("#### Missing Values Analysis Overview")
+                        
+                        # Category statistics cards following Model Configuration style
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.markdown(f"""
+                            <div style="background: white; padding: 0.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #e74c3c; height: 85px; display: flex; flex-direction: column; justify-content: center; margin-bottom: 1rem;">
+                                <h4 style="color: #e74c3c; margin: 0 0 -0.8rem 0; font-size: 0.7rem; font-weight: 600; line-height: 0.6;">SEVERE MISSING</h4>
+                                <h2 style="color: #2c3e50; margin: 0; font-size: 1.3rem; font-weight: 700; line-height: 0.6;">{len(severe_missing)}</h2>
+                                <p style="margin: -0.6rem 0 0 0; font-size: 0.6rem; color: #7f8c8d; line-height: 0.6;">>80% Missing values</p>
+                            </div>
+                            """, unsafe_allow_html=True)
                             
-                            if len(sheet_names) > 1:
-                                selected_sheet = st.selectbox("Select Sheet", sheet_names)
-                            else:
-                                selected_sheet = sheet_names[0]
+                            # View Details button
+                            if st.button("View Details", key="severe_btn", use_container_width=True):
+                                # Clear other category details and missing analysis states
+                                st.session_state.show_detailed_missing_info = False
+                                st.session_state.show_detailed_table = False
+                                # Set current category
+                                st.session_state.show_category_detail = "Severe"
+                        
+                        with col2:
+                            st.markdown(f"""
+                            <div style="background: white; padding: 0.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #f39c12; height: 85px; display: flex; flex-direction: column; justify-content: center; margin-bottom: 1rem;">
+                                <h4 style="color: #f39c12; margin: 0 0 -0.8rem 0; font-size: 0.7rem; font-weight: 600; line-height: 0.6;">MODERATE MISSING</h4>
+                                <h2 style="color: #2c3e50; margin: 0; font-size: 1.3rem; font-weight: 700; line-height: 0.6;">{len(moderate_missing)}</h2>
+                                <p style="margin: -0.6rem 0 0 0; font-size: 0.6rem; color: #7f8c8d; line-height: 0.6;">50-80% Missing values</p>
+                            </div>
+                            """, unsafe_allow_html=True)
                             
-                            uploaded_df = pd.read_excel(uploaded_file, sheet_name=selected_sheet)
-                        else:
-                            uploaded_df = pd.read_csv(uploaded_file)
+                            if st.button("View Details", key="moderate_btn", use_container_width=True):
+                                # Clear other category details and missing analysis states
+                                st.session_state.show_detailed_missing_info = False
+                                st.session_state.show_detailed_table = False
+                                # Set current category
+                                st.session_state.show_category_detail = "Moderate"
                         
-                        st.success(f"File loaded: {len(uploaded_df)} rows, {len(uploaded_df.columns)} columns")
+                        with col3:
+                            st.markdown(f"""
+                            <div style="background: white; padding: 0.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db; height: 85px; display: flex; flex-direction: column; justify-content: center; margin-bottom: 1rem;">
+                                <h4 style="color: #3498db; margin: 0 0 -0.8rem 0; font-size: 0.7rem; font-weight: 600; line-height: 0.6;">LOW MISSING</h4>
+                                <h2 style="color: #2c3e50; margin: 0; font-size: 1.3rem; font-weight: 700; line-height: 0.6;">{len(low_missing)}</h2>
+                                <p style="margin: -0.6rem 0 0 0; font-size: 0.6rem; color: #7f8c8d; line-height: 0.6;"><50% Missing values</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                            
+                            if st.button("View Details", key="low_btn", use_container_width=True):
+                                # Clear other category details and missing analysis states
+                                st.session_state.show_detailed_missing_info = False
+                                st.session_state.show_detailed_table = False
+                                # Set current category
+                                st.session_state.show_category_detail = "Low"
                         
-                        # Data Preview
-                        st.write("Data Preview:")
-                        st.dataframe(uploaded_df.head(10))
+                        # Detailed missing values table - optimized version
+                        st.markdown("#### Missing Values Analysis Details")
                         
-                        # Column mapping
-                        st.subheader("Column Mapping")
+                        # Create missing values details DataFrame
+                        missing_df = pd.DataFrame({
+                            'Column': missing_data.index,
+                            'Missing Count': missing_data.values,
+                            'Missing Percentage': (missing_data.values / len(df) * 100).round(2),
+                            'Data Type': [str(df[col].dtype) for col in missing_data.index],
+                            'Category': [
+                                'Severe' if missing_data[col] / len(df) > 0.8 
+                                else 'Moderate' if missing_data[col] / len(df) > 0.5 
+                                else 'Low' for col in missing_data.index
+                            ]
+                        })
                         
-                        # Get database column names
-                        db_columns = [col for col in df.columns if col != 'id']
+                        # Create integrated horizontal bar chart to display missing values information
                         
-                        # Auto match column names
-                        column_mapping = {}
-                        for db_col in db_columns:
-                            matching_cols = [col for col in uploaded_df.columns if db_col.lower() in col.lower()]
-                            if matching_cols:
-                                default_index = uploaded_df.columns.tolist().index(matching_cols[0]) + 1
+                        # Check if specific category details need to be displayed
+                        if 'show_category_detail' in st.session_state and st.session_state.show_category_detail:
+                            selected_category = st.session_state.show_category_detail
+                            category_data = missing_df[missing_df['Category'] == selected_category]
+                            
+                            if len(category_data) > 0:
+                                st.info(f"Displaying {selected_category} category missing values details ({len(category_data)} fields total)")
+                                
+                                # Create specialized chart for selected category
+                                fig_category = go.Figure()
+                                
+                                category_color = {'Severe': '#e74c3c', 'Moderate': '#f39c12', 'Low': '#3498db'}[selected_category]
+                                display_category = category_data.head(10)  # Display up to 10 items
+                                
+                                fig_category.add_trace(go.Bar(
+                                    y=display_category['Column'],
+                                    x=display_category['Missing Percentage'],
+                                    orientation='h',
+                                    marker=dict(color=category_color, line=dict(color='white', width=0.5)),
+                                    text=[f"{val:.1f}%" for val in display_category['Missing Percentage']],
+                                    textposition='inside',
+                                    textfont=dict(color='white', size=10),
+                                    hovertemplate=(
+                                        "<b>%{y}</b><br>" +
+                                        "Missing Ratio: %{x:.1f}%<br>" +
+                                        "Missing Count: %{customdata[0]:,}<br>" +
+                                        "Data Type: %{customdata[1]}" +
+                                        "<extra></extra>"
+                                    ),
+                                    customdata=[[row['Missing Count'], row['Data Type']] for _, row in display_category.iterrows()]
+                                ))
+                                
+                                fig_category.update_layout(
+                                    title=f"{selected_category} Category Missing Values Details",
+                                    xaxis=dict(title="Missing Percentage (%)", range=[0, 105]),
+                                    yaxis=dict(title="", autorange="reversed"),
+                                    height=max(200, len(display_category) * 30),
+                                    template="plotly_white",
+                                    margin=dict(l=120, r=30, t=50, b=40),
+                                    showlegend=False
+                                )
+                                
+                                st.plotly_chart(fig_category, use_container_width=True)
                             else:
-                                default_index = 0
-                            
-                            column_mapping[db_col] = st.selectbox(
-                                f"Map '{db_col}' to:",
-                                ["None"] + uploaded_df.columns.tolist(),
-                                index=default_index,
-                                key=f"mapping_{db_col}"
-                            )
+                                st.warning(f"No missing values found in {selected_category} category")
                         
-                        # Submit button
-                        if st.button("Submit Batch Upload", type="primary"):
-                            # Prepare data
-                            mapped_data = {}
-                            for db_col, file_col in column_mapping.items():
-                                if file_col != "None":
-                                    mapped_data[db_col] = uploaded_df[file_col]
+                        else:
+                            # Prepare data for visualization
+                            missing_viz_data = []
+                            for idx, row in missing_df.iterrows():
+                                percentage = row['Missing Percentage']
+                                category = row['Category']
+                                
+                                # Determine color based on category
+                                if category == 'Severe':
+                                    color = "#e74c3c"
+                                elif category == 'Moderate':
+                                    color = "#f39c12"
+                                else:
+                                    color = "#3498db"
+                                
+                                missing_viz_data.append({
+                                    'Column': row['Column'],
+                                    'Missing_Count': row['Missing Count'],
+                                    'Missing_Percentage': percentage,
+                                    'Category': category,
+                                    'Color': color,
+                                    'Data_Type': row['Data Type']
+                                })
                             
-                            if mapped_data:
-                                mapped_df = pd.DataFrame(mapped_data)
+                            # Create beautiful integrated bar chart
+                            if missing_viz_data:
+                                # Sort by missing percentage
+                                missing_viz_data.sort(key=lambda x: x['Missing_Percentage'], reverse=True)
                                 
-                                # Batch submit
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
+                                # If too many fields, only show top 10 most severe ones
+                                display_data = missing_viz_data[:10] if len(missing_viz_data) > 10 else missing_viz_data
+                                remaining_count = len(missing_viz_data) - len(display_data)
                                 
-                                submitted_count = 0
-                                total_rows = len(mapped_df)
+                                if remaining_count > 0:
+                                    st.markdown(f"""
+                                    <div class="missing-info-text">
+                                        <div style="background-color: #d1ecf1; color: #0c5460; padding: 0.75rem 1rem; border-radius: 8px; border-left: 4px solid #bee5eb; margin: 1rem 0; animation: slideInLeft 0.6s ease-out;">
+                                            Showing top {len(display_data)} fields with most missing values, {remaining_count} more fields have missing values
+                                        </div>
+                                    </div>
+                                    """, unsafe_allow_html=True)
                                 
-                                for idx, row in mapped_df.iterrows():
-                                    try:
-                                        submit_data_change(
-                                            user_info['email'],
-                                            'insert',
-                                            table_name,
-                                            None,
-                                            None,
-                                            row.to_dict(),
-                                            engine
-                                        )
-                                        submitted_count += 1
-                                    except Exception as e:
-                                        st.error(f"Error submitting row {idx}: {e}")
-                                    
-                                    progress = (idx + 1) / total_rows
-                                    progress_bar.progress(progress)
-                                    status_text.text(f"Processing: {idx + 1}/{total_rows}")
+                                # Create Plotly chart - remove legend
+                                fig_overview = go.Figure()
                                 
-                                progress_bar.empty()
-                                status_text.empty()
+                                # Create single trace for all data without categorization
+                                fig_overview.add_trace(go.Bar(
+                                    y=[item['Column'] for item in display_data],
+                                    x=[item['Missing_Percentage'] for item in display_data],
+                                    orientation='h',
+                                    marker=dict(
+                                        color=[item['Color'] for item in display_data],
+                                        line=dict(color='white', width=0.5)
+                                    ),
+                                    text=[f"{item['Missing_Percentage']:.1f}%" for item in display_data],
+                                    textposition='inside',
+                                    textfont=dict(color='white', size=10, family="Arial"),
+                                    hovertemplate=(
+                                        "<b>%{y}</b><br>" +
+                                        "Missing Ratio: %{x:.1f}%<br>" +
+                                        "Missing Count: %{customdata[0]:,}<br>" +
+                                        "Data Type: %{customdata[1]}" +
+                                        "<extra></extra>"
+                                    ),
+                                    customdata=[[item['Missing_Count'], item['Data_Type']] for item in display_data],
+                                    showlegend=False
+                                ))
                                 
-                                st.success(f"Batch upload completed! {submitted_count} records submitted for approval.")
-                                st.session_state["show_batch_upload"] = False
+                                fig_overview.update_layout(
+                                    title=dict(
+                                        text="Missing Values Analysis Overview",
+                                        font=dict(size=14, color="#2c3e50"),
+                                        x=0.5
+                                    ),
+                                    xaxis=dict(
+                                        title="Missing Percentage (%)",
+                                        showgrid=True,
+                                        gridcolor='rgba(128,128,128,0.2)',
+                                        range=[0, 105]
+                                    ),
+                                    yaxis=dict(
+                                        title="",
+                                        autorange="reversed",
+                                        tickfont=dict(size=10)
+                                    ),
+                                    height=max(250, len(display_data) * 30),
+                                    template="plotly_white",
+                                    margin=dict(l=120, r=30, t=50, b=40),
+                                    plot_bgcolor='rgba(248,249,250,0.5)',
+                                    paper_bgcolor='white',
+                                    showlegend=False
+                                )
                                 
-                                # Send notification
-                                send_email(
-                                    EMAIL_USER,
-                                    "Batch Data Submission",
-                                    f"User {user_info['name']} submitted {submitted_count} records for approval.\nTable: {table_name}"
+                                # Add simplified reference lines (only when meaningful)
+                                if any(item['Missing_Percentage'] > 50 for item in display_data):
+                                    fig_overview.add_vline(x=50, line_dash="dot", line_color="orange", line_width=1)
+                                if any(item['Missing_Percentage'] > 80 for item in display_data):
+                                    fig_overview.add_vline(x=80, line_dash="dot", line_color="red", line_width=1)
+                                
+                                st.plotly_chart(fig_overview, use_container_width=True)
+                                
+                                # Add compact statistical summary
+                                col_summary1, col_summary2, col_summary3, col_summary4 = st.columns(4)
+                                with col_summary1:
+                                    st.metric("Highest Missing Rate", f"{max(item['Missing_Percentage'] for item in missing_viz_data):.1f}%", 
+                                             help="Field with highest missing value proportion in dataset")
+                                with col_summary2:
+                                    avg_missing = sum(item['Missing_Percentage'] for item in missing_viz_data) / len(missing_viz_data)
+                                    st.metric("Average Missing Rate", f"{avg_missing:.1f}%", 
+                                             help="Average missing ratio for all fields with missing values")
+                                with col_summary3:
+                                    st.metric("Missing Fields Count", f"{len(missing_viz_data)}", 
+                                             help="Total number of fields with missing values")
+                                with col_summary4:
+                                    severe_count = len([item for item in missing_viz_data if item['Category'] == 'Severe'])
+                                    st.metric("Severe Missing", f"{severe_count}", 
+                                             help="Number of fields with missing rate exceeding 80%")
+                        
+                        # Add functional buttons (without divider) - Modified layout: 3+2 with longer bottom buttons
+                        col_btn1, col_btn2, col_btn3 = st.columns(3)
+                        with col_btn1:
+                            if st.button("Detailed Chart", key="detailed_chart_btn", use_container_width=True):
+                                # Clear other missing analysis states
+                                st.session_state.show_detailed_table = False
+                                if 'show_category_detail' in st.session_state:
+                                    del st.session_state.show_category_detail
+                                # Toggle current state
+                                st.session_state.show_detailed_missing_info = not st.session_state.get('show_detailed_missing_info', False)
+                        with col_btn2:
+                            if st.button("Data Table", key="detailed_table_btn", use_container_width=True):
+                                # Clear other missing analysis states
+                                st.session_state.show_detailed_missing_info = False
+                                if 'show_category_detail' in st.session_state:
+                                    del st.session_state.show_category_detail
+                                # Toggle current state
+                                st.session_state.show_detailed_table = not st.session_state.get('show_detailed_table', False)
+                        with col_btn3:
+                            if st.button("Back to Overview", key="back_overview_btn", use_container_width=True):
+                                # Clear all missing analysis states
+                                st.session_state.show_detailed_missing_info = False
+                                st.session_state.show_detailed_table = False
+                                if 'show_category_detail' in st.session_state:
+                                    del st.session_state.show_category_detail
+                        
+                        # Second row with 2 longer buttons
+                        col_btn4, col_btn5 = st.columns(2)
+                        with col_btn4:
+                            if st.button("Advanced Analysis", key="advanced_analysis_btn", use_container_width=True):
+                                st.info("Advanced missing value analysis coming soon!")
+                        with col_btn5:
+                            if st.button("Export Report", key="export_report_btn", use_container_width=True):
+                                st.info("Export functionality coming soon!")
+                        
+                        # Display detailed original charts (collapsible)
+                        if st.session_state.get('show_detailed_missing_info', False):
+                            st.markdown("#### Detailed Missing Values Visualization")
+                            
+                            # Create original missing value percentage chart
+                            missing_pct = (missing_data / len(df) * 100)
+                            
+                            fig_detailed = go.Figure(data=[
+                                go.Bar(
+                                    x=missing_pct.values,
+                                    y=missing_pct.index,
+                                    orientation='h',
+                                    marker=dict(
+                                        color=missing_pct.values,
+                                        colorscale='RdYlBu_r',
+                                        showscale=True,
+                                        colorbar=dict(title="Missing %", thickness=15)
+                                    ),
+                                    text=[f'{val:.1f}%' for val in missing_pct.values],
+                                    textposition='auto',
+                                    hovertemplate=(
+                                        "<b>%{y}</b><br>" +
+                                        "Missing Ratio: %{x:.1f}%<br>" +
+                                        "Missing Count: %{customdata:,}" +
+                                        "<extra></extra>"
+                                    ),
+                                    customdata=missing_data.values
                                 )
-                            else:
-                                st.error("No columns mapped. Please map at least one column.")
-                    
-                    except Exception as e:
-                        st.error(f"Error processing file: {e}")
-            
-            # Create model dataset functionality
-            if st.session_state.get("show_create_model", False):
-                st.markdown("---")
-                st.subheader("Create Machine Learning Model Dataset")
-                
-                st.info("""
-                **Advanced data preprocessing workflow:**
-                1. Missing value marker conversion (SMD → NaN)
-                2. Range value parsing ("20,30" → 25)  
-                3. Feature engineering (13 ML features)
-                4. Model dataset creation
-                """)
-                
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    if st.button("Start Advanced Data Preprocessing", type="primary", use_container_width=True):
-                        try:
-                            # Execute advanced data preprocessing
-                            model_dataset = create_advanced_model_dataset()
+                            ])
                             
-                            if model_dataset is not None and len(model_dataset) > 0:
-                                st.success(f"Successfully created model dataset! Shape: {model_dataset.shape}")
-                                
-                                # Save to session state
-                                st.session_state["model_dataset"] = model_dataset
-                                
-                                # Display data preview
-                                st.subheader("Model Dataset Preview")
-                                st.dataframe(model_dataset.head(10), use_container_width=True)
-                                
-                                # Display feature statistics
-                                st.subheader("Feature Statistics")
-                                col_stat1, col_stat2 = st.columns(2)
-                                
-                                with col_stat1:
-                                    st.write("**Data Integrity:**")
-                                    for col in model_dataset.columns:
-                                        non_null = model_dataset[col].count()
-                                        total = len(model_dataset)
-                                        percentage = (non_null / total * 100) if total > 0 else 0
-                                        st.write(f"- {col}: {percentage:.1f}% ({non_null}/{total})")
-                                
-                                with col_stat2:
-                                    st.write("**Numerical Feature Statistics:**")
-                                    numeric_cols = model_dataset.select_dtypes(include=[np.number]).columns
-                                    if len(numeric_cols) > 0:
-                                        stats = model_dataset[numeric_cols].describe()
-                                        st.dataframe(stats.round(2))
+                            fig_detailed.update_layout(
+                                title="Detailed Missing Values Analysis - Continuous Color Scale Display",
+                                xaxis_title="Missing Percentage (%)",
+                                yaxis_title="Field Name",
+                                height=max(400, len(missing_data) * 25),
+                                template="plotly_white",
+                                margin=dict(l=150, r=80, t=60, b=60)
+                            )
+                            
+                            st.plotly_chart(fig_detailed, use_container_width=True)
+                        
+                        # Display detailed data table (collapsible)
+                        if st.session_state.get('show_detailed_table', False):
+                            st.markdown("#### Detailed Data Table")
+                            
+                            # Use more refined styling function
+                            def style_missing_table(df):
+                                def color_percentage(val):
+                                    if val > 80:
+                                        return 'background: linear-gradient(90deg, #ffebee, #ffcdd2); color: #c62828; font-weight: 600;'
+                                    elif val > 50:
+                                        return 'background: linear-gradient(90deg, #fff3e0, #ffe0b2); color: #ef6c00; font-weight: 600;'
+                                    else:
+                                        return 'background: linear-gradient(90deg, #e3f2fd, #bbdefb); color: #1565c0; font-weight: 600;'
                                 
-                                # Provide download option
-                                csv_data = model_dataset.to_csv(index=False).encode('utf-8')
-                                st.download_button(
-                                    label="Download Model Dataset (CSV)",
-                                    data=csv_data,
-                                    file_name=f"frp_model_dataset_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                    mime="text/csv",
-                                    use_container_width=True
-                                )
+                                def color_category(val):
+                                    if val == 'Severe':
+                                        return 'background: #ffebee; color: #c62828; font-weight: 600; text-align: center; border-radius: 8px; padding: 4px;'
+                                    elif val == 'Moderate':
+                                        return 'background: #fff3e0; color: #ef6c00; font-weight: 600; text-align: center; border-radius: 8px; padding: 4px;'
+                                    else:
+                                        return 'background: #e3f2fd; color: #1565c0; font-weight: 600; text-align: center; border-radius: 8px; padding: 4px;'
                                 
-                                # Record operation log
-                                if engine:
-                                    log_operation(
-                                        user_info["email"],
-                                        "create_model_dataset",
-                                        "research_data",
-                                        None,
-                                        {"rows": len(model_dataset), "columns": len(model_dataset.columns)},
-                                        get_client_ip(),
-                                        engine
-                                    )
+                                return df.style.applymap(color_percentage, subset=['Missing Percentage']).applymap(color_category, subset=['Category']).format({
+                                    'Missing Count': '{:,}',
+                                    'Missing Percentage': '{:.1f}%'
+                                })
                             
-                            else:
-                                st.error("Model dataset creation failed or data is empty")
-                                
-                        except Exception as e:
-                            st.error(f"Error during processing: {e}")
-                            st.write("**Error Details:**")
-                            st.code(str(e))
-                
-                with col2:
-                    st.info("""
-                    **Expected Output Features:**
-                    - Tensile strength retention
-                    - pH of condition environment  
-                    - Exposure time
-                    - Fibre content
-                    - Exposure temperature
-                    - Diameter
-                    - Presence of concrete
-                    - Load
-                    - Presence of chloride ion
-                    - Fibre type
-                    - Matrix type
-                    - Surface treatment
-                    - Strength of unconditioned rebar
-                    """)
-                
-                if st.button("Close", use_container_width=True):
-                    st.session_state["show_create_model"] = False
-                    st.rerun()
-            
-            # Data export
-            if st.session_state.get("show_export", False):
-                st.markdown("---")
-                st.subheader("Export Data")
-                
-                export_format = st.radio("Export Format", ["CSV", "Excel"])
-                
-                if st.button("Generate Export File"):
-                    if export_format == "CSV":
-                        csv = filtered_df.to_csv(index=False)
-                        b64 = base64.b64encode(csv.encode()).decode()
-                        href = f'<a href="data:file/csv;base64,{b64}" download="{table_name}_export.csv">Download CSV File</a>'
-                        st.markdown(href, unsafe_allow_html=True)
-                    else:
-                        output = io.BytesIO()
-                        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                            filtered_df.to_excel(writer, sheet_name=table_name, index=False)
-                        excel_data = output.getvalue()
-                        b64 = base64.b64encode(excel_data).decode()
-                        href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{table_name}_export.xlsx">Download Excel File</a>'
-                        st.markdown(href, unsafe_allow_html=True)
-                    
-                    # Record export operation
-                    log_operation(
-                        user_info['email'],
-                        'export',
-                        table_name,
-                        None,
-                        {"format": export_format, "records": len(filtered_df)},
-                        get_client_ip(),
-                        engine
-                    )
-                
-                st.session_state["show_export"] = False
-        
-        except Exception as e:
-            st.error(f"Error reading data: {e}")
-            st.write("**Debug Information:**")
-            st.write("Please check database connection and data format.")
-            
-            # Provide data repair suggestions
-            st.subheader("Data Repair Suggestions")
-            st.write("""
-            1. **Clean problematic values**: Replace 'SMD', 'Notreported', and similar values with NULL in the database
-            2. **Check Data Types**: Ensure numeric columns contain only numbers
-            3. **Validate data format**: Review the source data for consistency
-            """)
-            
-            if st.button("Try to reload data"):
-                data_manager.invalidate_cache(f"table_{table_name}")
-                st.rerun()
-
-        # ——————————————————————————————
-        # 管理缓存部分 - 只对admin用户可见，放在Data Operations下面
-        # ——————————————————————————————
-        if st.session_state["authenticated_user"]["role"] == "admin":
+                            styled_table = style_missing_table(missing_df)
+                            st.dataframe(styled_table, use_container_width=True, hide_index=True)
+                        
+                        else:
+                            # Display data integrity confirmation
+                            st.markdown(f"""
+                            <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; margin: 1rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">
+                                <h4 style="color: #27ae60; margin: 0; font-size: 1.2rem;">Perfect Data Quality</h4>
+                                <p style="margin: 0.5rem 0 0 0; color: #7f8c8d; font-size: 0.9rem;">All {len(df):,} records have complete data across all {len(df.columns)} columns.</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        
+                        st.markdown("<br>", unsafe_allow_html=True)
             
-            with st.expander("Manage Cache", expanded=False):
-                st.markdown("""
-                <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #dc3545;">
-                    <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
-                        Manage data preprocessing caches and trained machine learning models
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # 创建两个管理标签页
-                cache_tabs = st.tabs(["Data Preprocessing Cache", "Trained Models"])
-                
-                # 第一个标签页：数据预处理缓存
-                with cache_tabs[0]:
-                    st.markdown("#### Data Preprocessing Cache Management")
-                    
-                    st.info("""
-                    **Cache Management Operations:**
-                    - Generate and save preprocessed datasets to cache
-                    - View and manage existing cached datasets
-                    - Clear individual or all cached datasets
-                    - Monitor cache storage usage
-                    """)
-                    
-                    try:
-                        preprocessor = FRPDataPreprocessor(engine)
+            # Data Operations - collapsible section (对admin和editor用户可见)
+                    with quality_tabs[1]:
+                        # Data Distribution Analysis Panel - Integrated complete data visualization functionality
+                        st.markdown("### Data Distribution & Visualization")
                         
-                        # Cache generation section
-                        st.markdown("##### Generate New Cache")
-                        col_gen1, col_gen2 = st.columns(2)
+                        # Top statistics cards following Model Configuration style
+                        col1, col2, col3, col4 = st.columns(4)
+                        
+                        # Calculate statistics
+                        numeric_cols = df.select_dtypes(include=[np.number]).columns
+                        text_cols = df.select_dtypes(include=['object']).columns
+                        datetime_cols = df.select_dtypes(include=['datetime64']).columns
+                        if 'time_field' in df.columns:
+                            try:
+                                df['time_field'] = pd.to_datetime(df['time_field'])
+                                if 'time_field' not in datetime_cols:
+                                    datetime_cols = datetime_cols.union(['time_field'])
+                            except:
+                                pass
                         
-                        with col_gen1:
-                            if st.button("Generate & Cache Dataset", type="primary", use_container_width=True):
-                                try:
-                                    with st.spinner("Executing advanced data preprocessing..."):
-                                        model_dataset = create_advanced_model_dataset()
-                                        if model_dataset is not None and len(model_dataset) > 0:
-                                            st.session_state["model_dataset"] = model_dataset
-                                            
-                                            # Save to database cache
-                                            cache_key = f"advanced_dataset_{user_info['email']}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}"
-                                            feature_columns = model_dataset.columns.tolist()
-                                            
-                                            if preprocessor.save_to_cache(cache_key, model_dataset, feature_columns):
-                                                st.success(f"Dataset generated and cached! Shape: {model_dataset.shape}")
-                                                st.success(f"Cache key: {cache_key}")
-                                                st.rerun()
-                                            else:
-                                                st.error("Failed to save to cache")
-                                        else:
-                                            st.error("Advanced preprocessing failed")
-                                except Exception as e:
-                                    st.error(f"Processing error: {e}")
+                        # Calculate statistics
+                        if len(df) > 0:
+                            total_null = df.isnull().sum().sum()
                         
-                        with col_gen2:
-                            # Save current dataset to cache (if exists)
-                            if "model_dataset" in st.session_state and st.session_state.model_dataset is not None:
-                                if st.button("Save Current Dataset to Cache", type="secondary", use_container_width=True):
-                                    try:
-                                        cache_key = f"current_dataset_{user_info['email']}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}"
-                                        feature_columns = st.session_state.model_dataset.columns.tolist()
-                                        
-                                        if preprocessor.save_to_cache(cache_key, st.session_state.model_dataset, feature_columns):
-                                            st.success(f"Current dataset saved to cache!")
-                                            st.success(f"Cache key: {cache_key}")
-                                            st.rerun()
-                                        else:
-                                            st.error("Failed to save to cache")
-                                    except Exception as e:
-                                        st.error(f"Cache save error: {e}")
-                            else:
-                                st.info("No dataset in memory to cache")
+                        with col1:
+                            st.markdown(f"""
+                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db; height: 120px; display: flex; flex-direction: column; justify-content: center;">
+                                <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600;">NUMERIC FIELDS</h4>
+                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{len(numeric_cols)}</h2>
+                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Continuous variables</p>
+                            </div>
+                            """, unsafe_allow_html=True)
                         
-                        st.markdown("---")
+                        with col2:
+                            st.markdown(f"""
+                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #9b59b6; height: 120px; display: flex; flex-direction: column; justify-content: center;">
+                                <h4 style="color: #9b59b6; margin: 0; font-size: 0.75rem; font-weight: 600;">TEXT FIELDS</h4>
+                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{len(text_cols)}</h2>
+                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Categorical variables</p>
+                            </div>
+                            """, unsafe_allow_html=True)
                         
-                        # Cache listing and management
-                        st.markdown("##### Existing Cached Datasets")
-                        cached_datasets = preprocessor.list_cached_datasets()
+                        with col3:
+                            st.markdown(f"""
+                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #1abc9c; height: 120px; display: flex; flex-direction: column; justify-content: center;">
+                                <h4 style="color: #1abc9c; margin: 0; font-size: 0.75rem; font-weight: 600;">DATETIME FIELDS</h4>
+                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{len(datetime_cols)}</h2>
+                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Time series variables</p>
+                            </div>
+                            """, unsafe_allow_html=True)
                         
-                        if cached_datasets:
+                        with col4:
+                            null_percentage = (total_null / (len(df) * len(df.columns)) * 100) if len(df) > 0 else 0
                             st.markdown(f"""
-                            <div style="background: #d1ecf1; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin: 0.5rem 0;">
-                                <strong style="color: #0c5460;">Found {len(cached_datasets)} cached dataset(s)</strong>
+                            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #34495e; height: 120px; display: flex; flex-direction: column; justify-content: center;">
+                                <h4 style="color: #34495e; margin: 0; font-size: 0.75rem; font-weight: 600;">MISSING VALUES</h4>
+                                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700;">{null_percentage:.1f}%</h2>
+                                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d;">Overall completion</p>
                             </div>
                             """, unsafe_allow_html=True)
+                        
+                        # Integrated visualization analysis tab
+                        viz_sub_tabs = st.tabs(["Distribution Analysis", "Relationships", "Summary"])
+                        
+                        with viz_sub_tabs[0]:
+                            st.markdown("#### Field Distribution Analysis")
                             
-                            # Show cached datasets with improved layout
-                            for idx, cache_info in enumerate(cached_datasets):
-                                # Use container for better visual separation
-                                with st.container():
-                                    st.markdown(f"""
-                                    <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin: 0.8rem 0; border-left: 4px solid #3498db;">
-                                        <h4 style="color: #2c3e50; margin: 0 0 0.8rem 0;">{cache_info['cache_key']}</h4>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                            # Create layout for column type selection and field selection
+                            col_type_selection, col_field_selection = st.columns([1, 2])
+                            
+                            with col_type_selection:
+                                # Column type selection
+                                available_types = []
+                                if len(numeric_cols) > 0:
+                                    available_types.append("Numerical Columns")
+                                if len(text_cols) > 0:
+                                    available_types.append("Text Columns")
+                                
+                                if available_types:
+                                    selected_type = st.selectbox(
+                                        "Select analysis type:",
+                                        available_types,
+                                        key="column_type_selection"
+                                    )
+                                else:
+                                    st.warning("No columns available for analysis")
+                                    selected_type = None
+                            
+                            with col_field_selection:
+                                if selected_type == "Numerical Columns":
+                                    # Numerical column selection
+                                    meaningful_cols = [col for col in numeric_cols if not col.lower().startswith('id')]
+                                    if not meaningful_cols:
+                                        meaningful_cols = numeric_cols.tolist()
+                                    
+                                    # Smart default selection
+                                    default_col = None
+                                    priority_cols = ['Value1', 'temperature', 'pH', 'pH_1', 'time_field', 'ultimate_tensile_strength']
+                                    for priority in priority_cols:
+                                        if priority in meaningful_cols:
+                                            default_col = priority
+                                            break
+                                    if not default_col and meaningful_cols:
+                                        default_col = meaningful_cols[0]
+                                    
+                                    selected_col = st.selectbox(
+                                        "Select numerical column to analyze:",
+                                        meaningful_cols,
+                                        index=meaningful_cols.index(default_col) if default_col in meaningful_cols else 0,
+                                        key="numeric_dist_analysis"
+                                    )
+                                
+                                elif selected_type == "Text Columns":
+                                    # Text column selection
+                                    selected_col = st.selectbox(
+                                        "Select text column to analyze:",
+                                        text_cols.tolist(),
+                                        key="text_dist_analysis"
+                                    )
+                                else:
+                                    selected_col = None
+                            
+                            # Analysis results display
+                            if selected_col and selected_type:
+                                st.markdown("---")
+                                
+                                if selected_type == "Numerical Columns":
+                                    # Numerical column analysis
+                                    col_data = pd.to_numeric(df[selected_col], errors='coerce').dropna()
+                                    
+                                    if len(col_data) > 0:
+                                        # Statistical summary
+                                        col1, col2, col3 = st.columns(3)
+                                        with col1:
+                                            st.metric("Mean", f"{col_data.mean():.2f}")
+                                        with col2:
+                                            st.metric("Median", f"{col_data.median():.2f}")
+                                        with col3:
+                                            st.metric("Std Dev", f"{col_data.std():.2f}")
+                                        
+                                        # Distribution chart
+                                        fig = px.histogram(x=col_data, title=f"{selected_col} Distribution")
+                                        st.plotly_chart(fig, use_container_width=True)
+                                    else:
+                                        st.warning(f"Column '{selected_col}' does not contain valid numerical data")
+                                
+                                elif selected_type == "Text Columns":
+                                    # Text column analysis
+                                    text_data = df[selected_col].dropna()
+                                    
+                                    if len(text_data) > 0:
+                                        # Text statistics
+                                        col1, col2, col3 = st.columns(3)
+                                        with col1:
+                                            st.metric("Unique Values", f"{text_data.nunique()}")
+                                        with col2:
+                                            st.metric("Most Common", f"{text_data.mode().iloc[0] if len(text_data.mode()) > 0 else 'N/A'}")
+                                        with col3:
+                                            st.metric("Total Count", f"{len(text_data)}")
+                                        
+                                        # Distribution chart
+                                        text_counts = text_data.value_counts().head(10)
+                                        fig = px.bar(x=text_counts.values, y=text_counts.index, orientation='h', 
+                                                   title=f"{selected_col} Distribution (Top 10)")
+                                        st.plotly_chart(fig, use_container_width=True)
+                                    else:
+                                        st.warning(f"Column '{selected_col}' does not contain valid text data")
+                        
+                        with viz_sub_tabs[1]:
+                            st.markdown("#### Variable Correlation Analysis")
+                            
+                            if len(numeric_cols) >= 2:
+                                # Variable selection
+                                col1, col2 = st.columns(2)
+                                
+                                with col1:
+                                    x_col = st.selectbox(
+                                        "X-axis Variable:",
+                                        numeric_cols.tolist(),
+                                        key="scatter_x_var"
+                                    )
+                                
+                                with col2:
+                                    y_col = st.selectbox(
+                                        "Y-axis Variable:",
+                                        [col for col in numeric_cols if col != x_col],
+                                        key="scatter_y_var"
+                                    )
+                                
+                                if x_col and y_col:
+                                    # Prepare data
+                                    x_data = pd.to_numeric(df[x_col], errors='coerce')
+                                    y_data = pd.to_numeric(df[y_col], errors='coerce')
+                                    valid_mask = x_data.notna() & y_data.notna()
+                                    
+                                    if valid_mask.sum() > 0:
+                                        # Calculate correlation
+                                        correlation = x_data[valid_mask].corr(y_data[valid_mask])
+                                        
+                                        # Display correlation
+                                        st.metric("Correlation Coefficient", f"{correlation:.3f}")
+                                        
+                                        # Scatter plot
+                                        plot_df = pd.DataFrame({
+                                            'x': x_data[valid_mask],
+                                            'y': y_data[valid_mask]
+                                        })
+                                        
+                                        fig = px.scatter(plot_df, x='x', y='y', 
+                                                       title=f"{x_col} vs {y_col}",
+                                                       labels={'x': x_col, 'y': y_col})
+                                        st.plotly_chart(fig, use_container_width=True)
+                                    else:
+                                        st.warning("No valid data points for correlation analysis")
+                            else:
+                                st.info("Need at least 2 numerical columns for correlation analysis")
+                        
+                        with viz_sub_tabs[2]:
+                            st.markdown("#### Comprehensive Data Summary")
+                            
+                            # Main content area with three analysis modules
+                            summary_tabs = st.tabs(["Correlation Overview", "Field Type Analysis", "Data Quality Report"])
+                            
+                            with summary_tabs[0]:
+                                # Correlation Overview - 相关性概览
+                                st.markdown("**Numerical Variable Correlation Overview**")
+                                
+                                if len(numeric_cols) >= 2:
+                                    # Select number of variables to display
+                                    max_vars = min(len(numeric_cols), 12)  # Display up to 12 variables
+                                    if len(numeric_cols) > max_vars:
+                                        st.info(f"Displaying correlation of top {max_vars} numerical variables, total {len(numeric_cols)} numerical variables")
                                     
-                                    col_info, col_actions = st.columns([3, 1])
+                                    selected_numeric_cols = numeric_cols[:max_vars]
+                                    corr_matrix = df[selected_numeric_cols].corr()
                                     
-                                    with col_info:
-                                        # Use cleaner info display
-                                        col_shape, col_created, col_updated = st.columns(3)
-                                        with col_shape:
-                                            st.caption("Shape")
-                                            st.write(f"**{cache_info['shape']}**")
-                                        with col_created:
-                                            st.caption("Created")
-                                            st.write(f"**{cache_info['created_at'].strftime('%Y-%m-%d %H:%M')}**")
-                                        with col_updated:
-                                            st.caption("Updated")
-                                            st.write(f"**{cache_info['updated_at'].strftime('%Y-%m-%d %H:%M')}**")
+                                    # Create correlation heatmap
+                                    fig_heatmap = px.imshow(
+                                        corr_matrix,
+                                        title="Variable Correlation Heatmap",
+                                        color_continuous_scale='RdBu',
+                                        aspect="auto",
+                                        text_auto=True,
+                                        height=400
+                                    )
                                     
-                                    with col_actions:
-                                        # Keep button styling consistent
-                                        if st.button("Delete Cache", key=f"delete_cache_mgmt_{idx}", use_container_width=True, type="secondary"):
-                                            try:
-                                                deleted_count = preprocessor.clear_cache(cache_info['cache_key'])
-                                                if deleted_count > 0:
-                                                    st.success("Cache deleted!")
-                                                    st.rerun()
-                                                else:
-                                                    st.warning("Cache not found")
-                                            except Exception as e:
-                                                st.error(f"Delete error: {e}")
+                                    fig_heatmap.update_traces(
+                                        text=corr_matrix.round(2).values,
+                                        texttemplate="%{text}",
+                                        textfont={"size": 9}
+                                    )
                                     
-                                    # Add small separator
-                                    st.markdown("<br>", unsafe_allow_html=True)
-                        
-                        else:
-                            st.markdown("""
-                            <div style="background: #fff3cd; padding: 1rem; border-radius: 8px; border-left: 4px solid #ffc107; margin: 1rem 0;">
-                                <h5 style="color: #856404; margin: 0 0 0.5rem 0;">No Cached Datasets</h5>
-                                <p style="color: #856404; margin: 0;">Generate your first cached dataset using the button above.</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    
-                    except Exception as e:
-                        st.error(f"Cache management error: {e}")
-                
-                # 第二个标签页：已训练模型管理
-                with cache_tabs[1]:
-                    st.markdown("#### Trained Models Management")
-                    
-                    # 检查是否有缓存的模型
-                    try:
-                        model_cache_manager = ModelCacheManager(engine)
-                        cached_models = model_cache_manager.list_cached_models()
-                        
-                        if cached_models:
-                            st.markdown(f"""
-                            <div style="background: #d1ecf1; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin: 0.5rem 0;">
-                                <strong style="color: #0c5460;">{len(cached_models)} trained model(s) available in cache</strong>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # 创建模型管理标签页
-                            model_tabs = st.tabs(["Model List", "Model Details", "Cache Management"])
+                                    fig_heatmap.update_layout(
+                                        title_font_size=14,
+                                        margin=dict(l=100, r=50, t=60, b=50)
+                                    )
+                                    
+                                    st.plotly_chart(fig_heatmap, use_container_width=True)
+                                else:
+                                    st.info("Insufficient numerical variables to generate correlation heatmap")
                             
-                            with model_tabs[0]:
-                                # 按目标变量分组显示
-                                models_by_target = {}
-                                for model in cached_models:
-                                    target = model['target_variable']
-                                    if target not in models_by_target:
-                                        models_by_target[target] = []
-                                    models_by_target[target].append(model)
+                            with summary_tabs[1]:
+                                # Field Type Analysis - Field Type Analysis
+                                st.markdown("**Field Type Distribution and Details**")
                                 
-                                for target_var, target_models in models_by_target.items():
-                                    st.markdown(f"**Target Variable: {target_var}**")
+                                # Data type statistics
+                                dtype_counts = df.dtypes.value_counts()
+                                
+                                if len(dtype_counts) > 0:
+                                    type_chart_col, type_detail_col = st.columns([1.5, 1])
                                     
-                                    # 显示该目标变量的所有模型，使用与缓存数据集一致的风格
-                                    for idx, model in enumerate(target_models):
-                                        # Use container for better visual separation
-                                        with st.container():
-                                            # 计算模型表现评分
-                                            eval_strategy = model['evaluation_strategy']
-                                            created_time = model['created_at'].strftime('%Y-%m-%d %H:%M') if model['created_at'] else 'Unknown'
-                                            model_key = model['model_key']
-                                            model_name = model['model_name']
-                                            
-                                            st.markdown(f"""
-                                            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin: 0.8rem 0; border-left: 4px solid #3498db;">
-                                                <h4 style="color: #2c3e50; margin: 0 0 0.8rem 0;">{model_name}</h4>
-                                            </div>
-                                            """, unsafe_allow_html=True)
-                                            
-                                            col_info, col_actions = st.columns([3, 1])
-                                            
-                                            with col_info:
-                                                # Use cleaner info display
-                                                col_strategy, col_key, col_created = st.columns(3)
-                                                with col_strategy:
-                                                    st.caption("Evaluation Strategy")
-                                                    st.write(f"**{eval_strategy}**")
-                                                with col_key:
-                                                    st.caption("Model Key")
-                                                    st.write(f"**{model_key}**")
-                                                with col_created:
-                                                    st.caption("Trained")
-                                                    st.write(f"**{created_time}**")
-                                            
-                                            with col_actions:
-                                                # Action buttons in a column layout
-                                                if st.button("Load Model", key=f"cache_load_model_{model['model_key']}", use_container_width=True, type="primary"):
-                                                    try:
-                                                        # 加载模型详情
-                                                        loaded_model = model_cache_manager.load_model(model['model_key'])
-                                                        if loaded_model:
-                                                            # 将模型加载到session state
-                                                            st.session_state.trained_model = loaded_model['model']
-                                                            st.session_state.selected_target = loaded_model['target_variable']
-                                                            st.session_state.selected_model = loaded_model['model_name']
-                                                            st.session_state.current_model_key = model['model_key']
-                                                            
-                                                            # 加载特征信息
-                                                            feature_info = loaded_model['feature_info']
-                                                            preprocessing_info = loaded_model['preprocessing_info']
-                                                            
-                                                            st.session_state.feature_names = feature_info.get('feature_names', [])
-                                                            st.session_state.feature_columns = feature_info.get('feature_columns', [])
-                                                            st.session_state.numeric_features = feature_info.get('numeric_features', [])
-                                                            st.session_state.categorical_features = feature_info.get('categorical_features', [])
-                                                            
-                                                            # 显示加载结果
-                                                            eval_results = loaded_model['evaluation_results']
-                                                            st.success(f"Model loaded successfully! Test R²: {eval_results.get('test_r2', 'N/A'):.4f}")
-                                                            st.rerun()
-                                                        else:
-                                                            st.error("Failed to load model")
-                                                    except Exception as e:
-                                                        st.error(f"Load error: {e}")
-                                                
-                                                # 添加删除按钮
-                                                if st.button("Delete", key=f"cache_delete_model_{model['model_key']}", use_container_width=True, type="secondary", help="Delete this model"):
-                                                    # 确认删除
-                                                    if f"confirm_delete_{model['model_key']}" not in st.session_state:
-                                                        st.session_state[f"confirm_delete_{model['model_key']}"] = False
-                                                    
-                                                    if not st.session_state[f"confirm_delete_{model['model_key']}"]:
-                                                        st.session_state[f"confirm_delete_{model['model_key']}"] = True
-                                                        st.rerun()
-                                                
-                                                # 如果用户点击了删除，显示确认对话框
-                                                if st.session_state.get(f"confirm_delete_{model['model_key']}", False):
-                                                    st.warning(f"⚠️ Confirm deletion of model: **{model_name}**")
-                                                    col_confirm, col_cancel = st.columns(2)
-                                                    
-                                                    with col_confirm:
-                                                        if st.button("Confirm Delete", key=f"confirm_delete_btn_{model['model_key']}", type="primary", use_container_width=True):
-                                                            try:
-                                                                success = model_cache_manager.delete_model(model['model_key'])
-                                                                if success:
-                                                                    st.success(f"Model {model_name} deleted successfully!")
-                                                                    # 清理确认状态
-                                                                    if f"confirm_delete_{model['model_key']}" in st.session_state:
-                                                                        del st.session_state[f"confirm_delete_{model['model_key']}"]
-                                                                    st.rerun()
-                                                                else:
-                                                                    st.error("Failed to delete model")
-                                                            except Exception as e:
-                                                                st.error(f"Delete error: {e}")
-                                                    
-                                                    with col_cancel:
-                                                        if st.button("Cancel", key=f"cancel_delete_btn_{model['model_key']}", use_container_width=True):
-                                                            # 取消删除，清理确认状态
-                                                            st.session_state[f"confirm_delete_{model['model_key']}"] = False
-                                                            st.rerun()
-                                            
-                                            # Add small separator
-                                            st.markdown("<br>", unsafe_allow_html=True)
+                                    with type_chart_col:
+                                        fig_dtype = px.pie(
+                                            values=dtype_counts.values,
+                                            names=[str(dtype) for dtype in dtype_counts.index],
+                                            title="Data Type Distribution",
+                                            height=300
+                                        )
+                                        fig_dtype.update_traces(textposition='inside', textinfo='percent+label')
+                                        st.plotly_chart(fig_dtype, use_container_width=True)
                                     
-                                    st.markdown("---")
+                                    with type_detail_col:
+                                        # Detailed type statistics table
+                                        type_detail_df = pd.DataFrame({
+                                            'Data Type': [str(dtype) for dtype in dtype_counts.index],
+                                            'Field Count': dtype_counts.values,
+                                            'Percentage': [f"{count/len(df.columns)*100:.1f}%" for count in dtype_counts.values]
+                                        })
+                                        st.dataframe(type_detail_df, hide_index=True, use_container_width=True)
+                                
+                                # Field detailed information table
+                                st.markdown("**Field Detailed Information**")
+                                
+                                field_info = []
+                                for col in df.columns:
+                                    col_data = df[col]
+                                    field_info.append({
+                                        'Field Name': col,
+                                        'Data Type': str(col_data.dtype),
+                                        'Non-null Count': col_data.notna().sum(),
+                                        'Missing Count': col_data.isnull().sum(),
+                                        'Missing Rate': f"{col_data.isnull().sum()/len(col_data)*100:.1f}%",
+                                        'Unique Count': col_data.nunique() if col_data.dtype == 'object' else 'N/A'
+                                    })
+                                
+                                field_info_df = pd.DataFrame(field_info)
+                                st.dataframe(field_info_df, hide_index=True, use_container_width=True, height=400)
                             
-                            with model_tabs[1]:
-                                st.markdown("**Model Performance Details:**")
+                            with summary_tabs[2]:
+                                # Data Quality Report - 数据质量报告
+                                st.markdown("**Comprehensive Data Quality Assessment**")
+                                
+                                # Calculate comprehensive indicators
+                                total_rows = len(df)
+                                total_cols = len(df.columns)
+                                missing_cells = df.isnull().sum().sum()
+                                total_cells = total_rows * total_cols
+                                overall_completeness = ((total_cells - missing_cells) / total_cells * 100) if total_cells > 0 else 0
+                                duplicate_rows = df.duplicated().sum()
+                                
+                                # Quality score calculation
+                                completeness_score = overall_completeness
+                                uniqueness_score = (1 - duplicate_rows/total_rows) * 100 if total_rows > 0 else 100
+                                consistency_score = 85  # Basic consistency score
                                 
-                                # 选择模型查看详情
-                                model_options = [f"{m['model_name']} - {m['target_variable']} ({m['model_key']})" for m in cached_models]
-                                selected_model_option = st.selectbox("Select model for details:", model_options, key="cache_model_details_select")
+                                overall_quality = (completeness_score + uniqueness_score + consistency_score) / 3
                                 
-                                if selected_model_option:
-                                    # 提取model_key
-                                    selected_key = selected_model_option.split('(')[-1].split(')')[0]
-                                    
-                                    # 加载模型详情
-                                    model_details = model_cache_manager.load_model(selected_key)
-                                    
-                                    if model_details:
-                                        eval_results = model_details['evaluation_results']
-                                        training_info = model_details['training_info']
-                                        feature_info = model_details['feature_info']
-                                        
-                                        # 显示性能指标 - 5个指标
-                                        col_perf1, col_perf2, col_perf3, col_perf4, col_perf5 = st.columns(5)
-                                        
-                                        with col_perf1:
-                                            st.metric("Test R²", f"{eval_results.get('test_r2', 0):.4f}")
-                                        with col_perf2:
-                                            st.metric("CV Training R²", f"{eval_results.get('cv_train_r2_mean', 0):.4f}")
-                                        with col_perf3:
-                                            st.metric("CV R² Mean", f"{eval_results.get('cv_r2_mean', 0):.4f}")
-                                        with col_perf4:
-                                            st.metric("Test RMSE", f"{eval_results.get('test_rmse', 0):.2f}")
-                                        with col_perf5:
-                                            stability = eval_results.get('model_stability', 0)
-                                            st.metric("Model Stability", f"{stability:.3f}")
-                                        
-                                        # 训练信息
-                                        st.markdown("**Training Information:**")
-                                        training_info_df = pd.DataFrame([
-                                            ["Model Type", training_info.get('model_type', 'Unknown')],
-                                            ["Evaluation Strategy", training_info.get('evaluation_strategy', 'Unknown')],
-                                            ["Hyperparameter Tuning", "Yes" if training_info.get('hyperparameter_tuning', False) else "No"],
-                                            ["Auto Model Select", "Yes" if training_info.get('auto_model_select', False) else "No"],
-                                            ["Training Time", training_info.get('training_timestamp', 'Unknown')],
-                                            ["Test Set Size", f"{training_info.get('test_size', 0)*100:.0f}%"]
-                                        ], columns=["Parameter", "Value"])
-                                        
-                                        st.dataframe(training_info_df, use_container_width=True, hide_index=True)
-                                        
-                                        # 特征信息
-                                        st.markdown("**Feature Information:**")
-                                        st.write(f"- Total features: {feature_info.get('n_features', 0)}")
-                                        st.write(f"- Training samples: {feature_info.get('n_samples', 0)}")
-                                        st.write(f"- Numeric features: {len(feature_info.get('numeric_features', []))}")
-                                        st.write(f"- Categorical features: {len(feature_info.get('categorical_features', []))}")
-                                        
-                                        # 最佳参数
-                                        best_params = model_details.get('best_params', {})
-                                        if best_params:
-                                            st.markdown("**Best Parameters:**")
-                                            params_df = pd.DataFrame(list(best_params.items()), columns=["Parameter", "Value"])
-                                            st.dataframe(params_df, use_container_width=True, hide_index=True)
-                            
-                            with model_tabs[2]:
-                                st.markdown("**Cache Management Operations:**")
+                                # Quality score cards
+                                quality_col1, quality_col2, quality_col3, quality_col4 = st.columns(4)
                                 
-                                # 显示缓存统计
-                                total_models = len(cached_models)
-                                targets = list(set([m['target_variable'] for m in cached_models]))
+                                with quality_col1:
+                                    comp_color = "#27ae60" if completeness_score > 80 else "#f39c12" if completeness_score > 60 else "#e74c3c"
+                                    st.markdown(f"""
+                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {comp_color};">
+                                        <h4 style="color: {comp_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">COMPLETENESS</h4>
+                                        <h3 style="color: {comp_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{completeness_score:.1f}</h3>
+                                    </div>
+                                    """, unsafe_allow_html=True)
                                 
-                                col_stat1, col_stat2 = st.columns(2)
-                                with col_stat1:
-                                    st.metric("Total Cached Models", total_models)
-                                with col_stat2:
-                                    st.metric("Target Variables", len(targets))
+                                with quality_col2:
+                                    uniq_color = "#27ae60" if uniqueness_score > 90 else "#f39c12" if uniqueness_score > 70 else "#e74c3c"
+                                    st.markdown(f"""
+                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {uniq_color};">
+                                        <h4 style="color: {uniq_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">UNIQUENESS</h4>
+                                        <h3 style="color: {uniq_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{uniqueness_score:.1f}</h3>
+                                    </div>
+                                    """, unsafe_allow_html=True)
                                 
-                                # 批量操作
-                                st.markdown("**Batch Operations:**")
+                                with quality_col3:
+                                    cons_color = "#27ae60" if consistency_score > 80 else "#f39c12" if consistency_score > 60 else "#e74c3c"
+                                    st.markdown(f"""
+                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {cons_color};">
+                                        <h4 style="color: {cons_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">CONSISTENCY</h4>
+                                        <h3 style="color: {cons_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{consistency_score:.1f}</h3>
+                                    </div>
+                                    """, unsafe_allow_html=True)
                                 
-                                # 按目标变量清除
-                                target_to_clear = st.selectbox("Select target variable to clear all models:", [""] + targets, key="cache_target_clear_select")
+                                with quality_col4:
+                                    overall_color = "#27ae60" if overall_quality > 80 else "#f39c12" if overall_quality > 60 else "#e74c3c"
+                                    st.markdown(f"""
+                                    <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {overall_color};">
+                                        <h4 style="color: {overall_color}; margin: 0; font-size: 0.75rem; font-weight: 600;">OVERALL SCORE</h4>
+                                        <h3 style="color: {overall_color}; margin: 0.3rem 0; font-size: 1.2rem; font-weight: 700;">{overall_quality:.1f}</h3>
+                                    </div>
+                                    """, unsafe_allow_html=True)
                                 
-                                if st.button("Clear Selected Target", disabled=not target_to_clear, key="cache_clear_target_btn", use_container_width=True):
-                                    if target_to_clear:
-                                        try:
-                                            deleted_count = 0
-                                            for model in cached_models:
-                                                if model['target_variable'] == target_to_clear:
-                                                    deleted_count += model_cache_manager.delete_model(model['model_key'])
-                                            
-                                            if deleted_count > 0:
-                                                st.success(f"Deleted {deleted_count} models for target: {target_to_clear}")
-                                                st.rerun()
-                                            else:
-                                                st.warning("No models found for this target")
-                                        except Exception as e:
-                                            st.error(f"Clear error: {e}")
+                                st.markdown("<br>", unsafe_allow_html=True)
                                 
-                                # System Management Section
-                                st.markdown("---")
-                                st.markdown("**System Maintenance:**")
+                                # Quality issue analysis
+                                st.markdown("**Quality Issue Analysis**")
                                 
-                                sys_col1, sys_col2 = st.columns(2)
+                                quality_issues = []
                                 
-                                with sys_col1:
-                                    st.markdown("**Legacy Model Cleanup**")
-                                    st.info("Remove old cached models that don't include preprocessor information.")
-                                    
-                                    if st.button("Check & Clean Legacy Models", use_container_width=True, key="legacy_cleanup_btn"):
-                                        try:
-                                            deleted_count, total_legacy = model_cache_manager.clear_legacy_models()
-                                            
-                                            if total_legacy > 0:
-                                                st.success(f"Found {total_legacy} legacy models. Removed {deleted_count} models.")
-                                                if deleted_count < total_legacy:
-                                                    st.warning(f"Failed to remove {total_legacy - deleted_count} models.")
-                                                st.rerun()
-                                            else:
-                                                st.success("✅ No legacy models found. All cached models are up to date.")
-                                        except Exception as e:
-                                            st.error(f"Failed to check legacy models: {e}")
+                                # Check missing values issue
+                                if missing_cells > total_cells * 0.1:
+                                    quality_issues.append("Dataset has too many missing values, data cleaning is recommended")
                                 
-                                with sys_col2:
-                                    st.markdown("**Clear All Model Cache**")
-                                    st.info("This will permanently delete all cached models from the system.")
-                                    
-                                    if st.button("Clear All Models", 
-                                               use_container_width=True,
-                                               key="clear_all_cache_btn"):
-                                        try:
-                                            st.info("🔄 Clearing all cached models...")
-                                            deleted_count = model_cache_manager.clear_all_models()
-                                            if deleted_count > 0:
-                                                st.success(f"🗑️ Cleared {deleted_count} cached models.")
-                                            else:
-                                                st.warning("No models found to delete or deletion failed.")
-                                            st.rerun()
-                                        except Exception as e:
-                                            st.error(f"Failed to clear model cache: {e}")
-                                            st.error(f"Error details: {str(e)}")
+                                # Check duplicate rows issue
+                                if duplicate_rows > 0:
+                                    quality_issues.append(f"Found {duplicate_rows} duplicate rows, deduplication is recommended")
+                                
+                                # Check data type consistency
+                                mixed_types = 0
+                                for col in df.columns:
+                                    if df[col].dtype == 'object':
+                                        # Try to convert to numeric, check for mixed types
+                                        numeric_converted = pd.to_numeric(df[col], errors='coerce')
+                                        if numeric_converted.notna().sum() > len(df[col]) * 0.5:  # If more than 50% can be converted to numeric
+                                            mixed_types += 1
+                                
+                                if mixed_types > 0:
+                                    quality_issues.append(f"Found {mixed_types} fields with possible data type inconsistency issues")
+                                
+                                if not quality_issues:
+                                    st.success("Data quality is good, no obvious issues found")
+                                else:
+                                    for issue in quality_issues:
+                                        st.warning(issue)
+
+            
+            # Data Filters
+            with st.expander("Data Filter", expanded=False):
+                st.markdown("""
+                <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #e67e22;">
+                    <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
+                        Apply advanced filtering criteria to focus on specific data subsets
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                col1, col2, col3 = st.columns(3)
+                
+                # Initialize filter variables
+                fiber_filter = []
+                temp_range = None
+                ph_range = None
+                
+                with col1:
+                    st.subheader("Fiber Type")
+                    if "Fiber_type" in df.columns:
+                        unique_fibers = df["Fiber_type"].dropna().unique().tolist()
+                        if unique_fibers:
+                            fiber_filter = st.multiselect(
+                                "Select fiber types:",
+                                options=unique_fibers,
+                                key="fiber_filter"
+                            )
+                            if fiber_filter:
+                                filtered_count = df[df["Fiber_type"].isin(fiber_filter)].shape[0]
+                                st.caption(f"Selected: {len(fiber_filter)} types, {filtered_count:,} records")
+                        else:
+                            st.caption("No fiber type data available")
+                    else:
+                        st.caption("Fiber type column not found")
+                
+                with col2:
+                    st.subheader("Temperature Range")
+                    if "temperature" in df.columns:
+                        temp_numeric = pd.to_numeric(df["temperature"], errors='coerce')
+                        if temp_numeric.notna().sum() > 0:
+                            temp_min = float(temp_numeric.min())
+                            temp_max = float(temp_numeric.max())
+                            if temp_min != temp_max:
+                                temp_range = st.slider(
+                                    "Temperature (°C):",
+                                    temp_min,
+                                    temp_max,
+                                    (temp_min, temp_max),
+                                    step=0.1,
+                                    key="temp_filter"
+                                )
+                                st.caption(f"Range: {temp_range[0]:.1f}°C - {temp_range[1]:.1f}°C")
+                            else:
+                                temp_range = (temp_min, temp_max)
+                                st.caption(f"Single value: {temp_min:.1f}°C")
+                        else:
+                            st.caption("No valid temperature data")
+                    else:
+                        st.caption("Temperature column not found")
+                
+                with col3:
+                    st.subheader("pH Range")
+                    if "pH_1" in df.columns:
+                        ph_numeric = pd.to_numeric(df["pH_1"], errors='coerce')
+                        if ph_numeric.notna().sum() > 0:
+                            ph_min = float(ph_numeric.min())
+                            ph_max = float(ph_numeric.max())
+                            if ph_min != ph_max:
+                                ph_range = st.slider(
+                                    "pH:",
+                                    ph_min,
+                                    ph_max,
+                                    (ph_min, ph_max),
+                                    step=0.1,
+                                    key="ph_filter"
+                                )
+                                avg_ph = (ph_range[0] + ph_range[1]) / 2
+                                ph_category = "Acidic" if avg_ph < 7 else "Basic" if avg_ph > 7 else "Neutral"
+                                st.caption(f"Range: {ph_range[0]:.1f} - {ph_range[1]:.1f} ({ph_category})")
+                            else:
+                                ph_range = (ph_min, ph_max)
+                                st.caption(f"Single value: {ph_min:.1f}")
                         else:
-                            st.markdown("""
-                            <div style="background: #f8f9fa; border: 1px solid #dee2e6; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
-                                <h3 style="color: #6c757d; margin: 0;">No Trained Models</h3>
-                                <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Train your first model in the Model Training tab to see it here.</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.caption("No valid pH data")
+                    else:
+                        st.caption("pH column not found")
+                
+                # Filter summary and reset
+                st.markdown("---")
+                
+                col_summary, col_reset = st.columns([3, 1])
+                
+                with col_summary:
+                    active_filters = []
+                    if fiber_filter:
+                        active_filters.append(f"Fiber Types: {len(fiber_filter)}")
+                    if temp_range and "temperature" in df.columns:
+                        temp_numeric = pd.to_numeric(df["temperature"], errors='coerce')
+                        if temp_numeric.notna().sum() > 0:
+                            temp_min_orig = float(temp_numeric.min())
+                            temp_max_orig = float(temp_numeric.max())
+                            if temp_range != (temp_min_orig, temp_max_orig):
+                                active_filters.append("Temperature Range")
+                    if ph_range and "pH_1" in df.columns:
+                        ph_numeric = pd.to_numeric(df["pH_1"], errors='coerce')
+                        if ph_numeric.notna().sum() > 0:
+                            ph_min_orig = float(ph_numeric.min())
+                            ph_max_orig = float(ph_numeric.max())
+                            if ph_range != (ph_min_orig, ph_max_orig):
+                                active_filters.append("pH Range")
                     
-                    except Exception as e:
-                        st.error(f"Failed to load model cache: {e}")
-
-# ——————————————————————————————
-# Tab 2: Access Control (只对admin用户可见)
-# ——————————————————————————————
-if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
-    with tabs[tab_indexes["access_control"]]:
-        
-        if "authenticated_user" not in st.session_state:
-            st.markdown("""
-            <div style="background: #fff3cd; border: 1px solid #ffeaa7; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                <h4 style="color: #856404; margin: 0;">Authentication Required</h4>
-                <p style="color: #856404; margin: 0.5rem 0 0 0;">Please log in to access the control panel.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        elif st.session_state["authenticated_user"]["role"] != "admin":
-            st.markdown("""
-            <div style="background: #f8d7da; border: 1px solid #f5c6cb; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                <h4 style="color: #721c24; margin: 0;">Access Denied</h4>
-                <p style="color: #721c24; margin: 0.5rem 0 0 0;">Administrator access required to manage user permissions.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            # Access Control Management interface
-            user_info = st.session_state["authenticated_user"]
-        
-        # Welcome header for access control - clean design
-        st.markdown(f"""
-        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
-            <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
-                Access Control Management
-            </h3>
-            <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
-                Manage user access requests and permissions
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        # Management panel statistics cards
-        col1, col2, col3, col4 = st.columns(4)
-        
-        # Get statistical data
-        pending_count = pd.read_sql("SELECT COUNT(*) as count FROM users WHERE status = 'pending'", engine).iloc[0]['count']
-        approved_count = pd.read_sql("SELECT COUNT(*) as count FROM users WHERE status = 'approved'", engine).iloc[0]['count']
-        rejected_count = pd.read_sql("SELECT COUNT(*) as count FROM users WHERE status = 'rejected'", engine).iloc[0]['count']
-        total_requests = pd.read_sql("SELECT COUNT(*) as count FROM users", engine).iloc[0]['count']
-        
-        with col1:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #f39c12;">
-                <h4 style="color: #f39c12; margin: 0; font-size: 0.9rem; font-weight: 600;">PENDING REQUESTS</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{pending_count}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Awaiting review</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #27ae60;">
-                <h4 style="color: #27ae60; margin: 0; font-size: 0.9rem; font-weight: 600;">APPROVED USERS</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{approved_count}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Active access</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #e74c3c;">
-                <h4 style="color: #e74c3c; margin: 0; font-size: 0.9rem; font-weight: 600;">REJECTED</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{rejected_count}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Denied access</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
-                <h4 style="color: #3498db; margin: 0; font-size: 0.9rem; font-weight: 600;">TOTAL REQUESTS</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{total_requests}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">All time</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Main content area tabs
-        access_tabs = st.tabs(["Pending Requests", "Approved Users", "User Management"])
-        
-        with access_tabs[0]:
-            # Pending user applications - modern design
-            st.markdown("### Pending User Requests")
+                    if active_filters:
+                        st.info(f"Active Filters: {', '.join(active_filters)}")
+                    else:
+                        st.info("No filters applied - Showing all data")
+                
+                with col_reset:
+                    if st.button("Reset Filters", use_container_width=True):
+                        for key in ['fiber_filter', 'temp_filter', 'ph_filter', 'has_active_filters', 'filtered_df', 'original_count', 'filtered_count']:
+                            if key in st.session_state:
+                                del st.session_state[key]
+                        st.rerun()
+                
+                # Apply filters
+                filtered_df = df.copy()
+                original_count = len(filtered_df)
+                
+                # Apply fiber type filter
+                if fiber_filter:
+                    filtered_df = filtered_df[filtered_df["Fiber_type"].isin(fiber_filter)]
+                
+                # Apply temperature filter
+                if temp_range and "temperature" in filtered_df.columns:
+                    temp_numeric = pd.to_numeric(filtered_df["temperature"], errors='coerce')
+                    temp_mask = (temp_numeric >= temp_range[0]) & (temp_numeric <= temp_range[1])
+                    filtered_df = filtered_df[temp_mask.fillna(False)]
+                
+                # Apply pH filter
+                if ph_range and "pH_1" in filtered_df.columns:  # Fix: use pH_1 instead of pH
+                    ph_numeric = pd.to_numeric(filtered_df["pH_1"], errors='coerce')
+                    ph_mask = (ph_numeric >= ph_range[0]) & (ph_numeric <= ph_range[1])
+                    filtered_df = filtered_df[ph_mask.fillna(False)]
+                
+                # Store filtered data for later use
+                filtered_count = len(filtered_df)
+                
+                # Store filter state for display outside expander
+                st.session_state['has_active_filters'] = (fiber_filter or 
+                    (temp_range and "temperature" in df.columns and temp_range != (pd.to_numeric(df["temperature"], errors='coerce').min(), pd.to_numeric(df["temperature"], errors='coerce').max())) or 
+                    (ph_range and "pH_1" in df.columns and ph_range != (pd.to_numeric(df["pH_1"], errors='coerce').min(), pd.to_numeric(df["pH_1"], errors='coerce').max())))
+                
+                st.session_state['filtered_df'] = filtered_df
+                st.session_state['original_count'] = original_count
+                st.session_state['filtered_count'] = filtered_count
             
-            pending_users = pd.read_sql(
-                "SELECT * FROM users WHERE status = 'pending' ORDER BY created_at DESC",
-                engine
-            )
+            # Filtered Results section (outside the Data Filter expander)
+            if st.session_state.get('has_active_filters', False):
+                with st.expander("Filtered Results", expanded=True):
+                    st.markdown("""
+                    <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #27ae60;">
+                        <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
+                            View and analyze your filtered dataset results
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Get data from session state
+                    filtered_df = st.session_state.get('filtered_df', df)
+                    original_count = st.session_state.get('original_count', len(df))
+                    filtered_count = st.session_state.get('filtered_count', len(df))
+                    
+                    # Summary statistics
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric(
+                            label="Original Records",
+                            value=f"{original_count:,}",
+                            help="Total number of records before filtering"
+                        )
+                    
+                    with col2:
+                        st.metric(
+                            label="Filtered Records", 
+                            value=f"{filtered_count:,}",
+                            delta=f"{filtered_count - original_count:,}",
+                            delta_color="inverse",
+                            help="Number of records after applying filters"
+                        )
+                    
+                    with col3:
+                        retention_rate = (filtered_count / original_count * 100) if original_count > 0 else 0
+                        st.metric(
+                            label="Retention Rate",
+                            value=f"{retention_rate:.1f}%",
+                            help="Percentage of records retained after filtering"
+                        )
+                    
+                    with col4:
+                        filtered_fields = len([col for col in filtered_df.columns if filtered_df[col].notna().any()])
+                        st.metric(
+                            label="Active Fields",
+                            value=f"{filtered_fields}",
+                            help="Number of fields with data in filtered results"
+                        )
+                    
+                    # Display filtered data
+                    if filtered_count > 0:
+                        st.markdown("#### Filtered Data Preview")
+                        
+                        # Prepare display data, handle NaN values
+                        display_filtered_df = filtered_df.copy()
+                        for col in display_filtered_df.columns:
+                            if display_filtered_df[col].dtype == 'object':
+                                display_filtered_df[col] = display_filtered_df[col].fillna('--')
+                            else:
+                                display_filtered_df[col] = display_filtered_df[col].fillna(0)
+                        
+                        # Show info about the filtered data
+                        st.info(f"Displaying {len(display_filtered_df):,} filtered records from {original_count:,} total records")
+                        
+                        # Display the filtered data table
+                        st.dataframe(
+                            display_filtered_df,
+                            use_container_width=True,
+                            height=400  # Set a reasonable height for the filtered results
+                        )
+                        
+                        # Download filtered data button
+                        if len(display_filtered_df) > 0:
+                            csv_data = display_filtered_df.to_csv(index=False)
+                            st.download_button(
+                                label="Download Filtered Data as CSV",
+                                data=csv_data,
+                                file_name=f"filtered_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                mime="text/csv",
+                                help="Download the filtered dataset as a CSV file"
+                            )
+                    else:
+                        st.warning("⚠️ No records match the selected filter criteria. Please adjust your filters to see results.")
+                        
+                        # Suggestions for users when no results found
+                        st.markdown("""
+                        **Suggestions:**
+                        - Try expanding the temperature or pH ranges
+                        - Select fewer or different fiber types
+                        - Check if the data contains the values you're filtering for
+                        - Use the 'Reset Filters' button to start over
+                        """)
             
-            if not pending_users.empty:
-                st.markdown(f"""
-                <div style="background: #e8f4fd; padding: 0.8rem; border-radius: 8px; margin: 1rem 0; border-left: 4px solid #3498db;">
-                    <p style="margin: 0; color: #2980b9; font-weight: 500;">{len(pending_users)} request(s) awaiting your review</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                for idx, user in pending_users.iterrows():
-                    # Modern user request card
-                    ip_status = "Allowed" if is_ip_allowed(user['ip_address']) else "Not Allowed"
-                    ip_color = "#27ae60" if is_ip_allowed(user['ip_address']) else "#e74c3c"
-                    
-                    st.markdown(f"""
-                    <div style="background: white; padding: 1.5rem; border-radius: 10px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin: 1rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0; color: #2c3e50; font-size: 1.2rem;">{user['name']}</h4>
-                            <span style="background: {ip_color}; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">{ip_status}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem;">
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">EMAIL</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['email']}</p>
-                            </div>
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">INSTITUTION</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['institution']}</p>
-                            </div>
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">IP ADDRESS</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['ip_address']}</p>
-                            </div>
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">APPLIED AT</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['created_at']}</p>
-                            </div>
-                        </div>
+            # Data Operations - collapsible section (对admin和editor用户可见)
+            if user_role in ["admin", "editor"]:
+                with st.expander("Data Operations", expanded=False):
+                    st.markdown("""
+                    <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 1rem; border-left: 3px solid #3498db;">
+                        <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
+                            Manage your FRP materials database with these essential data operations
+                        </p>
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    # Action button area
-                    col1, col2, col3 = st.columns([2, 1, 1])
+                    # 优化按钮布局：2行布局，视觉更平衡
+                    # 第一行：主要数据操作
+                    btn_col1, btn_col2, btn_col3 = st.columns(3)
                     
-                    with col1:
-                        role = st.selectbox(
-                            "Assign Role",
-                            ["viewer", "editor"],
-                            key=f"role_{user['id']}",
-                            help="Select the role to assign to this user"
-                        )
+                    with btn_col1:
+                        if st.button(
+                            "Add New Record", 
+                            use_container_width=True, 
+                            help="Add a single new data record to the database"
+                        ):
+                            # Clear all other operation states
+                            for key in ["show_batch_upload", "show_edit_form", "show_create_model", "show_export", "show_cache_management"]:
+                                if key in st.session_state:
+                                    del st.session_state[key]
+                            st.session_state["show_add_form"] = True
                     
-                    with col2:
-                        if st.button("Approve", key=f"approve_{user['id']}", type="primary", use_container_width=True):
-                            with engine.connect() as conn:
-                                conn.execute(
-                                    text("""
-                                        UPDATE users
-                                        SET status = 'approved',
-                                            role = :role,
-                                            approved_by = :approver,
-                                            approved_at = NOW()
-                                        WHERE id = :id
-                                    """),
-                                    {
-                                        "id": user['id'],
-                                        "role": role,
-                                        "approver": st.session_state["authenticated_user"]["email"]
-                                    }
-                                )
-                                conn.commit()
-                            
-                            # Send notification
-                            send_email(
-                                user['email'],
-                                "FRP Database Access Approved",
-                                f"Your access request has been approved with {role} role."
-                            )
-                            st.success("User approval successful!")
-                            st.rerun()
+                    with btn_col2:
+                        if st.button(
+                            "Batch Upload", 
+                            use_container_width=True, 
+                            help="Upload multiple records from CSV or Excel files"
+                        ):
+                            # Clear all other operation states
+                            for key in ["show_add_form", "show_edit_form", "show_create_model", "show_export", "show_cache_management"]:
+                                if key in st.session_state:
+                                    del st.session_state[key]
+                            st.session_state["show_batch_upload"] = True
+                    
+                    with btn_col3:
+                        if st.button(
+                            "Edit Record", 
+                            use_container_width=True, 
+                            help="Modify existing data records"
+                        ):
+                            # Clear all other operation states
+                            for key in ["show_add_form", "show_batch_upload", "show_create_model", "show_export", "show_cache_management"]:
+                                if key in st.session_state:
+                                    del st.session_state[key]
+                            st.session_state["show_edit_form"] = True
+                    
+                    # Add spacing between rows
+                    st.markdown("<br>", unsafe_allow_html=True)
+                    
+                    # 第二行：模型和导出操作 - 两个更宽的按钮
+                    btn_col4, btn_col5 = st.columns(2)
+                    
+                    with btn_col4:
+                        if st.button(
+                            "Create Model Dataset", 
+                            use_container_width=True, 
+                            help="Generate preprocessed dataset for machine learning"
+                        ):
+                            # Clear all other operation states
+                            for key in ["show_add_form", "show_batch_upload", "show_edit_form", "show_export", "show_cache_management"]:
+                                if key in st.session_state:
+                                    del st.session_state[key]
+                            st.session_state["show_create_model"] = True
+                    
+                    with btn_col5:
+                        if st.button(
+                            "Export Data", 
+                            use_container_width=True, 
+                            help="Download data in various formats (CSV, Excel, JSON)"
+                        ):
+                            # Clear all other operation states
+                            for key in ["show_add_form", "show_batch_upload", "show_edit_form", "show_create_model", "show_cache_management"]:
+                                if key in st.session_state:
+                                    del st.session_state[key]
+                            st.session_state["show_export"] = True
+            
+            # Ensure filtered_df is available for other sections
+            if 'filtered_df' not in locals():
+                # Apply filters if not already applied in Data Filter section
+                filtered_df = df.copy()
+                
+                # Apply fiber type filter if it exists
+                if 'fiber_filter' in locals() and fiber_filter:
+                    filtered_df = filtered_df[filtered_df["Fiber_type"].isin(fiber_filter)]
+                
+                # Apply temperature filter if it exists
+                if 'temp_range' in locals() and temp_range and "temperature" in filtered_df.columns:
+                    temp_numeric = pd.to_numeric(filtered_df["temperature"], errors='coerce')
+                    temp_mask = (temp_numeric >= temp_range[0]) & (temp_numeric <= temp_range[1])
+                    filtered_df = filtered_df[temp_mask.fillna(False)]
+                
+                # Apply pH filter if it exists
+                if 'ph_range' in locals() and ph_range and "pH_1" in filtered_df.columns:
+                    ph_numeric = pd.to_numeric(filtered_df["pH_1"], errors='coerce')
+                    ph_mask = (ph_numeric >= ph_range[0]) & (ph_numeric <= ph_range[1])
+                    filtered_df = filtered_df[ph_mask.fillna(False)]
+            
+            
+            # Add new record form
+            if st.session_state.get("show_add_form", False):
+                st.markdown("---")
+                st.subheader("Add New Record")
+                
+                # Feature descriptions dictionary
+                feature_descriptions = {
+                    'Title': 'Reference title of the research paper or study',
+                    'Fiber_type': 'Type of reinforcing fiber used in the composite material',
+                    'Matrix_type': 'Type of polymer matrix that binds the fibers together',
+                    'surface_treatment': 'Chemical or physical treatment applied to fiber surface for better bonding',
+                    'Fiber_type_detail': 'Specific grade, manufacturer, or detailed specification of the fiber',
+                    'Matrix_type_detail': 'Specific formulation, grade, or manufacturer details of the matrix',
+                    'Fiber_content_weight': 'Weight percentage of fibers in the total composite weight',
+                    'Fiber_content_volume': 'Volume percentage of fibers in the total composite volume',
+                    'diameter': 'Cross-sectional diameter of the FRP rebar specimen',
+                    'Void_content': 'Percentage of air voids or empty spaces in the composite',
+                    'cure_ratio': 'Degree of polymerization or crosslinking in the matrix material',
+                    'cure_ratio_2': 'Secondary or post-cure degree of polymerization',
+                    'tensile_modulus': 'Elastic modulus measuring stiffness under tensile loading',
+                    'ultimate_tensile_strength': 'Maximum stress the material can withstand before failure',
+                    'temperature': 'Environmental temperature during the exposure or testing',
+                    'temp': 'Ambient temperature conditions during the experiment',
+                    'temp2': 'Secondary temperature measurement or different stage temperature',
+                    'pH': 'Measure of acidity or alkalinity of the exposure environment',
+                    'pH_1': 'Initial pH value at the beginning of exposure',
+                    'pH_2': 'Final pH value at the end of exposure period',
+                    'pHafter': 'pH value measured after completing the exposure treatment',
+                    'cycle_pH': 'pH value during cyclic exposure conditions',
+                    'cycle_pH_after': 'pH value after completing cyclic exposure treatment',
+                    'Duration_hours': 'Total exposure time expressed in hours',
+                    'Duration_days': 'Total exposure time expressed in days',
+                    'test_age': 'Age of the specimen at the time of testing',
+                    'chloride': 'Concentration of chloride ions in the exposure solution',
+                    'alkaline': 'Concentration of alkaline substances in the exposure medium',
+                    'field_average_temperature': 'Average temperature recorded in field exposure conditions',
+                    'field_average_humidity': 'Average relative humidity during field exposure',
+                    'Effektive_Klimaklassifikation': 'Climate classification system used for environmental conditions',
+                    'Strength of unconditioned rebar': 'Baseline tensile strength before any environmental exposure',
+                    'Tensile strength retention': 'Ratio of residual strength to original strength (0-1 scale)',
+                    'Tensile strength retention rate (%)': 'Percentage of original strength retained after exposure',
+                    'Residual tensile strength (MPa)': 'Remaining tensile strength after environmental degradation'
+                }
+                
+                with st.form("add_record_form"):
+                    new_data = {}
+                    
+                    # Dynamically generate form fields
+                    cols = st.columns(3)
+                    col_index = 0
+                    
+                    for col in df.columns:
+                        if col != 'id':  # Skip ID field
+                            with cols[col_index % 3]:
+                                # Get feature description
+                                description = feature_descriptions.get(col, f'{col}')
+                                
+                                if df[col].dtype == 'object':
+                                    unique_vals = df[col].dropna().unique().tolist()
+                                    if len(unique_vals) < 20 and len(unique_vals) > 0:
+                                        new_data[col] = st.selectbox(f"{col}", [""] + unique_vals, 
+                                                                   help=description, key=f"add_{col}")
+                                    else:
+                                        new_data[col] = st.text_input(f"{col}", help=description, key=f"add_{col}")
+                                else:
+                                    new_data[col] = st.number_input(f"{col}", value=0.0, 
+                                                                  help=description, key=f"add_{col}")
+                            col_index += 1
                     
-                    with col3:
-                        if st.button("Reject", key=f"reject_{user['id']}", use_container_width=True):
-                            with engine.connect() as conn:
-                                conn.execute(
-                                    text("UPDATE users SET status = 'rejected' WHERE id = :id"),
-                                    {"id": user['id']}
-                                )
-                                conn.commit()
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.form_submit_button("Submit for Approval", type="primary"):
+                            # Submit change request
+                            submit_data_change(
+                                user_info['email'],
+                                'insert',
+                                table_name,
+                                None,
+                                None,
+                                new_data,
+                                engine
+                            )
+                            st.success("Changes submitted for approval!")
+                            st.session_state["show_add_form"] = False
                             
-                            send_email(
-                                user['email'],
-                                "FRP Database Access Rejected",
-                                "Your access request has been rejected."
+                            # Record operation
+                            log_operation(
+                                user_info['email'],
+                                'submit_insert',
+                                table_name,
+                                None,
+                                new_data,
+                                get_client_ip(),
+                                engine
                             )
-                            st.warning("User request has been rejected!")
                             st.rerun()
                     
-                    st.markdown("---")
-            else:
-                st.markdown("""
-                <div style="background: #d4edda; border: 1px solid #c3e6cb; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
-                    <h3 style="color: #155724; margin: 0;">All Complete!</h3>
-                    <p style="color: #155724; margin: 0.5rem 0 0 0;">Currently no pending user requests for approval.</p>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        with access_tabs[1]:
-            # Approved users list - modern design
-            st.markdown("### Approved Users")
-            
-            approved_users = pd.read_sql(
-                "SELECT name, email, institution, role, approved_at FROM users WHERE status = 'approved' ORDER BY created_at DESC",
-                engine
-            )
+                    with col2:
+                        if st.form_submit_button("Cancel"):
+                            st.session_state["show_add_form"] = False
+                            st.rerun()
             
-            if not approved_users.empty:
-                st.markdown(f"""
-                <div style="background: #d1ecf1; padding: 0.8rem; border-radius: 8px; margin: 1rem 0; border-left: 4px solid #17a2b8;">
-                    <p style="margin: 0; color: #0c5460; font-weight: 500;">👥 {len(approved_users)} active user(s) with database access</p>
-                </div>
-                """, unsafe_allow_html=True)
+            # Batch upload function
+            if st.session_state.get("show_batch_upload", False):
+                st.markdown("---")
+                st.subheader("Batch Upload")
                 
-                # Modern user table
-                st.dataframe(
-                    approved_users,
-                    use_container_width=True,
-                    column_config={
-                        "name": st.column_config.TextColumn("Name", width="medium"),
-                        "email": st.column_config.TextColumn("Email", width="large"),
-                        "institution": st.column_config.TextColumn("Institution", width="medium"),
-                        "role": st.column_config.TextColumn("Role", width="small"),
-                        "approved_at": st.column_config.DatetimeColumn("Approved", width="medium")
-                    },
-                    hide_index=True
+                uploaded_file = st.file_uploader(
+                    "Choose a file",
+                    type=['xlsx', 'xls', 'csv'],
+                    help="Upload Excel or CSV file with data",
+                    key="batch_upload_file"
                 )
-            else:
-                st.markdown("""
-                <div style="background: #f8f9fa; border: 1px solid #dee2e6; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
-                    <h3 style="color: #6c757d; margin: 0;">No Active Users</h3>
-                    <p style="color: #6c757d; margin: 0.5rem 0 0 0;">No approved users found in the system.</p>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        with access_tabs[2]:
-            # User management operations - Modern design
-            st.markdown("### User Management")
-            
-            approved_users = pd.read_sql(
-                "SELECT name, email, institution, role, approved_at FROM users WHERE status = 'approved' ORDER BY created_at DESC",
-                engine
-            )
-            
-            if not approved_users.empty:
-                # User selection area
-                st.markdown("#### Select User to Manage")
-                
-                user_selection_col, actions_col = st.columns([2, 1])
-                
-                with user_selection_col:
-                    selected_user = st.selectbox(
-                        "Choose a user:",
-                        approved_users['email'].tolist(),
-                        format_func=lambda x: f"{approved_users[approved_users['email'] == x]['name'].iloc[0]} ({x})",
-                        help="Select a user to manage their permissions and status"
-                    )
-                
-                with actions_col:
-                    if st.button("Refresh User List", use_container_width=True):
-                        st.rerun()
                 
-                if selected_user:
-                    # Display selected user details
-                    user_details = approved_users[approved_users['email'] == selected_user].iloc[0]
-                    
-                    st.markdown("---")
-                    st.markdown("#### User Details & Actions")
-                    
-                    # User information card
-                    st.markdown(f"""
-                    <div style="background: white; padding: 1.5rem; border-radius: 10px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin: 1rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">
-                        <h4 style="margin: 0 0 1rem 0; color: #2c3e50;">{user_details['name']}</h4>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">EMAIL</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user_details['email']}</p>
-                            </div>
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">INSTITUTION</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user_details['institution']}</p>
-                            </div>
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">CURRENT ROLE</p>
-                                <span style="background: #3498db; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">{user_details['role'].upper()}</span>
-                            </div>
-                            <div>
-                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">APPROVED AT</p>
-                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user_details['approved_at']}</p>
-                            </div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Management operations
-                    st.markdown("#### Management Actions")
-                    
-                    # Create management operation tabs
-                    action_tabs = st.tabs(["Change Role", "Deactivate User", "Delete User"])
-                    
-                    with action_tabs[0]:
-                        st.markdown("**Change User Role**")
+                if uploaded_file is not None:
+                    try:
+                        # Read file
+                        if uploaded_file.name.endswith(('.xlsx', '.xls')):
+                            excel_file = pd.ExcelFile(uploaded_file)
+                            sheet_names = excel_file.sheet_names
+                            
+                            if len(sheet_names) > 1:
+                                selected_sheet = st.selectbox("Select Sheet", sheet_names)
+                            else:
+                                selected_sheet = sheet_names[0]
+                            
+                            uploaded_df = pd.read_excel(uploaded_file, sheet_name=selected_sheet)
+                        else:
+                            uploaded_df = pd.read_csv(uploaded_file)
                         
-                        new_role = st.selectbox(
-                            "Select new role:",
-                            ["viewer", "editor", "admin"],
-                            index=["viewer", "editor", "admin"].index(user_details['role']),
-                            help="Change user's access level"
-                        )
+                        st.success(f"File loaded: {len(uploaded_df)} rows, {len(uploaded_df.columns)} columns")
                         
-                        if st.button("Update Role", type="primary", use_container_width=True):
-                            if new_role != user_details['role']:
-                                with engine.connect() as conn:
-                                    conn.execute(
-                                        text("UPDATE users SET role = :role WHERE email = :email"),
-                                        {"role": new_role, "email": selected_user}
-                                    )
-                                    conn.commit()
-                                st.success(f"Role updated to {new_role}!")
-                                st.rerun()
-                            else:
-                                st.info("User already has this role")
-                    
-                    with action_tabs[1]:
-                        st.markdown("**Deactivate User Account**")
-                        st.markdown("This will temporarily suspend the user's access to the platform.")
+                        # Data Preview
+                        st.write("Data Preview:")
+                        st.dataframe(uploaded_df.head(10))
                         
-                        st.warning("**Warning:** This action will immediately revoke user access.")
+                        # Column mapping
+                        st.subheader("Column Mapping")
                         
-                        if st.button("Deactivate User", use_container_width=True):
-                            with engine.connect() as conn:
-                                conn.execute(
-                                    text("UPDATE users SET status = 'deactivated' WHERE email = :email"),
-                                    {"email": selected_user}
+                        # Get database column names
+                        db_columns = [col for col in df.columns if col != 'id']
+                        
+                        # Auto match column names
+                        column_mapping = {}
+                        for db_col in db_columns:
+                            matching_cols = [col for col in uploaded_df.columns if db_col.lower() in col.lower()]
+                            if matching_cols:
+                                default_index = uploaded_df.columns.tolist().index(matching_cols[0]) + 1
+                            else:
+                                default_index = 0
+                            
+                            column_mapping[db_col] = st.selectbox(
+                                f"Map '{db_col}' to:",
+                                ["None"] + uploaded_df.columns.tolist(),
+                                index=default_index,
+                                key=f"mapping_{db_col}"
+                            )
+                        
+                        # Submit button
+                        if st.button("Submit Batch Upload", type="primary"):
+                            # Prepare data
+                            mapped_data = {}
+                            for db_col, file_col in column_mapping.items():
+                                if file_col != "None":
+                                    mapped_data[db_col] = uploaded_df[file_col]
+                            
+                            if mapped_data:
+                                mapped_df = pd.DataFrame(mapped_data)
+                                
+                                # Batch submit
+                                progress_bar = st.progress(0)
+                                status_text = st.empty()
+                                
+                                submitted_count = 0
+                                total_rows = len(mapped_df)
+                                
+                                for idx, row in mapped_df.iterrows():
+                                    try:
+                                        submit_data_change(
+                                            user_info['email'],
+                                            'insert',
+                                            table_name,
+                                            None,
+                                            None,
+                                            row.to_dict(),
+                                            engine
+                                        )
+                                        submitted_count += 1
+                                    except Exception as e:
+                                        st.error(f"Error submitting row {idx}: {e}")
+                                    
+                                    progress = (idx + 1) / total_rows
+                                    progress_bar.progress(progress)
+                                    status_text.text(f"Processing: {idx + 1}/{total_rows}")
+                                
+                                progress_bar.empty()
+                                status_text.empty()
+                                
+                                st.success(f"Batch upload completed! {submitted_count} records submitted for approval.")
+                                st.session_state["show_batch_upload"] = False
+                                
+                                # Send notification
+                                send_email(
+                                    EMAIL_USER,
+                                    "Batch Data Submission",
+                                    f"User {user_info['name']} submitted {submitted_count} records for approval.\nTable: {table_name}"
                                 )
-                                conn.commit()
-                            st.warning("User deactivated successfully!")
-                            st.rerun()
+                            else:
+                                st.error("No columns mapped. Please map at least one column.")
                     
-                    with action_tabs[2]:
-                        st.markdown("**Permanently Delete User**")
-                        st.markdown("This will completely remove the user from the system.")
-                        
-                        st.error("**Danger Zone:** This action cannot be undone!")
-                        
-                        confirm_delete = st.checkbox(
-                            "I understand this action cannot be undone", 
-                            key="confirm_delete",
-                            help="Check this box to confirm permanent deletion"
-                        )
-                        
-                        if st.button("Permanently Delete User", 
-                                   disabled=not confirm_delete, 
-                                   use_container_width=True):
-                            with engine.connect() as conn:
-                                conn.execute(
-                                    text("DELETE FROM users WHERE email = :email"),
-                                    {"email": selected_user}
-                                )
-                                conn.commit()
-                            st.error("User permanently deleted!")
-                            st.rerun()
-            
-            else:
-                st.markdown("""
-                <div style="background: #f8f9fa; border: 1px solid #dee2e6; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
-                    <h3 style="color: #6c757d; margin: 0;">No Users to Manage</h3>
-                    <p style="color: #6c757d; margin: 0.5rem 0 0 0;">No approved users available for management.</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-# ——————————————————————————————
-# Tab 3: Data Change Management (只对admin用户可见)
-# ——————————————————————————————
-if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
-    with tabs[tab_indexes["data_changes"]]:
-        
-        if "authenticated_user" not in st.session_state:
-            st.warning("Please log in first.")
-        else:
-            user_info = st.session_state["authenticated_user"]
+                    except Exception as e:
+                        st.error(f"Error processing file: {e}")
             
-        # Data Changes Management interface - 与Access Control保持一致的设计
-        st.markdown(f"""
-        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
-            <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
-                Data Changes Management
-            </h3>
-            <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
-                Track and manage data modification requests and approvals
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # 获取数据变更统计信息
-        pending_changes = get_pending_changes(engine)
-        
-        # 统计卡片 - 与Access Control保持一致的设计
-        col1, col2, col3, col4 = st.columns(4)
-        
-        # 计算统计数据
-        total_pending = len(pending_changes) if pending_changes else 0
-        
-        # 获取历史统计
-        try:
-            history_stats = pd.read_sql(
-                text("SELECT status, COUNT(*) as count FROM data_changes GROUP BY status"),
-                engine
-            )
-            approved_count = history_stats[history_stats['status'] == 'approved']['count'].sum() if not history_stats.empty else 0
-            rejected_count = history_stats[history_stats['status'] == 'rejected']['count'].sum() if not history_stats.empty else 0
-            total_requests = history_stats['count'].sum() if not history_stats.empty else 0
-        except:
-            approved_count = rejected_count = total_requests = 0
-        
-        with col1:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #f39c12;">
-                <h4 style="color: #f39c12; margin: 0; font-size: 0.9rem; font-weight: 600;">PENDING REQUESTS</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{total_pending}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Awaiting review</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #27ae60;">
-                <h4 style="color: #27ae60; margin: 0; font-size: 0.9rem; font-weight: 600;">APPROVED</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{approved_count}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Total approved</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #e74c3c;">
-                <h4 style="color: #e74c3c; margin: 0; font-size: 0.9rem; font-weight: 600;">REJECTED</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{rejected_count}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Total rejected</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
-                <h4 style="color: #3498db; margin: 0; font-size: 0.9rem; font-weight: 600;">TOTAL REQUESTS</h4>
-                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{total_requests}</h2>
-                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">All time</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Admin approval interface
-        if user_info["role"] == "admin":
+            # Create model dataset functionality
+            if st.session_state.get("show_create_model", False):
+                st.markdown("---")
+                st.subheader("Create Machine Learning Model Dataset")
+                
+                st.info("""
+                **Advanced data preprocessing workflow:**
+                1. Missing value marker conversion (SMD → NaN)
+                2. Range value parsing ("20,30" → 25)  
+                3. Feature engineering (13 ML features)
+                4. Model dataset creation
+                """)
+                
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    if st.button("Start Advanced Data Preprocessing", type="primary", use_container_width=True):
+                        try:
+                            # Execute advanced data preprocessing
+                            model_dataset = create_advanced_model_dataset()
+                            
+                            if model_dataset is not None and len(model_dataset) > 0:
+                                st.success(f"Successfully created model dataset! Shape: {model_dataset.shape}")
+                                
+                                # Save to session state
+                                st.session_state["model_dataset"] = model_dataset
+                                
+                                # Display data preview
+                                st.subheader("Model Dataset Preview")
+                                st.dataframe(model_dataset.head(10), use_container_width=True)
+                                
+                                # Display feature statistics
+                                st.subheader("Feature Statistics")
+                                col_stat1, col_stat2 = st.columns(2)
+                                
+                                with col_stat1:
+                                    st.write("**Data Integrity:**")
+                                    for col in model_dataset.columns:
+                                        non_null = model_dataset[col].count()
+                                        total = len(model_dataset)
+                                        percentage = (non_null / total * 100) if total > 0 else 0
+                                        st.write(f"- {col}: {percentage:.1f}% ({non_null}/{total})")
+                                
+                                with col_stat2:
+                                    st.write("**Numerical Feature Statistics:**")
+                                    numeric_cols = model_dataset.select_dtypes(include=[np.number]).columns
+                                    if len(numeric_cols) > 0:
+                                        stats = model_dataset[numeric_cols].describe()
+                                        st.dataframe(stats.round(2))
+                                
+                                # Provide download option
+                                csv_data = model_dataset.to_csv(index=False).encode('utf-8')
+                                st.download_button(
+                                    label="Download Model Dataset (CSV)",
+                                    data=csv_data,
+                                    file_name=f"frp_model_dataset_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                    mime="text/csv",
+                                    use_container_width=True
+                                )
+                                
+                                # Record operation log
+                                if engine:
+                                    log_operation(
+                                        user_info["email"],
+                                        "create_model_dataset",
+                                        "research_data",
+                                        None,
+                                        {"rows": len(model_dataset), "columns": len(model_dataset.columns)},
+                                        get_client_ip(),
+                                        engine
+                                    )
+                            
+                            else:
+                                st.error("Model dataset creation failed or data is empty")
+                                
+                        except Exception as e:
+                            st.error(f"Error during processing: {e}")
+                            st.write("**Error Details:**")
+                            st.code(str(e))
+                
+                with col2:
+                    st.info("""
+                    **Expected Output Features:**
+                    - Tensile strength retention
+                    - pH of condition environment  
+                    - Exposure time
+                    - Fibre content
+                    - Exposure temperature
+                    - Diameter
+                    - Presence of concrete
+                    - Load
+                    - Presence of chloride ion
+                    - Fibre type
+                    - Matrix type
+                    - Surface treatment
+                    - Strength of unconditioned rebar
+                    """)
+                
+                if st.button("Close", use_container_width=True):
+                    st.session_state["show_create_model"] = False
+                    st.rerun()
             
-            if pending_changes:
-                # 简约的过滤器设计
-                st.markdown("#### Review Pending Changes")
+            # Data export
+            if st.session_state.get("show_export", False):
+                st.markdown("---")
+                st.subheader("Export Data")
                 
-                # 单行过滤器
-                filter_col1, filter_col2, filter_col3 = st.columns([1, 1, 1])
+                export_format = st.radio("Export Format", ["CSV", "Excel"])
                 
-                with filter_col1:
-                    filter_type = st.selectbox(
-                        "Type",
-                        ["All"] + list(set([dict(change._mapping if hasattr(change, '_mapping') else change._asdict())['change_type'] for change in pending_changes])),
-                        key="change_type_filter"
+                if st.button("Generate Export File"):
+                    if export_format == "CSV":
+                        csv = filtered_df.to_csv(index=False)
+                        b64 = base64.b64encode(csv.encode()).decode()
+                        href = f'<a href="data:file/csv;base64,{b64}" download="{table_name}_export.csv">Download CSV File</a>'
+                        st.markdown(href, unsafe_allow_html=True)
+                    else:
+                        output = io.BytesIO()
+                        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+                            filtered_df.to_excel(writer, sheet_name=table_name, index=False)
+                        excel_data = output.getvalue()
+                        b64 = base64.b64encode(excel_data).decode()
+                        href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{table_name}_export.xlsx">Download Excel File</a>'
+                        st.markdown(href, unsafe_allow_html=True)
+                    
+                    # Record export operation
+                    log_operation(
+                        user_info['email'],
+                        'export',
+                        table_name,
+                        None,
+                        {"format": export_format, "records": len(filtered_df)},
+                        get_client_ip(),
+                        engine
                     )
                 
-                with filter_col2:
-                    filter_table = st.selectbox(
-                        "Table",
-                        ["All"] + list(set([dict(change._mapping if hasattr(change, '_mapping') else change._asdict())['table_name'] for change in pending_changes])),
-                        key="table_filter"
-                    )
+                st.session_state["show_export"] = False
+        
+        except Exception as e:
+            st.error(f"Error reading data: {e}")
+            st.write("**Debug Information:**")
+            st.write("Please check database connection and data format.")
+            
+            # Provide data repair suggestions
+            st.subheader("Data Repair Suggestions")
+            st.write("""
+            1. **Clean problematic values**: Replace 'SMD', 'Notreported', and similar values with NULL in the database
+            2. **Check Data Types**: Ensure numeric columns contain only numbers
+            3. **Validate data format**: Review the source data for consistency
+            """)
+            
+            if st.button("Try to reload data"):
+                data_manager.invalidate_cache(f"table_{table_name}")
+                st.rerun()
+
+        # ——————————————————————————————
+        # 管理缓存部分 - 只对admin用户可见，放在Data Operations下面
+        # ——————————————————————————————
+        if st.session_state["authenticated_user"]["role"] == "admin":
+            
+            with st.expander("Manage Cache", expanded=False):
+                st.markdown("""
+                <div style="background: #f8f9fa; padding: 0.8rem; border-radius: 6px; margin-bottom: 0.5rem; border-left: 3px solid #dc3545;">
+                    <p style="margin: 0; color: #495057; font-size: 0.9rem; font-weight: 500;">
+                        Manage data preprocessing caches and trained machine learning models
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
                 
-                with filter_col3:
-                    filter_user = st.selectbox(
-                        "User",
-                        ["All"] + list(set([dict(change._mapping if hasattr(change, '_mapping') else change._asdict())['user_email'] for change in pending_changes])),
-                        key="user_filter"
-                    )                
-                # Apply filters
-                filtered_changes = []
-                for change in pending_changes:
-                    change_dict = dict(change._mapping) if hasattr(change, '_mapping') else change._asdict()
-                    
-                    if (filter_type == "All" or change_dict['change_type'] == filter_type) and \
-                       (filter_table == "All" or change_dict['table_name'] == filter_table) and \
-                       (filter_user == "All" or change_dict['user_email'] == filter_user):
-                        filtered_changes.append(change)
+                # 创建两个管理标签页
+                cache_tabs = st.tabs(["Data Preprocessing Cache", "Trained Models"])
                 
-                if filtered_changes:
-                    st.markdown(f"**{len(filtered_changes)} of {len(pending_changes)} changes**")
+                # 第一个标签页：数据预处理缓存
+                with cache_tabs[0]:
+                    st.markdown("#### Data Preprocessing Cache Management")
                     
-                    # 简约的变更请求卡片展示
-                    for idx, change in enumerate(filtered_changes):
-                        change_dict = dict(change._mapping) if hasattr(change, '_mapping') else change._asdict()
+                    st.info("""
+                    **Cache Management Operations:**
+                    - Generate and save preprocessed datasets to cache
+                    - View and manage existing cached datasets
+                    - Clear individual or all cached datasets
+                    - Monitor cache storage usage
+                    """)
+                    
+                    try:
+                        preprocessor = FRPDataPreprocessor(engine)
                         
-                        # 卡片式布局
-                        with st.container():
+                        # Cache generation section
+                        st.markdown("##### Generate New Cache")
+                        col_gen1, col_gen2 = st.columns(2)
+                        
+                        with col_gen1:
+                            if st.button("Generate & Cache Dataset", type="primary", use_container_width=True):
+                                try:
+                                    with st.spinner("Executing advanced data preprocessing..."):
+                                        model_dataset = create_advanced_model_dataset()
+                                        if model_dataset is not None and len(model_dataset) > 0:
+                                            st.session_state["model_dataset"] = model_dataset
+                                            
+                                            # Save to database cache
+                                            cache_key = f"advanced_dataset_{user_info['email']}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}"
+                                            feature_columns = model_dataset.columns.tolist()
+                                            
+                                            if preprocessor.save_to_cache(cache_key, model_dataset, feature_columns):
+                                                st.success(f"Dataset generated and cached! Shape: {model_dataset.shape}")
+                                                st.success(f"Cache key: {cache_key}")
+                                                st.rerun()
+                                            else:
+                                                st.error("Failed to save to cache")
+                                        else:
+                                            st.error("Advanced preprocessing failed")
+                                except Exception as e:
+                                    st.error(f"Processing error: {e}")
+                        
+                        with col_gen2:
+                            # Save current dataset to cache (if exists)
+                            if "model_dataset" in st.session_state and st.session_state.model_dataset is not None:
+                                if st.button("Save Current Dataset to Cache", type="secondary", use_container_width=True):
+                                    try:
+                                        cache_key = f"current_dataset_{user_info['email']}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}"
+                                        feature_columns = st.session_state.model_dataset.columns.tolist()
+                                        
+                                        if preprocessor.save_to_cache(cache_key, st.session_state.model_dataset, feature_columns):
+                                            st.success(f"Current dataset saved to cache!")
+                                            st.success(f"Cache key: {cache_key}")
+                                            st.rerun()
+                                        else:
+                                            st.error("Failed to save to cache")
+                                    except Exception as e:
+                                        st.error(f"Cache save error: {e}")
+                            else:
+                                st.info("No dataset in memory to cache")
+                        
+                        st.markdown("---")
+                        
+                        # Cache listing and management
+                        st.markdown("##### Existing Cached Datasets")
+                        cached_datasets = preprocessor.list_cached_datasets()
+                        
+                        if cached_datasets:
                             st.markdown(f"""
-                            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin: 1rem 0; border-left: 4px solid #3498db;">
-                                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                                    <h4 style="color: #2c3e50; margin: 0; font-size: 1.1rem;">{change_dict['change_type'].upper()} - {change_dict['table_name']}</h4>
-                                    <span style="color: #7f8c8d; font-size: 0.85rem;">{change_dict['created_at'].strftime("%Y-%m-%d %H:%M") if hasattr(change_dict['created_at'], 'strftime') else str(change_dict['created_at'])}</span>
-                                </div>
-                                <p style="color: #7f8c8d; margin: 0; font-size: 0.9rem;">By: {change_dict['user_email']}</p>
+                            <div style="background: #d1ecf1; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin: 0.5rem 0;">
+                                <strong style="color: #0c5460;">Found {len(cached_datasets)} cached dataset(s)</strong>
                             </div>
                             """, unsafe_allow_html=True)
                             
-                            # 展开详细信息的选项
-                            if st.checkbox(f"Show Details", key=f"show_detail_{change_dict['id']}"):
-                                
-                                # 基本信息区域
-                                info_col1, info_col2, info_col3 = st.columns(3)
-                                with info_col1:
-                                    st.markdown(f"""
-                                    <div style="background: #f8f9fa; padding: 0.5rem; border-radius: 6px; text-align: center;">
-                                        <strong style="color: #495057;">Type</strong><br>
-                                        <span style="color: #3498db;">{change_dict['change_type'].upper()}</span>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                with info_col2:
-                                    st.markdown(f"""
-                                    <div style="background: #f8f9fa; padding: 0.5rem; border-radius: 6px; text-align: center;">
-                                        <strong style="color: #495057;">Table</strong><br>
-                                        <span style="color: #6c757d;">{change_dict['table_name']}</span>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                with info_col3:
+                            # Show cached datasets with improved layout
+                            for idx, cache_info in enumerate(cached_datasets):
+                                # Use container for better visual separation
+                                with st.container():
                                     st.markdown(f"""
-                                    <div style="background: #f8f9fa; padding: 0.5rem; border-radius: 6px; text-align: center;">
-                                        <strong style="color: #495057;">Created</strong><br>
-                                        <span style="color: #6c757d;">{change_dict['created_at'].strftime("%m-%d %H:%M") if hasattr(change_dict['created_at'], 'strftime') else str(change_dict['created_at'])}</span>
+                                    <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin: 0.8rem 0; border-left: 4px solid #3498db;">
+                                        <h4 style="color: #2c3e50; margin: 0 0 0.8rem 0;">{cache_info['cache_key']}</h4>
                                     </div>
                                     """, unsafe_allow_html=True)
+                                    
+                                    col_info, col_actions = st.columns([3, 1])
+                                    
+                                    with col_info:
+                                        # Use cleaner info display
+                                        col_shape, col_created, col_updated = st.columns(3)
+                                        with col_shape:
+                                            st.caption("Shape")
+                                            st.write(f"**{cache_info['shape']}**")
+                                        with col_created:
+                                            st.caption("Created")
+                                            st.write(f"**{cache_info['created_at'].strftime('%Y-%m-%d %H:%M')}**")
+                                        with col_updated:
+                                            st.caption("Updated")
+                                            st.write(f"**{cache_info['updated_at'].strftime('%Y-%m-%d %H:%M')}**")
+                                    
+                                    with col_actions:
+                                        # Keep button styling consistent
+                                        if st.button("Delete Cache", key=f"delete_cache_mgmt_{idx}", use_container_width=True, type="secondary"):
+                                            try:
+                                                deleted_count = preprocessor.clear_cache(cache_info['cache_key'])
+                                                if deleted_count > 0:
+                                                    st.success("Cache deleted!")
+                                                    st.rerun()
+                                                else:
+                                                    st.warning("Cache not found")
+                                            except Exception as e:
+                                                st.error(f"Delete error: {e}")
+                                    
+                                    # Add small separator
+                                    st.markdown("<br>", unsafe_allow_html=True)
+                        
+                        else:
+                            st.markdown("""
+                            <div style="background: #fff3cd; padding: 1rem; border-radius: 8px; border-left: 4px solid #ffc107; margin: 1rem 0;">
+                                <h5 style="color: #856404; margin: 0 0 0.5rem 0;">No Cached Datasets</h5>
+                                <p style="color: #856404; margin: 0;">Generate your first cached dataset using the button above.</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                    
+                    except Exception as e:
+                        st.error(f"Cache management error: {e}")
+                
+                # 第二个标签页：已训练模型管理
+                with cache_tabs[1]:
+                    st.markdown("#### Trained Models Management")
+                    
+                    # 检查是否有缓存的模型
+                    try:
+                        model_cache_manager = ModelCacheManager(engine)
+                        cached_models = model_cache_manager.list_cached_models()
+                        
+                        if cached_models:
+                            st.markdown(f"""
+                            <div style="background: #d1ecf1; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin: 0.5rem 0;">
+                                <strong style="color: #0c5460;">{len(cached_models)} trained model(s) available in cache</strong>
+                            </div>
+                            """, unsafe_allow_html=True)
+                            
+                            # 创建模型管理标签页
+                            model_tabs = st.tabs(["Model List", "Model Details", "Cache Management"])
+                            
+                            with model_tabs[0]:
+                                # 按目标变量分组显示
+                                models_by_target = {}
+                                for model in cached_models:
+                                    target = model['target_variable']
+                                    if target not in models_by_target:
+                                        models_by_target[target] = []
+                                    models_by_target[target].append(model)
                                 
-                                st.markdown("<br>", unsafe_allow_html=True)
-                                
-                                # 数据对比区域
-                                if change_dict['old_data']:
-                                    st.markdown("**Before (Old Data):**")
-                                    display_structured_data(change_dict['old_data'])
-                                    st.markdown("**After (Proposed Change):**")
-                                else:
-                                    st.markdown("**Proposed New Data:**")
-                                display_structured_data(change_dict['new_data'])
-                                
-                                st.markdown("---")
-                                
-                                # 审批操作区域 - 简约设计
-                                review_col1, review_col2 = st.columns([2, 1])
-                                
-                                with review_col1:
-                                    comment = st.text_area(
-                                        "Review Comment",
-                                        placeholder="Optional: Add your review comments...",
-                                        key=f"comment_{change_dict['id']}",
-                                        height=80
-                                    )
-                                
-                                with review_col2:
-                                    st.markdown("**Actions:**")
+                                for target_var, target_models in models_by_target.items():
+                                    st.markdown(f"**Target Variable: {target_var}**")
                                     
-                                    # 操作按钮 - 垂直布局，移除表情符号
-                                    if st.button("Approve", key=f"approve_{change_dict['id']}", type="primary", use_container_width=True):
-                                        # Execute change
-                                        with engine.connect() as conn:
-                                            # Update change status
-                                            conn.execute(
-                                                text("""
-                                                    UPDATE data_changes
-                                                    SET status = 'approved',
-                                                        reviewed_by = :reviewer,
-                                                        reviewed_at = NOW(),
-                                                        review_comment = :comment
-                                                    WHERE id = :id
-                                                """),
-                                                {
-                                                    "id": change_dict['id'],
-                                                    "reviewer": user_info['email'],
-                                                    "comment": comment
-                                                }
-                                            )
+                                    # 显示该目标变量的所有模型，使用与缓存数据集一致的风格
+                                    for idx, model in enumerate(target_models):
+                                        # Use container for better visual separation
+                                        with st.container():
+                                            # 计算模型表现评分
+                                            eval_strategy = model['evaluation_strategy']
+                                            created_time = model['created_at'].strftime('%Y-%m-%d %H:%M') if model['created_at'] else 'Unknown'
+                                            model_key = model['model_key']
+                                            model_name = model['model_name']
                                             
-                                            # Apply changes
-                                            new_data = json.loads(change_dict['new_data'])
+                                            st.markdown(f"""
+                                            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin: 0.8rem 0; border-left: 4px solid #3498db;">
+                                                <h4 style="color: #2c3e50; margin: 0 0 0.8rem 0;">{model_name}</h4>
+                                            </div>
+                                            """, unsafe_allow_html=True)
                                             
-                                            if change_dict['change_type'] == 'insert':
-                                                columns = ", ".join(new_data.keys())
-                                                placeholders = ", ".join([f":{k}" for k in new_data.keys()])
-                                                conn.execute(
-                                                    text(f"INSERT INTO {change_dict['table_name']} ({columns}) VALUES ({placeholders})"),
-                                                    new_data
-                                                )
+                                            col_info, col_actions = st.columns([3, 1])
                                             
-                                            conn.commit()
+                                            with col_info:
+                                                # Use cleaner info display
+                                                col_strategy, col_key, col_created = st.columns(3)
+                                                with col_strategy:
+                                                    st.caption("Evaluation Strategy")
+                                                    st.write(f"**{eval_strategy}**")
+                                                with col_key:
+                                                    st.caption("Model Key")
+                                                    st.write(f"**{model_key}**")
+                                                with col_created:
+                                                    st.caption("Trained")
+                                                    st.write(f"**{created_time}**")
+                                            
+                                            with col_actions:
+                                                # Action buttons in a column layout
+                                                if st.button("Load Model", key=f"cache_load_model_{model['model_key']}", use_container_width=True, type="primary"):
+                                                    try:
+                                                        # 加载模型详情
+                                                        loaded_model = model_cache_manager.load_model(model['model_key'])
+                                                        if loaded_model:
+                                                            # 将模型加载到session state
+                                                            st.session_state.trained_model = loaded_model['model']
+                                                            st.session_state.selected_target = loaded_model['target_variable']
+                                                            st.session_state.selected_model = loaded_model['model_name']
+                                                            st.session_state.current_model_key = model['model_key']
+                                                            
+                                                            # 加载特征信息
+                                                            feature_info = loaded_model['feature_info']
+                                                            preprocessing_info = loaded_model['preprocessing_info']
+                                                            
+                                                            st.session_state.feature_names = feature_info.get('feature_names', [])
+                                                            st.session_state.feature_columns = feature_info.get('feature_columns', [])
+                                                            st.session_state.numeric_features = feature_info.get('numeric_features', [])
+                                                            st.session_state.categorical_features = feature_info.get('categorical_features', [])
+                                                            
+                                                            # 显示加载结果
+                                                            eval_results = loaded_model['evaluation_results']
+                                                            st.success(f"Model loaded successfully! Test R²: {eval_results.get('test_r2', 'N/A'):.4f}")
+                                                            st.rerun()
+                                                        else:
+                                                            st.error("Failed to load model")
+                                                    except Exception as e:
+                                                        st.error(f"Load error: {e}")
+                                                
+                                                # 添加删除按钮
+                                                if st.button("Delete", key=f"cache_delete_model_{model['model_key']}", use_container_width=True, type="secondary", help="Delete this model"):
+                                                    # 确认删除
+                                                    if f"confirm_delete_{model['model_key']}" not in st.session_state:
+                                                        st.session_state[f"confirm_delete_{model['model_key']}"] = False
+                                                    
+                                                    if not st.session_state[f"confirm_delete_{model['model_key']}"]:
+                                                        st.session_state[f"confirm_delete_{model['model_key']}"] = True
+                                                        st.rerun()
+                                                
+                                                # 如果用户点击了删除，显示确认对话框
+                                                if st.session_state.get(f"confirm_delete_{model['model_key']}", False):
+                                                    st.warning(f"⚠️ Confirm deletion of model: **{model_name}**")
+                                                    col_confirm, col_cancel = st.columns(2)
+                                                    
+                                                    with col_confirm:
+                                                        if st.button("Confirm Delete", key=f"confirm_delete_btn_{model['model_key']}", type="primary", use_container_width=True):
+                                                            try:
+                                                                success = model_cache_manager.delete_model(model['model_key'])
+                                                                if success:
+                                                                    st.success(f"Model {model_name} deleted successfully!")
+                                                                    # 清理确认状态
+                                                                    if f"confirm_delete_{model['model_key']}" in st.session_state:
+                                                                        del st.session_state[f"confirm_delete_{model['model_key']}"]
+                                                                    st.rerun()
+                                                                else:
+                                                                    st.error("Failed to delete model")
+                                                            except Exception as e:
+                                                                st.error(f"Delete error: {e}")
+                                                    
+                                                    with col_cancel:
+                                                        if st.button("Cancel", key=f"cancel_delete_btn_{model['model_key']}", use_container_width=True):
+                                                            # 取消删除，清理确认状态
+                                                            st.session_state[f"confirm_delete_{model['model_key']}"] = False
+                                                            st.rerun()
+                                            
+                                            # Add small separator
+                                            st.markdown("<br>", unsafe_allow_html=True)
+                                    
+                                    st.markdown("---")
+                            
+                            with model_tabs[1]:
+                                st.markdown("**Model Performance Details:**")
+                                
+                                # 选择模型查看详情
+                                model_options = [f"{m['model_name']} - {m['target_variable']} ({m['model_key']})" for m in cached_models]
+                                selected_model_option = st.selectbox("Select model for details:", model_options, key="cache_model_details_select")
+                                
+                                if selected_model_option:
+                                    # 提取model_key
+                                    selected_key = selected_model_option.split('(')[-1].split(')')[0]
+                                    
+                                    # 加载模型详情
+                                    model_details = model_cache_manager.load_model(selected_key)
+                                    
+                                    if model_details:
+                                        eval_results = model_details['evaluation_results']
+                                        training_info = model_details['training_info']
+                                        feature_info = model_details['feature_info']
                                         
-                                        # Send notification
-                                        send_email(
-                                            change_dict['user_email'],
-                                            "Data Change Approved",
-                                            f"Your data change request has been approved.\nComment: {comment}"
-                                        )
+                                        # 显示性能指标 - 5个指标
+                                        col_perf1, col_perf2, col_perf3, col_perf4, col_perf5 = st.columns(5)
                                         
-                                        st.success("Change approved and applied!")
-                                        st.rerun()
-                                    
-                                    if st.button("Reject", key=f"reject_{change_dict['id']}", use_container_width=True):
-                                        if not comment.strip():
-                                            st.error("Please provide rejection reason")
-                                        else:
-                                            with engine.connect() as conn:
-                                                conn.execute(
-                                                    text("""
-                                                        UPDATE data_changes
-                                                        SET status = 'rejected',
-                                                            reviewed_by = :reviewer,
-                                                            reviewed_at = NOW(),
-                                                            review_comment = :comment
-                                                        WHERE id = :id
-                                                    """),
-                                                    {
-                                                        "id": change_dict['id'],
-                                                        "reviewer": user_info['email'],
-                                                        "comment": comment
-                                                    }
-                                                )
-                                                conn.commit()
+                                        with col_perf1:
+                                            st.metric("Test R²", f"{eval_results.get('test_r2', 0):.4f}")
+                                        with col_perf2:
+                                            st.metric("CV Training R²", f"{eval_results.get('cv_train_r2_mean', 0):.4f}")
+                                        with col_perf3:
+                                            st.metric("CV R² Mean", f"{eval_results.get('cv_r2_mean', 0):.4f}")
+                                        with col_perf4:
+                                            st.metric("Test RMSE", f"{eval_results.get('test_rmse', 0):.2f}")
+                                        with col_perf5:
+                                            stability = eval_results.get('model_stability', 0)
+                                            st.metric("Model Stability", f"{stability:.3f}")
+                                        
+                                        # 训练信息
+                                        st.markdown("**Training Information:**")
+                                        training_info_df = pd.DataFrame([
+                                            ["Model Type", training_info.get('model_type', 'Unknown')],
+                                            ["Evaluation Strategy", training_info.get('evaluation_strategy', 'Unknown')],
+                                            ["Hyperparameter Tuning", "Yes" if training_info.get('hyperparameter_tuning', False) else "No"],
+                                            ["Auto Model Select", "Yes" if training_info.get('auto_model_select', False) else "No"],
+                                            ["Training Time", training_info.get('training_timestamp', 'Unknown')],
+                                            ["Test Set Size", f"{training_info.get('test_size', 0)*100:.0f}%"]
+                                        ], columns=["Parameter", "Value"])
+                                        
+                                        st.dataframe(training_info_df, use_container_width=True, hide_index=True)
+                                        
+                                        # 特征信息
+                                        st.markdown("**Feature Information:**")
+                                        st.write(f"- Total features: {feature_info.get('n_features', 0)}")
+                                        st.write(f"- Training samples: {feature_info.get('n_samples', 0)}")
+                                        st.write(f"- Numeric features: {len(feature_info.get('numeric_features', []))}")
+                                        st.write(f"- Categorical features: {len(feature_info.get('categorical_features', []))}")
+                                        
+                                        # 最佳参数
+                                        best_params = model_details.get('best_params', {})
+                                        if best_params:
+                                            st.markdown("**Best Parameters:**")
+                                            params_df = pd.DataFrame(list(best_params.items()), columns=["Parameter", "Value"])
+                                            st.dataframe(params_df, use_container_width=True, hide_index=True)
+                            
+                            with model_tabs[2]:
+                                st.markdown("**Cache Management Operations:**")
+                                
+                                # 显示缓存统计
+                                total_models = len(cached_models)
+                                targets = list(set([m['target_variable'] for m in cached_models]))
+                                
+                                col_stat1, col_stat2 = st.columns(2)
+                                with col_stat1:
+                                    st.metric("Total Cached Models", total_models)
+                                with col_stat2:
+                                    st.metric("Target Variables", len(targets))
+                                
+                                # 批量操作
+                                st.markdown("**Batch Operations:**")
+                                
+                                # 按目标变量清除
+                                target_to_clear = st.selectbox("Select target variable to clear all models:", [""] + targets, key="cache_target_clear_select")
+                                
+                                if st.button("Clear Selected Target", disabled=not target_to_clear, key="cache_clear_target_btn", use_container_width=True):
+                                    if target_to_clear:
+                                        try:
+                                            deleted_count = 0
+                                            for model in cached_models:
+                                                if model['target_variable'] == target_to_clear:
+                                                    deleted_count += model_cache_manager.delete_model(model['model_key'])
                                             
-                                            # Send notification
-                                            send_email(
-                                                change_dict['user_email'],
-                                                "Data Change Rejected",
-                                                f"Your data change request has been rejected.\nReason: {comment}"
-                                            )
+                                            if deleted_count > 0:
+                                                st.success(f"Deleted {deleted_count} models for target: {target_to_clear}")
+                                                st.rerun()
+                                            else:
+                                                st.warning("No models found for this target")
+                                        except Exception as e:
+                                            st.error(f"Clear error: {e}")
+                                
+                                # System Management Section
+                                st.markdown("---")
+                                st.markdown("**System Maintenance:**")
+                                
+                                sys_col1, sys_col2 = st.columns(2)
+                                
+                                with sys_col1:
+                                    st.markdown("**Legacy Model Cleanup**")
+                                    st.info("Remove old cached models that don't include preprocessor information.")
+                                    
+                                    if st.button("Check & Clean Legacy Models", use_container_width=True, key="legacy_cleanup_btn"):
+                                        try:
+                                            deleted_count, total_legacy = model_cache_manager.clear_legacy_models()
                                             
-                                            st.warning("Change rejected")
+                                            if total_legacy > 0:
+                                                st.success(f"Found {total_legacy} legacy models. Removed {deleted_count} models.")
+                                                if deleted_count < total_legacy:
+                                                    st.warning(f"Failed to remove {total_legacy - deleted_count} models.")
+                                                st.rerun()
+                                            else:
+                                                st.success("✅ No legacy models found. All cached models are up to date.")
+                                        except Exception as e:
+                                            st.error(f"Failed to check legacy models: {e}")
+                                
+                                with sys_col2:
+                                    st.markdown("**Clear All Model Cache**")
+                                    st.info("This will permanently delete all cached models from the system.")
+                                    
+                                    if st.button("Clear All Models", 
+                                               use_container_width=True,
+                                               key="clear_all_cache_btn"):
+                                        try:
+                                            st.info("🔄 Clearing all cached models...")
+                                            deleted_count = model_cache_manager.clear_all_models()
+                                            if deleted_count > 0:
+                                                st.success(f"🗑️ Cleared {deleted_count} cached models.")
+                                            else:
+                                                st.warning("No models found to delete or deletion failed.")
                                             st.rerun()
+                                        except Exception as e:
+                                            st.error(f"Failed to clear model cache: {e}")
+                                            st.error(f"Error details: {str(e)}")
+                        else:
+                            st.markdown("""
+                            <div style="background: #f8f9fa; border: 1px solid #dee2e6; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
+                                <h3 style="color: #6c757d; margin: 0;">No Trained Models</h3>
+                                <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Train your first model in the Model Training tab to see it here.</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                    
+                    except Exception as e:
+                        st.error(f"Failed to load model cache: {e}")
+
+# ——————————————————————————————
+# Tab 2: Access Control (只对admin用户可见)
+# ——————————————————————————————
+if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
+    with tabs[tab_indexes["access_control"]]:
+        
+        if "authenticated_user" not in st.session_state:
+            st.markdown("""
+            <div style="background: #fff3cd; border: 1px solid #ffeaa7; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
+                <h4 style="color: #856404; margin: 0;">Authentication Required</h4>
+                <p style="color: #856404; margin: 0.5rem 0 0 0;">Please log in to access the control panel.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        elif st.session_state["authenticated_user"]["role"] != "admin":
+            st.markdown("""
+            <div style="background: #f8d7da; border: 1px solid #f5c6cb; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
+                <h4 style="color: #721c24; margin: 0;">Access Denied</h4>
+                <p style="color: #721c24; margin: 0.5rem 0 0 0;">Administrator access required to manage user permissions.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            # Access Control Management interface
+            user_info = st.session_state["authenticated_user"]
+        
+        # Welcome header for access control - clean design
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
+            <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
+                Access Control Management
+            </h3>
+            <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
+                Manage user access requests and permissions
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        # Management panel statistics cards
+        col1, col2, col3, col4 = st.columns(4)
+        
+        # Get statistical data
+        pending_count = pd.read_sql("SELECT COUNT(*) as count FROM users WHERE status = 'pending'", engine).iloc[0]['count']
+        approved_count = pd.read_sql("SELECT COUNT(*) as count FROM users WHERE status = 'approved'", engine).iloc[0]['count']
+        rejected_count = pd.read_sql("SELECT COUNT(*) as count FROM users WHERE status = 'rejected'", engine).iloc[0]['count']
+        total_requests = pd.read_sql("SELECT COUNT(*) as count FROM users", engine).iloc[0]['count']
+        
+        with col1:
+            st.markdown(f"""
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #f39c12;">
+                <h4 style="color: #f39c12; margin: 0; font-size: 0.9rem; font-weight: 600;">PENDING REQUESTS</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{pending_count}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Awaiting review</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(f"""
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #27ae60;">
+                <h4 style="color: #27ae60; margin: 0; font-size: 0.9rem; font-weight: 600;">APPROVED USERS</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{approved_count}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Active access</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown(f"""
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #e74c3c;">
+                <h4 style="color: #e74c3c; margin: 0; font-size: 0.9rem; font-weight: 600;">REJECTED</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{rejected_count}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Denied access</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown(f"""
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
+                <h4 style="color: #3498db; margin: 0; font-size: 0.9rem; font-weight: 600;">TOTAL REQUESTS</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{total_requests}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">All time</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Main content area tabs
+        access_tabs = st.tabs(["Pending Requests", "Approved Users", "User Management"])
+        
+        with access_tabs[0]:
+            # Pending user applications - modern design
+            st.markdown("### Pending User Requests")
+            
+            pending_users = pd.read_sql(
+                "SELECT * FROM users WHERE status = 'pending' ORDER BY created_at DESC",
+                engine
+            )
+            
+            if not pending_users.empty:
+                st.markdown(f"""
+                <div style="background: #e8f4fd; padding: 0.8rem; border-radius: 8px; margin: 1rem 0; border-left: 4px solid #3498db;">
+                    <p style="margin: 0; color: #2980b9; font-weight: 500;">{len(pending_users)} request(s) awaiting your review</p>
+                </div>
+                """, unsafe_allow_html=True)
                 
-                else:
-                    st.info("No changes match the selected filters.")
+                for idx, user in pending_users.iterrows():
+                    # Modern user request card
+                    ip_status = "Allowed" if is_ip_allowed(user['ip_address']) else "Not Allowed"
+                    ip_color = "#27ae60" if is_ip_allowed(user['ip_address']) else "#e74c3c"
+                    
+                    st.markdown(f"""
+                    <div style="background: white; padding: 1.5rem; border-radius: 10px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin: 1rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">
+                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                            <h4 style="margin: 0; color: #2c3e50; font-size: 1.2rem;">{user['name']}</h4>
+                            <span style="background: {ip_color}; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">{ip_status}</span>
+                        </div>
+                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem;">
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">EMAIL</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['email']}</p>
+                            </div>
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">INSTITUTION</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['institution']}</p>
+                            </div>
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">IP ADDRESS</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['ip_address']}</p>
+                            </div>
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">APPLIED AT</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user['created_at']}</p>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Action button area
+                    col1, col2, col3 = st.columns([2, 1, 1])
+                    
+                    with col1:
+                        role = st.selectbox(
+                            "Assign Role",
+                            ["viewer", "editor"],
+                            key=f"role_{user['id']}",
+                            help="Select the role to assign to this user"
+                        )
+                    
+                    with col2:
+                        if st.button("Approve", key=f"approve_{user['id']}", type="primary", use_container_width=True):
+                            with engine.connect() as conn:
+                                conn.execute(
+                                    text("""
+                                        UPDATE users
+                                        SET status = 'approved',
+                                            role = :role,
+                                            approved_by = :approver,
+                                            approved_at = NOW()
+                                        WHERE id = :id
+                                    """),
+                                    {
+                                        "id": user['id'],
+                                        "role": role,
+                                        "approver": st.session_state["authenticated_user"]["email"]
+                                    }
+                                )
+                                conn.commit()
+                            
+                            # Send notification
+                            send_email(
+                                user['email'],
+                                "FRP Database Access Approved",
+                                f"Your access request has been approved with {role} role."
+                            )
+                            st.success("User approval successful!")
+                            st.rerun()
+                    
+                    with col3:
+                        if st.button("Reject", key=f"reject_{user['id']}", use_container_width=True):
+                            with engine.connect() as conn:
+                                conn.execute(
+                                    text("UPDATE users SET status = 'rejected' WHERE id = :id"),
+                                    {"id": user['id']}
+                                )
+                                conn.commit()
+                            
+                            send_email(
+                                user['email'],
+                                "FRP Database Access Rejected",
+                                "Your access request has been rejected."
+                            )
+                            st.warning("User request has been rejected!")
+                            st.rerun()
+                    
+                    st.markdown("---")
             else:
                 st.markdown("""
-                <div style="background: linear-gradient(135deg, #27ae60 0%, #2ecc71 100%); padding: 2rem; border-radius: 12px; text-align: center; margin: 2rem 0;">
-                    <h3 style="color: white; margin: 0; font-size: 1.3rem;">All Clear</h3>
-                    <p style="color: rgba(255,255,255,0.9); margin: 0.5rem 0 0 0; font-size: 1rem;">No pending changes require your attention at this time.</p>
+                <div style="background: #d4edda; border: 1px solid #c3e6cb; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
+                    <h3 style="color: #155724; margin: 0;">All Complete!</h3>
+                    <p style="color: #155724; margin: 0.5rem 0 0 0;">Currently no pending user requests for approval.</p>
                 </div>
                 """, unsafe_allow_html=True)
         
-        # 用户变更历史 - 简约设计
-        st.markdown("---")
-        st.markdown("#### My Change History")
-        
-        my_changes = pd.read_sql(
-            text("""
-                SELECT id, change_type, table_name, status, created_at, reviewed_at, review_comment
-                FROM data_changes
-                WHERE user_email = :email
-                ORDER BY created_at DESC
-                LIMIT 50
-            """),
-            engine,
-            params={"email": user_info['email']}
-        )
-        
-        if not my_changes.empty:
-            # 状态统计 - 添加动画效果
-            status_counts = my_changes['status'].value_counts()
-            hist_col1, hist_col2, hist_col3 = st.columns(3)
+        with access_tabs[1]:
+            # Approved users list - modern design
+            st.markdown("### Approved Users")
             
-            with hist_col1:
-                pending_hist = status_counts.get('pending', 0)
+            approved_users = pd.read_sql(
+                "SELECT name, email, institution, role, approved_at FROM users WHERE status = 'approved' ORDER BY created_at DESC",
+                engine
+            )
+            
+            if not approved_users.empty:
                 st.markdown(f"""
-                <style>
-                .status-card {{
-                    transition: all 0.3s ease;
-                    animation: slideInUp 0.6s ease-out;
-                }}
-                .status-card:hover {{
-                    transform: translateY(-5px);
-                    box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-                }}
-                @keyframes slideInUp {{
-                    from {{
-                        opacity: 0;
-                        transform: translateY(30px);
-                    }}
-                    to {{
-                        opacity: 1;
-                        transform: translateY(0);
-                    }}
-                }}
-                .status-pending {{
-                    animation-delay: 0.1s;
-                }}
-                .status-approved {{
-                    animation-delay: 0.2s;
-                }}
-                .status-rejected {{
-                    animation-delay: 0.3s;
-                }}
-                </style>
-                <div class="status-card status-pending" style="background: #fff3cd; padding: 0.7rem; border-radius: 6px; text-align: center; border-left: 3px solid #ffc107; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);">
-                    <strong style="color: #856404;">Pending: {pending_hist}</strong>
+                <div style="background: #d1ecf1; padding: 0.8rem; border-radius: 8px; margin: 1rem 0; border-left: 4px solid #17a2b8;">
+                    <p style="margin: 0; color: #0c5460; font-weight: 500;">👥 {len(approved_users)} active user(s) with database access</p>
                 </div>
                 """, unsafe_allow_html=True)
-            
-            with hist_col2:
-                approved_hist = status_counts.get('approved', 0)
-                st.markdown(f"""
-                <div class="status-card status-approved" style="background: #d4edda; padding: 0.7rem; border-radius: 6px; text-align: center; border-left: 3px solid #28a745; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);">
-                    <strong style="color: #155724;">Approved: {approved_hist}</strong>
+                
+                # Modern user table
+                st.dataframe(
+                    approved_users,
+                    use_container_width=True,
+                    column_config={
+                        "name": st.column_config.TextColumn("Name", width="medium"),
+                        "email": st.column_config.TextColumn("Email", width="large"),
+                        "institution": st.column_config.TextColumn("Institution", width="medium"),
+                        "role": st.column_config.TextColumn("Role", width="small"),
+                        "approved_at": st.column_config.DatetimeColumn("Approved", width="medium")
+                    },
+                    hide_index=True
+                )
+            else:
+                st.markdown("""
+                <div style="background: #f8f9fa; border: 1px solid #dee2e6; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
+                    <h3 style="color: #6c757d; margin: 0;">No Active Users</h3>
+                    <p style="color: #6c757d; margin: 0.5rem 0 0 0;">No approved users found in the system.</p>
                 </div>
                 """, unsafe_allow_html=True)
+        
+        with access_tabs[2]:
+            # User management operations - Modern design
+            st.markdown("### User Management")
             
-            with hist_col3:
-                rejected_hist = status_counts.get('rejected', 0)
-                st.markdown(f"""
-                <div class="status-card status-rejected" style="background: #f8d7da; padding: 0.7rem; border-radius: 6px; text-align: center; border-left: 3px solid #dc3545; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);">
-                    <strong style="color: #721c24;">Rejected: {rejected_hist}</strong>
+            approved_users = pd.read_sql(
+                "SELECT name, email, institution, role, approved_at FROM users WHERE status = 'approved' ORDER BY created_at DESC",
+                engine
+            )
+            
+            if not approved_users.empty:
+                # User selection area
+                st.markdown("#### Select User to Manage")
+                
+                user_selection_col, actions_col = st.columns([2, 1])
+                
+                with user_selection_col:
+                    selected_user = st.selectbox(
+                        "Choose a user:",
+                        approved_users['email'].tolist(),
+                        format_func=lambda x: f"{approved_users[approved_users['email'] == x]['name'].iloc[0]} ({x})",
+                        help="Select a user to manage their permissions and status"
+                    )
+                
+                with actions_col:
+                    if st.button("Refresh User List", use_container_width=True):
+                        st.rerun()
+                
+                if selected_user:
+                    # Display selected user details
+                    user_details = approved_users[approved_users['email'] == selected_user].iloc[0]
+                    
+                    st.markdown("---")
+                    st.markdown("#### User Details & Actions")
+                    
+                    # User information card
+                    st.markdown(f"""
+                    <div style="background: white; padding: 1.5rem; border-radius: 10px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin: 1rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">
+                        <h4 style="margin: 0 0 1rem 0; color: #2c3e50;">{user_details['name']}</h4>
+                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">EMAIL</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user_details['email']}</p>
+                            </div>
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">INSTITUTION</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user_details['institution']}</p>
+                            </div>
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">CURRENT ROLE</p>
+                                <span style="background: #3498db; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">{user_details['role'].upper()}</span>
+                            </div>
+                            <div>
+                                <p style="margin: 0; color: #7f8c8d; font-size: 0.8rem; font-weight: 600;">APPROVED AT</p>
+                                <p style="margin: 0; color: #2c3e50; font-weight: 500;">{user_details['approved_at']}</p>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Management operations
+                    st.markdown("#### Management Actions")
+                    
+                    # Create management operation tabs
+                    action_tabs = st.tabs(["Change Role", "Deactivate User", "Delete User"])
+                    
+                    with action_tabs[0]:
+                        st.markdown("**Change User Role**")
+                        
+                        new_role = st.selectbox(
+                            "Select new role:",
+                            ["viewer", "editor", "admin"],
+                            index=["viewer", "editor", "admin"].index(user_details['role']),
+                            help="Change user's access level"
+                        )
+                        
+                        if st.button("Update Role", type="primary", use_container_width=True):
+                            if new_role != user_details['role']:
+                                with engine.connect() as conn:
+                                    conn.execute(
+                                        text("UPDATE users SET role = :role WHERE email = :email"),
+                                        {"role": new_role, "email": selected_user}
+                                    )
+                                    conn.commit()
+                                st.success(f"Role updated to {new_role}!")
+                                st.rerun()
+                            else:
+                                st.info("User already has this role")
+                    
+                    with action_tabs[1]:
+                        st.markdown("**Deactivate User Account**")
+                        st.markdown("This will temporarily suspend the user's access to the platform.")
+                        
+                        st.warning("**Warning:** This action will immediately revoke user access.")
+                        
+                        if st.button("Deactivate User", use_container_width=True):
+                            with engine.connect() as conn:
+                                conn.execute(
+                                    text("UPDATE users SET status = 'deactivated' WHERE email = :email"),
+                                    {"email": selected_user}
+                                )
+                                conn.commit()
+                            st.warning("User deactivated successfully!")
+                            st.rerun()
+                    
+                    with action_tabs[2]:
+                        st.markdown("**Permanently Delete User**")
+                        st.markdown("This will completely remove the user from the system.")
+                        
+                        st.error("**Danger Zone:** This action cannot be undone!")
+                        
+                        confirm_delete = st.checkbox(
+                            "I understand this action cannot be undone", 
+                            key="confirm_delete",
+                            help="Check this box to confirm permanent deletion"
+                        )
+                        
+                        if st.button("Permanently Delete User", 
+                                   disabled=not confirm_delete, 
+                                   use_container_width=True):
+                            with engine.connect() as conn:
+                                conn.execute(
+                                    text("DELETE FROM users WHERE email = :email"),
+                                    {"email": selected_user}
+                                )
+                                conn.commit()
+                            st.error("User permanently deleted!")
+                            st.rerun()
+            
+            else:
+                st.markdown("""
+                <div style="background: #f8f9fa; border: 1px solid #dee2e6; padding: 2rem; border-radius: 10px; text-align: center; margin: 2rem 0;">
+                    <h3 style="color: #6c757d; margin: 0;">No Users to Manage</h3>
+                    <p style="color: #6c757d; margin: 0.5rem 0 0 0;">No approved users available for management.</p>
                 </div>
                 """, unsafe_allow_html=True)
-            
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            # 简约的历史记录表格
-            my_changes_display = my_changes.copy()
-            my_changes_display['Created'] = my_changes_display['created_at'].dt.strftime('%Y-%m-%d %H:%M')
-            my_changes_display['Type'] = my_changes_display['change_type'].str.upper()
-            my_changes_display['Table'] = my_changes_display['table_name']
-            my_changes_display['Status'] = my_changes_display['status'].str.title()
-            
-            # 只显示关键列
-            display_columns = ['Type', 'Table', 'Status', 'Created']
-            if 'review_comment' in my_changes_display.columns and my_changes_display['review_comment'].notna().any():
-                my_changes_display['Review'] = my_changes_display['review_comment'].fillna('N/A')
-                display_columns.append('Review')
-            
-            st.dataframe(
-                my_changes_display[display_columns],
-                use_container_width=True,
-                hide_index=True,
-                height=300
-            )
-        else:
-            st.markdown("""
-            <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 8px; text-align: center; border: 1px solid #dee2e6;">
-                <p style="color: #6c757d; margin: 0; font-size: 0.9rem;">No change history records found.</p>
-            </div>
-            """, unsafe_allow_html=True)
 
 # ——————————————————————————————
-# Tab 4: Model Configuration (对所有已认证用户可见)
+# Tab 3: Data Change Management (只对admin用户可见)
 # ——————————————————————————————
-with tabs[tab_indexes["model_configuration"]]:
-    
-    # Model Configuration interface
-    st.markdown(f"""
-    <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
-        <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
-            Model Configuration
-        </h3>
-        <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
-            Configure machine learning models and preprocessing parameters
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    if st.session_state.df_raw is None:
-        st.warning("Dataset not loaded. Please check database connection.")
-    else:
-        # Statistics cards
+if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
+    with tabs[tab_indexes["data_changes"]]:
+        
+        if "authenticated_user" not in st.session_state:
+            st.warning("Please log in first.")
+        else:
+            user_info = st.session_state["authenticated_user"]
+            
+        # Data Changes Management interface - 与Access Control保持一致的设计
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
+            <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
+                Data Changes Management
+            </h3>
+            <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
+                Track and manage data modification requests and approvals
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # 获取数据变更统计信息
+        pending_changes = get_pending_changes(engine)
+        
+        # 统计卡片 - 与Access Control保持一致的设计
         col1, col2, col3, col4 = st.columns(4)
         
-        # Get dataset statistics
-        raw_data_count = len(st.session_state.df_raw) if st.session_state.df_raw is not None else 0
-        has_model_dataset = "model_dataset" in st.session_state and st.session_state.model_dataset is not None
-        model_data_count = len(st.session_state.model_dataset) if has_model_dataset else 0
-        current_target = st.session_state.get("selected_target", "Not Set")
-        current_model = st.session_state.get("selected_model", "Not Set")
+        # 计算统计数据
+        total_pending = len(pending_changes) if pending_changes else 0
+        
+        # 获取历史统计
+        try:
+            history_stats = pd.read_sql(
+                text("SELECT status, COUNT(*) as count FROM data_changes GROUP BY status"),
+                engine
+            )
+            approved_count = history_stats[history_stats['status'] == 'approved']['count'].sum() if not history_stats.empty else 0
+            rejected_count = history_stats[history_stats['status'] == 'rejected']['count'].sum() if not history_stats.empty else 0
+            total_requests = history_stats['count'].sum() if not history_stats.empty else 0
+        except:
+            approved_count = rejected_count = total_requests = 0
         
         with col1:
             st.markdown(f"""
-            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
-                <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">RAW DATASET</h4>
-                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">{raw_data_count:,}</h2>
-                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Records available</p>
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #f39c12;">
+                <h4 style="color: #f39c12; margin: 0; font-size: 0.9rem; font-weight: 600;">PENDING REQUESTS</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{total_pending}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Awaiting review</p>
             </div>
             """, unsafe_allow_html=True)
         
         with col2:
-            color = "#27ae60" if has_model_dataset else "#95a5a6"
-            status = f"{model_data_count:,}" if has_model_dataset else "Not Ready"
-            
             st.markdown(f"""
-            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {color}; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
-                <h4 style="color: {color}; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">ML DATASET</h4>
-                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">{status}</h2>
-                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Preprocessed features</p>
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #27ae60;">
+                <h4 style="color: #27ae60; margin: 0; font-size: 0.9rem; font-weight: 600;">APPROVED</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{approved_count}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Total approved</p>
             </div>
             """, unsafe_allow_html=True)
         
         with col3:
-            target_color = "#e74c3c" if current_target == "Not Set" else "#f39c12"
-            target_display = current_target if current_target != "Not Set" else "None"
-            
-            st.markdown(f"""
-            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {target_color}; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
-                <h4 style="color: {target_color}; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">TARGET VARIABLE</h4>
-                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;" title="{target_display}">{target_display if len(target_display) <= 12 else target_display[:12] + '...'}</h2>
-                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Prediction target</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            model_color = "#e74c3c" if current_model == "Not Set" else "#8B5FBF"
-            model_display = current_model if current_model != "Not Set" else "None"
-            
             st.markdown(f"""
-            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {model_color}; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
-                <h4 style="color: {model_color}; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">ML MODEL</h4>
-                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">{model_display}</h2>
-                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Algorithm selected</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Main configuration layout - 根据用户角色调整布局
-        if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
-            # Admin用户：使用双列布局
-            col_left, col_right = st.columns(2)
-            
-            # Left column: Data Preprocessing
-            with col_left:
-                st.markdown("#### Data Preprocessing")
-                
-                # Set default advanced preprocessing
-                st.session_state.use_advanced_preprocessing = True
-                
-                # Dataset selection options - simplified for users
-                if has_model_dataset:
-                    st.markdown("""
-                    <div style="background: #d4edda; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #28a745; margin: 1rem 0;">
-                        <strong style="color: #155724;">Preprocessed dataset ready for use</strong>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Show dataset info
-                    dataset_info_col1, dataset_info_col2 = st.columns(2)
-                    with dataset_info_col1:
-                        st.metric("Records", f"{len(st.session_state.model_dataset):,}")
-                    with dataset_info_col2:
-                        st.metric("Features", f"{len(st.session_state.model_dataset.columns)}")
-                    
-                else:
-                    # Check database cache first
-                    try:
-                        preprocessor = FRPDataPreprocessor(engine)
-                        cached_datasets = preprocessor.list_cached_datasets()
-                        
-                        if cached_datasets:
-                            st.markdown("""
-                            <div style="background: #d1ecf1; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin: 1rem 0;">
-                                <strong style="color: #0c5460;">Cached datasets available in database</strong>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Show available caches
-                            with st.expander("Available Cached Datasets", expanded=True):
-                                for idx, cache_info in enumerate(cached_datasets[:5]):  # Show last 5
-                                    col_info, col_load = st.columns([4, 1])
-                                    
-                                    with col_info:
-                                        st.markdown(f"""
-                                        **{cache_info['cache_key']}**  
-                                        Shape: {cache_info['shape']} | Updated: {cache_info['updated_at'].strftime('%Y-%m-%d %H:%M')}
-                                        """)
-                                    
-                                    with col_load:
-                                        if st.button("Load", key=f"load_cache_{idx}", use_container_width=True):
-                                            try:
-                                                cached_data = preprocessor.get_cached_data(cache_info['cache_key'])
-                                                if cached_data:
-                                                    st.session_state["model_dataset"] = cached_data['data']
-                                                    st.success(f"Loaded cached dataset! Shape: {cached_data['shape']}")
-                                                    st.rerun()
-                                                else:
-                                                    st.error("Failed to load cached data")
-                                            except Exception as e:
-                                                st.error(f"Load error: {e}")
-                    
-                    except Exception as e:
-                        st.error(f"Cache check failed: {e}")
-                
-                # Get Offline Code button - 移到外面，使其在数据加载后仍然可见
-                if st.button("Get Offline Code", type="secondary", use_container_width=True, key="get_offline_code_admin1"):
-                    st.session_state["show_offline_code"] = True
-                
-                # Show offline code if requested - 添加到admin部分
-                if st.session_state.get("show_offline_code", False):
-                    st.markdown("---")
-                    st.markdown("### Offline Preprocessing Code")
-                    st.markdown("**Copy this code to run data preprocessing independently:**")
-                    
-                    offline_code = '''
-import pandas as pd
-import numpy as np
-from sqlalchemy import create_engine
-import re
-import warnings
-warnings.filterwarnings('ignore')
-
-class FRPDataPreprocessor:
-    """FRP数据预处理器 - 完整的离线版本"""
-    
-    def __init__(self):
-        self.feature_columns = [
-            'pH', 'Fiber_content_wt', 'Diameter_mm', 'Surface_treatment',
-            'Resin_type', 'Temp_C', 'Duration_hours', 'Solution_type',
-            'Concentration_mol_L', 'Total_fibers', 'Aramid_fibers',
-            'Glass_fibers', 'Carbon_fibers'
-        ]
-    
-    def change_smd_to_nan(self, df):
-        """将SMD替换为NaN"""
-        df_processed = df.copy()
-        
-        # 处理数值列中的SMD
-        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
-                          'Duration_hours', 'Concentration_mol_L']
-        
-        for col in numeric_columns:
-            if col in df_processed.columns:
-                df_processed[col] = df_processed[col].replace('SMD', np.nan)
-                df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce')
-        
-        return df_processed
-    
-    def parse_range_to_mean(self, df):
-        """将范围值转换为均值"""
-        df_processed = df.copy()
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #e74c3c;">
+                <h4 style="color: #e74c3c; margin: 0; font-size: 0.9rem; font-weight: 600;">REJECTED</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{rejected_count}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">Total rejected</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        # 定义需要处理的数值列
-        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
-                          'Duration_hours', 'Concentration_mol_L']
+        with col4:
+            st.markdown(f"""
+            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db;">
+                <h4 style="color: #3498db; margin: 0; font-size: 0.9rem; font-weight: 600;">TOTAL REQUESTS</h4>
+                <h2 style="color: #2c3e50; margin: 0.5rem 0; font-size: 2rem; font-weight: 700;">{total_requests}</h2>
+                <p style="margin: 0; font-size: 0.8rem; color: #7f8c8d;">All time</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        range_pattern = r'(\d+(?:\.\d+)?)\s*[-−–]\s*(\d+(?:\.\d+)?)'
+        st.markdown("<br>", unsafe_allow_html=True)
         
-        for col in numeric_columns:
-            if col in df_processed.columns:
-                def process_value(val):
-                    if pd.isna(val) or val == '':
-                        return np.nan
-                    
-                    val_str = str(val).strip()
-                    
-                    # 匹配范围值
-                    range_match = re.search(range_pattern, val_str)
-                    if range_match:
-                        try:
-                            start = float(range_match.group(1))
-                            end = float(range_match.group(2))
-                            return (start + end) / 2
-                        except ValueError:
-                            return np.nan
-                    
-                    # 尝试直接转换为数值
-                    try:
-                        return float(val_str)
-                    except (ValueError, TypeError):
-                        return np.nan
+        # Admin approval interface
+        if user_info["role"] == "admin":
+            
+            if pending_changes:
+                # 简约的过滤器设计
+                st.markdown("#### Review Pending Changes")
                 
-                df_processed[col] = df_processed[col].apply(process_value)
-        
-        return df_processed
-    
-    def process_fiber_types(self, df):
-        """处理纤维类型数据"""
-        df_processed = df.copy()
-        
-        # 初始化纤维类型列
-        df_processed['Total_fibers'] = 0
-        df_processed['Aramid_fibers'] = 0
-        df_processed['Glass_fibers'] = 0
-        df_processed['Carbon_fibers'] = 0
-        
-        if 'Fiber_type' in df_processed.columns:
-            for idx, fiber_type in df_processed['Fiber_type'].items():
-                if pd.isna(fiber_type):
-                    continue
+                # 单行过滤器
+                filter_col1, filter_col2, filter_col3 = st.columns([1, 1, 1])
                 
-                fiber_str = str(fiber_type).lower()
+                with filter_col1:
+                    filter_type = st.selectbox(
+                        "Type",
+                        ["All"] + list(set([dict(change._mapping if hasattr(change, '_mapping') else change._asdict())['change_type'] for change in pending_changes])),
+                        key="change_type_filter"
+                    )
                 
-                # 计算总纤维数
-                total_count = len(re.findall(r'aramid|glass|carbon', fiber_str))
-                df_processed.loc[idx, 'Total_fibers'] = total_count
+                with filter_col2:
+                    filter_table = st.selectbox(
+                        "Table",
+                        ["All"] + list(set([dict(change._mapping if hasattr(change, '_mapping') else change._asdict())['table_name'] for change in pending_changes])),
+                        key="table_filter"
+                    )
                 
-                # 统计各类型纤维
-                df_processed.loc[idx, 'Aramid_fibers'] = len(re.findall(r'aramid', fiber_str))
-                df_processed.loc[idx, 'Glass_fibers'] = len(re.findall(r'glass', fiber_str))
-                df_processed.loc[idx, 'Carbon_fibers'] = len(re.findall(r'carbon', fiber_str))
-        
-        return df_processed
-    
-    def encode_categorical_features(self, df):
-        """编码分类特征"""
-        df_processed = df.copy()
+                with filter_col3:
+                    filter_user = st.selectbox(
+                        "User",
+                        ["All"] + list(set([dict(change._mapping if hasattr(change, '_mapping') else change._asdict())['user_email'] for change in pending_changes])),
+                        key="user_filter"
+                    )                
+                # Apply filters
+                filtered_changes = []
+                for change in pending_changes:
+                    change_dict = dict(change._mapping) if hasattr(change, '_mapping') else change._asdict()
+                    
+                    if (filter_type == "All" or change_dict['change_type'] == filter_type) and \
+                       (filter_table == "All" or change_dict['table_name'] == filter_table) and \
+                       (filter_user == "All" or change_dict['user_email'] == filter_user):
+                        filtered_changes.append(change)
+                
+                if filtered_changes:
+                    st.markdown(f"**{len(filtered_changes)} of {len(pending_changes)} changes**")
+                    
+                    # 简约的变更请求卡片展示
+                    for idx, change in enumerate(filtered_changes):
+                        change_dict = dict(change._mapping) if hasattr(change, '_mapping') else change._asdict()
+                        
+                        # 卡片式布局
+                        with st.container():
+                            st.markdown(f"""
+                            <div style="background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin: 1rem 0; border-left: 4px solid #3498db;">
+                                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
+                                    <h4 style="color: #2c3e50; margin: 0; font-size: 1.1rem;">{change_dict['change_type'].upper()} - {change_dict['table_name']}</h4>
+                                    <span style="color: #7f8c8d; font-size: 0.85rem;">{change_dict['created_at'].strftime("%Y-%m-%d %H:%M") if hasattr(change_dict['created_at'], 'strftime') else str(change_dict['created_at'])}</span>
+                                </div>
+                                <p style="color: #7f8c8d; margin: 0; font-size: 0.9rem;">By: {change_dict['user_email']}</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                            
+                            # 展开详细信息的选项
+                            if st.checkbox(f"Show Details", key=f"show_detail_{change_dict['id']}"):
+                                
+                                # 基本信息区域
+                                info_col1, info_col2, info_col3 = st.columns(3)
+                                with info_col1:
+                                    st.markdown(f"""
+                                    <div style="background: #f8f9fa; padding: 0.5rem; border-radius: 6px; text-align: center;">
+                                        <strong style="color: #495057;">Type</strong><br>
+                                        <span style="color: #3498db;">{change_dict['change_type'].upper()}</span>
+                                    </div>
+                                    """, unsafe_allow_html=True)
+                                with info_col2:
+                                    st.markdown(f"""
+                                    <div style="background: #f8f9fa; padding: 0.5rem; border-radius: 6px; text-align: center;">
+                                        <strong style="color: #495057;">Table</strong><br>
+                                        <span style="color: #6c757d;">{change_dict['table_name']}</span>
+                                    </div>
+                                    """, unsafe_allow_html=True)
+                                with info_col3:
+                                    st.markdown(f"""
+                                    <div style="background: #f8f9fa; padding: 0.5rem; border-radius: 6px; text-align: center;">
+                                        <strong style="color: #495057;">Created</strong><br>
+                                        <span style="color: #6c757d;">{change_dict['created_at'].strftime("%m-%d %H:%M") if hasattr(change_dict['created_at'], 'strftime') else str(change_dict['created_at'])}</span>
+                                    </div>
+                                    """, unsafe_allow_html=True)
+                                
+                                st.markdown("<br>", unsafe_allow_html=True)
+                                
+                                # 数据对比区域
+                                if change_dict['old_data']:
+                                    st.markdown("**Before (Old Data):**")
+                                    display_structured_data(change_dict['old_data'])
+                                    st.markdown("**After (Proposed Change):**")
+                                else:
+                                    st.markdown("**Proposed New Data:**")
+                                display_structured_data(change_dict['new_data'])
+                                
+                                st.markdown("---")
+                                
+                                # 审批操作区域 - 简约设计
+                                review_col1, review_col2 = st.columns([2, 1])
+                                
+                                with review_col1:
+                                    comment = st.text_area(
+                                        "Review Comment",
+                                        placeholder="Optional: Add your review comments...",
+                                        key=f"comment_{change_dict['id']}",
+                                        height=80
+                                    )
+                                
+                                with review_col2:
+                                    st.markdown("**Actions:**")
+                                    
+                                    # 操作按钮 - 垂直布局，移除表情符号
+                                    if st.button("Approve", key=f"approve_{change_dict['id']}", type="primary", use_container_width=True):
+                                        # Execute change
+                                        with engine.connect() as conn:
+                                            # Update change status
+                                            conn.execute(
+                                                text("""
+                                                    UPDATE data_changes
+                                                    SET status = 'approved',
+                                                        reviewed_by = :reviewer,
+                                                        reviewed_at = NOW(),
+                                                        review_comment = :comment
+                                                    WHERE id = :id
+                                                """),
+                                                {
+                                                    "id": change_dict['id'],
+                                                    "reviewer": user_info['email'],
+                                                    "comment": comment
+                                                }
+                                            )
+                                            
+                                            # Apply changes
+                                            new_data = json.loads(change_dict['new_data'])
+                                            
+                                            if change_dict['change_type'] == 'insert':
+                                                columns = ", ".join(new_data.keys())
+                                                placeholders = ", ".join([f":{k}" for k in new_data.keys()])
+                                                conn.execute(
+                                                    text(f"INSERT INTO {change_dict['table_name']} ({columns}) VALUES ({placeholders})"),
+                                                    new_data
+                                                )
+                                            
+                                            conn.commit()
+                                        
+                                        # Send notification
+                                        send_email(
+                                            change_dict['user_email'],
+                                            "Data Change Approved",
+                                            f"Your data change request has been approved.\nComment: {comment}"
+                                        )
+                                        
+                                        st.success("Change approved and applied!")
+                                        st.rerun()
+                                    
+                                    if st.button("Reject", key=f"reject_{change_dict['id']}", use_container_width=True):
+                                        if not comment.strip():
+                                            st.error("Please provide rejection reason")
+                                        else:
+                                            with engine.connect() as conn:
+                                                conn.execute(
+                                                    text("""
+                                                        UPDATE data_changes
+                                                        SET status = 'rejected',
+                                                            reviewed_by = :reviewer,
+                                                            reviewed_at = NOW(),
+                                                            review_comment = :comment
+                                                        WHERE id = :id
+                                                    """),
+                                                    {
+                                                        "id": change_dict['id'],
+                                                        "reviewer": user_info['email'],
+                                                        "comment": comment
+                                                    }
+                                                )
+                                                conn.commit()
+                                            
+                                            # Send notification
+                                            send_email(
+                                                change_dict['user_email'],
+                                                "Data Change Rejected",
+                                                f"Your data change request has been rejected.\nReason: {comment}"
+                                            )
+                                            
+                                            st.warning("Change rejected")
+                                            st.rerun()
+                
+                else:
+                    st.info("No changes match the selected filters.")
+            else:
+                st.markdown("""
+                <div style="background: linear-gradient(135deg, #27ae60 0%, #2ecc71 100%); padding: 2rem; border-radius: 12px; text-align: center; margin: 2rem 0;">
+                    <h3 style="color: white; margin: 0; font-size: 1.3rem;">All Clear</h3>
+                    <p style="color: rgba(255,255,255,0.9); margin: 0.5rem 0 0 0; font-size: 1rem;">No pending changes require your attention at this time.</p>
+                </div>
+                """, unsafe_allow_html=True)
         
-        # 定义分类特征映射
-        categorical_mappings = {
-            'Surface_treatment': {
-                'Untreated': 0, 'Silane': 1, 'Plasma': 2, 'Acid etching': 3,
-                'Alkali treatment': 4, 'Coating': 5, 'Other': 6
-            },
-            'Resin_type': {
-                'Epoxy': 0, 'Polyester': 1, 'Vinyl ester': 2, 'Polyurethane': 3,
-                'Phenolic': 4, 'Other': 5
-            },
-            'Solution_type': {
-                'NaCl': 0, 'HCl': 1, 'NaOH': 2, 'H2SO4': 3, 'Seawater': 4,
-                'Ca(OH)2': 5, 'MgSO4': 6, 'Other': 7
-            }
-        }
+        # 用户变更历史 - 简约设计
+        st.markdown("---")
+        st.markdown("#### My Change History")
         
-        for feature, mapping in categorical_mappings.items():
-            if feature in df_processed.columns:
-                # 处理未知类别
-                df_processed[feature] = df_processed[feature].fillna('Other')
-                df_processed[feature] = df_processed[feature].map(mapping).fillna(mapping.get('Other', 0))
+        my_changes = pd.read_sql(
+            text("""
+                SELECT id, change_type, table_name, status, created_at, reviewed_at, review_comment
+                FROM data_changes
+                WHERE user_email = :email
+                ORDER BY created_at DESC
+                LIMIT 50
+            """),
+            engine,
+            params={"email": user_info['email']}
+        )
         
-        return df_processed
+        if not my_changes.empty:
+            # 状态统计 - 添加动画效果
+            status_counts = my_changes['status'].value_counts()
+            hist_col1, hist_col2, hist_col3 = st.columns(3)
+            
+            with hist_col1:
+                pending_hist = status_counts.get('pending', 0)
+                st.markdown(f"""
+                <style>
+                .status-card {{
+                    transition: all 0.3s ease;
+                    animation: slideInUp 0.6s ease-out;
+                }}
+                .status-card:hover {{
+                    transform: translateY(-5px);
+                    box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
+                }}
+                @keyframes slideInUp {{
+                    from {{
+                        opacity: 0;
+                        transform: translateY(30px);
+                    }}
+                    to {{
+                        opacity: 1;
+                        transform: translateY(0);
+                    }}
+                }}
+                .status-pending {{
+                    animation-delay: 0.1s;
+                }}
+                .status-approved {{
+                    animation-delay: 0.2s;
+                }}
+                .status-rejected {{
+                    animation-delay: 0.3s;
+                }}
+                </style>
+                <div class="status-card status-pending" style="background: #fff3cd; padding: 0.7rem; border-radius: 6px; text-align: center; border-left: 3px solid #ffc107; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);">
+                    <strong style="color: #856404;">Pending: {pending_hist}</strong>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with hist_col2:
+                approved_hist = status_counts.get('approved', 0)
+                st.markdown(f"""
+                <div class="status-card status-approved" style="background: #d4edda; padding: 0.7rem; border-radius: 6px; text-align: center; border-left: 3px solid #28a745; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);">
+                    <strong style="color: #155724;">Approved: {approved_hist}</strong>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with hist_col3:
+                rejected_hist = status_counts.get('rejected', 0)
+                st.markdown(f"""
+                <div class="status-card status-rejected" style="background: #f8d7da; padding: 0.7rem; border-radius: 6px; text-align: center; border-left: 3px solid #dc3545; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);">
+                    <strong style="color: #721c24;">Rejected: {rejected_hist}</strong>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # 简约的历史记录表格
+            my_changes_display = my_changes.copy()
+            my_changes_display['Created'] = my_changes_display['created_at'].dt.strftime('%Y-%m-%d %H:%M')
+            my_changes_display['Type'] = my_changes_display['change_type'].str.upper()
+            my_changes_display['Table'] = my_changes_display['table_name']
+            my_changes_display['Status'] = my_changes_display['status'].str.title()
+            
+            # 只显示关键列
+            display_columns = ['Type', 'Table', 'Status', 'Created']
+            if 'review_comment' in my_changes_display.columns and my_changes_display['review_comment'].notna().any():
+                my_changes_display['Review'] = my_changes_display['review_comment'].fillna('N/A')
+                display_columns.append('Review')
+            
+            st.dataframe(
+                my_changes_display[display_columns],
+                use_container_width=True,
+                hide_index=True,
+                height=300
+            )
+        else:
+            st.markdown("""
+            <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 8px; text-align: center; border: 1px solid #dee2e6;">
+                <p style="color: #6c757d; margin: 0; font-size: 0.9rem;">No change history records found.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+# ——————————————————————————————
+# Tab 4: Model Configuration (对所有已认证用户可见)
+# ——————————————————————————————
+with tabs[tab_indexes["model_configuration"]]:
     
-    def handle_missing_values(self, df):
-        """Handle missing values"""
-        df_processed = df.copy()
-        
-        # 数值特征使用中位数填充
-        numeric_features = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
-                           'Duration_hours', 'Concentration_mol_L']
-        
-        for feature in numeric_features:
-            if feature in df_processed.columns:
-                median_val = df_processed[feature].median()
-                df_processed[feature] = df_processed[feature].fillna(median_val)
-        
-        # 分类特征已在编码时处理
-        return df_processed
+    # Model Configuration interface
+    st.markdown(f"""
+    <div style="background: white; padding: 1.5rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); margin-bottom: 2rem; border-left: 4px solid #3498db;">
+        <h3 style="color: #2c3e50; margin: 0 0 0.5rem 0; font-size: 1.5rem; font-weight: 600;">
+            Model Configuration
+        </h3>
+        <p style="color: #7f8c8d; margin: 0; font-size: 1rem;">
+            Configure machine learning models and preprocessing parameters
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
     
-    def preprocess(self, df):
-        """完整的数据预处理流程"""
-        print("开始数据预处理...")
-        
-        # 1. 将SMD替换为NaN
-        df = self.change_smd_to_nan(df)
-        print("✓ SMD值已替换为NaN")
-        
-        # 2. 解析范围值为均值
-        df = self.parse_range_to_mean(df)
-        print("✓ 范围值已转换为均值")
+    if st.session_state.df_raw is None:
+        st.warning("Dataset not loaded. Please check database connection.")
+    else:
+        # Statistics cards
+        col1, col2, col3, col4 = st.columns(4)
         
-        # 3. 处理纤维类型
-        df = self.process_fiber_types(df)
-        print("✓ 纤维类型特征已处理")
+        # Get dataset statistics
+        raw_data_count = len(st.session_state.df_raw) if st.session_state.df_raw is not None else 0
+        has_model_dataset = "model_dataset" in st.session_state and st.session_state.model_dataset is not None
+        model_data_count = len(st.session_state.model_dataset) if has_model_dataset else 0
+        current_target = st.session_state.get("selected_target", "Not Set")
+        current_model = st.session_state.get("selected_model", "Not Set")
         
-        # 4. 编码分类特征
-        df = self.encode_categorical_features(df)
-        print("✓ 分类特征已编码")
+        with col1:
+            st.markdown(f"""
+            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid #3498db; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
+                <h4 style="color: #3498db; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">RAW DATASET</h4>
+                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">{raw_data_count:,}</h2>
+                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Records available</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        # 5. Handle missing values
-        df = self.handle_missing_values(df)
-        print("✓ Missing values handled")
+        with col2:
+            color = "#27ae60" if has_model_dataset else "#95a5a6"
+            status = f"{model_data_count:,}" if has_model_dataset else "Not Ready"
+            
+            st.markdown(f"""
+            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {color}; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
+                <h4 style="color: {color}; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">ML DATASET</h4>
+                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">{status}</h2>
+                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Preprocessed features</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        # 6. 选择最终特征
-        final_features = [col for col in self.feature_columns if col in df.columns]
-        df_final = df[final_features].copy()
+        with col3:
+            target_color = "#e74c3c" if current_target == "Not Set" else "#f39c12"
+            target_display = current_target if current_target != "Not Set" else "None"
+            
+            st.markdown(f"""
+            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {target_color}; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
+                <h4 style="color: {target_color}; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">TARGET VARIABLE</h4>
+                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;" title="{target_display}">{target_display if len(target_display) <= 12 else target_display[:12] + '...'}</h2>
+                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Prediction target</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        print(f"✓ 预处理完成！最终数据形状: {df_final.shape}")
-        print(f"特征列: {list(df_final.columns)}")
+        with col4:
+            model_color = "#e74c3c" if current_model == "Not Set" else "#8B5FBF"
+            model_display = current_model if current_model != "Not Set" else "None"
+            
+            st.markdown(f"""
+            <div style="background: white; padding: 0.8rem; border-radius: 8px; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); text-align: center; border-left: 4px solid {model_color}; height: 120px; display: flex; flex-direction: column; justify-content: center; overflow: hidden;">
+                <h4 style="color: {model_color}; margin: 0; font-size: 0.75rem; font-weight: 600; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">ML MODEL</h4>
+                <h2 style="color: #2c3e50; margin: 0.2rem 0; font-size: 1.4rem; font-weight: 700; line-height: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">{model_display}</h2>
+                <p style="margin: 0; font-size: 0.65rem; color: #7f8c8d; line-height: 1.1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">Algorithm selected</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        return df_final
-
-# 使用示例:
-# 1. 加载数据
-# df = pd.read_csv('your_data.csv')
-
-# 2. 创建预处理器并处理数据
-# preprocessor = FRPDataPreprocessor()
-# processed_df = preprocessor.preprocess(df)
-
-# 3. 保存处理后的数据
-# processed_df.to_csv('processed_data.csv', index=False)
-'''
+        # Main configuration layout - 根据用户角色调整布局
+        if "authenticated_user" in st.session_state and st.session_state["authenticated_user"]["role"] == "admin":
+            # Admin用户：使用双列布局
+            col_left, col_right = st.columns(2)
+            
+            # Left column: Data Preprocessing
+            with col_left:
+                st.markdown("#### Data Preprocessing")
+                
+                # Set default advanced preprocessing
+                st.session_state.use_advanced_preprocessing = True
+                
+                # Dataset selection options - simplified for users
+                if has_model_dataset:
+                    st.markdown("""
+                    <div style="background: #d4edda; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #28a745; margin: 1rem 0;">
+                        <strong style="color: #155724;">Preprocessed dataset ready for use</strong>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Show dataset info
+                    dataset_info_col1, dataset_info_col2 = st.columns(2)
+                    with dataset_info_col1:
+                        st.metric("Records", f"{len(st.session_state.model_dataset):,}")
+                    with dataset_info_col2:
+                        st.metric("Features", f"{len(st.session_state.model_dataset.columns)}")
+                    
+                else:
+                    # Check database cache first
+                    try:
+                        preprocessor = FRPDataPreprocessor(engine)
+                        cached_datasets = preprocessor.list_cached_datasets()
+                        
+                        if cached_datasets:
+                            st.markdown("""
+                            <div style="background: #d1ecf1; padding: 0.75rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin: 1rem 0;">
+                                <strong style="color: #0c5460;">Cached datasets available in database</strong>
+                            </div>
+                            """, unsafe_allow_html=True)
+                            
+                            # Show available caches
+                            with st.expander("Available Cached Datasets", expanded=True):
+                                for idx, cache_info in enumerate(cached_datasets[:5]):  # Show last 5
+                                    col_info, col_load = st.columns([4, 1])
+                                    
+                                    with col_info:
+                                        st.markdown(f"""
+                                        **{cache_info['cache_key']}**  
+                                        Shape: {cache_info['shape']} | Updated: {cache_info['updated_at'].strftime('%Y-%m-%d %H:%M')}
+                                        """)
+                                    
+                                    with col_load:
+                                        if st.button("Load", key=f"load_cache_{idx}", use_container_width=True):
+                                            try:
+                                                cached_data = preprocessor.get_cached_data(cache_info['cache_key'])
+                                                if cached_data:
+                                                    st.session_state["model_dataset"] = cached_data['data']
+                                                    st.success(f"Loaded cached dataset! Shape: {cached_data['shape']}")
+                                                    st.rerun()
+                                                else:
+                                                    st.error("Failed to load cached data")
+                                            except Exception as e:
+                                                st.error(f"Load error: {e}")
+                    
+                    except Exception as e:
+                        st.error(f"Cache check failed: {e}")
+                
+                # Get Offline Code button - 移到外面，使其在数据加载后仍然可见
+                if st.button("Get Offline Code", type="secondary", use_container_width=True, key="get_offline_code_admin1"):
+                    st.session_state["show_offline_code"] = True
+                
+                # Show offline code if requested - 添加到admin部分
+                if st.session_state.get("show_offline_code", False):
+                    st.markdown("---")
+                    st.markdown("### Offline Preprocessing Code")
+                    st.markdown("**Copy this code to run data preprocessing independently:**")
                     
-                    st.code(offline_code, language='python')
+                    st.code(OFFLINE_PREPROCESS_PIPELINE_CODE, language='python')
                     
                     # 按钮平行排版
                     col_download, col_close = st.columns(2)
@@ -7648,7 +8006,7 @@ class FRPDataPreprocessor:
                     with col_download:
                         st.download_button(
                             "Download Offline Code",
-                            offline_code,
+                            OFFLINE_PREPROCESS_PIPELINE_CODE,
                             file_name="frp_preprocessing_offline.py",
                             mime="text/plain",
                             help="Download the complete offline preprocessing code",
@@ -7747,195 +8105,7 @@ class FRPDataPreprocessor:
                 st.markdown("### Offline Preprocessing Code")
                 st.markdown("**Copy this code to run data preprocessing independently:**")
                 
-                offline_code = '''
-import pandas as pd
-import numpy as np
-from sqlalchemy import create_engine
-import re
-import warnings
-warnings.filterwarnings('ignore')
-
-class FRPDataPreprocessor:
-    """FRP数据预处理器 - 完整的离线版本"""
-    
-    def __init__(self):
-        self.feature_columns = [
-            'pH', 'Fiber_content_wt', 'Diameter_mm', 'Surface_treatment',
-            'Resin_type', 'Temp_C', 'Duration_hours', 'Solution_type',
-            'Concentration_mol_L', 'Total_fibers', 'Aramid_fibers',
-            'Glass_fibers', 'Carbon_fibers'
-        ]
-    
-    def change_smd_to_nan(self, df):
-        """将SMD替换为NaN"""
-        df_processed = df.copy()
-        
-        # 处理数值列中的SMD
-        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
-                          'Duration_hours', 'Concentration_mol_L']
-        
-        for col in numeric_columns:
-            if col in df_processed.columns:
-                df_processed[col] = df_processed[col].replace('SMD', np.nan)
-                df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce')
-        
-        return df_processed
-    
-    def parse_range_to_mean(self, df):
-        """将范围值转换为均值"""
-        df_processed = df.copy()
-        
-        numeric_columns = ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 
-                          'Duration_hours', 'Concentration_mol_L']
-        
-        for col in numeric_columns:
-            if col in df_processed.columns:
-                for idx, value in df_processed[col].items():
-                    if pd.isna(value):
-                        continue
-                    
-                    str_value = str(value)
-                    
-                    # 处理范围：X-Y, X~Y, X to Y
-                    range_patterns = [r'(\d+\.?\d*)\s*[-~]\s*(\d+\.?\d*)', 
-                                    r'(\d+\.?\d*)\s*to\s*(\d+\.?\d*)']
-                    
-                    for pattern in range_patterns:
-                        match = re.search(pattern, str_value, re.IGNORECASE)
-                        if match:
-                            start_val = float(match.group(1))
-                            end_val = float(match.group(2))
-                            df_processed.at[idx, col] = (start_val + end_val) / 2
-                            break
-                    else:
-                        # 尝试直接转换为数值
-                        try:
-                            df_processed.at[idx, col] = float(str_value)
-                        except:
-                            df_processed.at[idx, col] = np.nan
-        
-        return df_processed
-    
-    def create_selected_features(self, df):
-        """创建选定的特征"""
-        df_processed = df.copy()
-        
-        # 表面处理编码
-        if 'Surface_treatment' in df_processed.columns:
-            surface_mapping = {
-                'None': 0, 'Silane coupling agent': 1, 'Epoxy sizing': 2,
-                'Plasma treatment': 3, 'Acid etching': 4, 'Alkaline treatment': 5
-            }
-            df_processed['Surface_treatment'] = df_processed['Surface_treatment'].map(surface_mapping).fillna(0)
-        
-        # 树脂类型编码
-        if 'Resin_type' in df_processed.columns:
-            resin_mapping = {
-                'Epoxy': 1, 'Vinyl ester': 2, 'Polyester': 3, 'Phenolic': 4
-            }
-            df_processed['Resin_type'] = df_processed['Resin_type'].map(resin_mapping).fillna(1)
-        
-        # 溶液类型编码
-        if 'Solution_type' in df_processed.columns:
-            solution_mapping = {
-                'NaOH': 1, 'HCl': 2, 'H2SO4': 3, 'NaCl': 4, 'Seawater': 5
-            }
-            df_processed['Solution_type'] = df_processed['Solution_type'].map(solution_mapping).fillna(1)
-        
-        # 纤维特征工程
-        df_processed['Total_fibers'] = 0
-        df_processed['Aramid_fibers'] = 0
-        df_processed['Glass_fibers'] = 0
-        df_processed['Carbon_fibers'] = 0
-        
-        if 'Fiber_type' in df_processed.columns:
-            fiber_type_col = df_processed['Fiber_type'].fillna('Glass').str.lower()
-            
-            df_processed['Aramid_fibers'] = (fiber_type_col.str.contains('aramid|kevlar', na=False)).astype(int)
-            df_processed['Glass_fibers'] = (fiber_type_col.str.contains('glass|e-glass', na=False)).astype(int)
-            df_processed['Carbon_fibers'] = (fiber_type_col.str.contains('carbon', na=False)).astype(int)
-            
-            # 如果都不匹配，默认为玻璃纤维
-            no_match = (df_processed['Aramid_fibers'] == 0) & (df_processed['Glass_fibers'] == 0) & (df_processed['Carbon_fibers'] == 0)
-            df_processed.loc[no_match, 'Glass_fibers'] = 1
-            
-            df_processed['Total_fibers'] = df_processed['Aramid_fibers'] + df_processed['Glass_fibers'] + df_processed['Carbon_fibers']
-        
-        # 确保所有特征列存在
-        for col in self.feature_columns:
-            if col not in df_processed.columns:
-                df_processed[col] = 0
-        
-        # 数据填充和清理
-        for col in self.feature_columns:
-            if col in ['pH', 'Fiber_content_wt', 'Diameter_mm', 'Temp_C', 'Duration_hours', 'Concentration_mol_L']:
-                df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce').fillna(0)
-            else:
-                df_processed[col] = df_processed[col].fillna(0)
-        
-        return df_processed[self.feature_columns]
-    
-    def create_model_dataset(self, df, target_column):
-        """创建模型数据集"""
-        # 预处理步骤
-        df_step1 = self.change_smd_to_nan(df)
-        df_step2 = self.parse_range_to_mean(df_step1)
-        df_features = self.create_selected_features(df_step2)
-        
-        # 添加目标变量
-        if target_column in df.columns:
-            df_features[target_column] = pd.to_numeric(df[target_column], errors='coerce')
-        
-        # 移除包含NaN的行
-        df_final = df_features.dropna()
-        
-        return df_final
-
-# 使用示例
-def process_data(csv_file_path, target_column):
-    """
-    处理数据的主函数
-    
-    参数:
-    csv_file_path: CSV文件路径
-    target_column: 目标变量列名
-    
-    返回:
-    处理后的DataFrame
-    """
-    # 读取数据
-    df = pd.read_csv(csv_file_path)
-    
-    # 初始化预处理器
-    preprocessor = FRPDataPreprocessor()
-    
-    # 执行预处理
-    processed_data = preprocessor.create_model_dataset(df, target_column)
-    
-    return processed_data
-
-# 运行示例
-if __name__ == "__main__":
-    # 替换为你的CSV文件路径
-    file_path = "your_data.csv"
-    
-    # 替换为你的目标变量列名
-    target_col = "Tensile_strength_retention_rate"  # 或 "Residual_tensile_strength_MPa"
-    
-    try:
-        result = process_data(file_path, target_col)
-        print(f"数据预处理完成! 数据形状: {result.shape}")
-        print(f"特征列: {result.columns.tolist()}")
-        
-        # 保存处理后的数据
-        result.to_csv("preprocessed_data.csv", index=False)
-        print("预处理数据已保存到 preprocessed_data.csv")
-        
-    except Exception as e:
-        print(f"处理出错: {e}")
-'''
-                
-                st.code(offline_code, language='python')
+                st.code(OFFLINE_MODEL_DATASET_CODE, language='python')
                 
                 # 按钮平行排版
                 col_download, col_close = st.columns(2)
@@ -7943,7 +8113,7 @@ if __name__ == "__main__":
                 with col_download:
                     st.download_button(
                         label="Download Offline Code",
-                        data=offline_code,
+                        data=OFFLINE_MODEL_DATASET_CODE,
                         file_name="frp_preprocessing_offline.py",
                         mime="text/plain",
                         help="Download the complete offline preprocessing code",
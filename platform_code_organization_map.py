@@ -242,25 +242,30 @@ class UsageGuide:
 # 5. 关键发现总结
 # ========================================
 
-print("Platform Code.py 代码组织关键发现：")
-print("="*50)
-print("📊 数据读取代码：")
-print("   - 主函数：load_default_data() (第3876行)")
-print("   - SQL查询：第3895行")
-print("   - 缓存机制：@st.cache_data装饰器")
-print()
-print("🔧 预处理代码：")
-print("   - 主类：FRPDataPreprocessor (第3185行) - 推荐使用")
-print("   - 重复类：第7462行和第7758行 - 需要清理")
-print("   - 特征工程：create_selected_features (第3447行)")
-print("   - 8个专门的_process_*方法处理不同特征类型")
-print()
-print("⚠️  代码重复问题：")
-print("   - FRPDataPreprocessor类重复定义3次")
-print("   - 严重影响代码维护性")
-print("   - 建议重构统一接口")
-print()
-print("💡 推荐使用路径：")
-print("   - 数据读取：第3876行的load_default_data()")
-print("   - 预处理：第3185行的FRPDataPreprocessor类")
-print("   - 特征工程：第3447行的create_selected_features()")
\ No newline at end of file
+def _print_summary():
+    """打印关键发现摘要"""
+    print("Platform Code.py 代码组织关键发现：")
+    print("="*50)
+    print("📊 数据读取代码：")
+    print("   - 主函数：load_default_data() (第3876行)")
+    print("   - SQL查询：第3895行")
+    print("   - 缓存机制：@st.cache_data装饰器")
+    print()
+    print("🔧 预处理代码：")
+    print("   - 主类：FRPDataPreprocessor (第3185行) - 推荐使用")
+    print("   - 重复类：第7462行和第7758行 - 需要清理")
+    print("   - 特征工程：create_selected_features (第3447行)")
+    print("   - 8个专门的_process_*方法处理不同特征类型")
+    print()
+    print("⚠️  代码重复问题：")
+    print("   - FRPDataPreprocessor类重复定义3次")
+    print("   - 严重影响代码维护性")
+    print("   - 建议重构统一接口")
+    print()
+    print("💡 推荐使用路径：")
+    print("   - 数据读取：第3876行的load_default_data()")
+    print("   - 预处理：第3185行的FRPDataPreprocessor类")
+    print("   - 特征工程：第3447行的create_selected_features()")
+
+if __name__ == "__main__":
+    _print_summary()
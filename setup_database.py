@@ -22,7 +22,8 @@ def connect_to_mysql():
             host='localhost',
             port=3306,
             user='root',
-            password=''  # XAMPP默认无密码
+            password='',  # XAMPP默认无密码
+            use_pure=False  # 安装了C扩展时使用C协议解析，否则自动退回纯Python实现
         )
         return connection
     except Error as e:
@@ -44,8 +45,9 @@ def setup_frp_database():
         logger.info("📋 查看现有数据库:")
         cursor.execute("SHOW DATABASES")
         databases = cursor.fetchall()
-        for db in databases:
-            logger.info(f"  📂 {db[0]}")
+        # 合并为一条日志输出，日志级别关闭时不拼接字符串
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(f"  📂 {db[0]}" for db in databases))
         
         # 2. 创建frp_database（如果不存在）
         logger.info("\n🏗️ 创建frp_database数据库...")
@@ -94,8 +96,8 @@ def setup_frp_database():
         cursor.execute("DESCRIBE data")
         columns = cursor.fetchall()
         logger.info(f"\n📋 data表结构 ({len(columns)}个字段):")
-        for col in columns:
-            logger.info(f"  📄 {col[0]}: {col[1]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(f"  📄 {col[0]}: {col[1]}" for col in columns))
         
         # 6. 检查表中数据
         cursor.execute("SELECT COUNT(*) FROM data")
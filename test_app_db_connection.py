@@ -4,13 +4,26 @@ Test database connection using the exact same code as the app
 """
 
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
 
+from db_utils import MYSQL_DRIVER, get_engine
+
+# Record count and the sample rows from the app query in one round-trip
+SAMPLE_QUERY = text(
+    "SELECT (SELECT COUNT(*) FROM research_data) AS record_count, feature_name, Title, Year "
+    "FROM research_data ORDER BY feature_name DESC LIMIT 10"
+)
+
+@lru_cache(maxsize=1)
 def _load_db_config_from_env_or_secrets():
     """
     Exact copy of the function from app.py
+
+    The result is cached; call _load_db_config_from_env_or_secrets.cache_clear()
+    after changing the environment to re-read .env.
     """
     # Load .env file
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -58,43 +71,30 @@ def test_db_connection():
         
         print(f"[DEBUG] Final DB connection - Host: {host}, Port: {port}, User: {user}, DB: {dbname}")
         
-        # Create URL exactly like app
         if pwd:
-            url = f"mysql+pymysql://{user}:{pwd}@{host}:{port}/{dbname}?charset=utf8mb4"
-            print(f"[DEBUG] Connection URL: mysql+pymysql://{user}:***@{host}:{port}/{dbname}?charset=utf8mb4")
+            print(f"[DEBUG] Connection URL: mysql+{MYSQL_DRIVER}://{user}:***@{host}:{port}/{dbname}?charset=utf8mb4")
         else:
-            url = f"mysql+pymysql://{user}@{host}:{port}/{dbname}?charset=utf8mb4"
-            print(f"[DEBUG] Connection URL: mysql+pymysql://{user}@{host}:{port}/{dbname}?charset=utf8mb4")
+            print(f"[DEBUG] Connection URL: mysql+{MYSQL_DRIVER}://{user}@{host}:{port}/{dbname}?charset=utf8mb4")
         
-        # Create engine exactly like app (without caching)
-        engine = create_engine(
-            url,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            pool_size=2,
-            max_overflow=3,
-            pool_timeout=30,
-        )
+        # Create engine exactly like app (shared pool per config)
+        engine = get_engine(host, port, user, pwd, dbname)
         
         print(f"✅ Engine created successfully")
         
-        # Test connection exactly like load_default_data
+        # Test connection like load_default_data (a missing table raises ProgrammingError)
         with engine.connect() as conn:
-            # Check if research_data table exists
-            result = conn.execute(text("SHOW TABLES LIKE 'research_data'")).fetchone()
-            if not result:
+            try:
+                rows = conn.execute(SAMPLE_QUERY).fetchall()
+            except ProgrammingError:
                 print("❌ research_data table does not exist")
                 return False
             
             print("✅ research_data table exists")
             
-            # Get record count
-            count = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
+            # An empty result means the table has no records
+            count = rows[0].record_count if rows else 0
             print(f"✅ Found {count:,} records in research_data table")
-            
-            # Try the exact query from the app
-            df = pd.read_sql("SELECT * FROM research_data ORDER BY feature_name DESC LIMIT 10", engine)
-            print(f"✅ Successfully loaded {len(df)} sample rows using app query")
+            print(f"✅ Successfully loaded {len(rows)} sample rows using app query")
             
         print(f"\n🎉 Database connection test PASSED!")
         print(f"📊 The app should be able to load research_data successfully")
@@ -4,25 +4,38 @@ Test environment variable loading exactly like the app does
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 import streamlit as st
 from dotenv import load_dotenv
 
+ENV_KEYS = ("DB_HOST", "DB_PORT", "DB_USER", "DB_PASSWORD", "DB_NAME")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+env_path = os.path.join(script_dir, '.env')
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Exactly like the app does: load .env once (on first use, not at import) and snapshot the DB variables"""
+    load_result = load_dotenv(env_path, override=True)
+    return load_result, MappingProxyType({key: os.getenv(key) for key in ENV_KEYS})
+
+def _getenv(key, default=None):
+    """os.getenv against the snapshot taken on first load"""
+    value = _load_env()[1].get(key)
+    return default if value is None else value
+
 def test_env_loading():
     """Test if environment variables are loading correctly"""
     
     print("🔍 Testing Environment Variable Loading")
     print("=" * 60)
     
-    # Exactly like the app does
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    env_path = os.path.join(script_dir, '.env')
+    load_result = _load_env()[0]
     
     print(f"📁 Script directory: {script_dir}")
     print(f"📄 .env file path: {env_path}")
     print(f"✅ .env file exists: {os.path.exists(env_path)}")
-    
-    # Load .env file
-    load_result = load_dotenv(env_path, override=True)
     print(f"📥 load_dotenv result: {load_result}")
     
     # Test _get function exactly like the app
@@ -30,7 +43,7 @@ def test_env_loading():
         # Check if we're in Streamlit (we're not in this test)
         if hasattr(st, "secrets") and key in st.secrets:
             return st.secrets.get(key, default)
-        return os.getenv(key, default)
+        return _getenv(key, default)
     
     # Test each variable
     test_vars = [
@@ -43,7 +56,7 @@ def test_env_loading():
     
     print(f"\n📋 Environment Variables:")
     for var_name, expected_default in test_vars:
-        env_value = os.getenv(var_name)
+        env_value = _getenv(var_name)
         app_value = _get(var_name, expected_default)
         print(f"  {var_name}:")
         print(f"    Raw env: {env_value}")
@@ -4,29 +4,38 @@ Simple test of environment variable loading
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 
+ENV_KEYS = ("DB_HOST", "DB_PORT", "DB_USER", "DB_PASSWORD", "DB_NAME")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+env_path = os.path.join(script_dir, '.env')
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load .env on first use (not at import) and snapshot the DB variables"""
+    load_result = load_dotenv(env_path, override=True)
+    return load_result, MappingProxyType({key: os.getenv(key) for key in ENV_KEYS})
+
 def test_env_simple():
     """Simple test of environment variables"""
     
     print("🔍 Simple Environment Test")
     print("=" * 40)
     
-    # Load .env file
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    env_path = os.path.join(script_dir, '.env')
+    load_result, _CFG = _load_env()
     
     print(f"📄 .env path: {env_path}")
     print(f"✅ .env exists: {os.path.exists(env_path)}")
-    
-    load_result = load_dotenv(env_path, override=True)
     print(f"📥 load_dotenv: {load_result}")
     
     # Check key variables
-    db_host = os.getenv("DB_HOST")
-    db_port = os.getenv("DB_PORT") 
-    db_user = os.getenv("DB_USER")
-    db_name = os.getenv("DB_NAME")
+    db_host = _CFG["DB_HOST"]
+    db_port = _CFG["DB_PORT"]
+    db_user = _CFG["DB_USER"]
+    db_name = _CFG["DB_NAME"]
     
     print(f"\n📋 Variables:")
     print(f"  DB_HOST: {db_host}")
@@ -4,25 +4,35 @@ FRP Streamlit App - Railway Database Connection Test
 测试Railway MySQL数据库连接
 """
 
-import os
 import sys
-from dotenv import load_dotenv
-import pymysql
-from sqlalchemy import create_engine, text
+
+# 优先使用mysqlclient（C扩展，DB-API与PyMySQL相同），未安装时回退到PyMySQL
+try:
+    import MySQLdb as pymysql
+except ImportError:
+    import pymysql
+from sqlalchemy import text
+
+from config import DB_ENV_VARS, get_db_config
+from db_utils import get_engine
+
+# 表数量和research_data记录数一次查询取回
+TABLE_SUMMARY_SQL = """
+    SELECT (SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = DATABASE()) AS n_tables,
+           (SELECT COUNT(*) FROM research_data) AS n_rows
+"""
 
 def test_railway_connection():
     """测试Railway数据库连接"""
     
-    # 加载环境变量
-    load_dotenv()
-    
-    # 获取数据库配置
+    # 获取数据库配置（.env在进程内只解析一次）
+    env = get_db_config()
     db_config = {
-        'host': os.getenv('DB_HOST', 'switchback.proxy.rlwy.net'),
-        'port': int(os.getenv('DB_PORT', '17121')),
-        'user': os.getenv('DB_USER', 'root'),
-        'password': os.getenv('DB_PASSWORD', 'zAFTUZnwLefvYBrVaQSZNndcSmnZeuRe'),
-        'database': os.getenv('DB_NAME', 'railway')
+        'host': env.host or 'switchback.proxy.rlwy.net',
+        'port': int(env.port or '17121'),
+        'user': env.user or 'root',
+        'password': env.password or 'zAFTUZnwLefvYBrVaQSZNndcSmnZeuRe',
+        'database': env.database or 'railway'
     }
     
     print("🚀 Railway Database Connection Test")
@@ -43,17 +53,17 @@ def test_railway_connection():
             version = cursor.fetchone()
             print(f"✅ MySQL Version: {version[0]}")
             
-            cursor.execute("SHOW TABLES")
-            tables = cursor.fetchall()
-            print(f"✅ Found {len(tables)} tables")
+            # 检查research_data表（表不存在时整条查询报错，退回只统计表数量）
+            try:
+                cursor.execute(TABLE_SUMMARY_SQL)
+                n_tables, n_rows = cursor.fetchone()
+            except pymysql.ProgrammingError:
+                cursor.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = DATABASE()")
+                n_tables, n_rows = cursor.fetchone()[0], None
             
-            # 检查research_data表
-            cursor.execute("SHOW TABLES LIKE 'research_data'")
-            research_table = cursor.fetchone()
-            if research_table:
-                cursor.execute("SELECT COUNT(*) FROM research_data")
-                count = cursor.fetchone()
-                print(f"✅ research_data table: {count[0]} records")
+            print(f"✅ Found {n_tables} tables")
+            if n_rows is not None:
+                print(f"✅ research_data table: {n_rows} records")
             else:
                 print("❌ research_data table not found")
         
@@ -61,8 +71,8 @@ def test_railway_connection():
         
         # 测试SQLAlchemy连接
         print("\n🔗 Testing SQLAlchemy connection...")
-        url = f"mysql+pymysql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}?charset=utf8mb4"
-        engine = create_engine(url)
+        engine = get_engine(db_config['host'], db_config['port'], db_config['user'],
+                            db_config['password'], db_config['database'])
         
         with engine.connect() as conn:
             result = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
@@ -82,9 +92,9 @@ def check_environment():
     print("\n🔧 Environment Configuration Check")
     print("=" * 50)
     
-    required_vars = ['DB_HOST', 'DB_PORT', 'DB_USER', 'DB_PASSWORD', 'DB_NAME']
-    for var in required_vars:
-        value = os.getenv(var)
+    env = get_db_config()
+    for var, attr in DB_ENV_VARS.items():
+        value = getattr(env, attr)
         if value:
             # 隐藏密码
             display_value = value if var != 'DB_PASSWORD' else '*' * len(value)
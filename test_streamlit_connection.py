@@ -4,7 +4,47 @@ Quick Railway Connection Test for Streamlit Cloud Deployment
 """
 
 import streamlit as st
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+
+from db_utils import get_engine
+
+SECRET_KEYS = {
+    "host": "DB_HOST",
+    "port": "DB_PORT",
+    "user": "DB_USER",
+    "password": "DB_PASSWORD",
+    "database": "DB_NAME",
+}
+
+def _load_secrets():
+    """Read the database secrets (not cached, so corrected secrets show up on the next rerun)"""
+    return {name: st.secrets.get(key, "Not configured") for name, key in SECRET_KEYS.items()}
+
+@st.cache_data(ttl=300)
+def _probe_database(host, port, user, password, database):
+    """Run the connection probes; results are reused for 5 minutes (failures are not cached)"""
+    # Shared engine, kept across Streamlit reruns
+    engine = get_engine(host, port, user, password, database)
+    result = {"count": None, "count_error": None, "permissions_error": None}
+    
+    with engine.connect() as conn:
+        # Test basic connection
+        result["version"] = conn.execute(text("SELECT VERSION()")).scalar()
+        
+        # Test research_data table
+        try:
+            result["count"] = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
+        except Exception as e:
+            result["count_error"] = str(e)
+        
+        # Test table creation permissions
+        try:
+            conn.execute(text("CREATE TABLE IF NOT EXISTS test_permissions (id INT PRIMARY KEY)"))
+            conn.execute(text("DROP TABLE test_permissions"))
+        except Exception as e:
+            result["permissions_error"] = str(e)
+    
+    return result
 
 def test_deployment_connection():
     """Test database connection using Streamlit secrets"""
@@ -13,11 +53,12 @@ def test_deployment_connection():
     
     try:
         # Get database config from Streamlit secrets
-        host = st.secrets.get("DB_HOST", "Not configured")
-        port = st.secrets.get("DB_PORT", "Not configured") 
-        user = st.secrets.get("DB_USER", "Not configured")
-        password = st.secrets.get("DB_PASSWORD", "Not configured")
-        database = st.secrets.get("DB_NAME", "Not configured")
+        secrets = _load_secrets()
+        host = secrets["host"]
+        port = secrets["port"]
+        user = secrets["user"]
+        password = secrets["password"]
+        database = secrets["database"]
         
         st.write("### Configuration:")
         st.write(f"- **Host**: {host}")
@@ -33,29 +74,20 @@ def test_deployment_connection():
         
         # Test connection
         with st.spinner("Testing database connection..."):
-            url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}?charset=utf8mb4"
-            engine = create_engine(url)
-            
-            with engine.connect() as conn:
-                # Test basic connection
-                version = conn.execute(text("SELECT VERSION()")).scalar()
-                st.success(f"✅ **Connection successful!**")
-                st.info(f"MySQL Version: {version}")
-                
-                # Test research_data table
-                try:
-                    count = conn.execute(text("SELECT COUNT(*) FROM research_data")).scalar()
-                    st.success(f"✅ **research_data table found**: {count:,} records")
-                except Exception as e:
-                    st.warning(f"⚠️ research_data table issue: {str(e)}")
-                
-                # Test table creation permissions
-                try:
-                    conn.execute(text("CREATE TABLE IF NOT EXISTS test_permissions (id INT PRIMARY KEY)"))
-                    conn.execute(text("DROP TABLE test_permissions"))
-                    st.success("✅ **Database permissions**: Full access (CREATE/DROP)")
-                except Exception as e:
-                    st.warning(f"⚠️ Limited database permissions: {str(e)}")
+            probe = _probe_database(host, port, user, password, database)
+        
+        st.success(f"✅ **Connection successful!**")
+        st.info(f"MySQL Version: {probe['version']}")
+        
+        if probe["count_error"] is None:
+            st.success(f"✅ **research_data table found**: {probe['count']:,} records")
+        else:
+            st.warning(f"⚠️ research_data table issue: {probe['count_error']}")
+        
+        if probe["permissions_error"] is None:
+            st.success("✅ **Database permissions**: Full access (CREATE/DROP)")
+        else:
+            st.warning(f"⚠️ Limited database permissions: {probe['permissions_error']}")
         
         return True
         
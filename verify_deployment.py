@@ -4,7 +4,27 @@ Verify Railway Database Deployment
 """
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+
+from db_utils import get_engine
+
+# Row estimates for every table in the current schema
+TABLES_SQL = """
+    SELECT table_name, table_rows
+    FROM information_schema.tables
+    WHERE table_schema = DATABASE()
+    ORDER BY table_name
+"""
+
+# All research_data probes folded into a single query
+RESEARCH_DATA_STATS_SQL = """
+    SELECT COUNT(*) AS total,
+           COUNT(DISTINCT feature_name) AS uniq_features,
+           SUM(Title IS NOT NULL AND Title <> '') AS non_null_titles,
+           (SELECT COUNT(*) FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = 'research_data') AS n_columns
+    FROM research_data
+"""
 
 def verify_deployment():
     """Verify the dataset deployment to Railway"""
@@ -22,38 +42,35 @@ def verify_deployment():
     print("=" * 60)
     
     try:
-        url = f"mysql+pymysql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}?charset=utf8mb4"
-        engine = create_engine(url)
+        engine = get_engine(db_config['host'], db_config['port'], db_config['user'],
+                            db_config['password'], db_config['database'])
         
         with engine.connect() as conn:
-            # Check all tables
+            # Check all tables (table_rows is InnoDB's estimate; exact count below for research_data)
             print("🗄️ Database Tables:")
-            tables = conn.execute(text('SHOW TABLES')).fetchall()
-            for table in tables:
-                count = conn.execute(text(f'SELECT COUNT(*) FROM `{table[0]}`')).scalar()
-                print(f"  ✅ {table[0]}: {count:,} records")
+            tables = conn.execute(text(TABLES_SQL)).fetchall()
+            for table_name, table_rows in tables:
+                print(f"  ✅ {table_name}: ~{table_rows or 0:,} records")
             
-            # Detailed research_data analysis
+            # Detailed research_data analysis: row count, distinct names,
+            # title completeness and column count in one round-trip
             print(f"\n📊 research_data table analysis:")
+            stats = conn.execute(text(RESEARCH_DATA_STATS_SQL)).mappings().one()
+            total_records = stats['total']
+            unique_count = stats['uniq_features']
+            non_null_titles = int(stats['non_null_titles'] or 0)
+            column_count = stats['n_columns']
             
-            # Get column count
-            columns = conn.execute(text('DESCRIBE research_data')).fetchall()
-            print(f"  📋 Columns: {len(columns)}")
-            
-            # Get record count
-            total_records = conn.execute(text('SELECT COUNT(*) FROM research_data')).scalar()
+            print(f"  📋 Columns: {column_count}")
             print(f"  📈 Total records: {total_records:,}")
             
             # Sample data
             sample = conn.execute(text('SELECT * FROM research_data LIMIT 3')).fetchall()
             print(f"  🔍 Sample records: {len(sample)}")
             
-            # Check for duplicates
-            unique_count = conn.execute(text('SELECT COUNT(DISTINCT feature_name) FROM research_data')).scalar()
             print(f"  🔄 Unique feature_names: {unique_count:,}")
             
             # Data completeness check
-            non_null_titles = conn.execute(text('SELECT COUNT(*) FROM research_data WHERE Title IS NOT NULL AND Title != ""')).scalar()
             completeness = (non_null_titles / total_records * 100) if total_records > 0 else 0
             print(f"  📝 Title completeness: {completeness:.1f}%")
             
@@ -9,28 +9,50 @@ FRP数据导出脚本
 """
 
 import pandas as pd
-from sqlalchemy import create_engine
 import os
 from datetime import datetime
-from dotenv import load_dotenv
+
+from config import get_db_config
+from db_utils import get_engine
+
+# 可选：pyarrow 用C实现的CSV写出，未安装时回退到 pandas to_csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 分块导出时每块的行数
+EXPORT_CHUNK_SIZE = 10000
+
+def _write_csv_chunk(df, f, header):
+    """将一块数据写入已打开的二进制文件，优先使用 pyarrow，转换失败时回退到 to_csv"""
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=header))
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # 混合类型的object列无法转为Arrow，本块改用pandas写出
+            pass
+    df.to_csv(f, header=header, index=False, encoding='utf-8')
 
 def export_frp_data():
     """导出FRP数据到CSV文件"""
     
-    # 加载环境变量
-    load_dotenv()
-    
     print("📤 FRP数据导出工具")
     print("=" * 40)
     print(f"导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # 从环境变量获取数据库配置
+    # 从环境变量获取数据库配置（.env在进程内只解析一次）
+    env = get_db_config()
     db_config = {
-        'host': os.getenv('DB_HOST', 'hopper.proxy.rlwy.net'),
-        'port': os.getenv('DB_PORT', '56566'),
-        'user': os.getenv('DB_USER', 'root'),
-        'password': os.getenv('DB_PASSWORD'),
-        'database': os.getenv('DB_NAME', 'railway')
+        'host': env.host or 'hopper.proxy.rlwy.net',
+        'port': env.port or '56566',
+        'user': env.user or 'root',
+        'password': env.password,
+        'database': env.database or 'railway'
     }
     
     if not db_config['password']:
@@ -38,57 +60,69 @@ def export_frp_data():
         return False
     
     try:
-        # 创建数据库连接
-        connection_string = (
-            f"mysql+pymysql://{db_config['user']}:{db_config['password']}@"
-            f"{db_config['host']}:{db_config['port']}/{db_config['database']}"
-        )
-        
-        engine = create_engine(connection_string)
+        # 创建数据库连接（共享连接池）
+        engine = get_engine(db_config['host'], db_config['port'], db_config['user'],
+                            db_config['password'], db_config['database'])
         
         print(f"🔗 连接数据库: {db_config['host']}")
         
-        # 查询并导出数据
-        query = "SELECT * FROM research_data ORDER BY id"
-        df = pd.read_sql(query, engine)
-        
-        print(f"✅ 成功获取 {len(df)} 条记录")
-        print(f"📊 数据列数: {len(df.columns)}")
-        
         # 生成文件名
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'frp_data_export_{timestamp}.csv'
         
-        # 导出为CSV
-        df.to_csv(filename, index=False, encoding='utf-8')
-        
+        # 查询并分块导出数据（服务端游标，内存中每次只保留一块），同时累计统计信息
+        query = "SELECT * FROM research_data ORDER BY id"
+        total_rows = 0
+        columns = []
+        distinct_values = {'Fiber_Type': set(), 'Matrix_Type': set()}
+        value_ranges = {}
+        
+        with engine.connect() as conn, open(filename, 'wb') as f:
+            chunks = pd.read_sql(query, conn.execution_options(stream_results=True), chunksize=EXPORT_CHUNK_SIZE)
+            for i, df in enumerate(chunks):
+                _write_csv_chunk(df, f, header=(i == 0))
+                
+                total_rows += len(df)
+                columns = list(df.columns)
+                for col, values in distinct_values.items():
+                    if col in df.columns:
+                        values.update(df[col].dropna().unique())
+                for col in ('Temperature_C', 'Duration_days'):
+                    if col in df.columns and df[col].notna().any():
+                        low, high = df[col].min(), df[col].max()
+                        if col in value_ranges:
+                            low, high = min(low, value_ranges[col][0]), max(high, value_ranges[col][1])
+                        value_ranges[col] = (low, high)
+        
+        print(f"✅ 成功获取 {total_rows} 条记录")
+        print(f"📊 数据列数: {len(columns)}")
         print(f"💾 数据已导出到: {filename}")
         
         # 显示数据统计
         print("\n📈 数据统计:")
-        if 'Fiber_Type' in df.columns:
-            print(f"  - 纤维类型数量: {df['Fiber_Type'].nunique()}")
-        if 'Matrix_Type' in df.columns:
-            print(f"  - 基体类型数量: {df['Matrix_Type'].nunique()}")
-        if 'Temperature_C' in df.columns and df['Temperature_C'].notna().any():
-            print(f"  - 温度范围: {df['Temperature_C'].min():.1f}°C - {df['Temperature_C'].max():.1f}°C")
-        if 'Duration_days' in df.columns and df['Duration_days'].notna().any():
-            print(f"  - 持续时间范围: {df['Duration_days'].min()} - {df['Duration_days'].max()} 天")
+        if 'Fiber_Type' in columns:
+            print(f"  - 纤维类型数量: {len(distinct_values['Fiber_Type'])}")
+        if 'Matrix_Type' in columns:
+            print(f"  - 基体类型数量: {len(distinct_values['Matrix_Type'])}")
+        if 'Temperature_C' in value_ranges:
+            print(f"  - 温度范围: {value_ranges['Temperature_C'][0]:.1f}°C - {value_ranges['Temperature_C'][1]:.1f}°C")
+        if 'Duration_days' in value_ranges:
+            print(f"  - 持续时间范围: {value_ranges['Duration_days'][0]} - {value_ranges['Duration_days'][1]} 天")
         
         file_size = os.path.getsize(filename) / 1024 / 1024
         print(f"  - 文件大小: {file_size:.2f} MB")
         
         # 生成数据说明文件
-        columns_list = '\n'.join([f'- {col}' for col in df.columns[:10]])
-        more_cols = '...(更多列)' if len(df.columns) > 10 else ''
+        columns_list = '\n'.join([f'- {col}' for col in columns[:10]])
+        more_cols = '...(更多列)' if len(columns) > 10 else ''
         
         readme_content = f"""# FRP预测平台数据包
 
 ## 📋 数据信息
 - 导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - 数据文件: {filename}
-- 记录数量: {len(df)} 条
-- 数据列数: {len(df.columns)} 列
+- 记录数量: {total_rows} 条
+- 数据列数: {len(columns)} 列
 - 文件大小: {file_size:.2f} MB
 
 ## 🗂️ 数据结构
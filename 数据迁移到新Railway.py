@@ -14,11 +14,46 @@ FRP预测平台 - 数据迁移脚本（用于新部署）
 - 从原始数据库导入（需要连接信息）
 """
 
+import csv
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 import os
-import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from itertools import chain
+
+from db_utils import get_engine
+from etl import LOCAL_INFILE_DISABLED_ERRORS, PYARROW_AVAILABLE, load_data_infile, mysql_error_code
+
+# 从原数据库分块读取时每块的行数
+READ_CHUNK_SIZE = 10000
+
+# 并行导入时每个任务的行数和并发数（并发数不超过连接池容量 pool_size + max_overflow = 5）
+INSERT_BATCH_ROWS = 5000
+INSERT_WORKERS = 4
+
+# 文本列的最大长度，防止目标库字段溢出
+TEXT_LENGTH_LIMITS = {
+    'Reference': 500,
+    'Specimen_Preparation': 500,
+    'Additional_Notes': 1000,
+    'Appearance_Change': 1000,
+}
+
+# 文本列统一转换的字符串类型（有pyarrow时使用Arrow字符串内核）
+TEXT_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else 'string'
+
+# 目标库连接建立时执行的会话设置：批量导入期间跳过唯一性和外键检查
+# （该引擎只用于迁移，不影响Streamlit应用的连接）
+BULK_LOAD_INIT_COMMAND = "SET SESSION unique_checks = 0, foreign_key_checks = 0"
+
+# research_data 的二级索引（索引名 -> 列名），批量导入期间先删除、导入后一次性重建
+SECONDARY_INDEXES = {
+    'idx_fiber_type': 'Fiber_Type',
+    'idx_temperature': 'Temperature_C',
+    'idx_duration': 'Duration_days',
+    'idx_retention': 'Tensile_Strength_Retention_percent',
+}
 
 class FRPDataMigrator:
     def __init__(self):
@@ -44,19 +79,16 @@ class FRPDataMigrator:
             'database': database
         }
     
-    def create_database_connection(self, config):
-        """创建数据库连接"""
+    def create_database_connection(self, config, bulk_load=False):
+        """创建数据库连接（目标库开启local_infile以支持LOAD DATA LOCAL INFILE，并应用批量导入会话设置）"""
         try:
-            # URL编码密码以处理特殊字符
-            encoded_password = urllib.parse.quote_plus(config['password'])
-            
-            connection_string = (
-                f"mysql+pymysql://{config['user']}:{encoded_password}@"
-                f"{config['host']}:{config['port']}/{config['database']}"
+            # 共享连接池（密码在db_utils中做URL编码）
+            engine = get_engine(
+                config['host'], config['port'], config['user'],
+                config['password'], config['database'], local_infile=bulk_load,
+                init_command=BULK_LOAD_INIT_COMMAND if bulk_load else None
             )
             
-            engine = create_engine(connection_string)
-            
             # 测试连接
             with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
@@ -113,8 +145,39 @@ class FRPDataMigrator:
             print(f"❌ 数据表创建失败: {e}")
             return False
     
-    def load_data_from_csv(self):
-        """从CSV文件加载数据"""
+    def drop_secondary_indexes(self, engine):
+        """删除research_data上已存在的二级索引，返回被删除的索引名列表"""
+        with engine.connect() as conn:
+            existing = {
+                row[0] for row in conn.execute(text(
+                    "SELECT DISTINCT index_name FROM information_schema.statistics "
+                    "WHERE table_schema = DATABASE() AND table_name = 'research_data'"
+                ))
+            }
+            dropped = [name for name in SECONDARY_INDEXES if name in existing]
+            if dropped:
+                conn.execute(text(
+                    "ALTER TABLE research_data " + ', '.join(f"DROP INDEX {name}" for name in dropped)
+                ))
+                conn.commit()
+                print(f"⚡ 已临时删除 {len(dropped)} 个二级索引，导入完成后重建")
+        return dropped
+    
+    def restore_secondary_indexes(self, engine, index_names):
+        """在一条ALTER TABLE中重建索引（只重建一次表，比逐行维护B树更快）"""
+        if not index_names:
+            return
+        print("🔧 正在重建二级索引...")
+        with engine.connect() as conn:
+            conn.execute(text(
+                "ALTER TABLE research_data "
+                + ', '.join(f"ADD INDEX {name} ({SECONDARY_INDEXES[name]})" for name in index_names)
+            ))
+            conn.commit()
+        print("✅ 二级索引重建完成")
+    
+    def select_csv_file(self):
+        """选择要导入的CSV文件"""
         print("\n📁 从CSV文件加载数据")
         print("=" * 30)
         
@@ -138,15 +201,87 @@ class FRPDataMigrator:
         else:
             selected_file = input("请输入CSV文件路径: ")
         
+        return selected_file
+    
+    def load_data_from_csv(self, selected_file):
+        """分块读取CSV文件（LOAD DATA不可用时的导入路径），返回按块产出DataFrame的迭代器"""
         try:
-            df = pd.read_csv(selected_file)
-            print(f"✅ 成功加载 {len(df)} 条记录")
-            print(f"数据列: {list(df.columns)}")
-            return df
+            # 先读取第一块，文件不存在或格式错误时在这里直接报告
+            chunks = pd.read_csv(selected_file, chunksize=READ_CHUNK_SIZE)
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                return pd.DataFrame()
+            print(f"✅ 成功打开CSV文件，按每块 {READ_CHUNK_SIZE} 条分块读取")
+            print(f"数据列: {list(first_chunk.columns)}")
+            return chain([first_chunk], chunks)
         except Exception as e:
             print(f"❌ CSV文件加载失败: {e}")
             return None
     
+    def load_csv_infile(self, csv_path, target_engine):
+        """不经过pandas，直接用 LOAD DATA LOCAL INFILE 导入CSV文件
+
+        成功返回True；LOCAL INFILE 被禁用、表头无法读取或导入产生警告时返回None，
+        由调用方改为分块读取CSV导入；其他数据库错误（如主键重复）视为迁移失败，返回False
+        """
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                first_line = f.readline()
+            header = next(csv.reader([first_line]), [])
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠️ 无法读取CSV表头: {e}")
+            return None
+        if not header:
+            return None
+        
+        # Windows下pandas导出的CSV以\r\n换行
+        line_end = '\\r\\n' if first_line.endswith('\r\n') else '\\n'
+        
+        # 各列先读入用户变量：空字段按NULL导入，超长文本截断
+        variables = [f"@v{i}" for i in range(len(header))]
+        assignments = []
+        for i, col in enumerate(header):
+            value = f"NULLIF(@v{i}, '')"
+            if col in TEXT_LENGTH_LIMITS:
+                value = f"LEFT({value}, {TEXT_LENGTH_LIMITS[col]})"
+            assignments.append(f"`{col}` = {value}")
+        
+        load_sql = (
+            "LOAD DATA LOCAL INFILE %s INTO TABLE research_data CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+            f"LINES TERMINATED BY '{line_end}' IGNORE 1 LINES "
+            f"({', '.join(variables)}) SET {', '.join(assignments)}"
+        )
+        
+        print("⚡ 尝试使用 LOAD DATA LOCAL INFILE 直接导入CSV文件...")
+        connection = target_engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(load_sql, (os.path.abspath(csv_path),))
+            loaded = cursor.rowcount
+            
+            # LOCAL导入隐含IGNORE：非数值文本被转为0、重复id被跳过，只体现为警告。
+            # 有警告时回滚，改走逐块检查的migrate_data路径
+            cursor.execute("SHOW WARNINGS")
+            warnings = [w for w in cursor.fetchall() if w[0] != 'Note']
+            if warnings:
+                connection.rollback()
+                print(f"⚠️ LOAD DATA 产生 {len(warnings)} 条警告（例如: {warnings[0]}），已回滚，改为分块读取CSV导入")
+                return None
+            
+            connection.commit()
+            print(f"\n🎉 数据迁移完成！总共迁移 {loaded} 条记录")
+            return True
+        except Exception as e:
+            connection.rollback()
+            if mysql_error_code(e) in LOCAL_INFILE_DISABLED_ERRORS:
+                print(f"⚠️ LOAD DATA LOCAL INFILE 不可用，改为分块读取CSV导入: {e}")
+                return None
+            print(f"❌ LOAD DATA 导入CSV失败: {e}")
+            return False
+        finally:
+            connection.close()
+    
     def load_data_from_database(self):
         """从原数据库加载数据"""
         print("\n🗄️ 从原数据库加载数据")
@@ -165,59 +300,117 @@ class FRPDataMigrator:
             return None
         
         try:
-            # 获取数据
-            df = pd.read_sql("SELECT * FROM research_data", source_engine)
-            print(f"✅ 成功从原数据库加载 {len(df)} 条记录")
-            return df
+            # 先读取第一块，连接或查询出错时在这里直接报告
+            chunks = self.stream_research_data(source_engine)
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                return pd.DataFrame()
+            print(f"✅ 已连接原数据库，按每块 {READ_CHUNK_SIZE} 条分块读取")
+            return chain([first_chunk], chunks)
         except Exception as e:
             print(f"❌ 从原数据库加载失败: {e}")
             return None
     
-    def migrate_data(self, df, target_engine):
-        """迁移数据到目标数据库"""
-        print(f"\n🚀 开始数据迁移 ({len(df)} 条记录)")
+    def stream_research_data(self, source_engine, chunksize=READ_CHUNK_SIZE):
+        """通过服务端游标分块读取research_data，内存中每次只保留一块"""
+        with source_engine.connect() as conn:
+            stream_conn = conn.execution_options(stream_results=True)
+            yield from pd.read_sql("SELECT * FROM research_data", stream_conn, chunksize=chunksize)
+    
+    def migrate_data(self, data, target_engine):
+        """迁移数据到目标数据库（data为DataFrame或按块产出DataFrame的迭代器，数据块会被原地清理）"""
+        if isinstance(data, pd.DataFrame):
+            print(f"\n🚀 开始数据迁移 ({len(data)} 条记录)")
+            chunks = [data]
+        else:
+            print("\n🚀 开始数据迁移（分块读取）")
+            chunks = data
         print("=" * 40)
         
+        chunk_num = 0
+        total_rows = 0
+        submitted = []
+        pending = set()
+        executor = ThreadPoolExecutor(max_workers=INSERT_WORKERS)
         try:
-            # 清理数据
-            df_clean = df.copy()
-            
-            # 处理可能的数据类型问题
-            for col in df_clean.columns:
-                if df_clean[col].dtype == 'object':
-                    df_clean[col] = df_clean[col].astype(str)
-                    # 限制文本长度
-                    if col in ['Reference', 'Specimen_Preparation']:
-                        df_clean[col] = df_clean[col].str[:500]
-                    elif col in ['Additional_Notes', 'Appearance_Change']:
-                        df_clean[col] = df_clean[col].str[:1000]
-            
-            # 分批导入数据（每次1000条）
-            batch_size = 1000
-            total_batches = (len(df_clean) + batch_size - 1) // batch_size
-            
-            for i in range(0, len(df_clean), batch_size):
-                batch_df = df_clean.iloc[i:i+batch_size]
-                batch_num = i // batch_size + 1
+            for df in chunks:
+                # 清理数据：只原地修改需要处理的列，不复制整块数据
+                # object列整体转为字符串类型（缺失值保持为NA，不会变成'nan'）
+                obj_cols = df.select_dtypes('object').columns
+                if len(obj_cols):
+                    df[obj_cols] = df[obj_cols].astype(TEXT_DTYPE)
                 
-                print(f"正在导入第 {batch_num}/{total_batches} 批 ({len(batch_df)} 条记录)...")
+                # 限制文本长度
+                for col, max_len in TEXT_LENGTH_LIMITS.items():
+                    if col in obj_cols:
+                        df[col] = df[col].str.slice(0, max_len)
                 
-                batch_df.to_sql(
-                    'research_data', 
-                    target_engine, 
-                    if_exists='append', 
-                    index=False, 
-                    method='multi'
-                )
+                # 按批提交到线程池，各批次通过连接池中不同的连接并行导入
+                chunk_num += 1
+                print(f"正在导入第 {chunk_num} 块 ({len(df)} 条记录)...")
+                for start in range(0, len(df), INSERT_BATCH_ROWS):
+                    batch = df.iloc[start:start + INSERT_BATCH_ROWS]
+                    future = executor.submit(self.insert_chunk, batch, target_engine)
+                    submitted.append(future)
+                    pending.add(future)
                 
-                print(f"✅ 第 {batch_num} 批导入完成")
+                # 限制排队的批次数，避免源数据读取过快导致内存堆积
+                while len(pending) >= INSERT_WORKERS * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    total_rows += sum(future.result() for future in done)
+                    print(f"✅ 已导入 {total_rows} 条记录")
+            
+            for future in pending:
+                total_rows += future.result()
             
-            print(f"\n🎉 数据迁移完成！总共迁移 {len(df_clean)} 条记录")
+            print(f"\n🎉 数据迁移完成！总共迁移 {total_rows} 条记录")
             return True
             
         except Exception as e:
+            # 取消尚未开始的批次，等正在执行的批次结束，再统计所有成功批次已提交的行数
+            executor.shutdown(wait=True, cancel_futures=True)
+            total_rows = sum(
+                future.result() for future in submitted
+                if not future.cancelled() and future.exception() is None
+            )
             print(f"❌ 数据迁移失败: {e}")
+            if total_rows:
+                print(f"⚠️ 目标表中已提交 {total_rows} 条记录，重新迁移前请先清空: TRUNCATE TABLE research_data")
             return False
+        finally:
+            executor.shutdown()
+    
+    def insert_chunk(self, df_clean, target_engine, batch_size=1000):
+        """使用 LOAD DATA LOCAL INFILE 整块导入，服务器不支持时退回executemany批量INSERT，返回实际导入行数
+
+        LOAD DATA 有警告或导入行数与批次不符（如目标表已有相同id）时抛出异常并回滚整批
+        """
+        connection = target_engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            loaded = load_data_infile(cursor, df_clean, 'research_data', df_clean.columns)
+            if loaded is None:
+                connection.rollback()
+                
+                # pymysql会把executemany的INSERT ... VALUES改写为多行INSERT
+                columns_sql = ', '.join([f"`{col}`" for col in df_clean.columns])
+                placeholders = ', '.join(['%s'] * len(df_clean.columns))
+                insert_sql = f"INSERT INTO research_data ({columns_sql}) VALUES ({placeholders})"
+                rows = df_clean.astype(object).where(df_clean.notna(), None).values.tolist()
+                loaded = 0
+                for i in range(0, len(rows), batch_size):
+                    cursor.executemany(insert_sql, rows[i:i + batch_size])
+                    loaded += cursor.rowcount
+                if loaded != len(rows):
+                    raise RuntimeError(f"批量INSERT写入 {loaded} 行，与批次的 {len(rows)} 行不符")
+            
+            connection.commit()
+            return loaded
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
     
     def verify_migration(self, target_engine):
         """验证数据迁移结果"""
@@ -265,7 +458,7 @@ class FRPDataMigrator:
         
         # 1. 获取目标数据库配置
         target_config = self.get_target_database_config()
-        target_engine = self.create_database_connection(target_config)
+        target_engine = self.create_database_connection(target_config, bulk_load=True)
         
         if not target_engine:
             print("❌ 无法连接目标数据库，迁移终止")
@@ -283,17 +476,34 @@ class FRPDataMigrator:
         
         choice = input("请选择 (1 或 2): ").strip()
         
+        # CSV文件先只选定路径，LOAD DATA不可用时才交给pandas分块读取
+        csv_path = None
+        df = None
         if choice == "2":
             df = self.load_data_from_database()
+            if df is None:
+                print("❌ 数据加载失败，迁移终止")
+                return False
         else:
-            df = self.load_data_from_csv()
+            csv_path = self.select_csv_file()
         
-        if df is None:
-            print("❌ 数据加载失败，迁移终止")
-            return False
+        # 4. 执行数据迁移（导入期间去掉二级索引，结束后无论成败都重建）
+        try:
+            dropped_indexes = self.drop_secondary_indexes(target_engine)
+        except Exception as e:
+            print(f"⚠️ 无法删除二级索引，按原方式导入: {e}")
+            dropped_indexes = []
+        try:
+            # CSV文件优先由服务器直接导入，返回None（不支持或有警告）时再分块读取后导入
+            migrated = self.load_csv_infile(csv_path, target_engine) if csv_path is not None else None
+            if migrated is None:
+                if df is None:
+                    df = self.load_data_from_csv(csv_path)
+                migrated = df is not None and self.migrate_data(df, target_engine)
+        finally:
+            self.restore_secondary_indexes(target_engine, dropped_indexes)
         
-        # 4. 执行数据迁移
-        if not self.migrate_data(df, target_engine):
+        if not migrated:
             print("❌ 数据迁移失败")
             return False
         
@@ -9,6 +9,9 @@ import re
 import secrets
 import string
 
+# app.py 中 st.set_page_config 的页面标题
+_TITLE_RE = re.compile(r'page_title="[^"]*"')
+
 def generate_secret_key(length=32):
     """生成随机密钥"""
     alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
@@ -25,6 +28,9 @@ def update_env_file():
     db_user = input("数据库用户名: ")
     db_password = input("数据库密码: ")
     
+    # 密钥只生成一次，.env 和 Streamlit Secrets 使用同一个值
+    secret_key = generate_secret_key()
+    
     env_content = f"""# FRP预测平台数据库配置
 # 新部署配置 - {db_host}
 DB_HOST={db_host}
@@ -34,7 +40,7 @@ DB_PASSWORD={db_password}
 DB_NAME={db_name}
 
 # 生成的安全密钥
-SECRET_KEY={generate_secret_key()}
+SECRET_KEY={secret_key}
 """
     
     with open('.env', 'w', encoding='utf-8') as f:
@@ -47,7 +53,7 @@ SECRET_KEY={generate_secret_key()}
         'DB_NAME': db_name,
         'DB_USER': db_user,
         'DB_PASSWORD': db_password,
-        'SECRET_KEY': generate_secret_key()
+        'SECRET_KEY': secret_key
     }
 
 def generate_streamlit_secrets(db_config):
@@ -78,18 +84,15 @@ def update_page_config():
     with open('app.py', 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # 更新页面标题
+    # 更新页面标题（替换内容用函数返回，组织名中的反斜杠不会被当作转义）
     if org_name:
         new_title = f"{org_name} - FRP纤维增强聚合物耐久性预测平台"
-        content = re.sub(
-            r'page_title="[^"]*"',
-            f'page_title="{new_title}"',
-            content
-        )
-    
-    # 保存修改
-    with open('app.py', 'w', encoding='utf-8') as f:
-        f.write(content)
+        new_content = _TITLE_RE.sub(lambda _: f'page_title="{new_title}"', content)
+        
+        # 保存修改（标题未变化时不重写文件）
+        if new_content != content:
+            with open('app.py', 'w', encoding='utf-8') as f:
+                f.write(new_content)
     
     print(f"✅ 页面配置已更新！")
     return {